@@ -57,6 +57,7 @@ from .config import write_project_config, validate_division, get_valid_divisions
 from .governance.waiver import WaiverManager
 from .governance.compliance import ComplianceChecker
 from .governance.report import ComplianceReportGenerator
+from .governance.result_writers import RESULT_WRITERS
 import ssl
 import truststore
 
@@ -948,8 +949,23 @@ def waive_requirement(
     waive_requirement_command(reason=reason)
 
 
+def _validate_output_format(value: Optional[str]) -> Optional[str]:
+    """Reject unknown --format values while options are parsed."""
+    if value is not None and value not in RESULT_WRITERS:
+        raise typer.BadParameter(f"'{value}' is not one of {', '.join(RESULT_WRITERS)}")
+    return value
+
+
 @app.command()
-def check_compliance():
+def check_compliance(
+    incremental: bool = typer.Option(False, "--incremental", help="Re-evaluate only rules affected by files changed since the last run (or --base-ref)"),
+    base_ref: str = typer.Option(None, "--base-ref", help="Git ref to diff against in incremental mode (e.g. origin/main)"),
+    processes: int = typer.Option(1, "--processes", min=0, help="Evaluate rules on N worker processes (0 = one per CPU)"),
+    profile: int = typer.Option(0, "--profile", min=0, help="Print the N slowest rules and guides"),
+    output_format: str = typer.Option(None, "--format", callback=_validate_output_format, help="Also stream results as jsonl, json or sarif"),
+    output: Path = typer.Option(None, "--output", help="File for --format output (default: compliance-results.<format>)"),
+    watch: bool = typer.Option(False, "--watch", help="Stay running and re-check rules affected by each file change"),
+):
     """
     Check code compliance against implementation guides.
     
@@ -960,9 +976,43 @@ def check_compliance():
     
     Example:
         specify check-compliance
+        specify check-compliance --incremental --base-ref origin/main
+        specify check-compliance --processes 0
+        specify check-compliance --profile 10
+        specify check-compliance --format sarif --output compliance.sarif
+        specify check-compliance --watch
     """
     from .commands.check_compliance import check_compliance_command
-    check_compliance_command()
+    check_compliance_command(
+        incremental=incremental,
+        base_ref=base_ref,
+        processes=processes,
+        profile=profile,
+        output_format=output_format,
+        output=output,
+        watch=watch
+    )
+
+
+@app.command()
+def metrics(
+    runs: int = typer.Option(20, "--runs", min=1, help="Number of recent runs to analyse"),
+    top: int = typer.Option(10, "--top", min=0, help="Number of slowest rules and guides to show"),
+    threshold: float = typer.Option(0.25, "--threshold", min=0.0, help="Relative slowdown flagged as a regression (0.25 = 25%)"),
+):
+    """
+    Show compliance check performance trends.
+
+    Reads the metrics history recorded by check-compliance in
+    .specify/.cache/metrics_history.jsonl and shows duration trends,
+    per-rule and per-guide percentiles, and flagged regressions.
+
+    Example:
+        specify metrics
+        specify metrics --runs 50 --threshold 0.5
+    """
+    from .commands.metrics import metrics_command
+    metrics_command(runs=runs, top=top, threshold=threshold)
 
 
 # Waivers subcommand group
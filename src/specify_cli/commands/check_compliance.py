@@ -1,49 +1,186 @@
 # Check compliance command implementation
 from pathlib import Path
+from typing import Optional
 
 import typer
 from rich.console import Console
 from rich.panel import Panel
+from rich.table import Table
 
-from ..governance.compliance import ComplianceChecker, RuleStatus
+from ..governance.compliance import ComplianceChecker, ResultAggregate
+from ..governance.metrics import ComplianceCheckMetrics, get_metrics_collector
 from ..governance.report import ComplianceReportGenerator
+from ..governance.result_writers import RESULT_WRITERS, create_result_writer
+from ..governance.watch import WatchUpdate, watch_compliance
 
 console = Console()
 
 
-def check_compliance_command():
+def print_profile(metrics: ComplianceCheckMetrics, limit: int) -> None:
+    """
+    Print the slowest rules and guides of a compliance check.
+
+    Args:
+        metrics: Metrics of the finished check
+        limit: Number of rules and guides to show
+    """
+    rules_table = Table(title=f"Slowest {limit} Rules", title_justify="left")
+    rules_table.add_column("Rule", style="cyan")
+    rules_table.add_column("Type")
+    rules_table.add_column("Guide")
+    rules_table.add_column("Time (ms)", justify="right")
+    for metric in metrics.slowest_rules(limit):
+        rules_table.add_row(metric.rule_id, metric.rule_type, metric.guide_id, f"{metric.duration_ms:.2f}")
+
+    guides_table = Table(title=f"Slowest {limit} Guides", title_justify="left")
+    guides_table.add_column("Guide", style="cyan")
+    guides_table.add_column("Rules", justify="right")
+    guides_table.add_column("Parse (ms)", justify="right")
+    guides_table.add_column("Evaluate (ms)", justify="right")
+    guides_table.add_column("Total (ms)", justify="right")
+    for guide in metrics.slowest_guides(limit):
+        guides_table.add_row(
+            guide.guide_id,
+            str(guide.rules_count),
+            f"{guide.parse_ms:.2f}",
+            f"{guide.evaluate_ms:.2f}",
+            f"{guide.total_ms:.2f}"
+        )
+
+    console.print()
+    console.print(rules_table)
+    console.print(guides_table)
+    stages = ", ".join(
+        f"{stage} {duration:.2f}ms" for stage, duration in metrics.stage_durations_ms.items()
+    )
+    console.print(
+        f"[dim]Total {metrics.total_duration_ms:.2f}ms"
+        f"{'; stages: ' + stages if stages else ''}"
+        f"; waiver lookup {metrics.waiver_lookup_ms:.2f}ms[/dim]"
+    )
+
+
+def print_watch_update(update: WatchUpdate) -> None:
+    """
+    Print the outcome of one watch cycle.
+
+    Args:
+        update: Results of the initial check or of a re-check
+    """
+    aggregate = ResultAggregate(update.results)
+    counts = (
+        f"✅ {aggregate.pass_count}  ❌ {aggregate.fail_count}  "
+        f"🚫 {aggregate.waived_count}  ⚠️ {aggregate.error_count}"
+    )
+    if not update.changed_files:
+        console.print(f"[bold]Initial check[/bold] ({update.duration_ms:.0f}ms): {counts}")
+        return
+
+    changed = sorted(update.changed_files)
+    shown = ", ".join(changed[:3]) + (f" (+{len(changed) - 3} more)" if len(changed) > 3 else "")
+    console.print(f"[dim]{shown} changed[/dim] → re-checked in {update.duration_ms:.1f}ms: {counts}")
+    for previous, result in update.status_changes:
+        before = f"{previous.status_emoji()} → " if previous is not None else ""
+        console.print(f"  {before}{result.status_emoji()} {result.rule_id} ({result.guide_id}): {result.message}")
+
+
+def check_compliance_command(
+    incremental: bool = False,
+    base_ref: Optional[str] = None,
+    processes: int = 1,
+    profile: int = 0,
+    output_format: Optional[str] = None,
+    output: Optional[Path] = None,
+    watch: bool = False
+):
     """
     Check code compliance against implementation guides.
 
     Evaluates all rules defined in implementation guides, generates a compliance
     report with pass/fail/waived status, and cross-references waivers.
 
+    With incremental=True, only rules whose target files or source guides changed
+    since base_ref (or the last recorded run) are re-evaluated.
+
+    With processes != 1, rules are evaluated on a process pool (0 = one
+    worker per CPU).
+
+    With profile > 0, the slowest N rules and guides are printed after the
+    results.
+
+    With output_format ("jsonl", "json" or "sarif"), each result is also
+    streamed to output (default compliance-results.<format>) as it is produced.
+
+    With watch=True, the checker stays resident and re-checks only the rules
+    affected by each file change, printing updated results until Ctrl+C.
+    No report is written in watch mode.
+
     Creates: compliance-report.md
 
     Example:
         specify check-compliance
+        specify check-compliance --incremental --base-ref origin/main
+        specify check-compliance --processes 0
+        specify check-compliance --profile 10
+        specify check-compliance --format sarif --output compliance.sarif
+        specify check-compliance --watch
     """
+    if output_format and output_format not in RESULT_WRITERS:
+        # Checked before any output file is created
+        console.print(
+            f"[red]Unknown output format:[/red] {output_format} "
+            f"(supported: {', '.join(RESULT_WRITERS)})"
+        )
+        raise typer.Exit(1)
+
+    if watch:
+        checker = ComplianceChecker(processes=processes)
+        console.print("[bold cyan]Watching for changes[/bold cyan] [dim](Ctrl+C to stop)[/dim]")
+        try:
+            watch_compliance(checker, print_watch_update)
+        except KeyboardInterrupt:
+            console.print("\n[dim]Stopped watching[/dim]")
+        return
+
     try:
-        with console.status("[bold cyan]Discovering guides...") as status:
-            checker = ComplianceChecker()
-            guides = checker._discover_guides()
+        checker = ComplianceChecker(processes=processes)
 
-        if not guides:
+        # Run compliance check; guides are discovered lazily while it runs, streaming results if requested
+        results_path = None
+        if output_format:
+            results_path = output or Path(f"compliance-results.{output_format}")
+        with console.status("[bold cyan]Checking compliance...") as status:
+            if results_path is None:
+                results = checker.run_compliance_check(
+                    incremental=incremental,
+                    base_ref=base_ref
+                )
+            else:
+                with open(results_path, "w", encoding="utf-8") as out:
+                    with create_result_writer(output_format, out) as writer:
+                        results = checker.run_compliance_check(
+                            incremental=incremental,
+                            base_ref=base_ref,
+                            on_result=writer.write
+                        )
+
+        history = get_metrics_collector().get_history()
+        check_metrics = history[-1] if history else None
+        if check_metrics is not None and check_metrics.guides_count == 0:
+            if results_path is not None:
+                results_path.unlink(missing_ok=True)
             console.print("[yellow]⚠[/yellow]  No implementation guides found")
             console.print("[dim]Looking in: context/references/, specs/[/dim]")
             raise typer.Exit(1)
+        if check_metrics is not None:
+            console.print(f"[dim]Checked {check_metrics.guides_count} guide(s)[/dim]")
 
-        console.print(f"[dim]Found {len(guides)} guide(s)[/dim]")
-
-        # Run compliance check
-        with console.status("[bold cyan]Checking compliance...") as status:
-            results = checker.run_compliance_check(guides)
-
-        # Count statuses
-        pass_count = sum(1 for r in results if r.status == RuleStatus.PASS)
-        fail_count = sum(1 for r in results if r.status == RuleStatus.FAIL)
-        waived_count = sum(1 for r in results if r.status == RuleStatus.WAIVED)
-        error_count = sum(1 for r in results if r.status == RuleStatus.ERROR)
+        # Bucket results once for the summary and the report
+        aggregate = ResultAggregate(results)
+        pass_count = aggregate.pass_count
+        fail_count = aggregate.fail_count
+        waived_count = aggregate.waived_count
+        error_count = aggregate.error_count
 
         # Display results
         console.print()
@@ -52,12 +189,17 @@ def check_compliance_command():
         console.print(f"  ❌ Failed: {fail_count}")
         console.print(f"  🚫 Waived: {waived_count}")
         console.print(f"  ⚠️ Errors: {error_count}")
+        if results_path is not None:
+            console.print(f"[dim]Streamed {output_format} results to {results_path}[/dim]")
+
+        if profile > 0 and check_metrics is not None:
+            print_profile(check_metrics, profile)
 
         # Generate and write report
         with console.status("[bold cyan]Generating report...") as status:
             generator = ComplianceReportGenerator()
             report_path = generator.generate_and_write_report(
-                results,
+                aggregate,
                 project_name=Path.cwd().name
             )
 
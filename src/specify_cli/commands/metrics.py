@@ -0,0 +1,117 @@
+# Metrics command implementation
+from typing import List
+
+import typer
+from rich.console import Console
+from rich.table import Table
+
+from ..governance.metrics_history import (
+    DurationStats,
+    MetricsHistoryStore,
+    duration_stats,
+    find_regressions,
+    percentile,
+)
+
+console = Console()
+
+
+def _stats_table(title: str, label: str, stats: List[DurationStats]) -> Table:
+    """Build a percentile table for rules or guides."""
+    table = Table(title=title, title_justify="left", show_header=True, header_style="bold bright_blue")
+    table.add_column(label, style="cyan")
+    table.add_column("Runs", justify="right")
+    for column in ("p50 (ms)", "p90 (ms)", "p95 (ms)", "Max (ms)", "Last (ms)"):
+        table.add_column(column, justify="right")
+    for s in stats:
+        table.add_row(
+            s.key,
+            str(s.count),
+            f"{s.p50_ms:.2f}",
+            f"{s.p90_ms:.2f}",
+            f"{s.p95_ms:.2f}",
+            f"{s.max_ms:.2f}",
+            f"{s.last_ms:.2f}"
+        )
+    return table
+
+
+def metrics_command(runs: int = 20, top: int = 10, threshold: float = 0.25):
+    """
+    Show compliance check performance over time.
+
+    Reads the metrics history recorded by check-compliance and prints the
+    duration trend of recent runs, duration percentiles of the slowest
+    rules and guides, and runs whose total or per-rule time regressed by
+    more than threshold against the median of the runs before them.
+
+    Example:
+        specify metrics
+        specify metrics --runs 50 --threshold 0.5
+    """
+    store = MetricsHistoryStore()
+    records = store.load(runs)
+
+    if not records:
+        console.print("[yellow]⚠[/yellow]  No metrics history found")
+        console.print("[dim]Run 'specify check-compliance' to record metrics[/dim]")
+        return
+
+    regressions = find_regressions(records, threshold=threshold)
+    flagged = {r.run_index for r in regressions}
+
+    trend = Table(
+        title=f"Compliance Check Trend (last {len(records)} runs)",
+        title_justify="left",
+        show_header=True,
+        header_style="bold bright_blue"
+    )
+    trend.add_column("Run", style="dim")
+    trend.add_column("Guides", justify="right")
+    trend.add_column("Rules", justify="right")
+    trend.add_column("Total (ms)", justify="right")
+    trend.add_column("Change", justify="right")
+    trend.add_column("")
+    previous = None
+    for index, record in enumerate(records):
+        total = record.get("total_ms", 0.0)
+        change = f"{(total / previous - 1) * 100:+.0f}%" if previous else ""
+        trend.add_row(
+            record.get("timestamp", ""),
+            str(record.get("guides_count", 0)),
+            str(record.get("rules_count", 0)),
+            f"{total:.2f}",
+            change,
+            "[red]⚠ regressed[/red]" if index in flagged else ""
+        )
+        previous = total or None
+    console.print(trend)
+
+    totals = [record.get("total_ms", 0.0) for record in records]
+    console.print(
+        f"[dim]Total duration p50 {percentile(totals, 50):.2f}ms, "
+        f"p90 {percentile(totals, 90):.2f}ms, p95 {percentile(totals, 95):.2f}ms[/dim]"
+    )
+
+    if top > 0:
+        rule_stats = duration_stats(records, "rule_ms")[:top]
+        guide_stats = duration_stats(records, "guide_ms")[:top]
+        if rule_stats:
+            console.print()
+            console.print(_stats_table(f"Slowest {len(rule_stats)} Rules (by p95)", "Rule", rule_stats))
+        if guide_stats:
+            console.print()
+            console.print(_stats_table(f"Slowest {len(guide_stats)} Guides (by p95)", "Guide", guide_stats))
+
+    console.print()
+    if not regressions:
+        console.print(f"[green]✓ No regressions above {threshold:.0%}[/green]")
+        return
+
+    console.print(f"[bold red]Regressions[/bold red] (>{threshold:.0%} over the median of preceding runs)")
+    for r in regressions:
+        label = "total duration" if r.scope == "total" else f"rule {r.key}"
+        console.print(
+            f"  ⚠️ {r.timestamp} {label}: {r.baseline_ms:.2f}ms → {r.duration_ms:.2f}ms "
+            f"({r.increase:+.0%})"
+        )
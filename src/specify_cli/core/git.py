@@ -90,6 +90,69 @@ def is_git_repo(path: Path = None) -> bool:
         return False
 
 
+def get_head_commit(path: Path) -> Optional[str]:
+    """Return the commit SHA of HEAD for the repository containing path, or None."""
+    try:
+        result = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=path,
+            capture_output=True,
+            text=True,
+            timeout=10,
+        )
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip() or None
+
+
+def get_changed_files(path: Path, base_ref: str = "HEAD") -> Optional[set[str]]:
+    """Return files changed in the working tree since base_ref, or None if git fails.
+
+    Includes committed, staged and unstaged changes relative to base_ref plus
+    untracked (non-ignored) files. Paths are relative to path, using '/' separators.
+    """
+    commands = [
+        ["git", "diff", "--name-only", "-z", "--relative", base_ref, "--"],
+        ["git", "ls-files", "-z", "--others", "--exclude-standard"],
+    ]
+    changed: set[str] = set()
+    for cmd in commands:
+        try:
+            result = subprocess.run(cmd, cwd=path, capture_output=True, text=True, timeout=30)
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        # NUL-separated output is not quoted (core.quotePath)
+        changed.update(name for name in result.stdout.split("\0") if name)
+    return changed
+
+
+def list_project_files(path: Path) -> Optional[set[str]]:
+    """Return files in the working tree known to git, or None if git fails.
+
+    Includes tracked files that still exist plus untracked (non-ignored) files.
+    Paths are relative to path, using '/' separators.
+    """
+    commands = [
+        ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+        ["git", "ls-files", "-z", "--deleted"],
+    ]
+    listed: list[set[str]] = []
+    for cmd in commands:
+        try:
+            result = subprocess.run(cmd, cwd=path, capture_output=True, text=True, timeout=30)
+        except (FileNotFoundError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        listed.append({name for name in result.stdout.split("\0") if name})
+    files, deleted = listed
+    return files - deleted
+
+
 def init_git_repo(project_path: Path, quiet: bool = False) -> bool:
     """Initialize a git repository in the specified path.
     quiet: if True suppress console output (tracker handles status)
@@ -7,19 +7,386 @@ to optimize performance for large codebases.
 
 import os
 import hashlib
+import json
+import stat
+import threading
+import time
+from collections import OrderedDict
 from pathlib import Path
-from typing import List, Optional, Dict
+from typing import Any, Callable, List, Optional, Dict, Tuple
 from datetime import datetime, timedelta
 import logging
 
+from ..core.git import list_project_files
+
 logger = logging.getLogger(__name__)
 
 
+class DirectoryIndex:
+    """
+    Persisted directory-mtime index of files under a set of root directories.
+    
+    A directory's mtime changes whenever an entry is added, removed or
+    renamed in it, so only directories whose mtime changed since the last
+    refresh are re-scanned; unchanged directories reuse their stored listing.
+    Refresh cost is one stat per directory plus a scan per changed directory,
+    instead of a stat per file. Symlinked directories are not followed.
+    """
+    
+    INDEX_VERSION = 1
+    # Directories modified this recently may still change within the same
+    # mtime tick, so their listing is not trusted on the next refresh
+    RACY_WINDOW_NS = 2_000_000_000
+    
+    def __init__(
+        self,
+        project_root: Path,
+        index_file: Path,
+        roots: List[Path],
+        suffix: str = "",
+        key: str = ""
+    ):
+        """
+        Initialize directory index.
+        
+        Args:
+            project_root: Root that indexed paths are made relative to
+            index_file: File the index is persisted to
+            roots: Directories to index recursively
+            suffix: Only index files with this suffix (e.g. ".md"); "" for all
+            key: Extra value a persisted index must match to be reused
+                (e.g. a hash of the scan settings)
+        """
+        self.project_root = Path(project_root)
+        self.index_file = Path(index_file)
+        self.roots = [Path(root) for root in roots]
+        self.suffix = suffix
+        self.key = key
+        self.rescanned_dirs = 0
+        # Directory entries of the last refresh, keyed by relative directory
+        self.dirs: Dict[str, Dict[str, Any]] = {}
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load persisted directory entries."""
+        if not self.index_file.exists():
+            return {}
+        try:
+            data = json.loads(self.index_file.read_text())
+            if (
+                data.get("version") == self.INDEX_VERSION
+                and data.get("suffix") == self.suffix
+                and data.get("key", "") == self.key
+            ):
+                return data.get("dirs", {})
+        except Exception as e:
+            logger.warning(f"Error reading directory index: {e}")
+        return {}
+    
+    def _save(self, dirs: Dict[str, Dict[str, Any]]) -> None:
+        """Persist directory entries."""
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            data = {"version": self.INDEX_VERSION, "suffix": self.suffix, "key": self.key, "dirs": dirs}
+            tmp_file = self.index_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(data, separators=(",", ":")))
+            tmp_file.replace(self.index_file)
+        except Exception as e:
+            logger.warning(f"Error saving directory index: {e}")
+    
+    def _scan(self, dir_path: Path, mtime_ns: int) -> Dict[str, Any]:
+        """List one directory's matching files and subdirectories."""
+        files = []
+        subdirs = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.name)
+                elif entry.name.endswith(self.suffix) and entry.is_file():
+                    files.append(entry.name)
+        
+        self.rescanned_dirs += 1
+        racy = time.time_ns() - mtime_ns < self.RACY_WINDOW_NS
+        return {
+            "mtime_ns": None if racy else mtime_ns,
+            "files": sorted(files),
+            "subdirs": sorted(subdirs),
+        }
+    
+    def refresh(self) -> List[str]:
+        """
+        Bring the index up to date and persist it.
+        
+        Returns:
+            Sorted file paths relative to project root, using '/' separators
+        """
+        self.rescanned_dirs = 0
+        old_dirs = self._load()
+        new_dirs: Dict[str, Dict[str, Any]] = {}
+        files: List[str] = []
+        
+        stack = [root for root in reversed(self.roots)]
+        while stack:
+            dir_path = stack.pop()
+            try:
+                mtime_ns = dir_path.stat().st_mtime_ns
+            except OSError:
+                continue
+            
+            rel_dir = os.path.relpath(dir_path, self.project_root).replace(os.sep, "/")
+            entry = old_dirs.get(rel_dir)
+            if entry is None or entry.get("mtime_ns") != mtime_ns:
+                try:
+                    entry = self._scan(dir_path, mtime_ns)
+                except OSError as e:
+                    logger.debug(f"Cannot scan {dir_path}: {e}")
+                    continue
+            
+            new_dirs[rel_dir] = entry
+            prefix = "" if rel_dir == "." else rel_dir + "/"
+            files.extend(prefix + name for name in entry["files"])
+            stack.extend(dir_path / name for name in reversed(entry["subdirs"]))
+        
+        if new_dirs != old_dirs:
+            self._save(new_dirs)
+        self.dirs = new_dirs
+        
+        logger.debug(f"Directory index refreshed: {len(new_dirs)} dirs, {self.rescanned_dirs} rescanned")
+        return sorted(files)
+    
+    def clear(self) -> None:
+        """Delete the persisted index."""
+        try:
+            if self.index_file.exists():
+                self.index_file.unlink()
+        except Exception as e:
+            logger.warning(f"Error clearing directory index: {e}")
+
+
+class ProjectFileIndex(DirectoryIndex):
+    """
+    Persisted index of the files and directories of a whole project.
+    
+    The first build lists the project with `git ls-files` when it is in a
+    git repository, otherwise with one os.scandir walk that prunes ignored
+    directories. Later runs bring it up to date like any DirectoryIndex,
+    re-scanning only directories whose mtime changed. Ignored paths are
+    left out, as are directories that only hold ignored files when the
+    index came from git.
+    
+    Queries are answered from memory and return None for paths the index
+    cannot vouch for (inside ignored directories, symlinked directories,
+    or names missing from a git-derived listing); callers stat those
+    themselves. The index refreshes lazily on the first query after
+    creation or mark_stale(), so each compliance run pays for at most one
+    refresh.
+    """
+    
+    INDEX_FILE = Path(".specify/.cache/file_index.json")
+    
+    def __init__(
+        self,
+        project_root: Path,
+        is_ignored: Optional[Callable[[str, bool], bool]] = None,
+        ignore_key: str = "",
+        use_git: bool = True
+    ):
+        """
+        Initialize project file index.
+        
+        Args:
+            project_root: Root directory of project
+            is_ignored: Called with (relative path, is_dir); True leaves the
+                path out of the index
+            ignore_key: Digest of the ignore rules; a persisted index built
+                with different rules is rebuilt
+            use_git: Build a missing index from `git ls-files` when possible
+        """
+        project_root = Path(project_root)
+        super().__init__(project_root, project_root / self.INDEX_FILE, roots=[project_root], key=ignore_key)
+        self.is_ignored = is_ignored or (lambda rel_path, is_dir: False)
+        self.use_git = use_git
+        self.built_from_git = False
+        self._fresh = False
+        self._names: Dict[str, Tuple[frozenset, frozenset]] = {}
+        self._lock = threading.Lock()
+    
+    def _scan(self, dir_path: Path, mtime_ns: int) -> Dict[str, Any]:
+        """List one directory, leaving out ignored entries."""
+        rel_dir = os.path.relpath(dir_path, self.project_root).replace(os.sep, "/")
+        prefix = "" if rel_dir == "." else rel_dir + "/"
+        files = []
+        subdirs = []
+        other = []
+        with os.scandir(dir_path) as entries:
+            for entry in entries:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if self.is_ignored(prefix + entry.name, is_dir):
+                    continue
+                if is_dir:
+                    subdirs.append(entry.name)
+                elif entry.is_file():
+                    files.append(entry.name)
+                else:
+                    # Symlinked directories, broken links, sockets, ...
+                    other.append(entry.name)
+        
+        self.rescanned_dirs += 1
+        racy = time.time_ns() - mtime_ns < self.RACY_WINDOW_NS
+        return {
+            "mtime_ns": None if racy else mtime_ns,
+            "files": sorted(files),
+            "subdirs": sorted(subdirs),
+            "other": sorted(other),
+        }
+    
+    def _build_from_git(self) -> Optional[Dict[str, Dict[str, Any]]]:
+        """
+        Derive directory entries from the files git knows about.
+        
+        Returns:
+            Directory entries, or None if the project is not in a git repository
+        """
+        files = list_project_files(self.project_root)
+        if files is None:
+            return None
+        
+        dirs: Dict[str, Dict[str, Any]] = {".": {"files": [], "subdirs": []}}
+        ignored_dirs: Dict[str, bool] = {}
+        for rel_path in sorted(files):
+            parts = rel_path.split("/")
+            parent = "."
+            for depth, name in enumerate(parts[:-1]):
+                child = "/".join(parts[:depth + 1])
+                if child not in ignored_dirs:
+                    ignored_dirs[child] = ignored_dirs.get(parent, False) or self.is_ignored(child, True)
+                if ignored_dirs[child]:
+                    break
+                if child not in dirs:
+                    dirs[child] = {"files": [], "subdirs": []}
+                    dirs[parent]["subdirs"].append(name)
+                parent = child
+            else:
+                if not self.is_ignored(rel_path, False):
+                    dirs[parent]["files"].append(parts[-1])
+        
+        now_ns = time.time_ns()
+        for rel_dir, entry in dirs.items():
+            try:
+                mtime_ns: Optional[int] = (self.project_root / rel_dir).stat().st_mtime_ns
+            except OSError:
+                mtime_ns = None
+            racy = mtime_ns is None or now_ns - mtime_ns < self.RACY_WINDOW_NS
+            entry["mtime_ns"] = None if racy else mtime_ns
+            # git omits empty and wholly ignored directories, so a name
+            # missing from this listing may still exist
+            entry["partial"] = True
+        
+        logger.debug(f"Built file index from git: {len(files)} files in {len(dirs)} directories")
+        return dirs
+    
+    def refresh(self) -> List[str]:
+        """
+        Bring the index up to date and persist it.
+        
+        Returns:
+            Sorted file paths relative to project root, using '/' separators
+        """
+        if self.use_git and not self.index_file.exists():
+            dirs = self._build_from_git()
+            if dirs is not None:
+                self._save(dirs)
+                self.built_from_git = True
+        files = super().refresh()
+        self._names.clear()
+        return files
+    
+    def mark_stale(self) -> None:
+        """Refresh the index again on the next query."""
+        with self._lock:
+            self._fresh = False
+    
+    def _entry(self, rel_dir: str) -> Optional[Dict[str, Any]]:
+        """Get a directory's entry, refreshing the index on first use."""
+        with self._lock:
+            if not self._fresh:
+                self.refresh()
+                self._fresh = True
+            return self.dirs.get(rel_dir or ".")
+    
+    def _name_sets(self, rel_dir: str, entry: Dict[str, Any]) -> Tuple[frozenset, frozenset]:
+        """Get (file names, subdirectory names) of a directory as sets."""
+        names = self._names.get(rel_dir)
+        if names is None:
+            names = (frozenset(entry["files"]) | frozenset(entry.get("other", ())), frozenset(entry["subdirs"]))
+            self._names[rel_dir] = names
+        return names
+    
+    @staticmethod
+    def _normalize(rel_path: str) -> Optional[str]:
+        """Normalize a relative path, or None if it leaves the project."""
+        path = Path(rel_path)
+        if path.is_absolute() or ".." in path.parts:
+            return None
+        normalized = path.as_posix()
+        return "" if normalized == "." else normalized
+    
+    def exists(self, rel_path: str) -> Optional[bool]:
+        """
+        Check whether a path exists.
+        
+        Args:
+            rel_path: Path relative to project root
+        
+        Returns:
+            True or False, or None if the index does not cover the path
+        """
+        rel_path = self._normalize(rel_path)
+        if rel_path is None:
+            return None
+        if not rel_path:
+            return True
+        
+        parent, _, name = rel_path.rpartition("/")
+        entry = self._entry(parent)
+        if entry is None:
+            # Inside a directory the index knows is missing
+            return False if parent and self.exists(parent) is False else None
+        
+        files, subdirs = self._name_sets(parent or ".", entry)
+        if name in subdirs or name in entry["files"]:
+            return True
+        if name in files or entry.get("partial"):
+            return None
+        if self.is_ignored(rel_path, True) or self.is_ignored(rel_path, False):
+            return None
+        return False
+    
+    def list_dir(self, rel_dir: str) -> Optional[Tuple[Tuple[str, bool], ...]]:
+        """
+        List an indexed directory.
+        
+        Args:
+            rel_dir: '/'-separated directory relative to project root ('' for the root)
+        
+        Returns:
+            Sorted (name, is_dir) entries, or None if the directory is not indexed
+        """
+        rel_dir = self._normalize(rel_dir)
+        entry = self._entry(rel_dir) if rel_dir is not None else None
+        if entry is None:
+            return None
+        names = [(name, False) for name in entry["files"]]
+        names.extend((name, False) for name in entry.get("other", ()))
+        names.extend((name, True) for name in entry["subdirs"])
+        return tuple(sorted(names))
+
+
 class GuideCacheManager:
     """Manages caching of guide discovery results."""
     
     CACHE_DIR = Path(".specify/.cache")
     CACHE_FILE = CACHE_DIR / "guides_cache.txt"
+    INDEX_FILE = CACHE_DIR / "guides_dir_index.json"
     CACHE_EXPIRY_SECONDS = 3600  # 1 hour
     
     def __init__(self, project_root: Optional[Path] = None):
@@ -32,30 +399,33 @@ class GuideCacheManager:
         self.project_root = Path(project_root) if project_root else Path(".")
         self.cache_dir = self.project_root / self.CACHE_DIR
         self.cache_file = self.project_root / self.CACHE_FILE
+        self.dir_index = DirectoryIndex(
+            self.project_root,
+            self.project_root / self.INDEX_FILE,
+            # Key directories that might contain guides
+            roots=[
+                self.project_root / "specs",
+                self.project_root / "context" / "references",
+            ],
+            suffix=".md",
+        )
     
     def _get_project_hash(self) -> str:
         """
         Generate hash of project structure for cache validation.
         
+        The hash covers the set of markdown files under the guide
+        directories. It is computed from the persisted directory index, so
+        only directories whose mtime changed are re-scanned. Editing a
+        guide's content does not change the discovered guide list and does
+        not invalidate the cache.
+        
         Returns:
             Hash of project state
         """
-        # Hash based on key directories that might contain guides
-        dirs_to_hash = [
-            self.project_root / "specs",
-            self.project_root / "context" / "references",
-        ]
-        
         hash_obj = hashlib.md5()
-        for dir_path in dirs_to_hash:
-            if dir_path.exists():
-                # Hash the list of markdown files
-                md_files = sorted(dir_path.glob("**/*.md"))
-                for md_file in md_files:
-                    # Use relative path and modification time
-                    rel_path = md_file.relative_to(self.project_root)
-                    mtime = md_file.stat().st_mtime
-                    hash_obj.update(f"{rel_path}:{mtime}".encode())
+        for rel_path in self.dir_index.refresh():
+            hash_obj.update(f"{rel_path}\n".encode())
         
         return hash_obj.hexdigest()
     
@@ -152,6 +522,7 @@ class GuideCacheManager:
                 logger.debug("Cache cleared")
         except Exception as e:
             logger.warning(f"Error clearing cache: {e}")
+        self.dir_index.clear()
     
     @staticmethod
     def get_global_cache_dir() -> Path:
@@ -165,55 +536,477 @@ class GuideCacheManager:
 
 
 class RuleEvaluationCache:
-    """Caches rule evaluation results."""
+    """
+    Caches rule evaluation results on disk.
+    
+    Entries are keyed by a hash of the rule definition plus the rule's target
+    path, and store a fingerprint of the target (mtime, size and content
+    hash). A cached result is reused only while the target is unchanged:
+    an mtime/size match is trusted directly, otherwise the content hash is
+    compared so touched-but-identical files still hit. The cache is bounded
+    and evicts least recently used entries.
+    """
     
     CACHE_DIR = Path(".specify/.cache")
-    CACHE_FILE = CACHE_DIR / "rule_cache.txt"
+    CACHE_FILE = CACHE_DIR / "rule_cache.json"
     CACHE_EXPIRY_SECONDS = 1800  # 30 minutes
+    MAX_ENTRIES = 5000
+    CACHE_VERSION = 1
     
-    def __init__(self, project_root: Optional[Path] = None):
+    def __init__(self, project_root: Optional[Path] = None, max_entries: Optional[int] = None):
         """
         Initialize rule cache.
         
         Args:
             project_root: Root directory of project
+            max_entries: Maximum number of cached results (defaults to MAX_ENTRIES)
         """
         self.project_root = Path(project_root) if project_root else Path(".")
         self.cache_dir = self.project_root / self.CACHE_DIR
         self.cache_file = self.project_root / self.CACHE_FILE
+        self.max_entries = max_entries or self.MAX_ENTRIES
+        self._entries: Optional[OrderedDict] = None
+        self._content_hashes: Dict[tuple, str] = {}
+        self._dirty = False
+        self._lock = threading.RLock()
+    
+    @staticmethod
+    def hash_rule(rule_data: Dict[str, Any]) -> str:
+        """
+        Hash a rule definition.
+        
+        Args:
+            rule_data: Rule definition from guide
+        
+        Returns:
+            Stable hex digest of the definition
+        """
+        canonical = json.dumps(rule_data, sort_keys=True, default=str)
+        return hashlib.sha256(canonical.encode()).hexdigest()
+    
+    def _load(self) -> OrderedDict:
+        """Load cache entries from disk on first use."""
+        if self._entries is not None:
+            return self._entries
+        
+        self._entries = OrderedDict()
+        if not self.cache_file.exists():
+            return self._entries
+        
+        try:
+            data = json.loads(self.cache_file.read_text())
+            if data.get("version") == self.CACHE_VERSION:
+                self._entries.update(data.get("entries", {}))
+                logger.debug(f"Loaded {len(self._entries)} cached rule results")
+        except Exception as e:
+            logger.warning(f"Error reading rule cache: {e}")
+        
+        return self._entries
+    
+    def _content_hash(self, path: Path, stat_result: os.stat_result) -> str:
+        """Hash file content, memoized per (path, mtime, size)."""
+        memo_key = (str(path), stat_result.st_mtime_ns, stat_result.st_size)
+        digest = self._content_hashes.get(memo_key)
+        if digest is None:
+            hash_obj = hashlib.sha256()
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    hash_obj.update(chunk)
+            digest = hash_obj.hexdigest()
+            self._content_hashes[memo_key] = digest
+        return digest
+    
+    def _fingerprint(self, target: str) -> Dict[str, Any]:
+        """
+        Fingerprint an evaluation target.
+        
+        Args:
+            target: Target path relative to project root
+        
+        Returns:
+            Fingerprint dict describing the target's current state
+        """
+        path = self.project_root / target
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return {"state": "missing"}
+        
+        if not stat.S_ISREG(stat_result.st_mode):
+            return {"state": "other"}
+        
+        return {
+            "state": "file",
+            "mtime_ns": stat_result.st_mtime_ns,
+            "size": stat_result.st_size,
+            "sha256": self._content_hash(path, stat_result),
+        }
+    
+    def _is_fresh(self, target: str, fingerprint: Dict[str, Any]) -> bool:
+        """Check a stored fingerprint against the target's current state."""
+        path = self.project_root / target
+        try:
+            stat_result = path.stat()
+        except OSError:
+            return fingerprint.get("state") == "missing"
+        
+        if not stat.S_ISREG(stat_result.st_mode):
+            return fingerprint.get("state") == "other"
+        
+        if fingerprint.get("state") != "file" or fingerprint.get("size") != stat_result.st_size:
+            return False
+        
+        if fingerprint.get("mtime_ns") == stat_result.st_mtime_ns:
+            return True
+        
+        # Touched but possibly unchanged: fall back to comparing content
+        if self._content_hash(path, stat_result) != fingerprint.get("sha256"):
+            return False
+        fingerprint["mtime_ns"] = stat_result.st_mtime_ns
+        self._dirty = True
+        return True
     
-    def get_cached_result(self, rule_id: str, target: str) -> Optional[Dict]:
+    @staticmethod
+    def _make_key(rule_id: str, target: str, rule_hash: str) -> str:
+        """Build the cache key for a rule/target pair."""
+        return f"{rule_hash or rule_id}:{target}"
+    
+    def get_cached_result(self, rule_id: str, target: str, rule_hash: str = "") -> Optional[Dict]:
         """
         Get cached evaluation result.
         
         Args:
             rule_id: Rule identifier
             target: Evaluation target (e.g., file path)
+            rule_hash: Hash of the full rule definition (see hash_rule)
         
         Returns:
-            Cached result dict or None
+            Cached result dict or None if missing, expired or stale
         """
-        # Placeholder for rule caching
-        # Can be implemented if needed for performance
-        return None
+        key = self._make_key(rule_id, target, rule_hash)
+        with self._lock:
+            entries = self._load()
+            entry = entries.get(key)
+            if entry is None:
+                return None
+            
+            age_seconds = time.time() - entry.get("cached_at", 0)
+            if age_seconds > self.CACHE_EXPIRY_SECONDS or not self._is_fresh(target, entry.get("fingerprint", {})):
+                logger.debug(f"Cached result for {rule_id} is stale")
+                del entries[key]
+                self._dirty = True
+                return None
+            
+            entries.move_to_end(key)
+            entry["cached_at"] = time.time()
+            self._dirty = True
+            logger.debug(f"Rule cache hit: {rule_id} ({target})")
+            return dict(entry["result"])
     
-    def cache_result(self, rule_id: str, target: str, result: Dict) -> None:
+    def cache_result(self, rule_id: str, target: str, result: Dict, rule_hash: str = "") -> None:
         """
         Cache evaluation result.
         
         Args:
             rule_id: Rule identifier
             target: Evaluation target
-            result: Result to cache
+            result: Result to cache (must be JSON serializable)
+            rule_hash: Hash of the full rule definition (see hash_rule)
         """
-        # Placeholder for rule caching
-        pass
+        key = self._make_key(rule_id, target, rule_hash)
+        try:
+            fingerprint = self._fingerprint(target)
+        except OSError as e:
+            logger.debug(f"Not caching {rule_id}: cannot fingerprint {target}: {e}")
+            return
+        
+        with self._lock:
+            entries = self._load()
+            entries[key] = {
+                "rule_id": rule_id,
+                "target": target,
+                "fingerprint": fingerprint,
+                "result": dict(result),
+                "cached_at": time.time(),
+            }
+            entries.move_to_end(key)
+            while len(entries) > self.max_entries:
+                entries.popitem(last=False)
+            self._dirty = True
+    
+    def save(self) -> None:
+        """Persist cache entries to disk if anything changed."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                data = {"version": self.CACHE_VERSION, "entries": self._entries}
+                tmp_file = self.cache_file.with_suffix(".tmp")
+                tmp_file.write_text(json.dumps(data, separators=(",", ":")))
+                tmp_file.replace(self.cache_file)
+                self._dirty = False
+                logger.debug(f"Saved {len(self._entries)} cached rule results")
+            except Exception as e:
+                logger.warning(f"Error saving rule cache: {e}")
     
     def clear_cache(self) -> None:
         """Clear the cache."""
+        with self._lock:
+            self._entries = None
+            self._content_hashes.clear()
+            self._dirty = False
         try:
             if self.cache_file.exists():
                 self.cache_file.unlink()
                 logger.debug("Rule cache cleared")
         except Exception as e:
             logger.warning(f"Error clearing rule cache: {e}")
+
+
+class ComplianceRunStore:
+    """
+    Stores the results of the last compliance run.
+    
+    Used by incremental checking: the record holds the commit the run was
+    made against, the files that were dirty at the time, and every result,
+    so a later run can reuse results for rules untouched by the change set.
+    """
+    
+    CACHE_DIR = Path(".specify/.cache")
+    CACHE_FILE = CACHE_DIR / "last_run.json"
+    CACHE_VERSION = 1
+    
+    def __init__(self, project_root: Optional[Path] = None):
+        """
+        Initialize run store.
+        
+        Args:
+            project_root: Root directory of project
+        """
+        self.project_root = Path(project_root) if project_root else Path(".")
+        self.cache_dir = self.project_root / self.CACHE_DIR
+        self.cache_file = self.project_root / self.CACHE_FILE
+    
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Load the last run record.
+        
+        Returns:
+            Dict with 'commit', 'dirty_files' and 'results' keys, or None
+        """
+        if not self.cache_file.exists():
+            logger.debug("No previous compliance run recorded")
+            return None
+        
+        try:
+            data = json.loads(self.cache_file.read_text())
+        except Exception as e:
+            logger.warning(f"Error reading last run record: {e}")
+            return None
+        
+        if data.get("version") != self.CACHE_VERSION:
+            return None
+        return data
+    
+    def save(
+        self,
+        results: List[Dict[str, Any]],
+        commit: Optional[str],
+        dirty_files: Optional[List[str]] = None
+    ) -> None:
+        """
+        Record a completed run.
+        
+        Args:
+            results: Result dictionaries (RuleEvaluationResult.to_dict())
+            commit: Commit SHA the run was made against
+            dirty_files: Files with uncommitted changes at run time
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            data = {
+                "version": self.CACHE_VERSION,
+                "commit": commit,
+                "dirty_files": sorted(dirty_files or []),
+                "results": results,
+            }
+            tmp_file = self.cache_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(data, separators=(",", ":")))
+            tmp_file.replace(self.cache_file)
+            logger.debug(f"Recorded {len(results)} results for commit {commit}")
+        except Exception as e:
+            logger.warning(f"Error saving last run record: {e}")
+    
+    def clear_cache(self) -> None:
+        """Clear the stored run."""
+        try:
+            if self.cache_file.exists():
+                self.cache_file.unlink()
+                logger.debug("Last run record cleared")
+        except Exception as e:
+            logger.warning(f"Error clearing last run record: {e}")
+
+
+class GuideParseCache:
+    """
+    Caches validated rules extracted from guide files.
+    
+    Entries are keyed by guide path and store the guide's mtime, size and
+    a hash of its frontmatter block. An mtime/size match returns the cached
+    rules without reading the guide; otherwise the frontmatter hash is
+    compared, so touched guides and body-only edits still skip YAML parsing
+    and rule validation. Entries also record the validator that produced
+    them and miss once it changes.
+    """
+    
+    CACHE_DIR = Path(".specify/.cache")
+    CACHE_FILE = CACHE_DIR / "parsed_rules.json"
+    CACHE_VERSION = 2
+    
+    def __init__(self, project_root: Optional[Path] = None):
+        """
+        Initialize guide parse cache.
+        
+        Args:
+            project_root: Root directory of project
+        """
+        self.project_root = Path(project_root) if project_root else Path(".")
+        self.cache_dir = self.project_root / self.CACHE_DIR
+        self.cache_file = self.project_root / self.CACHE_FILE
+        self.hits = 0
+        self.misses = 0
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._lock = threading.RLock()
+    
+    @staticmethod
+    def hash_content(content: str) -> str:
+        """Hash guide frontmatter content."""
+        return hashlib.sha256(content.encode()).hexdigest()
+    
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Load cache entries from disk on first use."""
+        if self._entries is not None:
+            return self._entries
+        
+        self._entries = {}
+        if not self.cache_file.exists():
+            return self._entries
+        
+        try:
+            data = json.loads(self.cache_file.read_text())
+            if data.get("version") == self.CACHE_VERSION:
+                self._entries = data.get("entries", {})
+                logger.debug(f"Loaded parsed rules for {len(self._entries)} guides")
+        except Exception as e:
+            logger.warning(f"Error reading guide parse cache: {e}")
+        
+        return self._entries
+    
+    @staticmethod
+    def _key(guide_file: Path) -> str:
+        """Build the cache key for a guide."""
+        return str(guide_file.absolute())
+    
+    def get_rules(
+        self,
+        guide_file: Path,
+        stat_result: os.stat_result,
+        content: Optional[str] = None,
+        validator: str = ""
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Get cached rules for a guide.
+        
+        Args:
+            guide_file: Path to guide file
+            stat_result: Current stat of the guide
+            content: Guide frontmatter text; when given, a hash match is
+                accepted even if mtime or size changed
+            validator: Fingerprint of the validation the rules must have passed
+                (see RuleParser.validator_fingerprint)
+        
+        Returns:
+            List of validated rule dicts, or None on a miss
+        """
+        with self._lock:
+            entry = self._load().get(self._key(guide_file))
+            if entry is None or entry.get("validator", "") != validator:
+                return None
+            
+            if entry["mtime_ns"] != stat_result.st_mtime_ns or entry["size"] != stat_result.st_size:
+                if content is None or entry["sha256"] != self.hash_content(content):
+                    return None
+                entry["mtime_ns"] = stat_result.st_mtime_ns
+                entry["size"] = stat_result.st_size
+                self._dirty = True
+            
+            self.hits += 1
+            return [dict(rule) for rule in entry["rules"]]
+    
+    def put_rules(
+        self,
+        guide_file: Path,
+        stat_result: os.stat_result,
+        content: str,
+        rules: List[Dict[str, Any]],
+        validator: str = ""
+    ) -> None:
+        """
+        Cache validated rules for a guide.
+        
+        Rules that do not survive a JSON round trip (e.g. YAML dates or sets)
+        are not cached, so a hit always returns exactly what parsing would.
+        
+        Args:
+            guide_file: Path to guide file
+            stat_result: Stat of the guide taken before it was read
+            content: Frontmatter text the rules were parsed from
+            rules: Validated rule dicts
+            validator: Fingerprint of the validation the rules passed
+        """
+        try:
+            if json.loads(json.dumps(rules)) != rules:
+                return
+        except (TypeError, ValueError):
+            return
+        
+        with self._lock:
+            self.misses += 1
+            self._load()[self._key(guide_file)] = {
+                "mtime_ns": stat_result.st_mtime_ns,
+                "size": stat_result.st_size,
+                "sha256": self.hash_content(content),
+                "validator": validator,
+                "rules": rules,
+            }
+            self._dirty = True
+    
+    def save(self) -> None:
+        """Persist cache entries to disk if anything changed."""
+        with self._lock:
+            if not self._dirty or self._entries is None:
+                return
+            try:
+                self.cache_dir.mkdir(parents=True, exist_ok=True)
+                data = {"version": self.CACHE_VERSION, "entries": self._entries}
+                tmp_file = self.cache_file.with_suffix(".tmp")
+                tmp_file.write_text(json.dumps(data, separators=(",", ":")))
+                tmp_file.replace(self.cache_file)
+                self._dirty = False
+                logger.debug(f"Saved parsed rules for {len(self._entries)} guides")
+            except Exception as e:
+                logger.warning(f"Error saving guide parse cache: {e}")
+    
+    def clear_cache(self) -> None:
+        """Clear the cache."""
+        with self._lock:
+            self._entries = None
+            self._dirty = False
+        try:
+            if self.cache_file.exists():
+                self.cache_file.unlink()
+                logger.debug("Guide parse cache cleared")
+        except Exception as e:
+            logger.warning(f"Error clearing guide parse cache: {e}")
@@ -8,18 +8,25 @@ compliance reports with cross-referencing to waivers.
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, Iterator, List, Mapping, Optional, Any, Set, Tuple
 from enum import Enum
 import logging
+import time
 
 logger = logging.getLogger(__name__)
 
 from .waiver import WaiverManager, Waiver
-from .rules.engine import RuleEngine
+from .rules.engine import RuleEngine, RuleFactory, evaluate_rules_in_processes
 from .rules.parser import RuleParser
-from .rules import BaseRule
+from .rules import BaseRule, FileContentStore
+from .rules.dependencies import dependency_order, rule_dependencies, skipped_evaluation
+from .rules.globbing import glob_matches, is_glob
 from .metrics import get_metrics_collector
-from .caching import GuideCacheManager
+from .metrics_history import MetricsHistoryStore
+from .caching import GuideCacheManager, GuideParseCache, RuleEvaluationCache, ComplianceRunStore, ProjectFileIndex
+from .discovery import GuideDiscovery
+from .pipeline import pipeline_stage
+from ..core.git import get_changed_files, get_head_commit, list_project_files
 
 
 class RuleStatus(str, Enum):
@@ -43,6 +50,8 @@ class RuleEvaluationResult:
     division: Optional[str] = None
     waiver_id: Optional[str] = None
     timestamp: str = field(default_factory=lambda: datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"))
+    path: Optional[str] = None  # file or directory the rule checked, relative to project root (None for globs)
+    guide_path: Optional[str] = None  # guide file relative to project root (guide_id is only its stem)
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert result to dictionary."""
@@ -55,9 +64,28 @@ class RuleEvaluationResult:
             "guide_id": self.guide_id,
             "division": self.division,
             "waiver_id": self.waiver_id,
-            "timestamp": self.timestamp
+            "timestamp": self.timestamp,
+            "path": self.path,
+            "guide_path": self.guide_path
         }
     
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'RuleEvaluationResult':
+        """Create result from dictionary produced by to_dict()."""
+        return cls(
+            rule_id=data["rule_id"],
+            rule_type=data["rule_type"],
+            status=RuleStatus(data["status"]),
+            message=data["message"],
+            target=data["target"],
+            guide_id=data["guide_id"],
+            division=data.get("division"),
+            waiver_id=data.get("waiver_id"),
+            timestamp=data["timestamp"],
+            path=data.get("path"),
+            guide_path=data.get("guide_path")
+        )
+    
     def status_emoji(self) -> str:
         """Get emoji for status."""
         status_emojis = {
@@ -69,6 +97,77 @@ class RuleEvaluationResult:
         return status_emojis.get(self.status, "❓")
 
 
+class ResultAggregate:
+    """
+    Compliance results bucketed by status in a single pass.
+    
+    Reports and summaries read counts and per-status lists from here
+    instead of re-filtering the full result list for every section.
+    Results can be added one at a time (e.g. from an on_result callback).
+    """
+    
+    def __init__(self, results: Iterable[RuleEvaluationResult] = ()):
+        """
+        Initialize aggregate.
+        
+        Args:
+            results: Initial results
+        """
+        self.by_status: Dict[RuleStatus, List[RuleEvaluationResult]] = {status: [] for status in RuleStatus}
+        self.waiver_ids: Set[str] = set()
+        # Guides with at least one evaluated rule (or a missing-guide error)
+        self.checked_guide_ids: Set[str] = set()
+        self.total = 0
+        self._sorted: Dict[RuleStatus, List[RuleEvaluationResult]] = {}
+        for result in results:
+            self.add(result)
+    
+    def add(self, result: RuleEvaluationResult) -> None:
+        """Add one result to the buckets and counts."""
+        self.total += 1
+        self.by_status[result.status].append(result)
+        if result.status == RuleStatus.WAIVED and result.waiver_id:
+            self.waiver_ids.add(result.waiver_id)
+        if result.status != RuleStatus.ERROR or result.rule_type == "discovery":
+            self.checked_guide_ids.add(result.guide_id)
+        self._sorted.pop(result.status, None)
+    
+    def count(self, status: RuleStatus) -> int:
+        """Get the number of results with a status."""
+        return len(self.by_status[status])
+    
+    @property
+    def pass_count(self) -> int:
+        """Number of passed rules."""
+        return self.count(RuleStatus.PASS)
+    
+    @property
+    def fail_count(self) -> int:
+        """Number of failed rules."""
+        return self.count(RuleStatus.FAIL)
+    
+    @property
+    def waived_count(self) -> int:
+        """Number of waived rules."""
+        return self.count(RuleStatus.WAIVED)
+    
+    @property
+    def error_count(self) -> int:
+        """Number of errored rules."""
+        return self.count(RuleStatus.ERROR)
+    
+    def sorted_by_rule(self, status: RuleStatus) -> List[RuleEvaluationResult]:
+        """
+        Get results with a status sorted by rule ID.
+        
+        The sorted view is computed once and reused until another result
+        with that status is added.
+        """
+        if status not in self._sorted:
+            self._sorted[status] = sorted(self.by_status[status], key=lambda r: r.rule_id)
+        return self._sorted[status]
+
+
 class ComplianceChecker:
     """
     Checks code compliance against rules defined in guides.
@@ -76,30 +175,110 @@ class ComplianceChecker:
     Evaluates rules, cross-references waivers, and produces aggregated results.
     """
     
-    def __init__(self, project_root: Optional[Path] = None, use_cache: bool = True):
+    # Guides buffered between pipeline stages
+    PIPELINE_QUEUE_SIZE = 8
+    
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        use_cache: bool = True,
+        ignore_patterns: Optional[Iterable[str]] = None,
+        processes: int = 1
+    ):
         """
         Initialize ComplianceChecker.
         
         Args:
             project_root: Root directory of project (defaults to current directory)
-            use_cache: Whether to use guide caching (default: True)
+            use_cache: Whether to use guide and rule result caching and the
+                persisted project file index (default: True)
+            ignore_patterns: .gitignore-style patterns excluded from guide discovery
+                (defaults to DEFAULT_IGNORE_PATTERNS plus the project's .gitignore)
+            processes: Worker processes for rule evaluation (1 = evaluate
+                in-process, 0 = one per CPU)
+        
+        Raises:
+            ValueError: If processes is negative
         """
+        if processes < 0:
+            raise ValueError(f"processes must be 0 or more, got {processes}")
+        
         self.project_root = Path(project_root) if project_root else Path(".")
         self.rule_engine = RuleEngine(str(self.project_root))
         self.rule_parser = RuleParser()
         self.waiver_manager = WaiverManager(project_root=self.project_root)
         self.cache_manager = GuideCacheManager(project_root=self.project_root)
+        self.discovery = GuideDiscovery(self.project_root, ignore_patterns=ignore_patterns)
+        self.rule_cache = RuleEvaluationCache(project_root=self.project_root) if use_cache else None
+        self.parse_cache = GuideParseCache(project_root=self.project_root) if use_cache else None
+        self.file_index = ProjectFileIndex(
+            self.project_root,
+            is_ignored=self.discovery.is_ignored,
+            ignore_key=self.discovery.ignore_key
+        ) if use_cache else None
+        self.run_store = ComplianceRunStore(project_root=self.project_root)
+        self.metrics_history = MetricsHistoryStore(project_root=self.project_root)
         self.use_cache = use_cache
+        self.processes = processes
     
     def run_compliance_check(
         self,
-        guides: Optional[List[Path]] = None
+        guides: Optional[List[Path]] = None,
+        incremental: bool = False,
+        base_ref: Optional[str] = None,
+        on_result: Optional[Callable[[RuleEvaluationResult], None]] = None,
+        changed_files: Optional[Set[str]] = None,
+        previous_results: Optional[Iterable[RuleEvaluationResult]] = None,
+        record: bool = True
     ) -> List[RuleEvaluationResult]:
         """
         Run compliance check against provided guides.
         
+        In incremental mode, git is asked which files changed since base_ref
+        (or since the commit of the last recorded run). Only rules whose
+        target or source guide is in that change set are re-evaluated; all
+        other results are taken from the last recorded run. Falls back to a
+        full check when there is no usable previous run or git is unavailable.
+        
+        Passing changed_files and previous_results instead re-evaluates only
+        rules affected by the given paths and reuses previous_results for
+        the rest, without consulting git (used by watch mode).
+        
+        Discovery, frontmatter parsing and rule evaluation run as pipeline
+        stages connected by bounded queues, so the next guide is parsed
+        while the current one is evaluated. Results keep guide order. Busy
+        time per stage, parse time per guide, evaluation time per rule and
+        waiver lookup time are recorded in the current check's metrics,
+        which are appended to the persistent metrics history when caching
+        is enabled.
+        
+        With processes != 1, rules without a cached result are collected and
+        evaluated on a process pool after parsing, chunked by target file;
+        their results are slotted back into guide order.
+        
+        Rules with depends_on are visited after the rules they depend on and
+        are skipped, reported as failed, when one of those did not pass. A
+        rule is re-evaluated whenever one of its dependencies is. Dependents
+        of rules sent to the process pool are evaluated in-process once the
+        pool finishes.
+        
+        on_result is called with each result, in the order of the returned
+        list, as soon as it and every result before it are final (after each
+        guide, or once the process pool finishes for pooled rules). Use it to
+        stream results to a writer while the check runs.
+        
         Args:
-            guides: List of guide files to check (discovers from plan.md if None)
+            guides: List of guide files to check (discovered lazily if None, so
+                evaluation starts before discovery finishes)
+            incremental: Re-evaluate only rules affected by changed files
+            base_ref: Git ref to diff against in incremental mode
+            on_result: Called with each result once it is final
+            changed_files: Paths changed since previous_results, relative to
+                project root
+            previous_results: Results of an earlier run to reuse for rules
+                unaffected by changed_files
+            record: Save caches, the run record and metrics history; when
+                False, call save_caches() later to persist warm caches
         
         Returns:
             List of rule evaluation results
@@ -111,85 +290,473 @@ class ComplianceChecker:
         
         results = []
         
-        # If no guides provided, discover them
+        collector = get_metrics_collector()
+        
+        # If no guides provided, discover them as the check proceeds
         if guides is None:
             logger.debug("Discovering guides from project")
-            guides = self._discover_guides()
-            logger.info(f"Discovered {len(guides)} guides")
+            guides_iter = pipeline_stage(
+                self.iter_guides(),
+                name="discovery",
+                maxsize=self.PIPELINE_QUEUE_SIZE,
+                on_busy_time=collector.record_stage_time
+            )
         else:
             logger.debug(f"Using {len(guides)} provided guides")
-        
-        metrics.guides_count = len(guides)
+            guides_iter = iter(guides)
+        parsed_guides = pipeline_stage(
+            guides_iter,
+            self._parse_guide,
+            name="parse",
+            maxsize=self.PIPELINE_QUEUE_SIZE,
+            on_busy_time=collector.record_stage_time
+        )
+        guides_count = 0
         
         # Load existing waivers
         logger.debug("Loading waivers")
-        waivers = self.waiver_manager.list_waivers()
-        waiver_map = self._build_waiver_map(waivers)
-        logger.debug(f"Loaded {len(waiver_map)} waivers")
-        
-        # Extract and evaluate rules from each guide
-        for guide_path in guides:
-            if not guide_path.exists():
-                logger.warning(f"Guide file not found: {guide_path}")
-                results.append(
-                    RuleEvaluationResult(
-                        rule_id="discovery-error",
-                        rule_type="discovery",
-                        status=RuleStatus.ERROR,
-                        message=f"Guide file not found: {guide_path}",
-                        target=str(guide_path),
-                        guide_id=guide_path.stem
-                    )
-                )
-                continue
-            
-            logger.debug(f"Processing guide: {guide_path}")
-            # Extract rules from guide
-            try:
-                rules_data = self.rule_parser.extract_rules(guide_path)
-                guide_id = self._extract_guide_id(guide_path)
-                logger.debug(f"Extracted {len(rules_data)} rules from {guide_id}")
+        started = time.perf_counter()
+        waiver_map = self.waiver_manager.get_rule_waiver_map()
+        collector.record_waiver_lookup(time.perf_counter() - started)
+        logger.debug(f"Loaded waivers for {len(waiver_map)} rules")
+        
+        # All rules in this run share one content store, backed by the
+        # project file index (refreshed on the first query of this run)
+        if self.file_index is not None:
+            self.file_index.mark_stale()
+        file_store = FileContentStore(self.project_root, file_index=self.file_index)
+        # Rules declared identically by several guides are built once
+        rule_factory = RuleFactory(self.rule_engine.create_rule)
+        
+        changed: Optional[Set[str]] = None
+        reusable: Dict[Tuple[str, str], RuleEvaluationResult] = {}
+        # Whether changes to a path show up in the change set
+        observed: Optional[Callable[[str], bool]] = None
+        if changed_files is not None and previous_results is not None:
+            changed, reusable = self._reusable_results(changed_files, previous_results)
+            observed = self._is_watched
+        elif incremental:
+            changed, reusable = self._load_incremental_state(base_ref)
+            if changed is not None:
+                observed = self._git_observed()
+                if observed is None:
+                    logger.warning("Could not list project files, running full check")
+                    changed, reusable = None, {}
+        reused_count = 0
+        # Rules deferred to the process pool: (result index, rule, guide, target, hash)
+        pending: List[Tuple[int, Dict[str, Any], str, str, str]] = []
+        # Rules whose dependencies are in the pool: (result index, rule, guide, dependency result indexes)
+        deferred: List[Tuple[int, Dict[str, Any], str, Dict[str, List[int]]]] = []
+        # Guide of each result, relative to project root (parallel to results)
+        result_guides: List[str] = []
+        emitted = 0
+        
+        def emit_ready() -> None:
+            """Pass on results up to the first one still awaiting the pool."""
+            nonlocal emitted
+            while emitted < len(results) and results[emitted] is not None:
+                results[emitted].guide_path = result_guides[emitted]
+                if on_result is not None:
+                    on_result(results[emitted])
+                emitted += 1
+        
+        # Evaluate rules from each guide as its parse result arrives
+        try:
+            for guide_path, rules_data, error_result in parsed_guides:
+                guides_count += 1
+                guide_key = self._relative_path(guide_path)
+                if error_result is not None:
+                    results.append(error_result)
+                    result_guides.append(guide_key)
+                    emit_ready()
+                    continue
                 
-                for rule_data in rules_data:
-                    result = self._evaluate_rule(
-                        rule_data,
-                        guide_id,
-                        waiver_map
-                    )
-                    results.append(result)
-                    logger.debug(f"Rule {result.rule_id}: {result.status.value}")
-            
-            except Exception as e:
-                logger.error(f"Failed to parse guide {guide_path}: {str(e)}")
-                results.append(
-                    RuleEvaluationResult(
-                        rule_id="parse-error",
-                        rule_type="parsing",
-                        status=RuleStatus.ERROR,
-                        message=f"Failed to parse guide: {str(e)}",
-                        target=str(guide_path),
-                        guide_id=guide_path.stem
+                started = time.perf_counter()
+                guide_start = len(results)
+                try:
+                    guide_id = self._extract_guide_id(guide_path)
+                    guide_changed = changed is not None and guide_key in changed
+                    
+                    # Results keep guide order; rules are visited dependencies first
+                    order = dependency_order(rules_data)
+                    results.extend([None] * len(rules_data))
+                    result_guides.extend([guide_key] * len(rules_data))
+                    indexes_by_id: Dict[str, List[int]] = {}
+                    for position, rule_data in enumerate(rules_data):
+                        indexes_by_id.setdefault(rule_data.get("id", "unknown"), []).append(guide_start + position)
+                    reevaluated: Set[int] = set()
+                    
+                    for position in order:
+                        rule_data = rules_data[position]
+                        index = guide_start + position
+                        dependencies = {dep: indexes_by_id[dep] for dep in rule_dependencies(rule_data)}
+                        dependency_indexes = [i for indexes in dependencies.values() for i in indexes]
+                        
+                        previous = reusable.get((guide_key, rule_data.get("id", "unknown")))
+                        if (
+                            previous is not None
+                            and not guide_changed
+                            and not self._is_target_changed(rule_data, changed, observed)
+                            and reevaluated.isdisjoint(dependency_indexes)
+                        ):
+                            results[index] = previous
+                            reused_count += 1
+                            continue
+                        reevaluated.add(index)
+                        
+                        if any(results[i] is None for i in dependency_indexes):
+                            # A dependency is waiting for the process pool
+                            deferred.append((index, rule_data, guide_id, dependencies))
+                            continue
+                        failed = self._failed_dependency(dependencies, results)
+                        if failed is not None:
+                            results[index] = self._build_result(
+                                rule_data, guide_id, skipped_evaluation(failed), waiver_map
+                            )
+                            continue
+                        
+                        if self.processes != 1:
+                            cached, target, rule_hash = self._cached_evaluation(rule_data)
+                            if cached is not None:
+                                results[index] = self._build_result(rule_data, guide_id, cached, waiver_map)
+                            else:
+                                pending.append((index, rule_data, guide_id, target, rule_hash))
+                            continue
+                        
+                        results[index] = self._evaluate_with_metrics(
+                            rule_data, guide_id, guide_key, waiver_map, file_store, rule_factory
+                        )
+                
+                except Exception as e:
+                    logger.error(f"Failed to parse guide {guide_path}: {str(e)}")
+                    del results[guide_start:]
+                    del result_guides[guide_start:]
+                    pending[:] = [entry for entry in pending if entry[0] < guide_start]
+                    deferred[:] = [entry for entry in deferred if entry[0] < guide_start]
+                    results.append(self._guide_error_result(guide_path, e))
+                    result_guides.append(guide_key)
+                finally:
+                    collector.record_stage_time("evaluate", time.perf_counter() - started)
+                emit_ready()
+        finally:
+            parsed_guides.close()
+        
+        if pending or deferred:
+            started = time.perf_counter()
+            if pending:
+                self._evaluate_in_processes(pending, results, waiver_map, result_guides)
+            # Dependents of pooled rules run once their dependencies are known
+            for index, rule_data, guide_id, dependencies in deferred:
+                failed = self._failed_dependency(dependencies, results)
+                if failed is not None:
+                    results[index] = self._build_result(rule_data, guide_id, skipped_evaluation(failed), waiver_map)
+                else:
+                    results[index] = self._evaluate_with_metrics(
+                        rule_data, guide_id, result_guides[index], waiver_map, file_store, rule_factory
                     )
-                )
+            collector.record_stage_time("evaluate", time.perf_counter() - started)
+            emit_ready()
         
         # Finalize metrics
+        if guides is None:
+            logger.info(f"Discovered {guides_count} guides")
+        metrics.guides_count = guides_count
         metrics.rules_count = len(results)
+        get_metrics_collector().record_file_cache(file_store.hits, file_store.misses)
+        if record:
+            self.save_caches()
+            if self.use_cache:
+                self._record_run(results)
         get_metrics_collector().end_check()
+        if record and self.use_cache:
+            self.metrics_history.append(metrics)
         
+        logger.debug(f"Built {rule_factory.built} rule instances, reused {rule_factory.reused}")
+        if changed is not None:
+            logger.info(f"Incremental check reused {reused_count} results from the previous run")
         logger.info(f"Compliance check complete: {len(results)} rules evaluated")
         return results
     
+    def save_caches(self) -> None:
+        """Persist the rule result and guide parse caches."""
+        if self.rule_cache is not None:
+            self.rule_cache.save()
+        if self.parse_cache is not None:
+            self.parse_cache.save()
+    
+    def _parse_guide(
+        self,
+        guide_path: Path
+    ) -> Tuple[Path, List[Dict[str, Any]], Optional[RuleEvaluationResult]]:
+        """
+        Extract rules from one guide (parse stage of the pipeline).
+        
+        Args:
+            guide_path: Guide file to parse
+        
+        Returns:
+            Tuple of (guide path, rules, error result). The error result is
+            set, and rules empty, when the guide is missing or unparsable.
+        """
+        if not guide_path.exists():
+            logger.warning(f"Guide file not found: {guide_path}")
+            return guide_path, [], RuleEvaluationResult(
+                rule_id="discovery-error",
+                rule_type="discovery",
+                status=RuleStatus.ERROR,
+                message=f"Guide file not found: {guide_path}",
+                target=str(guide_path),
+                guide_id=guide_path.stem,
+                path=str(guide_path)
+            )
+        
+        logger.debug(f"Processing guide: {guide_path}")
+        started = time.perf_counter()
+        try:
+            rules_data = self.rule_parser.extract_rules(guide_path, cache=self.parse_cache)
+        except Exception as e:
+            logger.error(f"Failed to parse guide {guide_path}: {str(e)}")
+            return guide_path, [], self._guide_error_result(guide_path, e)
+        finally:
+            get_metrics_collector().record_guide_parse(
+                self._relative_path(guide_path),
+                time.perf_counter() - started
+            )
+        
+        logger.debug(f"Extracted {len(rules_data)} rules from {self._extract_guide_id(guide_path)}")
+        return guide_path, rules_data, None
+    
+    @staticmethod
+    def _guide_error_result(guide_path: Path, error: Exception) -> RuleEvaluationResult:
+        """Build the ERROR result reported for a guide that failed to process."""
+        return RuleEvaluationResult(
+            rule_id="parse-error",
+            rule_type="parsing",
+            status=RuleStatus.ERROR,
+            message=f"Failed to parse guide: {str(error)}",
+            target=str(guide_path),
+            guide_id=guide_path.stem,
+            path=str(guide_path)
+        )
+    
+    def _load_incremental_state(
+        self,
+        base_ref: Optional[str]
+    ) -> Tuple[Optional[Set[str]], Dict[Tuple[str, str], RuleEvaluationResult]]:
+        """
+        Load the change set and reusable results for an incremental run.
+        
+        Args:
+            base_ref: Git ref to diff against (defaults to last run's commit)
+        
+        Returns:
+            Tuple of (changed file set, previous results keyed by (guide path, rule_id)).
+            The change set is None when a full check is required.
+        """
+        record = self.run_store.load()
+        if record is None:
+            logger.info("No previous compliance run recorded, running full check")
+            return None, {}
+        
+        base = base_ref or record.get("commit")
+        if not base:
+            logger.info("No base ref available for incremental check, running full check")
+            return None, {}
+        
+        changed_files = get_changed_files(self.project_root, base)
+        if changed_files is None:
+            logger.warning(f"Could not list changes since {base}, running full check")
+            return None, {}
+        
+        # Files dirty at the last run may since have been reverted
+        changed_files.update(record.get("dirty_files", []))
+        
+        previous_results = []
+        for data in record.get("results", []):
+            try:
+                previous_results.append(RuleEvaluationResult.from_dict(data))
+            except (KeyError, ValueError):
+                continue
+        
+        logger.debug(f"{len(changed_files)} files changed since {base}")
+        return self._reusable_results(changed_files, previous_results)
+    
+    def _reusable_results(
+        self,
+        changed_files: Set[str],
+        previous_results: Iterable[RuleEvaluationResult]
+    ) -> Tuple[Optional[Set[str]], Dict[Tuple[str, str], RuleEvaluationResult]]:
+        """
+        Index earlier results that may be reused for a change set.
+        
+        Args:
+            changed_files: Changed paths relative to project root
+            previous_results: Results of an earlier run
+        
+        Returns:
+            Tuple of (change set, results keyed by (guide path, rule_id)). The
+            change set is None, and nothing is reusable, when waivers changed.
+            Results without a guide path (recorded by older versions) and
+            rule IDs that occur more than once in a guide are never reused.
+        """
+        if WaiverManager.WAIVERS_FILE.as_posix() in changed_files:
+            logger.info("Waivers changed since last run, running full check")
+            return None, {}
+        
+        reusable: Dict[Tuple[str, str], RuleEvaluationResult] = {}
+        seen: Set[Tuple[str, str]] = set()
+        for result in previous_results:
+            if result.guide_path is None:
+                continue
+            key = (result.guide_path, result.rule_id)
+            if key in seen:
+                # Cannot tell which earlier result belongs to which rule
+                reusable.pop(key, None)
+            elif result.status != RuleStatus.ERROR:
+                # Errors may be transient, always re-evaluate them
+                reusable[key] = result
+            seen.add(key)
+        return changed_files, reusable
+    
+    def _record_run(self, results: List[RuleEvaluationResult]) -> None:
+        """
+        Record this run's results for later incremental checks.
+        
+        Args:
+            results: Results of the completed run
+        """
+        commit = get_head_commit(self.project_root)
+        dirty_files = get_changed_files(self.project_root, "HEAD") if commit else None
+        self.run_store.save(
+            [r.to_dict() for r in results],
+            commit=commit,
+            dirty_files=sorted(dirty_files) if dirty_files else None
+        )
+    
+    def _relative_path(self, path: Path) -> str:
+        """Get a path relative to project root using '/' separators."""
+        try:
+            return path.resolve().relative_to(self.project_root.resolve()).as_posix()
+        except ValueError:
+            return path.as_posix()
+    
+    @staticmethod
+    def _rule_target(rule_data: Dict[str, Any]) -> str:
+        """Get the file or path a rule evaluates."""
+        return str(rule_data.get("file") or rule_data.get("path") or "")
+    
+    @staticmethod
+    def _result_path(rule_data: Dict[str, Any]) -> Optional[str]:
+        """Get the single path a result refers to, if the target is not a glob."""
+        target = ComplianceChecker._rule_target(rule_data)
+        return target if target and not is_glob(target) else None
+    
+    def _git_observed(self) -> Optional[Callable[[str], bool]]:
+        """
+        Build a check for paths whose changes git reports.
+        
+        Changes to ignored files never appear in the git change set, so
+        only paths git lists (tracked or untracked, and their parent
+        directories) are observed.
+        
+        Returns:
+            Predicate on paths relative to project root, or None if git fails
+        """
+        files = list_project_files(self.project_root)
+        if files is None:
+            return None
+        listed = set(files)
+        for path in files:
+            parts = path.split("/")[:-1]
+            for depth in range(1, len(parts) + 1):
+                listed.add("/".join(parts[:depth]))
+        return listed.__contains__
+    
+    def _is_watched(self, rel_path: str) -> bool:
+        """
+        Check whether the file watcher sees a path.
+        
+        The watcher skips paths matching the discovery ignore patterns,
+        along with everything beneath ignored directories.
+        
+        Args:
+            rel_path: '/'-separated path relative to project root
+        
+        Returns:
+            True if changes to the path are reported
+        """
+        parts = rel_path.split("/")
+        for depth in range(1, len(parts)):
+            if self.discovery.is_ignored("/".join(parts[:depth]), True):
+                return False
+        return not self.discovery.is_ignored(rel_path, (self.project_root / rel_path).is_dir())
+    
+    def _is_target_changed(
+        self,
+        rule_data: Dict[str, Any],
+        changed_files: Optional[Set[str]],
+        observed: Optional[Callable[[str], bool]] = None
+    ) -> bool:
+        """
+        Check whether a rule's target is in the change set.
+        
+        Args:
+            rule_data: Rule definition from guide
+            changed_files: Changed paths relative to project root (None = everything)
+            observed: Whether changes to a path show up in changed_files; rules
+                on paths that are not observed (e.g. gitignored build output)
+                are always re-evaluated. None observes every path.
+        
+        Returns:
+            True if the rule must be re-evaluated
+        """
+        if changed_files is None:
+            return True
+        
+        target = self._rule_target(rule_data)
+        if not target:
+            return True
+        
+        target = Path(target).as_posix().rstrip("/")
+        if observed is not None:
+            # A glob's literal leading directories must be observed
+            parts = target.split("/")
+            literal = parts if not is_glob(target) else parts[:[is_glob(part) for part in parts].index(True)]
+            if literal and not observed("/".join(literal)):
+                return True
+        if is_glob(target):
+            # Any added, removed or modified match can change a glob rule
+            return any(glob_matches(target, path) for path in changed_files)
+        if target in changed_files:
+            return True
+        
+        # Directory targets are affected by any change beneath them
+        prefix = target + "/"
+        return any(path.startswith(prefix) for path in changed_files)
+    
     def _discover_guides(self) -> List[Path]:
         """
         Discover guide files from project structure.
         
         Looks for guides in:
         - context/references/ directory
-        - Any markdown files with rules in YAML frontmatter
+        - specs/ directory (recursively)
         
         Returns:
             List of discovered guide paths
         """
+        return list(self.iter_guides())
+    
+    def iter_guides(self) -> Iterator[Path]:
+        """
+        Yield guide files, from the guide cache when valid or from a fresh walk.
+        
+        A fresh walk is saved to the guide cache once it has been consumed
+        completely.
+        
+        Yields:
+            Discovered guide paths
+        """
         logger.debug("Discovering guides in project")
         
         # Check cache first if enabled
@@ -197,95 +764,240 @@ class ComplianceChecker:
             cached_guides = self.cache_manager.get_guides()
             if cached_guides is not None:
                 logger.debug(f"Using cached guides: {len(cached_guides)} guides")
-                return cached_guides
+                yield from cached_guides
+                return
         
         guides = []
-        
-        # Look in context/references/ if it exists
-        guides_dir = self.project_root / "context" / "references"
-        if guides_dir.exists():
-            refs = list(guides_dir.glob("*.md"))
-            guides.extend(refs)
-            logger.debug(f"Found {len(refs)} guides in context/references/")
-        
-        # Look for guides in specs/ directory
-        specs_dir = self.project_root / "specs"
-        if specs_dir.exists():
-            specs = list(specs_dir.glob("**/*.md"))
-            guides.extend(specs)
-            logger.debug(f"Found {len(specs)} guides in specs/")
+        for guide in self.discovery.iter_guides():
+            guides.append(guide)
+            yield guide
         
         logger.debug(f"Total guides discovered: {len(guides)}")
         
         # Cache results if enabled
         if self.use_cache and guides:
             self.cache_manager.save_guides(guides)
+    
+    def _evaluate_with_metrics(
+        self,
+        rule_data: Dict[str, Any],
+        guide_id: str,
+        guide_key: str,
+        waiver_map: Mapping[str, Waiver],
+        file_store: FileContentStore,
+        rule_factory: RuleFactory
+    ) -> RuleEvaluationResult:
+        """Evaluate a rule in-process, recording its evaluation time under the guide's relative path."""
+        collector = get_metrics_collector()
+        rule_metric = collector.start_rule_evaluation(
+            rule_data.get("id", "unknown"),
+            rule_data.get("type", "unknown"),
+            guide_key
+        )
+        result = self._evaluate_rule(
+            rule_data,
+            guide_id,
+            waiver_map,
+            file_store=file_store,
+            rule_factory=rule_factory
+        )
+        collector.end_rule_evaluation(rule_metric)
+        logger.debug(f"Rule {result.rule_id}: {result.status.value}")
+        return result
+    
+    @staticmethod
+    def _failed_dependency(
+        dependencies: Mapping[str, List[int]],
+        results: List[Optional[RuleEvaluationResult]]
+    ) -> Optional[str]:
+        """
+        Find the first dependency of a rule that did not pass.
+        
+        Args:
+            dependencies: Dependency rule IDs mapped to their result indexes
+            results: Run results
         
-        return guides
+        Returns:
+            ID of a dependency with a non-PASS result, or None if all passed
+        """
+        for dependency, indexes in dependencies.items():
+            if any(results[i].status != RuleStatus.PASS for i in indexes):
+                return dependency
+        return None
     
     def _evaluate_rule(
         self,
         rule_data: Dict[str, Any],
         guide_id: str,
-        waiver_map: Dict[str, Waiver]
+        waiver_map: Mapping[str, Waiver],
+        file_store: Optional[FileContentStore] = None,
+        rule_factory: Optional[RuleFactory] = None
     ) -> RuleEvaluationResult:
         """
         Evaluate a single rule against the codebase.
         
+        When rule caching is enabled, a result cached for an identical rule
+        definition over an unchanged target is reused without evaluating.
+        
         Args:
             rule_data: Rule definition from guide
             guide_id: ID of the guide this rule came from
             waiver_map: Map of rule IDs to waivers
+            file_store: Run-scoped content store shared between rules
+            rule_factory: Run-scoped factory sharing rule instances between guides
         
         Returns:
             RuleEvaluationResult with pass/fail/waived/error status
         """
-        rule_id = rule_data.get("id", "unknown")
-        rule_type = rule_data.get("type", "unknown")
-        
         try:
-            # Create rule instance
-            rule = self.rule_engine.create_rule(rule_data)
-            
-            # Evaluate rule
-            eval_result = rule.evaluate(self.project_root)
+            eval_result, target, rule_hash = self._cached_evaluation(rule_data)
             
-            # Determine if rule passed
-            rule_passed = eval_result.get("passed", False)
-            
-            # Check if there's a waiver for this failed rule
-            if not rule_passed and rule_id in waiver_map:
-                waiver = waiver_map[rule_id]
-                return RuleEvaluationResult(
-                    rule_id=rule_id,
-                    rule_type=rule_type,
-                    status=RuleStatus.WAIVED,
-                    message=f"🚫 {rule_id} waived by {waiver.waiver_id}",
-                    target=eval_result.get("details", ""),
-                    guide_id=guide_id,
-                    waiver_id=waiver.waiver_id
-                )
+            if eval_result is None:
+                factory = rule_factory or RuleFactory(self.rule_engine.create_rule)
+                rule = factory.create(rule_data)
+                
+                # Evaluate rule
+                eval_result = rule.evaluate(self.project_root, store=file_store)
+                
+                if self.rule_cache is not None and rule_hash:
+                    self.rule_cache.cache_result(rule_data.get("id", "unknown"), target, eval_result, rule_hash)
             
-            # Return pass or fail result
-            status = RuleStatus.PASS if rule_passed else RuleStatus.FAIL
+            return self._build_result(rule_data, guide_id, eval_result, waiver_map)
+        
+        except Exception as e:
+            return self._rule_error_result(rule_data, guide_id, str(e))
+    
+    def _cached_evaluation(
+        self,
+        rule_data: Dict[str, Any]
+    ) -> Tuple[Optional[Dict[str, Any]], str, str]:
+        """
+        Look up a cached evaluation for a rule definition.
+        
+        Args:
+            rule_data: Rule definition from guide
+        
+        Returns:
+            Tuple of (cached evaluation or None, rule target, rule hash);
+            the hash is empty when the result must not be cached
+        """
+        target = self._rule_target(rule_data)
+        # A glob's matches cannot be fingerprinted by statting its pattern
+        if self.rule_cache is None or is_glob(target):
+            return None, target, ""
+        rule_hash = RuleEvaluationCache.hash_rule(rule_data)
+        cached = self.rule_cache.get_cached_result(rule_data.get("id", "unknown"), target, rule_hash)
+        return cached, target, rule_hash
+    
+    def _build_result(
+        self,
+        rule_data: Dict[str, Any],
+        guide_id: str,
+        eval_result: Dict[str, Any],
+        waiver_map: Mapping[str, Waiver]
+    ) -> RuleEvaluationResult:
+        """
+        Turn a rule's evaluation into a result, applying waivers to failures.
+        
+        Args:
+            rule_data: Rule definition from guide
+            guide_id: ID of the guide this rule came from
+            eval_result: Evaluation dictionary returned by the rule
+            waiver_map: Map of rule IDs to waivers
+        
+        Returns:
+            RuleEvaluationResult with pass/fail/waived status
+        """
+        rule_id = rule_data.get("id", "unknown")
+        rule_type = rule_data.get("type", "unknown")
+        
+        # Determine if rule passed
+        rule_passed = eval_result.get("passed", False)
+        
+        # Check if there's a waiver for this failed rule
+        waiver = None
+        if not rule_passed:
+            started = time.perf_counter()
+            waiver = waiver_map.get(rule_id)
+            get_metrics_collector().record_waiver_lookup(time.perf_counter() - started)
+        if waiver is not None:
             return RuleEvaluationResult(
                 rule_id=rule_id,
                 rule_type=rule_type,
-                status=status,
-                message=eval_result.get("message", ""),
+                status=RuleStatus.WAIVED,
+                message=f"🚫 {rule_id} waived by {waiver.waiver_id}",
                 target=eval_result.get("details", ""),
-                guide_id=guide_id
+                guide_id=guide_id,
+                waiver_id=waiver.waiver_id,
+                path=self._result_path(rule_data)
             )
         
-        except Exception as e:
-            return RuleEvaluationResult(
-                rule_id=rule_id,
-                rule_type=rule_type,
-                status=RuleStatus.ERROR,
-                message=f"Error evaluating rule: {str(e)}",
-                target="",
-                guide_id=guide_id
+        # Return pass or fail result
+        status = RuleStatus.PASS if rule_passed else RuleStatus.FAIL
+        return RuleEvaluationResult(
+            rule_id=rule_id,
+            rule_type=rule_type,
+            status=status,
+            message=eval_result.get("message", ""),
+            target=eval_result.get("details", ""),
+            guide_id=guide_id,
+            path=self._result_path(rule_data)
+        )
+    
+    @staticmethod
+    def _rule_error_result(rule_data: Dict[str, Any], guide_id: str, error: str) -> RuleEvaluationResult:
+        """Build the ERROR result for a rule that could not be evaluated."""
+        return RuleEvaluationResult(
+            rule_id=rule_data.get("id", "unknown"),
+            rule_type=rule_data.get("type", "unknown"),
+            status=RuleStatus.ERROR,
+            message=f"Error evaluating rule: {error}",
+            target="",
+            guide_id=guide_id,
+            path=ComplianceChecker._result_path(rule_data)
+        )
+    
+    def _evaluate_in_processes(
+        self,
+        pending: List[Tuple[int, Dict[str, Any], str, str, str]],
+        results: List[Optional[RuleEvaluationResult]],
+        waiver_map: Mapping[str, Waiver],
+        guide_keys: List[str]
+    ) -> None:
+        """
+        Evaluate deferred rules on a process pool and fill in their results.
+        
+        Args:
+            pending: (result index, rule definition, guide ID, target, rule hash)
+                for every rule that needs evaluating
+            results: Run results with placeholders at the pending indexes
+            waiver_map: Map of rule IDs to waivers
+            guide_keys: Relative guide path of each result (metrics key)
+        """
+        evaluations, hits, misses, durations = evaluate_rules_in_processes(
+            str(self.project_root),
+            [rule_data for _, rule_data, _, _, _ in pending],
+            self.processes or None,
+            target_of=self._rule_target
+        )
+        collector = get_metrics_collector()
+        collector.record_file_cache(hits, misses)
+        
+        for (index, rule_data, guide_id, target, rule_hash), evaluation, duration in zip(
+            pending, evaluations, durations
+        ):
+            collector.record_rule_duration(
+                rule_data.get("id", "unknown"),
+                rule_data.get("type", "unknown"),
+                duration,
+                guide_keys[index]
             )
+            if "error" in evaluation:
+                results[index] = self._rule_error_result(rule_data, guide_id, evaluation["error"])
+                continue
+            if self.rule_cache is not None and rule_hash:
+                self.rule_cache.cache_result(rule_data.get("id", "unknown"), target, evaluation, rule_hash)
+            results[index] = self._build_result(rule_data, guide_id, evaluation, waiver_map)
     
     def _build_waiver_map(self, waivers: List[Waiver]) -> Dict[str, Waiver]:
         """
@@ -0,0 +1,212 @@
+"""
+Guide Discovery Module
+
+Walks the guide directories of a project with os.scandir, pruning ignored
+subtrees before descending into them, and yields guide files lazily so
+callers can start processing guides before the walk finishes.
+"""
+
+import hashlib
+import os
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+from pathlib import Path
+from typing import Iterable, Iterator, List, Optional, Tuple, Union
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+# Directories that never contain guides and can be very large
+DEFAULT_IGNORE_PATTERNS = (
+    ".git/",
+    "node_modules/",
+    ".venv/",
+    "venv/",
+    "__pycache__/",
+    ".specify/",
+)
+
+
+@dataclass(frozen=True)
+class IgnorePattern:
+    """A single .gitignore-style pattern."""
+    
+    pattern: str
+    dir_only: bool = False
+    anchored: bool = False
+    
+    @classmethod
+    def parse(cls, line: str) -> Optional["IgnorePattern"]:
+        """
+        Parse one .gitignore-style line.
+        
+        Supports comments, blank lines, trailing '/' (directories only) and
+        patterns anchored to the project root by a leading or inner '/'.
+        Negation ('!') is not supported and such lines are skipped.
+        
+        Args:
+            line: Pattern line
+        
+        Returns:
+            IgnorePattern, or None if the line holds no usable pattern
+        """
+        line = line.strip()
+        if not line or line.startswith("#"):
+            return None
+        if line.startswith("!"):
+            logger.debug(f"Negated ignore pattern not supported: {line}")
+            return None
+        
+        dir_only = line.endswith("/")
+        line = line.rstrip("/")
+        anchored = "/" in line
+        line = line.lstrip("/")
+        if not line:
+            return None
+        return cls(pattern=line, dir_only=dir_only, anchored=anchored)
+    
+    def matches(self, rel_path: str, name: str, is_dir: bool) -> bool:
+        """
+        Check whether a path matches this pattern.
+        
+        Args:
+            rel_path: Path relative to project root, '/'-separated
+            name: Final path component
+            is_dir: Whether the path is a directory
+        
+        Returns:
+            True if the path is ignored by this pattern
+        """
+        if self.dir_only and not is_dir:
+            return False
+        if self.anchored:
+            return fnmatchcase(rel_path, self.pattern)
+        return fnmatchcase(name, self.pattern)
+
+
+class GuideDiscovery:
+    """
+    Discovers guide files under context/references/ and specs/.
+    
+    context/references/ is scanned one level deep and specs/ recursively.
+    Each directory is listed exactly once; ignored directories and
+    symlinked directories are never entered.
+    """
+    
+    # (directory relative to project root, recurse into subdirectories)
+    GUIDE_ROOTS: Tuple[Tuple[str, bool], ...] = (
+        ("context/references", False),
+        ("specs", True),
+    )
+    GUIDE_SUFFIX = ".md"
+    
+    def __init__(
+        self,
+        project_root: Union[str, Path],
+        ignore_patterns: Optional[Iterable[str]] = None,
+        use_gitignore: bool = True
+    ):
+        """
+        Initialize guide discovery.
+        
+        Args:
+            project_root: Root directory of project
+            ignore_patterns: .gitignore-style patterns to skip
+                (defaults to DEFAULT_IGNORE_PATTERNS)
+            use_gitignore: Also honor patterns from the project's .gitignore
+        """
+        self.project_root = Path(project_root)
+        
+        lines: List[str] = list(DEFAULT_IGNORE_PATTERNS if ignore_patterns is None else ignore_patterns)
+        if use_gitignore:
+            lines.extend(self._read_gitignore())
+        
+        self.ignore_patterns: List[IgnorePattern] = [
+            pattern for pattern in map(IgnorePattern.parse, lines) if pattern is not None
+        ]
+    
+    def _read_gitignore(self) -> List[str]:
+        """Read the project's root .gitignore, if any."""
+        gitignore = self.project_root / ".gitignore"
+        try:
+            return gitignore.read_text().splitlines()
+        except FileNotFoundError:
+            return []
+        except (OSError, UnicodeDecodeError) as e:
+            logger.warning(f"Could not read {gitignore}: {e}")
+            return []
+    
+    @property
+    def ignore_key(self) -> str:
+        """Stable digest of the ignore patterns, for caches built with them."""
+        return hashlib.sha256(repr(self.ignore_patterns).encode()).hexdigest()[:16]
+    
+    def is_ignored(self, rel_path: str, is_dir: bool) -> bool:
+        """
+        Check whether a path is excluded by the ignore patterns.
+        
+        Args:
+            rel_path: Path relative to project root, '/'-separated
+            is_dir: Whether the path is a directory
+        
+        Returns:
+            True if the path should be skipped
+        """
+        name = rel_path.rsplit("/", 1)[-1]
+        return any(pattern.matches(rel_path, name, is_dir) for pattern in self.ignore_patterns)
+    
+    def iter_guides(self) -> Iterator[Path]:
+        """
+        Yield guide files as they are found.
+        
+        Within a directory, entries are visited in sorted order so results
+        are deterministic.
+        
+        Yields:
+            Paths to guide files
+        """
+        for root, recursive in self.GUIDE_ROOTS:
+            root_path = self.project_root / root
+            if not root_path.is_dir() or self.is_ignored(root, is_dir=True):
+                continue
+            
+            count = 0
+            for guide in self._walk(root_path, root, recursive):
+                count += 1
+                yield guide
+            logger.debug(f"Found {count} guides in {root}/")
+    
+    def _walk(self, dir_path: Path, rel_dir: str, recursive: bool) -> Iterator[Path]:
+        """Walk one directory, yielding guides before descending."""
+        try:
+            with os.scandir(dir_path) as it:
+                entries = sorted(it, key=lambda entry: entry.name)
+        except OSError as e:
+            logger.warning(f"Cannot scan {dir_path}: {e}")
+            return
+        
+        subdirs = []
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}"
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    if recursive and not self.is_ignored(rel_path, is_dir=True):
+                        subdirs.append((Path(entry.path), rel_path))
+                    continue
+                is_file = entry.is_file()
+            except OSError:
+                continue
+            
+            if (
+                is_file
+                and entry.name.endswith(self.GUIDE_SUFFIX)
+                and not self.is_ignored(rel_path, is_dir=False)
+            ):
+                yield Path(entry.path)
+        
+        for subdir_path, rel_subdir in subdirs:
+            yield from self._walk(subdir_path, rel_subdir, recursive)
+
+
+__all__ = ['DEFAULT_IGNORE_PATTERNS', 'IgnorePattern', 'GuideDiscovery']
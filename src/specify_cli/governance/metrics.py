@@ -5,6 +5,7 @@ Tracks timing and metrics for compliance checking, rule evaluation,
 and related governance operations.
 """
 
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
@@ -20,6 +21,7 @@ class RuleMetrics:
     """Metrics for a single rule evaluation."""
     rule_id: str
     rule_type: str
+    guide_id: str = ""  # guide path relative to project root (file stems are not unique)
     start_time: float = field(default_factory=time.time)
     end_time: Optional[float] = None
     
@@ -35,10 +37,35 @@ class RuleMetrics:
         return {
             'rule_id': self.rule_id,
             'rule_type': self.rule_type,
+            'guide_id': self.guide_id,
             'duration_ms': round(self.duration_ms, 2)
         }
 
 
+@dataclass
+class GuideMetrics:
+    """Time spent on one guide: parsing its frontmatter plus evaluating its rules."""
+    guide_id: str  # guide path relative to project root
+    parse_ms: float = 0.0
+    evaluate_ms: float = 0.0
+    rules_count: int = 0
+    
+    @property
+    def total_ms(self) -> float:
+        """Get parse plus evaluation time in milliseconds."""
+        return self.parse_ms + self.evaluate_ms
+    
+    def to_dict(self) -> Dict:
+        """Convert to dictionary."""
+        return {
+            'guide_id': self.guide_id,
+            'parse_ms': round(self.parse_ms, 2),
+            'evaluate_ms': round(self.evaluate_ms, 2),
+            'total_ms': round(self.total_ms, 2),
+            'rules_count': self.rules_count
+        }
+
+
 @dataclass
 class ComplianceCheckMetrics:
     """Metrics for a complete compliance check."""
@@ -47,6 +74,11 @@ class ComplianceCheckMetrics:
     guides_count: int = 0
     rules_count: int = 0
     rule_metrics: List[RuleMetrics] = field(default_factory=list)
+    file_cache_hits: int = 0
+    file_cache_misses: int = 0
+    stage_durations_ms: Dict[str, float] = field(default_factory=dict)
+    guide_parse_ms: Dict[str, float] = field(default_factory=dict)
+    waiver_lookup_ms: float = 0.0
     
     @property
     def total_duration_ms(self) -> float:
@@ -63,11 +95,43 @@ class ComplianceCheckMetrics:
         total = sum(m.duration_ms for m in self.rule_metrics)
         return total / len(self.rule_metrics)
     
+    @property
+    def file_cache_hit_rate(self) -> float:
+        """Get fraction of file lookups served from the run-scoped content store."""
+        lookups = self.file_cache_hits + self.file_cache_misses
+        if lookups == 0:
+            return 0.0
+        return self.file_cache_hits / lookups
+    
     def add_rule_metric(self, metric: RuleMetrics) -> None:
         """Add rule metrics."""
         self.rule_metrics.append(metric)
         logger.debug(f"Rule metric: {metric.rule_id} took {metric.duration_ms:.2f}ms")
     
+    def guide_metrics(self) -> List[GuideMetrics]:
+        """
+        Combine parse times and rule timings into per-guide totals.
+        
+        Returns:
+            Guide metrics in the order guides were first seen
+        """
+        guides: Dict[str, GuideMetrics] = {}
+        for guide_id, parse_ms in self.guide_parse_ms.items():
+            guides[guide_id] = GuideMetrics(guide_id=guide_id, parse_ms=parse_ms)
+        for metric in self.rule_metrics:
+            guide = guides.setdefault(metric.guide_id, GuideMetrics(guide_id=metric.guide_id))
+            guide.evaluate_ms += metric.duration_ms
+            guide.rules_count += 1
+        return list(guides.values())
+    
+    def slowest_rules(self, limit: int) -> List[RuleMetrics]:
+        """Get the limit slowest rule evaluations, slowest first."""
+        return sorted(self.rule_metrics, key=lambda m: m.duration_ms, reverse=True)[:limit]
+    
+    def slowest_guides(self, limit: int) -> List[GuideMetrics]:
+        """Get the limit guides with the highest parse plus evaluation time, slowest first."""
+        return sorted(self.guide_metrics(), key=lambda g: g.total_ms, reverse=True)[:limit]
+    
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
         return {
@@ -75,18 +139,34 @@ class ComplianceCheckMetrics:
             'guides_count': self.guides_count,
             'rules_count': self.rules_count,
             'avg_rule_duration_ms': round(self.avg_rule_duration_ms, 2),
+            'file_cache_hits': self.file_cache_hits,
+            'file_cache_misses': self.file_cache_misses,
+            'stage_durations_ms': {
+                stage: round(duration, 2) for stage, duration in self.stage_durations_ms.items()
+            },
+            'waiver_lookup_ms': round(self.waiver_lookup_ms, 2),
+            'guides': [g.to_dict() for g in self.guide_metrics()],
             'rules': [m.to_dict() for m in self.rule_metrics]
         }
     
     def summary(self) -> str:
         """Get human-readable summary."""
-        return (
+        summary = (
             f"Compliance Check Metrics:\n"
             f"  Total Duration: {self.total_duration_ms:.2f}ms\n"
             f"  Guides: {self.guides_count}\n"
             f"  Rules Evaluated: {self.rules_count}\n"
-            f"  Avg Rule Time: {self.avg_rule_duration_ms:.2f}ms"
+            f"  Avg Rule Time: {self.avg_rule_duration_ms:.2f}ms\n"
+            f"  File Cache: {self.file_cache_hits} hits, {self.file_cache_misses} misses"
         )
+        if self.stage_durations_ms:
+            stages = ", ".join(
+                f"{stage} {duration:.2f}ms" for stage, duration in self.stage_durations_ms.items()
+            )
+            summary += f"\n  Stages: {stages}"
+        if self.waiver_lookup_ms:
+            summary += f"\n  Waiver Lookup: {self.waiver_lookup_ms:.2f}ms"
+        return summary
 
 
 class MetricsCollector:
@@ -96,6 +176,7 @@ class MetricsCollector:
         """Initialize metrics collector."""
         self.current_check: Optional[ComplianceCheckMetrics] = None
         self.history: List[ComplianceCheckMetrics] = []
+        self._lock = threading.Lock()
     
     def start_check(self) -> ComplianceCheckMetrics:
         """Start a new compliance check."""
@@ -115,16 +196,75 @@ class MetricsCollector:
         self.current_check = None
         return result
     
-    def start_rule_evaluation(self, rule_id: str, rule_type: str) -> RuleMetrics:
+    def start_rule_evaluation(self, rule_id: str, rule_type: str, guide_id: str = "") -> RuleMetrics:
         """Start rule evaluation timing."""
-        metric = RuleMetrics(rule_id=rule_id, rule_type=rule_type)
+        metric = RuleMetrics(rule_id=rule_id, rule_type=rule_type, guide_id=guide_id)
         return metric
     
     def end_rule_evaluation(self, metric: RuleMetrics) -> None:
         """End rule evaluation timing."""
         metric.end_time = time.time()
-        if self.current_check is not None:
-            self.current_check.add_rule_metric(metric)
+        with self._lock:
+            if self.current_check is not None:
+                self.current_check.add_rule_metric(metric)
+    
+    def record_rule_duration(self, rule_id: str, rule_type: str, seconds: float, guide_id: str = "") -> None:
+        """
+        Record a rule evaluation timed elsewhere (e.g., in a worker process).
+        
+        Args:
+            rule_id: Rule ID
+            rule_type: Rule type
+            seconds: Time the evaluation took
+            guide_id: Path of the guide the rule came from, relative to project root
+        """
+        metric = RuleMetrics(rule_id=rule_id, rule_type=rule_type, guide_id=guide_id, start_time=0.0, end_time=seconds)
+        with self._lock:
+            if self.current_check is not None:
+                self.current_check.add_rule_metric(metric)
+    
+    def record_guide_parse(self, guide_id: str, seconds: float) -> None:
+        """
+        Add frontmatter parse time for a guide of the current check.
+        
+        Safe to call from stage threads.
+        
+        Args:
+            guide_id: Guide path relative to project root
+            seconds: Time spent extracting the guide's rules
+        """
+        with self._lock:
+            if self.current_check is not None:
+                parse_ms = self.current_check.guide_parse_ms
+                parse_ms[guide_id] = parse_ms.get(guide_id, 0.0) + seconds * 1000
+    
+    def record_waiver_lookup(self, seconds: float) -> None:
+        """Add time spent loading and looking up waivers for the current check."""
+        with self._lock:
+            if self.current_check is not None:
+                self.current_check.waiver_lookup_ms += seconds * 1000
+    
+    def record_file_cache(self, hits: int, misses: int) -> None:
+        """Record content store hit/miss counts for the current check."""
+        with self._lock:
+            if self.current_check is not None:
+                self.current_check.file_cache_hits += hits
+                self.current_check.file_cache_misses += misses
+    
+    def record_stage_time(self, stage: str, seconds: float) -> None:
+        """
+        Add busy time for a pipeline stage of the current check.
+        
+        Safe to call from stage threads.
+        
+        Args:
+            stage: Stage name (e.g., "discovery", "parse", "evaluate")
+            seconds: Time the stage spent working
+        """
+        with self._lock:
+            if self.current_check is not None:
+                durations = self.current_check.stage_durations_ms
+                durations[stage] = durations.get(stage, 0.0) + seconds * 1000
     
     def get_current_metrics(self) -> Optional[ComplianceCheckMetrics]:
         """Get current metrics."""
@@ -0,0 +1,302 @@
+"""
+Persistent metrics history for compliance checks.
+
+Each finished check is appended as one compact JSON line to
+.specify/.cache/metrics_history.jsonl, so durations can be compared across
+CLI invocations: percentiles per rule and guide, and runs whose total or
+per-rule time regressed against the runs before them.
+"""
+
+import json
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from statistics import median
+from typing import Any, Dict, List, Optional
+import logging
+
+from .metrics import ComplianceCheckMetrics
+
+logger = logging.getLogger(__name__)
+
+
+def to_history_record(metrics: ComplianceCheckMetrics) -> Dict[str, Any]:
+    """
+    Convert a finished check into a history record.
+    
+    Guides are keyed by their path relative to the project root (file stems
+    repeat, e.g. every specs/<feature>/spec.md) and rule durations by
+    "guide path/rule_id", since rule IDs are only unique within a guide.
+    Rules evaluated more than once in a run are summed.
+    
+    Args:
+        metrics: Metrics of a finished compliance check
+    
+    Returns:
+        Record dictionary as stored in the history file
+    """
+    rule_ms: Dict[str, float] = {}
+    for metric in metrics.rule_metrics:
+        key = f"{metric.guide_id}/{metric.rule_id}"
+        rule_ms[key] = rule_ms.get(key, 0.0) + metric.duration_ms
+    
+    return {
+        "version": MetricsHistoryStore.RECORD_VERSION,
+        "timestamp": datetime.fromtimestamp(metrics.start_time, timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+        "total_ms": round(metrics.total_duration_ms, 2),
+        "guides_count": metrics.guides_count,
+        "rules_count": metrics.rules_count,
+        "stage_ms": {stage: round(ms, 2) for stage, ms in metrics.stage_durations_ms.items()},
+        "guide_ms": {g.guide_id: round(g.total_ms, 2) for g in metrics.guide_metrics()},
+        "rule_ms": {key: round(ms, 2) for key, ms in rule_ms.items()},
+    }
+
+
+class MetricsHistoryStore:
+    """
+    Append-only store of compliance check metrics.
+    
+    Appending writes a single line. When the file grows past max_bytes it is
+    compacted to its newest max_records records, so growth stays bounded
+    without reading the history on every run.
+    """
+    
+    CACHE_DIR = Path(".specify/.cache")
+    HISTORY_FILE = CACHE_DIR / "metrics_history.jsonl"
+    # 2: guides keyed by relative path instead of file stem
+    RECORD_VERSION = 2
+    MAX_RECORDS = 200
+    MAX_BYTES = 8 * 1024 * 1024
+    
+    def __init__(
+        self,
+        project_root: Optional[Path] = None,
+        max_records: int = MAX_RECORDS,
+        max_bytes: int = MAX_BYTES
+    ):
+        """
+        Initialize history store.
+        
+        Args:
+            project_root: Root directory of project
+            max_records: Records kept when the file is compacted
+            max_bytes: File size that triggers compaction
+        """
+        self.project_root = Path(project_root) if project_root else Path(".")
+        self.cache_dir = self.project_root / self.CACHE_DIR
+        self.history_file = self.project_root / self.HISTORY_FILE
+        self.max_records = max_records
+        self.max_bytes = max_bytes
+    
+    def append(self, metrics: ComplianceCheckMetrics) -> None:
+        """
+        Record a finished check.
+        
+        Args:
+            metrics: Metrics of a finished compliance check
+        """
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            line = json.dumps(to_history_record(metrics), separators=(",", ":"))
+            with open(self.history_file, "a", encoding="utf-8") as f:
+                f.write(line + "\n")
+            if self.history_file.stat().st_size > self.max_bytes:
+                self._compact()
+        except Exception as e:
+            logger.warning(f"Error saving metrics history: {e}")
+    
+    def load(self, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Load recorded checks, oldest first.
+        
+        Unreadable lines and records of another version are skipped.
+        
+        Args:
+            limit: Return only the newest limit records
+        
+        Returns:
+            List of history records
+        """
+        if not self.history_file.exists():
+            return []
+        
+        records = []
+        try:
+            with open(self.history_file, encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue
+                    if isinstance(record, dict) and record.get("version") == self.RECORD_VERSION:
+                        records.append(record)
+        except OSError as e:
+            logger.warning(f"Error reading metrics history: {e}")
+            return []
+        
+        return records[-limit:] if limit else records
+    
+    def _compact(self) -> None:
+        """Rewrite the file with only the newest max_records records."""
+        records = self.load(self.max_records)
+        tmp_file = self.history_file.with_suffix(".tmp")
+        tmp_file.write_text(
+            "".join(json.dumps(record, separators=(",", ":")) + "\n" for record in records),
+            encoding="utf-8"
+        )
+        tmp_file.replace(self.history_file)
+        logger.debug(f"Compacted metrics history to {len(records)} records")
+    
+    def clear(self) -> None:
+        """Delete the recorded history."""
+        try:
+            if self.history_file.exists():
+                self.history_file.unlink()
+                logger.debug("Metrics history cleared")
+        except Exception as e:
+            logger.warning(f"Error clearing metrics history: {e}")
+
+
+def percentile(values: List[float], pct: float) -> float:
+    """
+    Get a percentile by linear interpolation between closest ranks.
+    
+    Args:
+        values: Sample values (need not be sorted)
+        pct: Percentile between 0 and 100
+    
+    Returns:
+        Percentile value, or 0.0 for an empty sample
+    """
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = (len(ordered) - 1) * pct / 100
+    lower = int(rank)
+    upper = min(lower + 1, len(ordered) - 1)
+    return ordered[lower] + (ordered[upper] - ordered[lower]) * (rank - lower)
+
+
+@dataclass
+class DurationStats:
+    """Duration distribution of one rule or guide across runs."""
+    key: str
+    count: int
+    p50_ms: float
+    p90_ms: float
+    p95_ms: float
+    max_ms: float
+    last_ms: float
+
+
+def duration_stats(records: List[Dict[str, Any]], field: str) -> List[DurationStats]:
+    """
+    Compute duration percentiles per key of a record field.
+    
+    Args:
+        records: History records, oldest first
+        field: "rule_ms" or "guide_ms"
+    
+    Returns:
+        Stats per key, slowest p95 first
+    """
+    samples: Dict[str, List[float]] = {}
+    for record in records:
+        for key, duration in record.get(field, {}).items():
+            samples.setdefault(key, []).append(duration)
+    
+    stats = [
+        DurationStats(
+            key=key,
+            count=len(values),
+            p50_ms=percentile(values, 50),
+            p90_ms=percentile(values, 90),
+            p95_ms=percentile(values, 95),
+            max_ms=max(values),
+            last_ms=values[-1]
+        )
+        for key, values in samples.items()
+    ]
+    return sorted(stats, key=lambda s: s.p95_ms, reverse=True)
+
+
+@dataclass
+class Regression:
+    """A run whose duration for some scope exceeded its baseline."""
+    run_index: int  # index into the analysed records
+    timestamp: str
+    scope: str  # "total" or "rule"
+    key: str  # rule key ("guide_id/rule_id"), or "total"
+    baseline_ms: float
+    duration_ms: float
+    
+    @property
+    def increase(self) -> float:
+        """Relative increase over the baseline (0.5 = 50% slower)."""
+        if self.baseline_ms <= 0:
+            return float("inf")
+        return self.duration_ms / self.baseline_ms - 1
+
+
+def find_regressions(
+    records: List[Dict[str, Any]],
+    threshold: float = 0.25,
+    window: int = 5,
+    min_delta_ms: float = 5.0
+) -> List[Regression]:
+    """
+    Flag runs whose total or per-rule time regressed.
+    
+    Each run is compared against the median of the up to window preceding
+    runs that have a value for the same scope. A run regresses when it is
+    more than threshold slower than that baseline and at least min_delta_ms
+    slower in absolute terms, which keeps sub-millisecond jitter quiet.
+    
+    Args:
+        records: History records, oldest first
+        threshold: Relative increase that counts as a regression (0.25 = 25%)
+        window: Number of preceding runs forming the baseline
+        min_delta_ms: Smallest absolute increase that counts as a regression
+    
+    Returns:
+        Regressions in run order, total before rules within a run
+    """
+    regressions = []
+    totals: List[float] = []
+    rule_history: Dict[str, List[float]] = {}
+    
+    def check(index: int, scope: str, key: str, previous: List[float], duration: float) -> None:
+        if not previous:
+            return
+        baseline = median(previous[-window:])
+        if duration > baseline * (1 + threshold) and duration - baseline >= min_delta_ms:
+            regressions.append(Regression(
+                run_index=index,
+                timestamp=records[index].get("timestamp", ""),
+                scope=scope,
+                key=key,
+                baseline_ms=baseline,
+                duration_ms=duration
+            ))
+    
+    for index, record in enumerate(records):
+        total = record.get("total_ms", 0.0)
+        check(index, "total", "total", totals, total)
+        totals.append(total)
+        for key, duration in record.get("rule_ms", {}).items():
+            previous = rule_history.setdefault(key, [])
+            check(index, "rule", key, previous, duration)
+            previous.append(duration)
+    
+    return regressions
+
+
+__all__ = [
+    'DurationStats',
+    'MetricsHistoryStore',
+    'Regression',
+    'duration_stats',
+    'find_regressions',
+    'percentile',
+    'to_history_record',
+]
@@ -0,0 +1,125 @@
+"""
+Threaded pipeline stages for compliance checking.
+
+Connects stages such as guide discovery, frontmatter parsing and rule
+evaluation through bounded queues so each stage works on the next item
+while downstream stages are still busy with the previous one.
+"""
+
+import queue
+import threading
+import time
+from typing import Callable, Iterable, Iterator, Optional, TypeVar
+import logging
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+_DONE = object()
+
+
+class _StageError:
+    """Carries an exception raised in a stage thread to the consumer."""
+    
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+def pipeline_stage(
+    source: Iterable[T],
+    func: Optional[Callable[[T], R]] = None,
+    name: str = "stage",
+    maxsize: int = 8,
+    on_busy_time: Optional[Callable[[str, float], None]] = None
+) -> Iterator[R]:
+    """
+    Run a stage in a background thread, yielding its output in order.
+    
+    The thread pulls items from source, applies func (identity if None) and
+    puts results on a queue holding at most maxsize items, so the stage
+    runs ahead of its consumer by a bounded amount. Exceptions raised while
+    iterating source or in func are re-raised in the consumer. If the
+    consumer stops early, the thread is told to stop and closes source, so
+    upstream stages shut down their own threads in turn.
+    
+    Args:
+        source: Input items (may itself be a pipeline stage)
+        func: Transformation applied to each item
+        name: Stage name, used for the thread name and timing
+        maxsize: Maximum number of results buffered ahead of the consumer
+        on_busy_time: Called once with (name, seconds) when the stage ends.
+            seconds is the time spent in func, or in pulling from source
+            when there is no func; time blocked on either queue is excluded
+    
+    Yields:
+        Stage results in source order
+    """
+    results: "queue.Queue[object]" = queue.Queue(maxsize=max(maxsize, 1))
+    stop = threading.Event()
+    
+    def put(item: object) -> bool:
+        """Put an item, giving up if the consumer has gone away."""
+        while not stop.is_set():
+            try:
+                results.put(item, timeout=0.1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    
+    def run() -> None:
+        busy = 0.0
+        iterator = None
+        try:
+            iterator = iter(source)
+            while not stop.is_set():
+                started = time.perf_counter()
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    if func is None:
+                        busy += time.perf_counter() - started
+                    break
+                if func is None:
+                    result = item
+                else:
+                    started = time.perf_counter()
+                    result = func(item)
+                busy += time.perf_counter() - started
+                if not put(result):
+                    break
+            put(_DONE)
+        except BaseException as e:
+            put(_StageError(e))
+        finally:
+            # Close source from this thread, which is the one iterating it
+            close = getattr(iterator, "close", None)
+            if close is not None:
+                try:
+                    close()
+                except Exception as e:
+                    logger.debug(f"Closing source of pipeline stage '{name}' failed: {e}")
+            if on_busy_time is not None:
+                on_busy_time(name, busy)
+    
+    thread = threading.Thread(target=run, name=f"compliance-{name}", daemon=True)
+    thread.start()
+    
+    try:
+        while True:
+            item = results.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _StageError):
+                raise item.error
+            yield item
+    finally:
+        stop.set()
+        thread.join(timeout=1.0)
+        if thread.is_alive():
+            logger.debug(f"Pipeline stage '{name}' still running after consumer stopped")
+
+
+__all__ = ['pipeline_stage']
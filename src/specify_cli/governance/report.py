@@ -1,18 +1,26 @@
 """
 Compliance Report Generation Module
 
-Generates markdown compliance reports from rule evaluation results.
+Generates markdown compliance reports from rule evaluation results. Reports
+are produced line by line so they can be streamed straight to a file.
 """
 
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import List, Dict, Optional, Set
+from typing import Iterator, List, Dict, Optional, Set, TextIO, Union
 from collections import defaultdict
 import logging
 
 logger = logging.getLogger(__name__)
 
-from .compliance import RuleEvaluationResult, RuleStatus
+from .compliance import ResultAggregate, RuleEvaluationResult, RuleStatus
+
+Results = Union[List[RuleEvaluationResult], ResultAggregate]
+
+
+def _aggregate(results: Results) -> ResultAggregate:
+    """Bucket results once, reusing an existing aggregate."""
+    return results if isinstance(results, ResultAggregate) else ResultAggregate(results)
 
 
 class ComplianceReportGenerator:
@@ -40,7 +48,7 @@ class ComplianceReportGenerator:
     
     def generate_report(
         self,
-        results: List[RuleEvaluationResult],
+        results: Results,
         project_name: Optional[str] = None,
         branch: Optional[str] = None
     ) -> str:
@@ -48,37 +56,72 @@ class ComplianceReportGenerator:
         Generate a formatted compliance report.
         
         Args:
-            results: List of rule evaluation results
+            results: Rule evaluation results, or their ResultAggregate
             project_name: Optional project name (defaults to directory name)
             branch: Optional git branch name
         
         Returns:
             Formatted markdown report as string
         """
-        logger.info(f"Generating compliance report for {len(results)} rule evaluations")
+        return "".join(self.iter_report(results, project_name=project_name, branch=branch))
+    
+    def iter_report(
+        self,
+        results: Results,
+        project_name: Optional[str] = None,
+        branch: Optional[str] = None
+    ) -> Iterator[str]:
+        """
+        Generate the compliance report a line at a time.
+        
+        Args:
+            results: Rule evaluation results, or their ResultAggregate
+            project_name: Optional project name (defaults to directory name)
+            branch: Optional git branch name
+        
+        Yields:
+            Report lines, including their trailing newlines
+        """
+        aggregate = _aggregate(results)
+        logger.info(f"Generating compliance report for {aggregate.total} rule evaluations")
         
         if project_name is None:
             project_name = self.project_root.name
         
-        report = ""
-        
         # Header and metadata
-        report += self.generate_report_header(project_name, branch)
+        yield from self._header_lines(project_name, branch)
         
         # Summary statistics
-        report += self.generate_summary_section(results)
+        yield from self._summary_lines(aggregate)
         
         # Guides checked
-        report += self.generate_checked_guides_section(results)
+        yield from self._checked_guides_lines(aggregate)
         
         # Detailed results grouped by status
-        report += self.generate_passed_rules_section(results)
-        report += self.generate_failed_rules_section(results)
-        report += self.generate_waived_rules_section(results)
-        report += self.generate_error_rules_section(results)
+        yield from self._passed_rules_lines(aggregate)
+        yield from self._failed_rules_lines(aggregate)
+        yield from self._waived_rules_lines(aggregate)
+        yield from self._error_rules_lines(aggregate)
         
         logger.debug("Report generation complete")
-        return report
+    
+    def write_report(
+        self,
+        results: Results,
+        out: TextIO,
+        project_name: Optional[str] = None,
+        branch: Optional[str] = None
+    ) -> None:
+        """
+        Write the compliance report to an open text stream as it is generated.
+        
+        Args:
+            results: Rule evaluation results, or their ResultAggregate
+            out: Writable text stream
+            project_name: Optional project name (defaults to directory name)
+            branch: Optional git branch name
+        """
+        out.writelines(self.iter_report(results, project_name=project_name, branch=branch))
     
     def generate_report_header(
         self,
@@ -95,37 +138,41 @@ class ComplianceReportGenerator:
         Returns:
             Formatted header section
         """
+        return "".join(self._header_lines(project_name, branch))
+    
+    def _header_lines(self, project_name: str, branch: Optional[str]) -> Iterator[str]:
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         
-        header = "# Compliance Report\n\n"
-        header += f"**Project**: {project_name}\n"
+        yield "# Compliance Report\n\n"
+        yield f"**Project**: {project_name}\n"
         if branch:
-            header += f"**Branch**: {branch}\n"
-        header += f"**Generated**: {timestamp}\n\n"
-        
-        return header
+            yield f"**Branch**: {branch}\n"
+        yield f"**Generated**: {timestamp}\n\n"
     
     def generate_summary_section(
         self,
-        results: List[RuleEvaluationResult]
+        results: Results
     ) -> str:
         """
         Generate summary statistics section.
         
         Args:
-            results: Rule evaluation results
+            results: Rule evaluation results, or their ResultAggregate
         
         Returns:
             Formatted summary section
         """
-        pass_count = sum(1 for r in results if r.status == RuleStatus.PASS)
-        fail_count = sum(1 for r in results if r.status == RuleStatus.FAIL)
-        waived_count = sum(1 for r in results if r.status == RuleStatus.WAIVED)
-        error_count = sum(1 for r in results if r.status == RuleStatus.ERROR)
-        total = len(results)
+        return "".join(self._summary_lines(_aggregate(results)))
+    
+    def _summary_lines(self, aggregate: ResultAggregate) -> Iterator[str]:
+        pass_count = aggregate.pass_count
+        fail_count = aggregate.fail_count
+        waived_count = aggregate.waived_count
+        error_count = aggregate.error_count
+        total = aggregate.total
         
-        # Get unique waivers referenced
-        unique_waivers = set(r.waiver_id for r in results if r.waiver_id and r.status == RuleStatus.WAIVED)
+        # Unique waivers referenced
+        unique_waivers = aggregate.waiver_ids
         
         # Determine overall status
         if fail_count > 0:
@@ -137,157 +184,164 @@ class ComplianceReportGenerator:
         else:
             overall_status = f"✅ COMPLIANT ({pass_count} passed)"
         
-        summary = "## Summary\n\n"
-        summary += f"**Overall Status**: {overall_status}\n\n"
-        summary += f"| Metric | Count |\n"
-        summary += f"|--------|-------|\n"
-        summary += f"| Total Rules | {total} |\n"
-        summary += f"| ✅ Passed | {pass_count} |\n"
-        summary += f"| ❌ Failed | {fail_count} |\n"
-        summary += f"| 🚫 Waived | {waived_count} |\n"
-        summary += f"| ⚠️ Errors | {error_count} |\n"
+        yield "## Summary\n\n"
+        yield f"**Overall Status**: {overall_status}\n\n"
+        yield "| Metric | Count |\n"
+        yield "|--------|-------|\n"
+        yield f"| Total Rules | {total} |\n"
+        yield f"| ✅ Passed | {pass_count} |\n"
+        yield f"| ❌ Failed | {fail_count} |\n"
+        yield f"| 🚫 Waived | {waived_count} |\n"
+        yield f"| ⚠️ Errors | {error_count} |\n"
         
         # Add waiver statistics if any waivers present
         if unique_waivers:
-            summary += f"| 📋 Active Waivers | {len(unique_waivers)} |\n"
-        
-        summary += f"\n"
+            yield f"| 📋 Active Waivers | {len(unique_waivers)} |\n"
         
-        return summary
+        yield "\n"
     
     def generate_checked_guides_section(
         self,
-        results: List[RuleEvaluationResult]
+        results: Results
     ) -> str:
         """
         Generate section listing guides that were checked.
         
         Args:
-            results: Rule evaluation results
+            results: Rule evaluation results, or their ResultAggregate
         
         Returns:
             Formatted guides section
         """
-        guide_ids = set(r.guide_id for r in results if r.status != RuleStatus.ERROR or r.rule_type == "discovery")
+        return "".join(self._checked_guides_lines(_aggregate(results)))
+    
+    def _checked_guides_lines(self, aggregate: ResultAggregate) -> Iterator[str]:
+        guide_ids = aggregate.checked_guide_ids
         
         if not guide_ids:
-            return ""
+            return
         
-        section = "## Guides Checked\n\n"
+        yield "## Guides Checked\n\n"
         for guide_id in sorted(guide_ids):
-            section += f"- {guide_id}\n"
-        section += "\n"
-        
-        return section
+            yield f"- {guide_id}\n"
+        yield "\n"
     
     def generate_passed_rules_section(
         self,
-        results: List[RuleEvaluationResult]
+        results: Results
     ) -> str:
         """
         Generate section for passed rules.
         
         Args:
-            results: Rule evaluation results
+            results: Rule evaluation results, or their ResultAggregate
         
         Returns:
             Formatted passed rules section
         """
-        passed = [r for r in results if r.status == RuleStatus.PASS]
+        return "".join(self._passed_rules_lines(_aggregate(results)))
+    
+    def _passed_rules_lines(self, aggregate: ResultAggregate) -> Iterator[str]:
+        passed = aggregate.sorted_by_rule(RuleStatus.PASS)
         
         if not passed:
-            return ""
-        
-        section = "## ✅ Passed Rules\n\n"
-        for result in sorted(passed, key=lambda r: r.rule_id):
-            section += f"- **{result.rule_id}** ({result.guide_id})\n"
-            section += f"  - Message: {result.message}\n"
-        section += "\n"
+            return
         
-        return section
+        yield "## ✅ Passed Rules\n\n"
+        for result in passed:
+            yield f"- **{result.rule_id}** ({result.guide_id})\n"
+            yield f"  - Message: {result.message}\n"
+        yield "\n"
     
     def generate_failed_rules_section(
         self,
-        results: List[RuleEvaluationResult]
+        results: Results
     ) -> str:
         """
         Generate section for failed rules with recommendations.
         
         Args:
-            results: Rule evaluation results
+            results: Rule evaluation results, or their ResultAggregate
         
         Returns:
             Formatted failed rules section
         """
-        failed = [r for r in results if r.status == RuleStatus.FAIL]
+        return "".join(self._failed_rules_lines(_aggregate(results)))
+    
+    def _failed_rules_lines(self, aggregate: ResultAggregate) -> Iterator[str]:
+        failed = aggregate.sorted_by_rule(RuleStatus.FAIL)
         
         if not failed:
-            return ""
-        
-        section = "## ❌ Failed Rules\n\n"
-        for result in sorted(failed, key=lambda r: r.rule_id):
-            section += f"- **{result.rule_id}** ({result.guide_id})\n"
-            section += f"  - Type: {result.rule_type}\n"
-            section += f"  - Message: {result.message}\n"
-            section += f"  - Details: {result.target}\n"
-            section += f"\n  **Recommendation**: Review the implementation guide for {result.guide_id} "
-            section += f"to understand the requirement for {result.rule_id}.\n"
-            section += f"  Alternatively, create a waiver if this failure is intentional: "
-            section += f"`specify waive-requirement \"<reason>\"`\n\n"
-        
-        return section
+            return
+        
+        yield "## ❌ Failed Rules\n\n"
+        for result in failed:
+            yield f"- **{result.rule_id}** ({result.guide_id})\n"
+            yield f"  - Type: {result.rule_type}\n"
+            yield f"  - Message: {result.message}\n"
+            yield f"  - Details: {result.target}\n"
+            yield (
+                f"\n  **Recommendation**: Review the implementation guide for {result.guide_id} "
+                f"to understand the requirement for {result.rule_id}.\n"
+            )
+            yield (
+                "  Alternatively, create a waiver if this failure is intentional: "
+                "`specify waive-requirement \"<reason>\"`\n\n"
+            )
     
     def generate_waived_rules_section(
         self,
-        results: List[RuleEvaluationResult]
+        results: Results
     ) -> str:
         """
         Generate section for waived rules.
         
         Args:
-            results: Rule evaluation results
+            results: Rule evaluation results, or their ResultAggregate
         
         Returns:
             Formatted waived rules section
         """
-        waived = [r for r in results if r.status == RuleStatus.WAIVED]
+        return "".join(self._waived_rules_lines(_aggregate(results)))
+    
+    def _waived_rules_lines(self, aggregate: ResultAggregate) -> Iterator[str]:
+        waived = aggregate.sorted_by_rule(RuleStatus.WAIVED)
         
         if not waived:
-            return ""
-        
-        section = "## 🚫 Waived Rules\n\n"
-        for result in sorted(waived, key=lambda r: r.rule_id):
-            section += f"- **{result.rule_id}** (waiver: {result.waiver_id})\n"
-            section += f"  - Guide: {result.guide_id}\n"
-            section += f"  - Status: {result.message}\n"
-        section += "\n"
-        
-        return section
+            return
+        
+        yield "## 🚫 Waived Rules\n\n"
+        for result in waived:
+            yield f"- **{result.rule_id}** (waiver: {result.waiver_id})\n"
+            yield f"  - Guide: {result.guide_id}\n"
+            yield f"  - Status: {result.message}\n"
+        yield "\n"
     
     def generate_error_rules_section(
         self,
-        results: List[RuleEvaluationResult]
+        results: Results
     ) -> str:
         """
         Generate section for errors (optional).
         
         Args:
-            results: Rule evaluation results
+            results: Rule evaluation results, or their ResultAggregate
         
         Returns:
             Formatted errors section
         """
-        errors = [r for r in results if r.status == RuleStatus.ERROR]
+        return "".join(self._error_rules_lines(_aggregate(results)))
+    
+    def _error_rules_lines(self, aggregate: ResultAggregate) -> Iterator[str]:
+        errors = aggregate.sorted_by_rule(RuleStatus.ERROR)
         
         if not errors:
-            return ""
-        
-        section = "## ⚠️ Errors\n\n"
-        for result in sorted(errors, key=lambda r: r.rule_id):
-            section += f"- **{result.rule_type.upper()}**: {result.message}\n"
-        section += "\n"
+            return
         
-        return section
+        yield "## ⚠️ Errors\n\n"
+        for result in errors:
+            yield f"- **{result.rule_type.upper()}**: {result.message}\n"
+        yield "\n"
     
     def write_report_to_file(
         self,
@@ -307,24 +361,23 @@ class ComplianceReportGenerator:
     
     def generate_and_write_report(
         self,
-        results: List[RuleEvaluationResult],
+        results: Results,
         project_name: Optional[str] = None,
         branch: Optional[str] = None
     ) -> Path:
         """
         Generate and write compliance report in one operation.
         
+        The report is streamed to the file as it is generated.
+        
         Args:
-            results: Rule evaluation results
+            results: Rule evaluation results, or their ResultAggregate
             project_name: Optional project name
             branch: Optional git branch
         
         Returns:
             Path to written report file
         """
-        report_content = self.generate_report(
-            results,
-            project_name=project_name,
-            branch=branch
-        )
-        return self.write_report_to_file(report_content)
+        with open(self.report_file, "w", encoding="utf-8") as out:
+            self.write_report(results, out, project_name=project_name, branch=branch)
+        return self.report_file
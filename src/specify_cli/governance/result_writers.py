@@ -0,0 +1,210 @@
+"""
+Streaming machine-readable compliance output.
+
+Writers accept results one at a time, as ComplianceChecker produces them
+(see run_compliance_check's on_result), and write each to the output
+stream immediately instead of buffering the whole run:
+
+- jsonl: one RuleEvaluationResult.to_dict() object per line
+- json: {"results": [...], "summary": {...}}, with the array streamed
+- sarif: SARIF 2.1.0 log for CI code-scanning annotations
+"""
+
+import json
+from abc import ABC, abstractmethod
+from typing import Any, Dict, TextIO, Type
+import logging
+
+from . import __version__
+from .compliance import RuleEvaluationResult, RuleStatus
+
+logger = logging.getLogger(__name__)
+
+
+class ResultWriter(ABC):
+    """
+    Abstract base class for streaming result writers.
+    
+    Use as a context manager, or call close() once all results are written
+    to finish the document. The stream itself is not closed.
+    """
+    
+    def __init__(self, out: TextIO):
+        """
+        Initialize writer.
+        
+        Args:
+            out: Writable text stream
+        """
+        self.out = out
+        self.counts: Dict[str, int] = {status.value: 0 for status in RuleStatus}
+        self.closed = False
+        self._start()
+    
+    def _start(self) -> None:
+        """Write anything that precedes the first result."""
+    
+    @abstractmethod
+    def _write(self, result: RuleEvaluationResult) -> None:
+        """Write one result (counts are already updated)."""
+    
+    def _finish(self) -> None:
+        """Write anything that follows the last result."""
+    
+    def write(self, result: RuleEvaluationResult) -> None:
+        """
+        Write one result.
+        
+        Args:
+            result: Rule evaluation result
+        
+        Raises:
+            ValueError: If the writer is closed
+        """
+        if self.closed:
+            raise ValueError("Cannot write to a closed result writer")
+        self.counts[result.status.value] += 1
+        self._write(result)
+    
+    def close(self) -> None:
+        """Finish the document and flush the stream."""
+        if self.closed:
+            return
+        self._finish()
+        self.out.flush()
+        self.closed = True
+    
+    def __enter__(self) -> "ResultWriter":
+        return self
+    
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+
+class JsonlResultWriter(ResultWriter):
+    """Writes one JSON object per result and line, flushed as written."""
+    
+    def _write(self, result: RuleEvaluationResult) -> None:
+        self.out.write(json.dumps(result.to_dict(), ensure_ascii=False) + "\n")
+        self.out.flush()
+
+
+class JsonResultWriter(ResultWriter):
+    """Writes a JSON document whose results array is streamed element by element."""
+    
+    def _start(self) -> None:
+        self.out.write('{"results": [')
+        self._first = True
+    
+    def _write(self, result: RuleEvaluationResult) -> None:
+        separator = "\n  " if self._first else ",\n  "
+        self.out.write(separator + json.dumps(result.to_dict(), ensure_ascii=False))
+        self._first = False
+    
+    def _finish(self) -> None:
+        summary = {"total": sum(self.counts.values()), **self.counts}
+        self.out.write(("\n" if not self._first else "") + '], "summary": ' + json.dumps(summary) + "}\n")
+
+
+class SarifResultWriter(ResultWriter):
+    """
+    Writes a SARIF 2.1.0 log with one result per non-passing rule.
+    
+    Failed rules are reported at level "error" and evaluation errors at
+    "warning". Waived rules are reported at level "note" with an external
+    suppression naming the waiver, so code-scanning tools show them as
+    dismissed. Passed rules are only included with include_passed, as
+    kind "pass". Results with a path get a physical location for annotations.
+    """
+    
+    SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+    TOOL_NAME = "specify-compliance"
+    
+    def __init__(self, out: TextIO, include_passed: bool = False):
+        """
+        Initialize writer.
+        
+        Args:
+            out: Writable text stream
+            include_passed: Whether to report passed rules as kind "pass"
+        """
+        self.include_passed = include_passed
+        super().__init__(out)
+    
+    def _start(self) -> None:
+        driver = {"name": self.TOOL_NAME, "version": __version__}
+        header = json.dumps({"$schema": self.SCHEMA, "version": "2.1.0"})
+        # Open the runs array by hand so results can be streamed into it
+        self.out.write(header[:-1] + ', "runs": [{"tool": {"driver": ' + json.dumps(driver) + '}, "results": [')
+        self._first = True
+    
+    def _sarif_result(self, result: RuleEvaluationResult) -> Dict[str, Any]:
+        """Map a result to a SARIF result object."""
+        text = f"{result.message}: {result.target}" if result.target else result.message
+        sarif: Dict[str, Any] = {
+            "ruleId": result.rule_id,
+            "message": {"text": text},
+            "properties": {"guideId": result.guide_id, "ruleType": result.rule_type},
+        }
+        if result.status == RuleStatus.PASS:
+            sarif.update(kind="pass", level="none")
+        elif result.status == RuleStatus.FAIL:
+            sarif["level"] = "error"
+        elif result.status == RuleStatus.ERROR:
+            sarif["level"] = "warning"
+        else:
+            sarif["level"] = "note"
+            sarif["suppressions"] = [{"kind": "external", "justification": f"Waived by {result.waiver_id}"}]
+        if result.path:
+            sarif["locations"] = [{"physicalLocation": {"artifactLocation": {"uri": result.path}}}]
+        return sarif
+    
+    def _write(self, result: RuleEvaluationResult) -> None:
+        if result.status == RuleStatus.PASS and not self.include_passed:
+            return
+        separator = "" if self._first else ","
+        self.out.write(separator + json.dumps(self._sarif_result(result), ensure_ascii=False))
+        self._first = False
+    
+    def _finish(self) -> None:
+        self.out.write("]}]}\n")
+
+
+RESULT_WRITERS: Dict[str, Type[ResultWriter]] = {
+    "jsonl": JsonlResultWriter,
+    "json": JsonResultWriter,
+    "sarif": SarifResultWriter,
+}
+
+
+def create_result_writer(output_format: str, out: TextIO) -> ResultWriter:
+    """
+    Create a streaming writer for an output format.
+    
+    Args:
+        output_format: One of RESULT_WRITERS ("jsonl", "json", "sarif")
+        out: Writable text stream
+    
+    Returns:
+        Result writer
+    
+    Raises:
+        ValueError: If the format is unknown
+    """
+    writer_class = RESULT_WRITERS.get(output_format)
+    if writer_class is None:
+        raise ValueError(
+            f"Unknown output format: {output_format}. Supported formats: {', '.join(RESULT_WRITERS)}"
+        )
+    logger.debug(f"Streaming results as {output_format}")
+    return writer_class(out)
+
+
+__all__ = [
+    'JsonResultWriter',
+    'JsonlResultWriter',
+    'RESULT_WRITERS',
+    'ResultWriter',
+    'SarifResultWriter',
+    'create_result_writer',
+]
@@ -5,7 +5,9 @@ Provides base rule abstraction and rule registry for governance compliance.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any
+from typing import Dict, Any, Optional, Tuple
+
+from .content_store import FileContentStore
 
 
 class BaseRule(ABC):
@@ -13,6 +15,9 @@ class BaseRule(ABC):
     
     TYPE: str = ""  # Override in subclasses
     
+    # IDs of rules that must pass before this one is evaluated (see rules.dependencies)
+    depends_on: Tuple[str, ...] = ()
+    
     def __init__(self, rule_id: str, description: str, **kwargs):
         """
         Initialize a compliance rule.
@@ -27,12 +32,13 @@ class BaseRule(ABC):
         self.rule_data = kwargs
     
     @abstractmethod
-    def evaluate(self, project_root: str) -> Dict[str, Any]:
+    def evaluate(self, project_root: str, store: Optional[FileContentStore] = None) -> Dict[str, Any]:
         """
         Evaluate rule against project codebase.
         
         Args:
             project_root: Absolute path to project root directory
+            store: Optional run-scoped content store shared between rules
         
         Returns:
             Dictionary with keys:
@@ -68,4 +74,4 @@ class BaseRule(ABC):
         return cls(rule_id, description, **data)
 
 
-__all__ = ['BaseRule']
+__all__ = ['BaseRule', 'FileContentStore']
@@ -0,0 +1,265 @@
+"""
+Run-scoped file content store.
+
+Shares file reads and stat results between all rules evaluated in a single
+compliance run, so a file targeted by many rules is only read once.
+"""
+
+import os
+import threading
+from pathlib import Path
+from typing import Dict, List, Optional, Union
+import logging
+
+from ..caching import ProjectFileIndex
+from .globbing import TreeIndex
+from .manifests import ManifestIndex, parse_manifest
+from .text_index import MappedTextIndex, TextMatchIndex
+
+logger = logging.getLogger(__name__)
+
+
+class FileContentStore:
+    """
+    Caches file contents and stat results for the duration of one run.
+    
+    Paths are resolved relative to the project root. The store is safe to
+    share between threads: concurrent requests for the same file block on a
+    per-path lock so the file is still read only once.
+    
+    Text searches on files of at least mmap_threshold bytes go through a
+    memory map (see MappedTextIndex) instead of reading the file into memory.
+    Glob targets are expanded through a shared TreeIndex, so every glob in
+    a run reuses the same directory listings.
+    
+    With a ProjectFileIndex, existence checks and directory listings are
+    answered from the index: paths it knows are missing are never stat-ed,
+    and only existing paths cost a (memoized) stat for their size and mtime.
+    """
+    
+    # Files at least this large are searched via mmap (64 MiB)
+    MMAP_THRESHOLD = 64 * 1024 * 1024
+    
+    def __init__(
+        self,
+        project_root: Union[str, Path],
+        mmap_threshold: Optional[int] = MMAP_THRESHOLD,
+        file_index: Optional[ProjectFileIndex] = None
+    ):
+        """
+        Initialize content store.
+        
+        Args:
+            project_root: Root directory that relative paths resolve against
+            mmap_threshold: Size in bytes from which text searches memory-map
+                the file instead of decoding it (None disables mapping)
+            file_index: Optional project file index answering existence
+                checks and directory listings
+        """
+        self.project_root = Path(project_root)
+        self.mmap_threshold = mmap_threshold
+        self.file_index = file_index
+        self.hits = 0
+        self.misses = 0
+        self._stats: Dict[Path, Optional[os.stat_result]] = {}
+        self._texts: Dict[Path, Union[str, Exception]] = {}
+        self._lock = threading.Lock()
+        self._path_locks: Dict[Path, threading.Lock] = {}
+        self._text_indexes: Dict[Path, Union[TextMatchIndex, MappedTextIndex]] = {}
+        self._manifests: Dict[Path, Union[ManifestIndex, Exception]] = {}
+        self.tree = TreeIndex(self.project_root, file_index)
+    
+    def resolve(self, relative_path: Union[str, Path]) -> Path:
+        """
+        Resolve a rule target against the project root.
+        
+        Args:
+            relative_path: Path relative to project root
+        
+        Returns:
+            Full path to the target
+        """
+        return self.project_root / relative_path
+    
+    def stat(self, relative_path: Union[str, Path]) -> Optional[os.stat_result]:
+        """
+        Get stat result for a path (size, mtime, type).
+        
+        Args:
+            relative_path: Path relative to project root
+        
+        Returns:
+            os.stat_result, or None if the path does not exist
+        """
+        path = self.resolve(relative_path)
+        with self._lock:
+            if path in self._stats:
+                self.hits += 1
+                return self._stats[path]
+        
+        result: Optional[os.stat_result] = None
+        if self.file_index is None or self.file_index.exists(str(relative_path)) is not False:
+            try:
+                result = path.stat()
+            except OSError:
+                pass
+        
+        with self._lock:
+            self.misses += 1
+            return self._stats.setdefault(path, result)
+    
+    def exists(self, relative_path: Union[str, Path]) -> bool:
+        """
+        Check whether a path exists.
+        
+        Args:
+            relative_path: Path relative to project root
+        
+        Returns:
+            True if the path exists
+        """
+        return self.stat(relative_path) is not None
+    
+    def glob(self, pattern: str, include_dirs: bool = True) -> List[str]:
+        """
+        Expand a glob target (see governance.rules.globbing).
+        
+        Args:
+            pattern: Glob pattern relative to project root
+            include_dirs: Whether matched directories are returned as well as files
+        
+        Returns:
+            Sorted matching paths relative to project root
+        """
+        return self.tree.glob(pattern, include_dirs)
+    
+    def read_text(self, relative_path: Union[str, Path]) -> str:
+        """
+        Read and decode a file, returning the shared buffer on later calls.
+        
+        Args:
+            relative_path: Path relative to project root
+        
+        Returns:
+            File content
+        
+        Raises:
+            OSError, UnicodeDecodeError: Whatever the first read raised; the
+                error is remembered and re-raised for every later caller
+        """
+        path = self.resolve(relative_path)
+        with self._lock:
+            path_lock = self._path_locks.setdefault(path, threading.Lock())
+        
+        with path_lock:
+            with self._lock:
+                cached = self._texts.get(path)
+                if cached is not None:
+                    self.hits += 1
+            
+            if cached is None:
+                try:
+                    cached = path.read_text()
+                except Exception as e:
+                    cached = e
+                with self._lock:
+                    self.misses += 1
+                    self._texts[path] = cached
+        
+        if isinstance(cached, Exception):
+            raise cached
+        return cached
+    
+    def is_large(self, relative_path: Union[str, Path]) -> bool:
+        """
+        Check whether a file is at or above the mmap threshold.
+        
+        Args:
+            relative_path: Path relative to project root
+        
+        Returns:
+            True if text searches on the file should be memory-mapped
+        """
+        if self.mmap_threshold is None:
+            return False
+        stat_result = self.stat(relative_path)
+        return stat_result is not None and stat_result.st_size >= max(self.mmap_threshold, 1)
+    
+    def text_index(self, relative_path: Union[str, Path]) -> Union[TextMatchIndex, MappedTextIndex]:
+        """
+        Get the shared pattern index for a file.
+        
+        Args:
+            relative_path: Path relative to project root
+        
+        Returns:
+            MappedTextIndex for large files, otherwise TextMatchIndex over
+            the file's decoded content
+        
+        Raises:
+            OSError, UnicodeDecodeError: If the file cannot be read
+        """
+        path = self.resolve(relative_path)
+        with self._lock:
+            index = self._text_indexes.get(path)
+        if index is not None:
+            return index
+        
+        if self.is_large(relative_path):
+            if not path.is_file():
+                raise IsADirectoryError(f"Not a file: {path}")
+            new_index: Union[TextMatchIndex, MappedTextIndex] = MappedTextIndex(path)
+        else:
+            new_index = TextMatchIndex(self.read_text(relative_path))
+        
+        with self._lock:
+            return self._text_indexes.setdefault(path, new_index)
+    
+    def manifest_index(self, relative_path: Union[str, Path]) -> ManifestIndex:
+        """
+        Get the parsed package index of a manifest, parsing it once per run.
+        
+        Args:
+            relative_path: Manifest path relative to project root
+        
+        Returns:
+            ManifestIndex of declared packages
+        
+        Raises:
+            OSError, UnicodeDecodeError: If the file cannot be read
+            ManifestParseError: If the manifest cannot be parsed; remembered
+                and re-raised for every later caller
+        """
+        content = self.read_text(relative_path)
+        path = self.resolve(relative_path)
+        with self._lock:
+            path_lock = self._path_locks.setdefault(path, threading.Lock())
+        
+        with path_lock:
+            index = self._manifests.get(path)
+            if index is None:
+                try:
+                    index = parse_manifest(str(relative_path), content)
+                except Exception as e:
+                    index = e
+                with self._lock:
+                    self._manifests[path] = index
+        
+        if isinstance(index, Exception):
+            raise index
+        return index
+    
+    def clear(self) -> None:
+        """Drop all cached contents and reset counters."""
+        with self._lock:
+            self._stats.clear()
+            self._texts.clear()
+            self._text_indexes.clear()
+            self._manifests.clear()
+            self._path_locks.clear()
+            self.tree = TreeIndex(self.project_root, self.file_index)
+            self.hits = 0
+            self.misses = 0
+
+
+__all__ = ['FileContentStore']
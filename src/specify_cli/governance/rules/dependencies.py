@@ -0,0 +1,162 @@
+"""
+Rule dependencies.
+
+A rule may name other rules of the same guide in 'depends_on' (a rule ID
+or a list of IDs). It is only evaluated once every rule it depends on has
+passed; otherwise it is skipped and reported as failed without touching
+the filesystem, so a chain like file_exists -> dependency_present ->
+text_includes stops at the first broken link.
+
+Dependencies must form a DAG: unknown IDs and cycles are rejected when
+guides are parsed.
+"""
+
+from collections import deque
+from typing import Any, Dict, List, Mapping, Sequence, Tuple
+
+
+def rule_dependencies(rule_data: Mapping[str, Any]) -> Tuple[str, ...]:
+    """
+    Get the rule IDs a rule definition depends on.
+    
+    Args:
+        rule_data: Rule definition
+    
+    Returns:
+        Dependency IDs in declaration order, without duplicates
+    """
+    depends_on = rule_data.get('depends_on')
+    if not depends_on:
+        return ()
+    if isinstance(depends_on, str):
+        return (depends_on,)
+    return tuple(dict.fromkeys(depends_on))
+
+
+def dependency_levels(rule_ids: Sequence[str], dependencies: Sequence[Sequence[str]]) -> List[List[int]]:
+    """
+    Group rules into levels that can be evaluated one after another.
+    
+    A rule's level is one more than the highest level among the rules it
+    depends on, so rules within a level never depend on each other and
+    independent branches of the graph share levels. Rules keep their
+    original order within a level. When several rules share an ID, a
+    dependency on that ID waits for all of them.
+    
+    Args:
+        rule_ids: ID of each rule
+        dependencies: IDs each rule depends on (see rule_dependencies)
+    
+    Returns:
+        Levels of rule indexes, dependencies first
+    
+    Raises:
+        ValueError: If a rule depends on an unknown ID or dependencies form a cycle
+    """
+    indexes_by_id: Dict[str, List[int]] = {}
+    for index, rule_id in enumerate(rule_ids):
+        indexes_by_id.setdefault(rule_id, []).append(index)
+    
+    for rule_id, depends_on in zip(rule_ids, dependencies):
+        for dependency in depends_on:
+            if dependency not in indexes_by_id:
+                raise ValueError(f"Rule '{rule_id}' depends on unknown rule '{dependency}'")
+    
+    # Kahn's algorithm: a rule is placed once every rule it depends on is
+    dependents: List[List[int]] = [[] for _ in rule_ids]
+    waiting: List[int] = [0] * len(rule_ids)
+    for index, depends_on in enumerate(dependencies):
+        for dependency in depends_on:
+            for dependency_index in indexes_by_id[dependency]:
+                dependents[dependency_index].append(index)
+                waiting[index] += 1
+    
+    levels: List[int] = [0] * len(rule_ids)
+    ready = deque(index for index in range(len(rule_ids)) if not waiting[index])
+    placed = 0
+    while ready:
+        index = ready.popleft()
+        placed += 1
+        for dependent in dependents[index]:
+            levels[dependent] = max(levels[dependent], levels[index] + 1)
+            waiting[dependent] -= 1
+            if not waiting[dependent]:
+                ready.append(dependent)
+    
+    if placed < len(rule_ids):
+        raise ValueError(f"Rule dependencies form a cycle: {_find_cycle(rule_ids, dependencies, indexes_by_id, waiting)}")
+    
+    grouped: List[List[int]] = [[] for _ in range(max(levels, default=-1) + 1)]
+    for index in range(len(rule_ids)):
+        grouped[levels[index]].append(index)
+    return grouped
+
+
+def _find_cycle(
+    rule_ids: Sequence[str],
+    dependencies: Sequence[Sequence[str]],
+    indexes_by_id: Mapping[str, List[int]],
+    waiting: Sequence[int]
+) -> str:
+    """
+    Describe a dependency cycle among the rules Kahn's algorithm could not place.
+    
+    Every unplaced rule depends on another unplaced rule, so following the
+    first unplaced dependency from the first unplaced rule reaches a cycle.
+    
+    Returns:
+        Cycle as 'a -> b -> a'
+    """
+    index = next(i for i, count in enumerate(waiting) if count)
+    path: List[int] = []
+    while index not in path:
+        path.append(index)
+        index = next(
+            dependency_index
+            for dependency in dependencies[index]
+            for dependency_index in indexes_by_id[dependency]
+            if waiting[dependency_index]
+        )
+    cycle = path[path.index(index):] + [index]
+    return ' -> '.join(rule_ids[i] for i in cycle)
+
+
+def dependency_order(rules_data: Sequence[Mapping[str, Any]]) -> List[int]:
+    """
+    Order rule definitions so every rule comes after the rules it depends on.
+    
+    Args:
+        rules_data: Rule definitions of one guide
+    
+    Returns:
+        Indexes into rules_data, level by level (see dependency_levels)
+    
+    Raises:
+        ValueError: If a rule depends on an unknown ID or dependencies form a cycle
+    """
+    levels = dependency_levels(
+        [str(rule_data.get('id', '')) for rule_data in rules_data],
+        [rule_dependencies(rule_data) for rule_data in rules_data]
+    )
+    return [index for level in levels for index in level]
+
+
+def skipped_evaluation(dependency: str) -> Dict[str, Any]:
+    """
+    Build the evaluation reported for a rule whose dependency did not pass.
+    
+    Args:
+        dependency: ID of the first dependency that did not pass
+    
+    Returns:
+        Evaluation dictionary (passed, message, details, skipped)
+    """
+    return {
+        'passed': False,
+        'message': f"⏭️ Skipped: depends on '{dependency}', which did not pass",
+        'details': f"Not evaluated because rule '{dependency}' did not pass",
+        'skipped': True,
+    }
+
+
+__all__ = ['dependency_levels', 'dependency_order', 'rule_dependencies', 'skipped_evaluation']
@@ -4,10 +4,11 @@ Dependency-based compliance rules.
 Implements rules that check for package dependencies in manifest files.
 """
 
-from pathlib import Path
 from typing import Dict, Any, Optional
 import re
-from . import BaseRule
+from . import BaseRule, FileContentStore
+from .manifests import is_supported_manifest
+from .versions import parse_specifier, specifiers_intersect
 
 
 class DependencyPresentRule(BaseRule):
@@ -47,12 +48,13 @@ class DependencyPresentRule(BaseRule):
         self.package = package
         self.version = version
     
-    def evaluate(self, project_root: str) -> Dict[str, Any]:
+    def evaluate(self, project_root: str, store: Optional[FileContentStore] = None) -> Dict[str, Any]:
         """
         Check if package is declared in manifest.
         
         Args:
             project_root: Absolute path to project root
+            store: Optional run-scoped content store (shares file reads)
         
         Returns:
             Dictionary with:
@@ -60,18 +62,21 @@ class DependencyPresentRule(BaseRule):
                 - message (str): Status message
                 - details (str): Version found, version required, etc.
         """
-        project_path = Path(project_root)
-        manifest_path = project_path / self.file
+        store = store or FileContentStore(project_root)
+        manifest_path = store.resolve(self.file)
         
-        if not manifest_path.exists():
+        if not store.exists(self.file):
             return {
                 "passed": False,
                 "message": f"❌ Manifest file not found: {self.file}",
                 "details": f"Expected manifest at: {manifest_path}"
             }
         
+        if is_supported_manifest(self.file):
+            return self._evaluate_manifest(store)
+        
         try:
-            content = manifest_path.read_text()
+            index = store.text_index(self.file)
         except Exception as e:
             return {
                 "passed": False,
@@ -79,8 +84,8 @@ class DependencyPresentRule(BaseRule):
                 "details": f"Error: {str(e)}"
             }
         
-        # Check if package is mentioned in manifest
-        package_found = self.package in content
+        # Unsupported manifest format: check if package is mentioned
+        package_found = index.find(self.package).found
         
         if not package_found:
             return {
@@ -89,11 +94,10 @@ class DependencyPresentRule(BaseRule):
                 "details": f"Searched in: {manifest_path}"
             }
         
-        # If version specified, provide details (full version matching deferred to future enhancement)
+        # If version specified, provide details (no structured data to validate against)
         if self.version:
-            # Simple presence check for now - full semantic versioning in future iteration
             version_pattern = re.escape(self.package) + r'[^\n]*' + re.escape(self.version.replace('>=', '').replace('~', '').replace('>', '').replace('<', '').replace('=', '').strip())
-            version_mentioned = re.search(version_pattern, content, re.IGNORECASE)
+            version_mentioned = index.search(version_pattern, re.IGNORECASE)
             
             if version_mentioned:
                 return {
@@ -105,7 +109,7 @@ class DependencyPresentRule(BaseRule):
                 return {
                     "passed": True,
                     "message": f"✅ Package '{self.package}' declared in {self.file}",
-                    "details": f"Note: Version constraint '{self.version}' not explicitly validated (semantic versioning deferred)"
+                    "details": f"Note: Version constraint '{self.version}' not explicitly validated (unsupported manifest format)"
                 }
         
         return {
@@ -114,6 +118,81 @@ class DependencyPresentRule(BaseRule):
             "details": f"Found in: {manifest_path}"
         }
     
+    def _evaluate_manifest(self, store: FileContentStore) -> Dict[str, Any]:
+        """
+        Check the package against the manifest's parsed package index.
+        
+        The rule passes when the declared range allows some version the
+        rule's constraint allows; lockfiles declare the resolved version
+        directly.
+        
+        Args:
+            store: Run-scoped content store (shares parsed manifests)
+        
+        Returns:
+            Evaluation result dictionary (see evaluate)
+        """
+        try:
+            index = store.manifest_index(self.file)
+        except Exception as e:
+            return {
+                "passed": False,
+                "message": f"❌ Could not read manifest file: {self.file}",
+                "details": f"Error: {str(e)}"
+            }
+        
+        if self.package not in index:
+            return {
+                "passed": False,
+                "message": f"❌ Package '{self.package}' not declared in {self.file}",
+                "details": f"Searched in: {store.resolve(self.file)}"
+            }
+        
+        declared = index.get(self.package)
+        if not self.version:
+            return {
+                "passed": True,
+                "message": f"✅ Package '{self.package}' declared in {self.file}",
+                "details": f"Declared version: {declared}" if declared else f"Found in: {store.resolve(self.file)}"
+            }
+        
+        try:
+            parse_specifier(self.version)
+        except ValueError as e:
+            return {
+                "passed": False,
+                "message": f"❌ Invalid version constraint for '{self.package}': {self.version}",
+                "details": f"Error: {str(e)}"
+            }
+        
+        unchecked = None
+        if not declared:
+            unchecked = "no version declared"
+        else:
+            try:
+                satisfied = specifiers_intersect(declared, self.version)
+            except ValueError:
+                unchecked = f"declared version '{declared}' is not a version range"
+        if unchecked is not None:
+            return {
+                "passed": True,
+                "message": f"✅ Package '{self.package}' declared in {self.file}",
+                "details": f"Note: Version constraint '{self.version}' not validated ({unchecked})"
+            }
+        
+        if not satisfied:
+            return {
+                "passed": False,
+                "message": f"❌ Package '{self.package}' version does not satisfy {self.version} in {self.file}",
+                "details": f"Declared version: {declared}"
+            }
+        
+        return {
+            "passed": True,
+            "message": f"✅ Package '{self.package}' declared with version constraint in {self.file}",
+            "details": f"Declared version {declared} satisfies {self.version}"
+        }
+    
     @classmethod
     def from_yaml(cls, data: Dict[str, Any]) -> 'DependencyPresentRule':
         """
@@ -4,15 +4,196 @@ Rule engine orchestration.
 Manages rule registration, evaluation, and provides rule factory.
 """
 
-from typing import List, Dict, Any
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import partial
+from typing import Callable, List, Dict, Any, Optional, Tuple
+import json
 import logging
+import os
+import threading
+import time
 
 logger = logging.getLogger(__name__)
 
 from .file_rules import FileExistsRule
 from .dependency_rules import DependencyPresentRule
-from .text_rules import TextIncludesRule
+from .text_rules import TextIncludesRule, TextMatchesRule
+from .content_store import FileContentStore
+from ..caching import ProjectFileIndex
+from .dependencies import dependency_levels, rule_dependencies, skipped_evaluation
+from .globbing import is_glob
 from . import BaseRule
+from ..metrics import get_metrics_collector
+
+
+def prepare_text_indexes(store: FileContentStore, rules: List[BaseRule]) -> None:
+    """
+    Search each file once for all text patterns and expressions targeting it.
+    
+    Rules then read their matches from the shared per-file index, and the
+    regular expressions against one file are searched as one batch. Files
+    that cannot be read are left for the rules to report.
+    
+    Args:
+        store: Run-scoped content store shared between rules
+        rules: Rules about to be evaluated
+    """
+    patterns_by_file: Dict[str, List[tuple]] = {}
+    regexes_by_file: Dict[str, List[tuple]] = {}
+    for rule in rules:
+        if isinstance(rule, TextIncludesRule):
+            by_file, query = patterns_by_file, (rule.text, rule.case_sensitive)
+        elif isinstance(rule, TextMatchesRule):
+            by_file, query = regexes_by_file, rule.query
+        else:
+            continue
+        files = store.glob(rule.file, include_dirs=False) if is_glob(rule.file) else [rule.file]
+        for file in files:
+            by_file.setdefault(file, []).append(query)
+    
+    for file in dict.fromkeys([*patterns_by_file, *regexes_by_file]):
+        if not store.exists(file):
+            continue
+        try:
+            index = store.text_index(file)
+            if file in patterns_by_file:
+                index.find_all(patterns_by_file[file])
+            if file in regexes_by_file:
+                index.find_regex_all(regexes_by_file[file])
+        except Exception as e:
+            logger.debug(f"Skipping text index for {file}: {e}")
+
+
+def evaluate_rule_batch(
+    project_root: str,
+    rules_data: List[Dict[str, Any]]
+) -> Tuple[List[Dict[str, Any]], int, int, List[float]]:
+    """
+    Evaluate a batch of rule definitions (process-pool worker entry point).
+    
+    The batch shares one FileContentStore, so batching rules by target file
+    keeps each file read in a single worker.
+    
+    Args:
+        project_root: Project root directory
+        rules_data: Rule definitions as parsed from guide frontmatter
+    
+    Returns:
+        Tuple of (evaluation dicts in input order, store hits, store misses,
+        seconds spent on each rule). A rule that raises yields
+        {'passed': False, 'error': <message>}.
+    """
+    store = FileContentStore(project_root)
+    factory = RuleFactory()
+    rules: List[Any] = []
+    for rule_data in rules_data:
+        try:
+            rules.append(factory.create(rule_data))
+        except Exception as e:
+            rules.append(e)
+    prepare_text_indexes(store, [rule for rule in rules if isinstance(rule, BaseRule)])
+    
+    evaluations = []
+    durations = []
+    for rule in rules:
+        started = time.perf_counter()
+        try:
+            if isinstance(rule, Exception):
+                raise rule
+            evaluations.append(rule.evaluate(project_root, store=store))
+        except Exception as e:
+            evaluations.append({'passed': False, 'error': str(e)})
+        durations.append(time.perf_counter() - started)
+    return evaluations, store.hits, store.misses, durations
+
+
+def chunk_by_target(
+    rules_data: List[Dict[str, Any]],
+    target_of: Callable[[Dict[str, Any]], str],
+    min_chunk_size: int = 1
+) -> List[List[int]]:
+    """
+    Group rule indexes so rules sharing a target file land in the same chunk.
+    
+    Groups keep first-seen order; consecutive groups are merged until a
+    chunk holds at least min_chunk_size rules, to limit per-task overhead.
+    
+    Args:
+        rules_data: Rule definitions
+        target_of: Returns the target file of a rule definition
+        min_chunk_size: Smallest number of rules per chunk (last may be smaller)
+    
+    Returns:
+        List of chunks, each a list of indexes into rules_data
+    """
+    groups: Dict[str, List[int]] = {}
+    for index, rule_data in enumerate(rules_data):
+        groups.setdefault(target_of(rule_data), []).append(index)
+    
+    chunks: List[List[int]] = []
+    current: List[int] = []
+    for indexes in groups.values():
+        current.extend(indexes)
+        if len(current) >= min_chunk_size:
+            chunks.append(current)
+            current = []
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def evaluate_rules_in_processes(
+    project_root: str,
+    rules_data: List[Dict[str, Any]],
+    max_workers: Optional[int],
+    target_of: Callable[[Dict[str, Any]], str]
+) -> Tuple[List[Dict[str, Any]], int, int, List[float]]:
+    """
+    Evaluate rule definitions on a process pool, chunked per target file.
+    
+    Falls back to evaluating in the current process if a pool cannot be
+    started or a worker dies.
+    
+    Args:
+        project_root: Project root directory
+        rules_data: Rule definitions to evaluate
+        max_workers: Number of worker processes (None = CPU count)
+        target_of: Returns the target file of a rule definition
+    
+    Returns:
+        Tuple of (evaluation dicts in input order, store hits, store misses,
+        seconds each rule took in its worker)
+    """
+    if not rules_data:
+        return [], 0, 0, []
+    
+    workers = max_workers or os.cpu_count() or 1
+    # Several chunks per worker keeps the pool busy when chunk sizes vary
+    min_chunk_size = max(1, len(rules_data) // (workers * 4))
+    chunks = chunk_by_target(rules_data, target_of, min_chunk_size)
+    logger.debug(f"Evaluating {len(rules_data)} rules in {len(chunks)} chunks on {workers} processes")
+    
+    evaluations: List[Optional[Dict[str, Any]]] = [None] * len(rules_data)
+    durations = [0.0] * len(rules_data)
+    hits = misses = 0
+    try:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            batches = executor.map(
+                partial(evaluate_rule_batch, project_root),
+                [[rules_data[index] for index in chunk] for chunk in chunks]
+            )
+            for chunk, (batch, batch_hits, batch_misses, batch_durations) in zip(chunks, batches):
+                for index, evaluation, duration in zip(chunk, batch, batch_durations):
+                    evaluations[index] = evaluation
+                    durations[index] = duration
+                hits += batch_hits
+                misses += batch_misses
+    except (BrokenProcessPool, OSError) as e:
+        logger.warning(f"Process pool unavailable ({e}), evaluating rules in-process")
+        return evaluate_rule_batch(project_root, rules_data)
+    
+    return evaluations, hits, misses, durations
 
 
 class RuleEngine:
@@ -23,18 +204,49 @@ class RuleEngine:
         'file_exists': FileExistsRule,
         'dependency_present': DependencyPresentRule,
         'text_includes': TextIncludesRule,
+        'text_matches': TextMatchesRule,
     }
     
-    def __init__(self, project_root: str):
+    BACKENDS = ('thread', 'process')
+    
+    def __init__(
+        self,
+        project_root: str,
+        max_workers: int = 1,
+        backend: str = 'thread',
+        file_index: Optional[ProjectFileIndex] = None
+    ):
         """
         Initialize rule engine.
         
         Args:
             project_root: Absolute path to project root directory
+            max_workers: Number of threads or processes used by evaluate_all
+                (1 = sequential)
+            backend: 'thread' for a thread pool (I/O-bound rules) or
+                'process' for a process pool (CPU-bound rules)
+            file_index: Optional project file index that in-process rules
+                query for existence and directory listings
+        
+        Raises:
+            ValueError: If max_workers is less than 1 or backend is unknown
         """
+        if max_workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {max_workers}")
+        self._check_backend(backend)
+        
         self.project_root = project_root
+        self.max_workers = max_workers
+        self.backend = backend
+        self.file_index = file_index
         self.rules: List[BaseRule] = []
     
+    @classmethod
+    def _check_backend(cls, backend: str) -> None:
+        """Validate an execution backend name."""
+        if backend not in cls.BACKENDS:
+            raise ValueError(f"Unknown backend: '{backend}'. Supported backends: {', '.join(cls.BACKENDS)}")
+    
     def register_rule(self, rule: BaseRule) -> None:
         """
         Register a rule for evaluation.
@@ -44,10 +256,27 @@ class RuleEngine:
         """
         self.rules.append(rule)
     
-    def evaluate_all(self) -> List[Dict[str, Any]]:
+    def evaluate_all(self, max_workers: Optional[int] = None, backend: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Evaluate all registered rules.
         
+        Rules are mostly I/O-bound (file stats and reads), so when more than
+        one worker is configured they are evaluated on a thread pool. With
+        the 'process' backend, rule definitions are shipped to a process
+        pool in chunks grouped by target file; rules of unregistered types
+        are still evaluated in-process. Results are always returned in
+        registration order. Rules evaluated in the same process share one
+        FileContentStore, so a file targeted by several rules is read once.
+        
+        Rules with depends_on are evaluated level by level (see
+        dependency_levels): each level runs concurrently as above, so
+        independent branches proceed side by side, and a rule whose
+        dependency did not pass is skipped without being evaluated.
+        
+        Args:
+            max_workers: Override the engine's worker count for this call
+            backend: Override the engine's backend for this call
+        
         Returns:
             List of evaluation results, each containing:
                 - rule_id: Rule identifier
@@ -56,47 +285,202 @@ class RuleEngine:
                 - message: Status message
                 - details: Additional context
                 - description: Rule description
+                - skipped: Present (True) when a dependency did not pass
+        
+        Raises:
+            ValueError: If max_workers is less than 1, backend is unknown, or
+                rule dependencies name unknown rules or form a cycle
         """
-        logger.debug(f"Evaluating {len(self.rules)} registered rules")
-        results = []
-        
-        for rule in self.rules:
-            logger.debug(f"Evaluating rule: {rule.id} ({rule.TYPE})")
-            try:
-                evaluation = rule.evaluate(self.project_root)
-                status = "PASS" if evaluation['passed'] else "FAIL"
-                logger.debug(f"Rule {rule.id}: {status} - {evaluation['message']}")
-                results.append({
-                    'rule_id': rule.id,
-                    'rule_type': rule.TYPE,
-                    'description': rule.description,
-                    'passed': evaluation['passed'],
-                    'message': evaluation['message'],
-                    'details': evaluation.get('details', ''),
-                })
-            except Exception as e:
-                # Rule evaluation error - mark as error status
-                logger.error(f"Error evaluating rule {rule.id}: {str(e)}")
-                results.append({
-                    'rule_id': rule.id,
-                    'rule_type': rule.TYPE,
-                    'description': rule.description,
-                    'passed': False,
-                    'message': f"⚠️ Error evaluating rule",
-                    'details': f"Error: {str(e)}",
-                    'error': True,
-                })
+        workers = self.max_workers if max_workers is None else max_workers
+        if workers < 1:
+            raise ValueError(f"max_workers must be at least 1, got {workers}")
+        backend = backend or self.backend
+        self._check_backend(backend)
+        
+        logger.debug(f"Evaluating {len(self.rules)} registered rules ({workers} {backend} worker(s))")
+        
+        if any(rule.depends_on for rule in self.rules):
+            levels = dependency_levels([rule.id for rule in self.rules], [rule.depends_on for rule in self.rules])
+        else:
+            levels = [list(range(len(self.rules)))]
         
+        results: List[Optional[Dict[str, Any]]] = [None] * len(self.rules)
+        passed: Dict[str, bool] = {}
+        store = FileContentStore(self.project_root, file_index=self.file_index)
+        hits = misses = 0
+        for level in levels:
+            ready = []
+            for index in level:
+                rule = self.rules[index]
+                failed = next((dep for dep in rule.depends_on if not passed[dep]), None)
+                if failed is None:
+                    ready.append(index)
+                else:
+                    logger.debug(f"Skipping rule {rule.id}: dependency {failed} did not pass")
+                    results[index] = self._format_result(rule, skipped_evaluation(failed))
+            
+            evaluated, pool_hits, pool_misses = self._evaluate_rules(
+                [self.rules[index] for index in ready], workers, backend, store
+            )
+            hits += pool_hits
+            misses += pool_misses
+            for index, result in zip(ready, evaluated):
+                results[index] = result
+            for index in level:
+                rule_id = self.rules[index].id
+                passed[rule_id] = passed.get(rule_id, True) and results[index]['passed']
+        
+        get_metrics_collector().record_file_cache(hits + store.hits, misses + store.misses)
         logger.debug(f"Rule evaluation complete: {len(results)} results")
         return results
     
+    def _evaluate_rules(
+        self,
+        rules: List[BaseRule],
+        workers: int,
+        backend: str,
+        store: FileContentStore
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Evaluate rules that do not depend on each other.
+        
+        Args:
+            rules: Rules to evaluate
+            workers: Number of threads or processes
+            backend: 'thread' or 'process'
+            store: Content store for rules evaluated in this process
+        
+        Returns:
+            Tuple of (results in input order, process pool store hits,
+            process pool store misses)
+        """
+        if backend == 'process' and workers > 1 and len(rules) > 1:
+            return self._evaluate_in_processes(rules, workers, store)
+        
+        self._prepare_text_indexes(store, rules)
+        evaluate = partial(self._evaluate_rule, store=store)
+        
+        if workers > 1 and len(rules) > 1:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                # map() yields results in submission order
+                return list(executor.map(evaluate, rules)), 0, 0
+        return [evaluate(rule) for rule in rules], 0, 0
+    
+    def _evaluate_in_processes(
+        self,
+        rules: List[BaseRule],
+        workers: int,
+        store: FileContentStore
+    ) -> Tuple[List[Dict[str, Any]], int, int]:
+        """
+        Evaluate rules on a process pool.
+        
+        Args:
+            rules: Rules to evaluate
+            workers: Number of worker processes
+            store: Content store for rules of unregistered types, which are
+                evaluated in this process
+        
+        Returns:
+            Tuple of (results in input order, pool store hits, pool store misses)
+        """
+        results: List[Optional[Dict[str, Any]]] = [None] * len(rules)
+        shipped: List[int] = []
+        local_rules: List[int] = []
+        for index, rule in enumerate(rules):
+            # Only registry types can be rebuilt from their definition in a worker
+            if type(rule) is self.RULE_TYPES.get(rule.TYPE):
+                shipped.append(index)
+            else:
+                local_rules.append(index)
+        
+        rules_data = [self._rule_definition(rules[index]) for index in shipped]
+        evaluations, hits, misses, _ = evaluate_rules_in_processes(
+            self.project_root,
+            rules_data,
+            workers,
+            target_of=lambda rule_data: rule_data.get('file') or rule_data.get('path') or ''
+        )
+        for index, evaluation in zip(shipped, evaluations):
+            rule = rules[index]
+            if 'error' in evaluation:
+                logger.error(f"Error evaluating rule {rule.id}: {evaluation['error']}")
+                results[index] = self._error_result(rule, evaluation['error'])
+            else:
+                results[index] = self._format_result(rule, evaluation)
+        
+        for index in local_rules:
+            results[index] = self._evaluate_rule(rules[index], store=store)
+        
+        return results, hits, misses
+    
+    @staticmethod
+    def _rule_definition(rule: BaseRule) -> Dict[str, Any]:
+        """Rebuild the frontmatter definition of a rule instance."""
+        return {'id': rule.id, 'type': rule.TYPE, 'description': rule.description, **rule.rule_data}
+    
+    def _prepare_text_indexes(self, store: FileContentStore, rules: Optional[List[BaseRule]] = None) -> None:
+        """Search each file once for all text patterns of the given (default: registered) rules."""
+        prepare_text_indexes(store, self.rules if rules is None else rules)
+    
+    def _evaluate_rule(self, rule: BaseRule, store: Optional[FileContentStore] = None) -> Dict[str, Any]:
+        """
+        Evaluate a single rule, isolating any error it raises.
+        
+        Args:
+            rule: Rule instance to evaluate
+            store: Run-scoped content store shared between rules
+        
+        Returns:
+            Evaluation result dictionary (see evaluate_all)
+        """
+        logger.debug(f"Evaluating rule: {rule.id} ({rule.TYPE})")
+        try:
+            evaluation = rule.evaluate(self.project_root, store=store)
+            return self._format_result(rule, evaluation)
+        except Exception as e:
+            # Rule evaluation error - mark as error status
+            logger.error(f"Error evaluating rule {rule.id}: {str(e)}")
+            return self._error_result(rule, str(e))
+    
+    @staticmethod
+    def _format_result(rule: BaseRule, evaluation: Dict[str, Any]) -> Dict[str, Any]:
+        """Build the result dictionary for a completed evaluation."""
+        status = "PASS" if evaluation['passed'] else "FAIL"
+        logger.debug(f"Rule {rule.id}: {status} - {evaluation['message']}")
+        result = {
+            'rule_id': rule.id,
+            'rule_type': rule.TYPE,
+            'description': rule.description,
+            'passed': evaluation['passed'],
+            'message': evaluation['message'],
+            'details': evaluation.get('details', ''),
+        }
+        if evaluation.get('skipped'):
+            result['skipped'] = True
+        return result
+    
+    @staticmethod
+    def _error_result(rule: BaseRule, error: str) -> Dict[str, Any]:
+        """Build the result dictionary for a rule that raised."""
+        return {
+            'rule_id': rule.id,
+            'rule_type': rule.TYPE,
+            'description': rule.description,
+            'passed': False,
+            'message': f"⚠️ Error evaluating rule",
+            'details': f"Error: {error}",
+            'error': True,
+        }
+    
     @staticmethod
     def create_rule(rule_type: str, **kwargs) -> BaseRule:
         """
         Factory method to create appropriate rule type.
         
         Args:
-            rule_type: "file_exists", "dependency_present", or "text_includes"
+            rule_type: "file_exists", "dependency_present", "text_includes"
+                or "text_matches"
             **kwargs: Type-specific arguments (id, description, etc.)
         
         Returns:
@@ -113,7 +497,85 @@ class RuleEngine:
                 f"Supported types: {', '.join(RuleEngine.RULE_TYPES.keys())}"
             )
         
-        return rule_class.from_yaml(kwargs)
+        rule = rule_class.from_yaml(kwargs)
+        rule.depends_on = rule_dependencies(kwargs)
+        return rule
+
+
+class RuleFactory:
+    """
+    Builds rule instances from definitions, once per distinct definition.
+    
+    Definitions are keyed by their canonical JSON, so guides that declare
+    the same rule share one instance (rules keep no state between
+    evaluations). A definition that cannot be built fails the same way on
+    every request without being rebuilt. Create one factory per run so
+    instances do not outlive the guides they came from. Safe to share
+    between threads.
+    """
+    
+    def __init__(self, create_rule: Optional[Callable[..., BaseRule]] = None):
+        """
+        Initialize factory.
+        
+        Args:
+            create_rule: Builds a rule from (rule_type, **definition)
+                (defaults to RuleEngine.create_rule)
+        """
+        self.create_rule = create_rule or RuleEngine.create_rule
+        self.built = 0
+        self.reused = 0
+        self._rules: Dict[str, Any] = {}
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def definition_key(rule_data: Dict[str, Any]) -> str:
+        """Canonical form of a rule definition."""
+        return json.dumps(rule_data, sort_keys=True, default=str)
+    
+    def create(self, rule_data: Dict[str, Any]) -> BaseRule:
+        """
+        Get the rule instance for a definition, building it on first use.
+        
+        Args:
+            rule_data: Rule definition as parsed from guide frontmatter
+        
+        Returns:
+            Rule instance
+        
+        Raises:
+            ValueError: If the definition has no type, an unknown type, or
+                is missing fields its type requires
+        """
+        key = self.definition_key(rule_data)
+        with self._lock:
+            rule = self._rules.get(key)
+            if rule is not None:
+                self.reused += 1
+        
+        if rule is None:
+            rule = self._build(rule_data)
+            with self._lock:
+                rule = self._rules.setdefault(key, rule)
+                self.built += 1
+        
+        if isinstance(rule, ValueError):
+            raise ValueError(str(rule))
+        return rule
+    
+    def _build(self, rule_data: Dict[str, Any]) -> Any:
+        """Build a rule, returning the ValueError instead if the definition is invalid."""
+        rule_type = rule_data.get('type')
+        if not rule_type:
+            return ValueError(f"Rule '{rule_data.get('id', 'unknown')}' missing required field: 'type'")
+        try:
+            return self.create_rule(rule_type, **rule_data)
+        except ValueError as e:
+            return e
 
 
-__all__ = ['RuleEngine']
+__all__ = [
+    'RuleEngine',
+    'RuleFactory', 'chunk_by_target', 'evaluate_rule_batch', 'evaluate_rules_in_processes',
+    'prepare_text_indexes',
+]
@@ -4,35 +4,43 @@ File-based compliance rules.
 Implements rules that check for file existence in the project.
 """
 
-from pathlib import Path
-from typing import Dict, Any
-from . import BaseRule
+from typing import Dict, Any, Optional
+from . import BaseRule, FileContentStore
+from .globbing import is_glob, summarize_paths
 
 
 class FileExistsRule(BaseRule):
-    """Checks if a file exists in project."""
+    """
+    Checks if a file exists in project.
+    
+    A glob path (e.g. 'src/**/routes.py', see governance.rules.globbing)
+    passes when at least min_count files or directories match it.
+    """
     
     TYPE = "file_exists"
     
-    def __init__(self, rule_id: str, description: str, path: str, **kwargs):
+    def __init__(self, rule_id: str, description: str, path: str, min_count: int = 1, **kwargs):
         """
         Initialize file existence rule.
         
         Args:
             rule_id: Unique rule identifier
             description: Human-readable rule description
-            path: File path to check (relative to project root)
+            path: File path or glob pattern to check (relative to project root)
+            min_count: Paths a glob must match (ignored for literal paths)
             **kwargs: Additional rule data
         """
-        super().__init__(rule_id, description, path=path, **kwargs)
+        super().__init__(rule_id, description, path=path, min_count=min_count, **kwargs)
         self.path = path
+        self.min_count = min_count
     
-    def evaluate(self, project_root: str) -> Dict[str, Any]:
+    def evaluate(self, project_root: str, store: Optional[FileContentStore] = None) -> Dict[str, Any]:
         """
         Check if file exists at given path.
         
         Args:
             project_root: Absolute path to project root
+            store: Optional run-scoped content store (caches stat results)
         
         Returns:
             Dictionary with:
@@ -40,10 +48,13 @@ class FileExistsRule(BaseRule):
                 - message (str): "✅ File exists" or "❌ File not found"
                 - details (str): Full path checked
         """
-        project_path = Path(project_root)
-        file_path = project_path / self.path
+        store = store or FileContentStore(project_root)
+        if is_glob(self.path):
+            return self._evaluate_glob(store)
+        
+        file_path = store.resolve(self.path)
         
-        exists = file_path.exists()
+        exists = store.exists(self.path)
         
         return {
             "passed": exists,
@@ -51,6 +62,30 @@ class FileExistsRule(BaseRule):
             "details": f"Checked path: {file_path}"
         }
     
+    def _evaluate_glob(self, store: FileContentStore) -> Dict[str, Any]:
+        """Count the paths matching a glob path."""
+        matches = store.glob(self.path)
+        count = len(matches)
+        noun = "path" if count == 1 else "paths"
+        
+        if count >= self.min_count:
+            return {
+                "passed": True,
+                "message": f"✅ {count} {noun} match {self.path}",
+                "details": f"Matched: {summarize_paths(matches)}"
+            }
+        if not matches:
+            return {
+                "passed": False,
+                "message": f"❌ No paths match {self.path}",
+                "details": f"Searched for: {store.resolve(self.path)}"
+            }
+        return {
+            "passed": False,
+            "message": f"❌ {count} {noun} match {self.path}, expected at least {self.min_count}",
+            "details": f"Matched: {summarize_paths(matches)}"
+        }
+    
     @classmethod
     def from_yaml(cls, data: Dict[str, Any]) -> 'FileExistsRule':
         """
@@ -68,6 +103,7 @@ class FileExistsRule(BaseRule):
         rule_id = data.get('id')
         description = data.get('description')
         path = data.get('path')
+        min_count = data.get('min_count', 1)
         
         if not rule_id:
             raise ValueError("Rule missing required field: 'id'")
@@ -76,7 +112,7 @@ class FileExistsRule(BaseRule):
         if not path:
             raise ValueError(f"Rule '{rule_id}' of type 'file_exists' missing required field: 'path'")
         
-        return cls(rule_id, description, path)
+        return cls(rule_id, description, path, min_count)
 
 
 __all__ = ['FileExistsRule']
@@ -0,0 +1,273 @@
+"""
+Glob targets for compliance rules.
+
+Rule targets containing '*', '?' or '[' are glob patterns matched against
+'/'-separated paths relative to the project root:
+
+- '*' and '?' match within one path segment; '[...]' matches a character set
+- '**' as a whole segment matches zero or more directories
+  (e.g. 'src/**/routes.py'); a trailing '**' matches everything beneath
+- Wildcards do not match names starting with '.' unless the pattern segment
+  itself starts with '.', so '**' never descends into .git or virtualenvs
+- Symlinked directories are not descended into
+
+Matching walks only the part of the tree a pattern can reach, and every
+directory listing is memoized in a TreeIndex, so many glob rules over the
+same tree cost one walk. With a ProjectFileIndex, listings come from the
+index and wildcards never match ignored paths (literal segments still can).
+"""
+
+import os
+import stat
+import threading
+from fnmatch import fnmatchcase
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Dict, Iterator, List, Optional, Set, Tuple, Union
+import logging
+
+if TYPE_CHECKING:
+    from ..caching import ProjectFileIndex
+
+logger = logging.getLogger(__name__)
+
+GLOB_CHARS = frozenset('*?[')
+
+# (name, is_dir) of each entry in a directory
+DirEntries = Tuple[Tuple[str, bool], ...]
+
+
+def is_glob(target: str) -> bool:
+    """
+    Check whether a rule target is a glob pattern.
+    
+    Args:
+        target: Rule target path
+    
+    Returns:
+        True if the target contains glob characters
+    """
+    return any(char in GLOB_CHARS for char in target)
+
+
+@lru_cache(maxsize=1024)
+def _segments(pattern: str) -> Tuple[str, ...]:
+    """Split a pattern into segments, dropping empty and '.' segments."""
+    return tuple(part for part in Path(pattern).as_posix().split('/') if part and part != '.')
+
+
+def _segment_matches(segment: str, name: str) -> bool:
+    """Match one path segment, keeping hidden names out of wildcards."""
+    if name.startswith('.') and not segment.startswith('.'):
+        return False
+    return fnmatchcase(name, segment)
+
+
+def _match_parts(segments: Tuple[str, ...], parts: Tuple[str, ...]) -> bool:
+    """Match path parts against pattern segments, expanding '**' recursively."""
+    if not segments:
+        return not parts
+    segment = segments[0]
+    if segment == '**':
+        if len(segments) == 1:
+            return bool(parts) and not any(part.startswith('.') for part in parts[:-1])
+        for skip in range(len(parts) + 1):
+            if skip and parts[skip - 1].startswith('.'):
+                break
+            if _match_parts(segments[1:], parts[skip:]):
+                return True
+        return False
+    return bool(parts) and _segment_matches(segment, parts[0]) and _match_parts(segments[1:], parts[1:])
+
+
+def glob_matches(pattern: str, rel_path: str) -> bool:
+    """
+    Check whether a relative path matches a glob pattern.
+    
+    Args:
+        pattern: Glob pattern relative to project root
+        rel_path: '/'-separated path relative to project root
+    
+    Returns:
+        True if the path matches
+    """
+    return _match_parts(_segments(pattern), _segments(rel_path))
+
+
+MATCH_MODES = ('any', 'all')
+
+
+def quantifier_passed(satisfied: int, total: int, match: str = 'any', min_count: int = 1) -> bool:
+    """
+    Decide a glob rule from how many matched paths satisfy it.
+    
+    Args:
+        satisfied: Matched paths that satisfy the rule
+        total: Paths matched by the glob
+        match: 'any' (at least min_count paths satisfy) or 'all' (at least
+            min_count paths matched and every one satisfies)
+        min_count: Smallest number of paths required
+    
+    Returns:
+        True if the rule passes
+    """
+    if match == 'all':
+        return total >= min_count and satisfied == total
+    return satisfied >= min_count
+
+
+def summarize_paths(paths: List[str], limit: int = 5) -> str:
+    """
+    Format matched paths for rule details.
+    
+    Args:
+        paths: Relative paths
+        limit: Most paths to list before summarizing the rest
+    
+    Returns:
+        Comma-separated paths, with a count of any that were left out
+    """
+    shown = ", ".join(paths[:limit])
+    if len(paths) > limit:
+        shown += f" (+{len(paths) - limit} more)"
+    return shown
+
+
+class TreeIndex:
+    """
+    Memoized directory listings of a project for glob matching.
+    
+    Each directory is listed at most once per index and each pattern is
+    expanded at most once, so the index should live for one run (see
+    FileContentStore.glob). Safe to share between threads.
+    """
+    
+    def __init__(self, project_root: Union[str, Path], file_index: Optional["ProjectFileIndex"] = None):
+        """
+        Initialize tree index.
+        
+        Args:
+            project_root: Root directory that patterns are matched under
+            file_index: Optional project file index to take listings from
+        """
+        self.project_root = Path(project_root)
+        self.file_index = file_index
+        self.dirs_listed = 0
+        self._listings: Dict[str, Optional[DirEntries]] = {}
+        self._globs: Dict[Tuple[str, bool], List[str]] = {}
+        self._lock = threading.Lock()
+    
+    def list_dir(self, rel_dir: str) -> Optional[DirEntries]:
+        """
+        List a directory, reading it only on first use.
+        
+        Args:
+            rel_dir: '/'-separated directory relative to project root ('' for the root)
+        
+        Returns:
+            Sorted (name, is_dir) entries, or None if the directory cannot be read
+        """
+        with self._lock:
+            if rel_dir in self._listings:
+                return self._listings[rel_dir]
+        
+        entries = self.file_index.list_dir(rel_dir) if self.file_index is not None else None
+        if entries is None:
+            try:
+                with os.scandir(self.project_root / rel_dir) as it:
+                    entries = tuple(sorted(
+                        (entry.name, entry.is_dir(follow_symlinks=False)) for entry in it
+                    ))
+            except OSError:
+                entries = None
+        
+        with self._lock:
+            if rel_dir not in self._listings:
+                self.dirs_listed += 1
+            return self._listings.setdefault(rel_dir, entries)
+    
+    def glob(self, pattern: str, include_dirs: bool = True) -> List[str]:
+        """
+        Expand a glob pattern.
+        
+        Args:
+            pattern: Glob pattern relative to project root
+            include_dirs: Whether matched directories are returned as well as files
+        
+        Returns:
+            Sorted '/'-separated paths relative to project root
+        """
+        key = (pattern, include_dirs)
+        with self._lock:
+            cached = self._globs.get(key)
+        if cached is not None:
+            return cached
+        
+        matches: Set[str] = set()
+        for rel_path, is_dir in self._expand('', _segments(pattern), True):
+            if include_dirs or not is_dir:
+                matches.add(rel_path)
+        result = sorted(matches)
+        logger.debug(f"Glob {pattern} matched {len(result)} paths")
+        
+        with self._lock:
+            return self._globs.setdefault(key, result)
+    
+    def _walk(self, rel_dir: str) -> Iterator[Tuple[str, bool]]:
+        """Yield every non-hidden path beneath a directory."""
+        for name, is_dir in self.list_dir(rel_dir) or ():
+            if name.startswith('.'):
+                continue
+            rel_path = f"{rel_dir}/{name}" if rel_dir else name
+            yield rel_path, is_dir
+            if is_dir:
+                yield from self._walk(rel_path)
+    
+    def _expand(self, rel_dir: str, segments: Tuple[str, ...], is_dir: bool) -> Iterator[Tuple[str, bool]]:
+        """Yield (path, is_dir) for paths under rel_dir matching the remaining segments."""
+        if not segments:
+            if rel_dir:
+                yield rel_dir, is_dir
+            return
+        if not is_dir:
+            return
+        
+        segment, rest = segments[0], segments[1:]
+        if segment == '**':
+            if not rest:
+                yield from self._walk(rel_dir)
+                return
+            yield from self._expand(rel_dir, rest, True)
+            for rel_path, child_is_dir in self._walk(rel_dir):
+                if child_is_dir:
+                    yield from self._expand(rel_path, rest, True)
+            return
+        
+        if not is_glob(segment):
+            rel_path = f"{rel_dir}/{segment}" if rel_dir else segment
+            child_is_dir = self._child_is_dir(rel_dir, segment)
+            if child_is_dir is not None:
+                yield from self._expand(rel_path, rest, child_is_dir)
+            return
+        
+        for name, child_is_dir in self.list_dir(rel_dir) or ():
+            if _segment_matches(segment, name):
+                rel_path = f"{rel_dir}/{name}" if rel_dir else name
+                yield from self._expand(rel_path, rest, child_is_dir)
+    
+    def _child_is_dir(self, rel_dir: str, name: str) -> Optional[bool]:
+        """Look up a literal child: True for a directory, False for another entry, None if missing."""
+        for entry_name, is_dir in self.list_dir(rel_dir) or ():
+            if entry_name == name:
+                return is_dir
+        if self.file_index is None:
+            return None
+        # Index listings leave out ignored entries, which literal segments may name
+        try:
+            mode = (self.project_root / rel_dir / name).lstat().st_mode
+        except OSError:
+            return None
+        return stat.S_ISDIR(mode)
+
+
+__all__ = ['MATCH_MODES', 'TreeIndex', 'glob_matches', 'is_glob', 'quantifier_passed', 'summarize_paths']
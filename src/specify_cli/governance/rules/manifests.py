@@ -0,0 +1,266 @@
+"""
+Dependency manifest parsing.
+
+Turns supported manifests into a package-name -> declared-version index so
+dependency rules can do exact name lookups instead of substring scans.
+
+Supported: package.json, package-lock.json / npm-shrinkwrap.json,
+requirements*.txt, pyproject.toml (PEP 621, PEP 735 and Poetry tables)
+and poetry.lock.
+"""
+
+import json
+import re
+import tomllib
+from dataclasses import dataclass, field
+from pathlib import PurePosixPath
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+class ManifestParseError(ValueError):
+    """Raised when a supported manifest cannot be parsed."""
+    pass
+
+
+# PEP 508: name, optional extras, then specifier / URL / markers
+_REQUIREMENT = re.compile(r'^\s*([A-Za-z0-9](?:[A-Za-z0-9._-]*[A-Za-z0-9])?)\s*(?:\[[^\]]*\])?\s*(.*)$')
+_NORMALIZE = re.compile(r'[-_.]+')
+
+_NPM_DEPENDENCY_FIELDS = (
+    'dependencies',
+    'devDependencies',
+    'peerDependencies',
+    'optionalDependencies',
+)
+
+
+def normalize_python_name(name: str) -> str:
+    """
+    Normalize a Python distribution name (PEP 503).
+    
+    Args:
+        name: Distribution name
+    
+    Returns:
+        Lowercased name with runs of '-', '_' and '.' replaced by '-'
+    """
+    return _NORMALIZE.sub('-', name).lower()
+
+
+@dataclass
+class ManifestIndex:
+    """Declared packages of one manifest."""
+    
+    ecosystem: str  # "python" or "npm"
+    locked: bool  # True if versions are resolved (lockfiles)
+    packages: Dict[str, Optional[str]] = field(default_factory=dict)
+    
+    def _key(self, name: str) -> str:
+        return normalize_python_name(name) if self.ecosystem == 'python' else name
+    
+    def add(self, name: str, version: Optional[str]) -> None:
+        """Record a package, keeping the first declaration of a name."""
+        self.packages.setdefault(self._key(name), version or None)
+    
+    def __contains__(self, name: object) -> bool:
+        return isinstance(name, str) and self._key(name) in self.packages
+    
+    def get(self, name: str) -> Optional[str]:
+        """
+        Get the declared version or specifier of a package.
+        
+        Args:
+            name: Package name (normalized for Python manifests)
+        
+        Returns:
+            Declared version, or None if undeclared or declared without one
+        """
+        return self.packages.get(self._key(name))
+
+
+def parse_requirement(requirement: str) -> Optional[Tuple[str, Optional[str]]]:
+    """
+    Split a PEP 508 requirement into name and version specifier.
+    
+    Args:
+        requirement: Requirement such as "requests[socks]>=2.28; python_version>'3'"
+    
+    Returns:
+        Tuple of (name, specifier or None), or None if no name can be read
+    """
+    match = _REQUIREMENT.match(requirement)
+    if not match:
+        return None
+    name, rest = match.group(1), match.group(2)
+    # Drop environment markers; a direct URL reference has no version
+    rest = rest.split(';', 1)[0].strip()
+    if rest.startswith('@'):
+        return name, None
+    rest = rest.strip('()').strip()
+    return name, rest or None
+
+
+def _parse_requirements_txt(content: str) -> ManifestIndex:
+    index = ManifestIndex(ecosystem='python', locked=False)
+    # Join backslash continuations before splitting into lines
+    for line in content.replace('\\\n', ' ').splitlines():
+        line = line.split(' #', 1)[0].strip()
+        if not line or line.startswith(('#', '-')) or '://' in line.split('@', 1)[0]:
+            continue
+        parsed = parse_requirement(line)
+        if parsed:
+            index.add(*parsed)
+    return index
+
+
+def _add_requirements(index: ManifestIndex, requirements: Iterable[Any]) -> None:
+    for requirement in requirements:
+        if isinstance(requirement, str):
+            parsed = parse_requirement(requirement)
+            if parsed:
+                index.add(*parsed)
+
+
+def _poetry_version(spec: Any) -> Optional[str]:
+    """Read the version from a Poetry dependency value."""
+    if isinstance(spec, list):
+        spec = spec[0] if spec else None
+    if isinstance(spec, dict):
+        spec = spec.get('version')
+    return spec if isinstance(spec, str) else None
+
+
+def _parse_pyproject(content: str) -> ManifestIndex:
+    data = tomllib.loads(content)
+    index = ManifestIndex(ecosystem='python', locked=False)
+    
+    project = data.get('project', {})
+    _add_requirements(index, project.get('dependencies', []))
+    for requirements in project.get('optional-dependencies', {}).values():
+        _add_requirements(index, requirements)
+    for requirements in data.get('dependency-groups', {}).values():
+        _add_requirements(index, requirements)
+    
+    poetry = data.get('tool', {}).get('poetry', {})
+    tables = [poetry.get('dependencies', {}), poetry.get('dev-dependencies', {})]
+    tables.extend(group.get('dependencies', {}) for group in poetry.get('group', {}).values())
+    for table in tables:
+        for name, spec in table.items():
+            if name != 'python':
+                index.add(name, _poetry_version(spec))
+    return index
+
+
+def _parse_poetry_lock(content: str) -> ManifestIndex:
+    data = tomllib.loads(content)
+    index = ManifestIndex(ecosystem='python', locked=True)
+    for package in data.get('package', []):
+        if 'name' in package:
+            index.add(package['name'], package.get('version'))
+    return index
+
+
+def _parse_package_json(content: str) -> ManifestIndex:
+    data = json.loads(content)
+    index = ManifestIndex(ecosystem='npm', locked=False)
+    for field_name in _NPM_DEPENDENCY_FIELDS:
+        for name, spec in (data.get(field_name) or {}).items():
+            index.add(name, spec if isinstance(spec, str) else None)
+    return index
+
+
+def _parse_package_lock(content: str) -> ManifestIndex:
+    data = json.loads(content)
+    index = ManifestIndex(ecosystem='npm', locked=True)
+    
+    packages = data.get('packages')
+    if packages:
+        # lockfileVersion 2/3: keys are install paths; shallowest install wins
+        for path in sorted(packages, key=lambda p: p.count('node_modules/')):
+            if not path:
+                continue  # the root project itself
+            entry = packages[path]
+            name = entry.get('name') or path.rsplit('node_modules/', 1)[-1]
+            index.add(name, entry.get('version'))
+        return index
+    
+    # lockfileVersion 1: nested "dependencies" trees, visited breadth-first
+    level = [data.get('dependencies') or {}]
+    while level:
+        next_level = []
+        for dependencies in level:
+            for name, entry in dependencies.items():
+                index.add(name, entry.get('version'))
+                if entry.get('dependencies'):
+                    next_level.append(entry['dependencies'])
+        level = next_level
+    return index
+
+
+def _parser_for(file_name: str) -> Optional[Callable[[str], ManifestIndex]]:
+    """Pick the parser for a manifest file name."""
+    name = PurePosixPath(file_name.replace('\\', '/')).name
+    if name == 'package.json':
+        return _parse_package_json
+    if name in ('package-lock.json', 'npm-shrinkwrap.json'):
+        return _parse_package_lock
+    if name == 'pyproject.toml':
+        return _parse_pyproject
+    if name == 'poetry.lock':
+        return _parse_poetry_lock
+    if name.startswith('requirements') and name.endswith('.txt'):
+        return _parse_requirements_txt
+    return None
+
+
+def is_supported_manifest(file_name: str) -> bool:
+    """
+    Check whether a manifest file name has a structured parser.
+    
+    Args:
+        file_name: Manifest path or file name
+    
+    Returns:
+        True if parse_manifest can index it
+    """
+    return _parser_for(file_name) is not None
+
+
+def parse_manifest(file_name: str, content: str) -> ManifestIndex:
+    """
+    Parse a manifest into a package index.
+    
+    Args:
+        file_name: Manifest path or file name (selects the format)
+        content: Manifest content
+    
+    Returns:
+        ManifestIndex of declared packages
+    
+    Raises:
+        ManifestParseError: If the format is unsupported or the content is invalid
+    """
+    parser = _parser_for(file_name)
+    if parser is None:
+        raise ManifestParseError(f"Unsupported manifest format: {file_name}")
+    try:
+        index = parser(content)
+    except (ValueError, AttributeError, TypeError) as e:
+        # json/tomllib decode errors are ValueErrors; wrong shapes raise the others
+        raise ManifestParseError(f"Could not parse {file_name}: {e}") from e
+    
+    logger.debug(f"Indexed {len(index.packages)} packages from {file_name}")
+    return index
+
+
+__all__ = [
+    'ManifestIndex',
+    'ManifestParseError',
+    'is_supported_manifest',
+    'normalize_python_name',
+    'parse_manifest',
+    'parse_requirement',
+]
@@ -6,9 +6,24 @@ Extracts and parses compliance rules from guide YAML frontmatter.
 
 from pathlib import Path
 from typing import List, Dict, Any, Tuple, Optional
+import hashlib
+import json
 import re
 import yaml
 
+from ..caching import GuideParseCache
+from .dependencies import dependency_order
+from .globbing import MATCH_MODES
+from .text_index import REGEX_FLAGS, compile_regex, regex_flags
+
+
+def _default_yaml_loader() -> type:
+    """Return the libyaml-backed loader when PyYAML was built with it, else SafeLoader."""
+    return getattr(yaml, 'CSafeLoader', yaml.SafeLoader)
+
+
+_YAML_LOADER = _default_yaml_loader()
+
 
 class RuleParseError(Exception):
     """Exception raised for rule parsing and validation errors."""
@@ -22,25 +37,59 @@ class RuleParser:
     RULE_TYPE_SCHEMAS = {
         'file_exists': {
             'required': ['id', 'type', 'description', 'path'],
-            'optional': ['division']
+            'optional': ['min_count', 'division', 'depends_on']
         },
         'dependency_present': {
             'required': ['id', 'type', 'description', 'file', 'package'],
-            'optional': ['version', 'division']
+            'optional': ['version', 'division', 'depends_on']
         },
         'text_includes': {
             'required': ['id', 'type', 'description', 'file', 'text'],
-            'optional': ['case_sensitive', 'division']
+            'optional': ['case_sensitive', 'match', 'min_count', 'division', 'depends_on']
+        },
+        'text_matches': {
+            'required': ['id', 'type', 'description', 'file', 'pattern'],
+            'optional': ['flags', 'scope', 'match', 'min_count', 'division', 'depends_on']
         }
     }
     
+    # Bump when validation changes in a way RULE_TYPE_SCHEMAS does not show,
+    # so guides cached by GuideParseCache are validated again
+    VALIDATION_VERSION = 1
+    
+    @staticmethod
+    def validator_fingerprint() -> str:
+        """
+        Identify the validation applied to parsed rules.
+        
+        Derived from VALIDATION_VERSION, the rule schemas and the accepted
+        option values, so cached rules validated by other code are not reused.
+        
+        Returns:
+            Short hex digest
+        """
+        validator = {
+            'version': RuleParser.VALIDATION_VERSION,
+            'schemas': RuleParser.RULE_TYPE_SCHEMAS,
+            'match_modes': list(MATCH_MODES),
+            'regex_flags': sorted(REGEX_FLAGS),
+        }
+        return hashlib.sha256(json.dumps(validator, sort_keys=True).encode()).hexdigest()[:16]
+    
     @staticmethod
-    def extract_rules(guide_file: Path) -> List[Dict[str, Any]]:
+    def extract_rules(guide_file: Path, cache: Optional[GuideParseCache] = None) -> List[Dict[str, Any]]:
         """
         Extract rules from YAML frontmatter of guide file.
         
+        Only the leading frontmatter block is read (see read_frontmatter_block);
+        the markdown body is never loaded. When a cache is given, unchanged
+        guides return their previously validated rules without YAML parsing
+        or validation, as long as validation itself is unchanged (see
+        validator_fingerprint).
+        
         Args:
             guide_file: Path to markdown file with YAML frontmatter
+            cache: Optional persistent cache of parsed rules
         
         Returns:
             List of rule dictionaries
@@ -52,8 +101,78 @@ class RuleParser:
         if not guide_file.exists():
             raise FileNotFoundError(f"Guide file not found: {guide_file}")
         
-        content = guide_file.read_text()
-        frontmatter, _ = RuleParser.parse_frontmatter(content)
+        if cache is not None:
+            validator = RuleParser.validator_fingerprint()
+            stat_result = guide_file.stat()
+            cached_rules = cache.get_rules(guide_file, stat_result, validator=validator)
+            if cached_rules is not None:
+                return cached_rules
+        
+        yaml_content = RuleParser.read_frontmatter_block(guide_file)
+        
+        if cache is not None:
+            # Body-only edits leave the frontmatter hash unchanged
+            cached_rules = cache.get_rules(guide_file, stat_result, yaml_content or "", validator)
+            if cached_rules is not None:
+                return cached_rules
+        
+        rules = RuleParser._parse_rules(yaml_content)
+        
+        if cache is not None:
+            cache.put_rules(guide_file, stat_result, yaml_content or "", rules, validator)
+        
+        return rules
+    
+    @staticmethod
+    def read_frontmatter_block(guide_file: Path) -> Optional[str]:
+        """
+        Read the YAML frontmatter block of a guide without loading its body.
+        
+        Reads line by line and stops at the closing '---' delimiter. Matches
+        the delimiters accepted by parse_frontmatter: the file must start with
+        a '---' line and the block ends at the next newline-terminated '---'
+        line (trailing whitespace allowed).
+        
+        Args:
+            guide_file: Path to markdown file
+        
+        Returns:
+            YAML text between the delimiters, or None if there is no frontmatter
+        """
+        with open(guide_file, 'r') as f:
+            first_line = f.readline()
+            if not RuleParser._is_delimiter_line(first_line):
+                return None
+            
+            lines = []
+            for line in f:
+                if RuleParser._is_delimiter_line(line):
+                    # Drop the newline that precedes the closing delimiter
+                    return ''.join(lines)[:-1]
+                lines.append(line)
+        
+        return None  # No closing delimiter
+    
+    @staticmethod
+    def _is_delimiter_line(line: str) -> bool:
+        """Check for a newline-terminated '---' frontmatter delimiter line."""
+        return line.startswith('---') and line.endswith('\n') and not line[3:].strip()
+    
+    @staticmethod
+    def _parse_rules(yaml_content: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Parse and validate rules from a frontmatter block.
+        
+        Args:
+            yaml_content: YAML frontmatter text (None if the guide has none)
+        
+        Returns:
+            List of validated rule dictionaries
+        
+        Raises:
+            RuleParseError: If rules cannot be extracted or are invalid
+        """
+        frontmatter = RuleParser.load_frontmatter(yaml_content) if yaml_content is not None else {}
         
         if not frontmatter:
             return []  # No frontmatter, no rules
@@ -82,6 +201,11 @@ class RuleParser:
                 rule_id = rule.get('id', f'<rule at index {idx}>')
                 raise RuleParseError(f"Error in rule '{rule_id}': {str(e)}")
         
+        try:
+            dependency_order(rules)
+        except ValueError as e:
+            raise RuleParseError(f"{e}. 'depends_on' must name other rules of the same guide without cycles.")
+        
         return rules
     
     @staticmethod
@@ -112,8 +236,24 @@ class RuleParser:
         yaml_content = match.group(1)
         remaining_content = content[match.end():]
         
+        return RuleParser.load_frontmatter(yaml_content), remaining_content
+    
+    @staticmethod
+    def load_frontmatter(yaml_content: str) -> Dict[str, Any]:
+        """
+        Load a YAML frontmatter block into a dictionary.
+        
+        Args:
+            yaml_content: YAML text between the '---' delimiters
+        
+        Returns:
+            Frontmatter dictionary (empty if the block is empty)
+        
+        Raises:
+            RuleParseError: If frontmatter is malformed
+        """
         try:
-            frontmatter = yaml.safe_load(yaml_content)
+            frontmatter = RuleParser._safe_load(yaml_content)
         except yaml.YAMLError as e:
             raise RuleParseError(
                 f"Malformed YAML in frontmatter: {str(e)}\n"
@@ -123,7 +263,7 @@ class RuleParser:
         
         if frontmatter is None:
             # Empty frontmatter
-            return {}, remaining_content
+            return {}
         
         if not isinstance(frontmatter, dict):
             raise RuleParseError(
@@ -132,7 +272,32 @@ class RuleParser:
                 f"Frontmatter must be a YAML dictionary."
             )
         
-        return frontmatter, remaining_content
+        return frontmatter
+    
+    @staticmethod
+    def _safe_load(yaml_content: str) -> Any:
+        """
+        Safely load YAML, using libyaml when available.
+        
+        libyaml reports errors without the source snippet the pure-Python
+        loader includes, so on failure the content is re-parsed with the
+        pure-Python loader to keep error messages loader independent.
+        
+        Args:
+            yaml_content: YAML text
+        
+        Returns:
+            Loaded YAML value
+        
+        Raises:
+            yaml.YAMLError: If the YAML is malformed
+        """
+        try:
+            return yaml.load(yaml_content, Loader=_YAML_LOADER)
+        except yaml.YAMLError:
+            if _YAML_LOADER is yaml.SafeLoader:
+                raise
+            return yaml.load(yaml_content, Loader=yaml.SafeLoader)
     
     @staticmethod
     def validate_rule_structure(rule: Dict[str, Any], rule_type: Optional[str] = None) -> bool:
@@ -193,6 +358,15 @@ class RuleParser:
                     f"Required fields: {', '.join(schema['required'])}"
                 )
         
+        depends_on = rule.get('depends_on', [])
+        if isinstance(depends_on, str):
+            depends_on = [depends_on]
+        if not isinstance(depends_on, list) or not all(isinstance(dep, str) and dep for dep in depends_on):
+            raise RuleParseError(
+                f"Rule '{rule_id}': 'depends_on' must be a rule ID or a list of rule IDs. "
+                f"Example: depends_on: [package-json-present]"
+            )
+        
         # Type-specific validation
         if rule_type == 'file_exists':
             RuleParser._validate_file_exists_rule(rule, rule_id)
@@ -200,6 +374,8 @@ class RuleParser:
             RuleParser._validate_dependency_present_rule(rule, rule_id)
         elif rule_type == 'text_includes':
             RuleParser._validate_text_includes_rule(rule, rule_id)
+        elif rule_type == 'text_matches':
+            RuleParser._validate_text_matches_rule(rule, rule_id)
         
         return True
     
@@ -214,6 +390,7 @@ class RuleParser:
             )
         if not path.strip():
             raise RuleParseError(f"Rule '{rule_id}': 'path' cannot be empty")
+        RuleParser._validate_glob_quantifier(rule, rule_id)
     
     @staticmethod
     def _validate_dependency_present_rule(rule: Dict[str, Any], rule_id: str) -> None:
@@ -256,6 +433,71 @@ class RuleParser:
             )
         if not text.strip():
             raise RuleParseError(f"Rule '{rule_id}': 'text' cannot be empty")
+        RuleParser._validate_glob_quantifier(rule, rule_id)
+    
+    @staticmethod
+    def _validate_text_matches_rule(rule: Dict[str, Any], rule_id: str) -> None:
+        """Validate text_matches rule."""
+        file_path = rule.get('file')
+        if not isinstance(file_path, str):
+            raise RuleParseError(
+                f"Rule '{rule_id}': 'file' must be a string, got {type(file_path).__name__}. "
+                f"Example: file: 'README.md'"
+            )
+        if not file_path.strip():
+            raise RuleParseError(f"Rule '{rule_id}': 'file' cannot be empty")
+        
+        pattern = rule.get('pattern')
+        if not isinstance(pattern, str):
+            raise RuleParseError(
+                f"Rule '{rule_id}': 'pattern' must be a string, got {type(pattern).__name__}. "
+                f"Example: pattern: 'Copyright \\(c\\) \\d{{4}}'"
+            )
+        if not pattern.strip():
+            raise RuleParseError(f"Rule '{rule_id}': 'pattern' cannot be empty")
+        
+        flags = rule.get('flags', [])
+        if isinstance(flags, str):
+            flags = [flags]
+        if not isinstance(flags, list) or not all(isinstance(flag, str) for flag in flags):
+            raise RuleParseError(
+                f"Rule '{rule_id}': 'flags' must be a list of flag names. "
+                f"Example: flags: [ignorecase, multiline]"
+            )
+        try:
+            re_flags = regex_flags(flags)
+        except ValueError:
+            raise RuleParseError(
+                f"Rule '{rule_id}': unknown regex flag in {flags!r}. "
+                f"Supported flags: {', '.join(REGEX_FLAGS)}"
+            )
+        
+        scope = rule.get('scope', 'file')
+        if scope not in ('file', 'line'):
+            raise RuleParseError(f"Rule '{rule_id}': 'scope' must be one of file, line, got {scope!r}")
+        
+        # Compiled once here and reused by every evaluation of the pattern
+        try:
+            compile_regex(pattern, re_flags)
+        except re.error as e:
+            raise RuleParseError(f"Rule '{rule_id}': invalid regular expression {pattern!r}: {e}")
+        RuleParser._validate_glob_quantifier(rule, rule_id)
+    
+    @staticmethod
+    def _validate_glob_quantifier(rule: Dict[str, Any], rule_id: str) -> None:
+        """Validate the optional 'match' and 'min_count' fields of glob targets."""
+        match = rule.get('match', 'any')
+        if match not in MATCH_MODES:
+            raise RuleParseError(
+                f"Rule '{rule_id}': 'match' must be one of {', '.join(MATCH_MODES)}, got {match!r}"
+            )
+        
+        min_count = rule.get('min_count', 1)
+        if isinstance(min_count, bool) or not isinstance(min_count, int) or min_count < 1:
+            raise RuleParseError(
+                f"Rule '{rule_id}': 'min_count' must be a positive integer, got {min_count!r}. "
+                f"Example: min_count: 2"
+            )
 
 
 __all__ = ['RuleParser', 'RuleParseError']
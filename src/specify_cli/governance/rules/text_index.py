@@ -0,0 +1,571 @@
+"""
+Per-file text match index.
+
+Answers substring queries for every text rule that targets the same file
+from one shared copy of its content, so repeated and case-insensitive
+patterns do not rescan or re-lowercase the file. Very large files are
+searched through a memory map instead of being decoded into memory.
+
+Regular expressions are compiled once per distinct (pattern, flags) for
+the whole process (see compile_regex). Before a case-sensitive expression
+scans a file, the literal text every match must contain is looked up with a
+plain substring search; most expressions that cannot match are ruled out
+that way without running the regex engine. Line-scoped expressions against
+one file share a single pass over its lines.
+"""
+
+import mmap
+import re
+import threading
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
+
+try:
+    # Private stdlib parser; without it expressions are matched without a prefilter
+    from re import _parser
+except ImportError:
+    _parser = None
+
+# Flag names accepted by regex rules
+REGEX_FLAGS = {
+    'ignorecase': re.IGNORECASE,
+    'multiline': re.MULTILINE,
+    'dotall': re.DOTALL,
+    'verbose': re.VERBOSE,
+}
+
+_INLINE_FLAGS = ((re.IGNORECASE, 'i'), (re.MULTILINE, 'm'), (re.DOTALL, 's'), (re.VERBOSE, 'x'))
+
+# Constructs whose meaning depends on group numbering or position in the
+# pattern; such expressions are not merged into a combined line prefilter
+_UNCOMBINABLE = re.compile(r'\\[1-9]|\(\?P|\(\?\(|\(\?[aiLmsux]+\)|\\g<')
+
+# (pattern, flags, line_scoped)
+RegexQuery = Tuple[str, int, bool]
+
+
+def regex_flags(names: Union[None, str, Iterable[str]]) -> int:
+    """
+    Convert regex flag names to re flags.
+    
+    Args:
+        names: A flag name, a list of names, or None (see REGEX_FLAGS)
+    
+    Returns:
+        Combined re flags
+    
+    Raises:
+        ValueError: If a flag name is unknown
+    """
+    if names is None:
+        return 0
+    if isinstance(names, str):
+        names = [names]
+    flags = 0
+    for name in names:
+        flag = REGEX_FLAGS.get(str(name).lower())
+        if flag is None:
+            raise ValueError(
+                f"Unknown regex flag: {name!r}. Supported flags: {', '.join(REGEX_FLAGS)}"
+            )
+        flags |= flag
+    return flags
+
+
+@lru_cache(maxsize=4096)
+def compile_regex(pattern: str, flags: int = 0, encoding: Optional[str] = None) -> "re.Pattern":
+    """
+    Compile a regular expression once per process.
+    
+    Args:
+        pattern: Regular expression pattern
+        flags: re flags
+        encoding: Encode the pattern and compile a bytes regex (for memory-mapped files)
+    
+    Returns:
+        Compiled pattern
+    
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    return re.compile(pattern.encode(encoding) if encoding else pattern, flags)
+
+
+@lru_cache(maxsize=4096)
+def required_literals(pattern: str, flags: int = 0) -> Tuple[str, ...]:
+    """
+    Find literal text that every match of a regular expression contains.
+    
+    Only runs of plain characters at the top level of the pattern are
+    used; case-insensitive patterns have none, and no runs are found when
+    the interpreter's regex parser is not available.
+    
+    Args:
+        pattern: Regular expression pattern
+        flags: re flags
+    
+    Returns:
+        Literal runs, possibly empty
+    """
+    if _parser is None or flags & re.IGNORECASE:
+        return ()
+    runs: List[str] = []
+    try:
+        parsed = _parser.parse(pattern, flags)
+        if parsed.state.flags & re.IGNORECASE:
+            return ()
+        current: List[str] = []
+        for op, argument in list(parsed) + [(None, None)]:
+            if op is _parser.LITERAL:
+                current.append(chr(argument))
+            elif current:
+                runs.append(''.join(current))
+                current = []
+    except Exception:
+        # Invalid pattern, or a parser whose internals differ
+        return ()
+    return tuple(runs)
+
+
+def _can_combine(pattern: str) -> bool:
+    """Check whether a pattern keeps its meaning inside a combined alternation."""
+    return _UNCOMBINABLE.search(pattern) is None
+
+
+def _combined_source(queries: Sequence[Tuple[str, int]]) -> str:
+    """Join patterns into one alternation, scoping each one's flags."""
+    parts = []
+    for pattern, flags in queries:
+        letters = ''.join(letter for flag, letter in _INLINE_FLAGS if flags & flag)
+        # A verbose pattern may end in a comment, which must not swallow the ')'
+        tail = '\n' if flags & re.VERBOSE else ''
+        parts.append(f"(?{letters}:{pattern}{tail})" if letters else f"(?:{pattern})")
+    return "|".join(parts)
+
+
+def _may_match(pattern: str, flags: int, contains: Callable[[str], bool]) -> bool:
+    """Rule out a pattern whose required literal text is missing from the buffer."""
+    return all(contains(literal) for literal in required_literals(pattern, flags))
+
+
+def _first_positions(
+    buffer,
+    queries: Sequence[Tuple[str, int]],
+    contains: Callable[[str], bool],
+    encoding: Optional[str] = None
+) -> Dict[Tuple[str, int], Optional[int]]:
+    """Find the first match offset of each (pattern, flags) in a buffer."""
+    first: Dict[Tuple[str, int], Optional[int]] = {}
+    for pattern, flags in queries:
+        found = None
+        if _may_match(pattern, flags, contains):
+            found = compile_regex(pattern, flags, encoding).search(buffer)
+        first[(pattern, flags)] = found.start() if found else None
+    return first
+
+
+def _first_lines(
+    lines: Iterable,
+    queries: Sequence[Tuple[str, int]],
+    contains: Callable[[str], bool],
+    encoding: Optional[str] = None
+) -> Dict[Tuple[str, int], Optional[int]]:
+    """
+    Find the first line each (pattern, flags) matches, in one pass over the lines.
+    
+    Each line is tested with a combined alternation of the patterns not yet
+    found (rebuilt whenever half of them have been found), so lines that
+    match none of them cost a single regex call; only lines that pass are
+    searched per pattern. Scanning stops once every pattern is found.
+    """
+    first: Dict[Tuple[str, int], Optional[int]] = dict.fromkeys(queries)
+    candidates = [query for query in first if _may_match(*query, contains)]
+    pending = [query for query in candidates if _can_combine(query[0])]
+    separate = [query for query in candidates if not _can_combine(query[0])]
+    
+    def build() -> Optional["re.Pattern"]:
+        return compile_regex(_combined_source(pending), 0, encoding) if pending else None
+    
+    combined, built_size, stale = build(), len(pending), 0
+    for number, line in enumerate(lines, 1):
+        if not pending and not separate:
+            break
+        if combined is not None and pending and combined.search(line):
+            for query in list(pending):
+                if compile_regex(*query, encoding).search(line):
+                    first[query] = number
+                    pending.remove(query)
+                    stale += 1
+            if stale * 2 >= built_size:
+                combined, built_size, stale = build(), len(pending), 0
+        for query in list(separate):
+            if compile_regex(*query, encoding).search(line):
+                first[query] = number
+                separate.remove(query)
+    return first
+
+
+def _split_queries(queries: Iterable[RegexQuery]) -> Tuple[List[Tuple[str, int]], List[Tuple[str, int]]]:
+    """Split regex queries into (whole-file, line-scoped) (pattern, flags) lists."""
+    whole = [(pattern, flags) for pattern, flags, line_scoped in queries if not line_scoped]
+    lines = [(pattern, flags) for pattern, flags, line_scoped in queries if line_scoped]
+    return whole, lines
+
+
+@dataclass(frozen=True)
+class TextMatch:
+    """Result of searching a file for one pattern."""
+    
+    count: int
+    first_line: Optional[int] = None  # 1-based, None when not found
+    
+    @property
+    def found(self) -> bool:
+        """Whether the pattern occurs at least once."""
+        return self.count > 0
+
+
+@dataclass(frozen=True)
+class RegexMatch:
+    """Result of searching a file for one regular expression."""
+    
+    first_line: Optional[int] = None  # 1-based line of the first match, None when not found
+    
+    @property
+    def found(self) -> bool:
+        """Whether the expression matches at least once."""
+        return self.first_line is not None
+
+
+class TextMatchIndex:
+    """
+    Memoized pattern lookups over a single file's content.
+    
+    Each distinct (pattern, case_sensitive) pair is searched once: one
+    counting pass over the buffer, plus a scan up to the first occurrence
+    to locate its line. Case-insensitive patterns all share one lowered
+    copy of the content, created on first use.
+    """
+    
+    def __init__(self, content: str):
+        """
+        Initialize index.
+        
+        Args:
+            content: Decoded file content
+        """
+        self.content = content
+        self._lowered: Optional[str] = None
+        self._matches: Dict[Tuple[str, bool], TextMatch] = {}
+        self._regex_matches: Dict[RegexQuery, RegexMatch] = {}
+        self._lock = threading.Lock()
+    
+    @property
+    def lowered(self) -> str:
+        """Lowercased content, shared by all case-insensitive patterns."""
+        if self._lowered is None:
+            with self._lock:
+                if self._lowered is None:
+                    self._lowered = self.content.lower()
+        return self._lowered
+    
+    def find(self, pattern: str, case_sensitive: bool = True) -> TextMatch:
+        """
+        Count occurrences of a pattern and locate the first one.
+        
+        Args:
+            pattern: Literal text to search for
+            case_sensitive: Whether matching is case-sensitive
+        
+        Returns:
+            TextMatch with non-overlapping occurrence count and first line
+        """
+        key = (pattern, case_sensitive)
+        match = self._matches.get(key)
+        if match is not None:
+            return match
+        
+        if case_sensitive:
+            buffer, needle = self.content, pattern
+        else:
+            buffer, needle = self.lowered, pattern.lower()
+        
+        count = buffer.count(needle)
+        first_line = None
+        if count:
+            first_line = buffer.count("\n", 0, buffer.find(needle)) + 1
+        match = TextMatch(count=count, first_line=first_line)
+        
+        with self._lock:
+            return self._matches.setdefault(key, match)
+    
+    def find_all(self, patterns: Iterable[Tuple[str, bool]]) -> Dict[Tuple[str, bool], TextMatch]:
+        """
+        Search for a batch of patterns.
+        
+        Args:
+            patterns: (pattern, case_sensitive) pairs; duplicates are searched once
+        
+        Returns:
+            Map of (pattern, case_sensitive) to TextMatch
+        """
+        return {key: self.find(*key) for key in dict.fromkeys(patterns)}
+    
+    def search(self, regex: str, flags: int = 0) -> bool:
+        """
+        Check whether a regular expression matches anywhere in the content.
+        
+        Args:
+            regex: Regular expression pattern
+            flags: re flags
+        
+        Returns:
+            True if the expression matches
+        """
+        return re.search(regex, self.content, flags) is not None
+    
+    def find_regex(self, pattern: str, flags: int = 0, line_scoped: bool = False) -> RegexMatch:
+        """
+        Locate the first match of a regular expression.
+        
+        Args:
+            pattern: Regular expression pattern
+            flags: re flags
+            line_scoped: Match each line on its own, so the expression cannot
+                span lines and '^'/'$' anchor at line boundaries
+        
+        Returns:
+            RegexMatch with the line of the first match
+        """
+        query = (pattern, flags, line_scoped)
+        return self.find_regex_all([query])[query]
+    
+    def find_regex_all(self, queries: Iterable[RegexQuery]) -> Dict[RegexQuery, RegexMatch]:
+        """
+        Search for a batch of regular expressions in one combined scan.
+        
+        Args:
+            queries: (pattern, flags, line_scoped) triples; duplicates and
+                expressions already searched are not searched again
+        
+        Returns:
+            Map of (pattern, flags, line_scoped) to RegexMatch
+        """
+        queries = list(dict.fromkeys(queries))
+        whole, lines = _split_queries([query for query in queries if query not in self._regex_matches])
+        
+        found: Dict[RegexQuery, RegexMatch] = {}
+        if whole:
+            for (pattern, flags), position in _first_positions(self.content, whole, self.content.__contains__).items():
+                first_line = None if position is None else self.content.count("\n", 0, position) + 1
+                found[(pattern, flags, False)] = RegexMatch(first_line)
+        if lines:
+            for (pattern, flags), first_line in _first_lines(self._lines(), lines, self.content.__contains__).items():
+                found[(pattern, flags, True)] = RegexMatch(first_line)
+        
+        with self._lock:
+            for query, match in found.items():
+                self._regex_matches.setdefault(query, match)
+            return {query: self._regex_matches[query] for query in queries}
+    
+    def _lines(self) -> Iterator[str]:
+        """Yield lines without their line endings, numbered like find()."""
+        for line in self.content.split("\n"):
+            yield line[:-1] if line.endswith("\r") else line
+
+
+class MappedTextIndex:
+    """
+    Pattern lookups over a memory-mapped file, without decoding it.
+    
+    Patterns are encoded as UTF-8 and searched as bytes, so resident memory
+    stays flat regardless of file size. Case-insensitive patterns are
+    matched with a bytes regex that folds each character's case variants.
+    Unlike TextMatchIndex, invalid UTF-8 in the file is not reported.
+    """
+    
+    CHUNK_SIZE = 1024 * 1024
+    
+    def __init__(self, path: Union[str, Path], encoding: str = "utf-8"):
+        """
+        Initialize index.
+        
+        Args:
+            path: File to search
+            encoding: Encoding used to encode patterns
+        """
+        self.path = Path(path)
+        self.encoding = encoding
+        self._matches: Dict[Tuple[str, bool], TextMatch] = {}
+        self._regex_matches: Dict[RegexQuery, RegexMatch] = {}
+        self._lock = threading.Lock()
+    
+    def _open(self) -> Tuple[object, mmap.mmap]:
+        """Open and map the file read-only."""
+        handle = open(self.path, "rb")
+        try:
+            return handle, mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except Exception:
+            handle.close()
+            raise
+    
+    def _case_insensitive_regex(self, pattern: str) -> "re.Pattern[bytes]":
+        """Build a bytes regex matching any case variant of pattern."""
+        parts = []
+        for char in pattern:
+            variants = dict.fromkeys([char, char.lower(), char.upper()])
+            encoded = [re.escape(variant.encode(self.encoding)) for variant in variants]
+            parts.append(encoded[0] if len(encoded) == 1 else b"(?:" + b"|".join(encoded) + b")")
+        return re.compile(b"".join(parts))
+    
+    def _count_newlines(self, mapped: mmap.mmap, end: int) -> int:
+        """Count newlines before offset end, a chunk at a time."""
+        count = 0
+        for start in range(0, end, self.CHUNK_SIZE):
+            count += mapped[start:min(start + self.CHUNK_SIZE, end)].count(b"\n")
+        return count
+    
+    def find(self, pattern: str, case_sensitive: bool = True) -> TextMatch:
+        """
+        Count occurrences of a pattern and locate the first one.
+        
+        Args:
+            pattern: Literal text to search for
+            case_sensitive: Whether matching is case-sensitive
+        
+        Returns:
+            TextMatch with non-overlapping occurrence count and first line
+        """
+        key = (pattern, case_sensitive)
+        match = self._matches.get(key)
+        if match is not None:
+            return match
+        
+        handle, mapped = self._open()
+        try:
+            count = 0
+            first = -1
+            if case_sensitive:
+                needle = pattern.encode(self.encoding)
+                position = mapped.find(needle)
+                first = position
+                while position != -1:
+                    count += 1
+                    position = mapped.find(needle, position + max(len(needle), 1))
+            else:
+                for found in self._case_insensitive_regex(pattern).finditer(mapped):
+                    if count == 0:
+                        first = found.start()
+                    count += 1
+            
+            first_line = self._count_newlines(mapped, first) + 1 if count else None
+        finally:
+            mapped.close()
+            handle.close()
+        
+        match = TextMatch(count=count, first_line=first_line)
+        with self._lock:
+            return self._matches.setdefault(key, match)
+    
+    def find_all(self, patterns: Iterable[Tuple[str, bool]]) -> Dict[Tuple[str, bool], TextMatch]:
+        """
+        Search for a batch of patterns.
+        
+        Args:
+            patterns: (pattern, case_sensitive) pairs; duplicates are searched once
+        
+        Returns:
+            Map of (pattern, case_sensitive) to TextMatch
+        """
+        return {key: self.find(*key) for key in dict.fromkeys(patterns)}
+    
+    def search(self, regex: str, flags: int = 0) -> bool:
+        """
+        Check whether a regular expression matches anywhere in the file.
+        
+        The pattern is encoded and run as a bytes regex over the mapping;
+        re.IGNORECASE folds ASCII letters only.
+        
+        Args:
+            regex: Regular expression pattern
+            flags: re flags
+        
+        Returns:
+            True if the expression matches
+        """
+        compiled = re.compile(regex.encode(self.encoding), flags)
+        handle, mapped = self._open()
+        try:
+            return compiled.search(mapped) is not None
+        finally:
+            mapped.close()
+            handle.close()
+    
+    def find_regex(self, pattern: str, flags: int = 0, line_scoped: bool = False) -> RegexMatch:
+        """
+        Locate the first match of a regular expression.
+        
+        Patterns run as bytes regexes over the mapping (see search).
+        
+        Args:
+            pattern: Regular expression pattern
+            flags: re flags
+            line_scoped: Match each line on its own
+        
+        Returns:
+            RegexMatch with the line of the first match
+        """
+        query = (pattern, flags, line_scoped)
+        return self.find_regex_all([query])[query]
+    
+    def find_regex_all(self, queries: Iterable[RegexQuery]) -> Dict[RegexQuery, RegexMatch]:
+        """
+        Search for a batch of regular expressions in one combined scan.
+        
+        Args:
+            queries: (pattern, flags, line_scoped) triples; duplicates and
+                expressions already searched are not searched again
+        
+        Returns:
+            Map of (pattern, flags, line_scoped) to RegexMatch
+        """
+        queries = list(dict.fromkeys(queries))
+        whole, lines = _split_queries([query for query in queries if query not in self._regex_matches])
+        
+        found: Dict[RegexQuery, RegexMatch] = {}
+        if whole or lines:
+            handle, mapped = self._open()
+            contains = lambda literal: mapped.find(literal.encode(self.encoding)) != -1
+            try:
+                if whole:
+                    first_positions = _first_positions(mapped, whole, contains, self.encoding)
+                    for (pattern, flags), position in first_positions.items():
+                        first_line = None if position is None else self._count_newlines(mapped, position) + 1
+                        found[(pattern, flags, False)] = RegexMatch(first_line)
+                if lines:
+                    first_lines = _first_lines(self._lines(mapped), lines, contains, self.encoding)
+                    for (pattern, flags), first_line in first_lines.items():
+                        found[(pattern, flags, True)] = RegexMatch(first_line)
+            finally:
+                mapped.close()
+                handle.close()
+        
+        with self._lock:
+            for query, match in found.items():
+                self._regex_matches.setdefault(query, match)
+            return {query: self._regex_matches[query] for query in queries}
+    
+    @staticmethod
+    def _lines(mapped: mmap.mmap) -> Iterator[bytes]:
+        """Yield lines of the mapping without their line endings."""
+        for line in iter(mapped.readline, b""):
+            line = line[:-1] if line.endswith(b"\n") else line
+            yield line[:-1] if line.endswith(b"\r") else line
+
+
+__all__ = [
+    'MappedTextIndex', 'REGEX_FLAGS', 'RegexMatch', 'TextMatch', 'TextMatchIndex',
+    'compile_regex', 'regex_flags', 'required_literals',
+]
@@ -4,13 +4,85 @@ Text pattern compliance rules.
 Implements rules that check for text patterns in files.
 """
 
-from pathlib import Path
-from typing import Dict, Any
-from . import BaseRule
+from typing import Callable, Dict, Any, List, Optional
+from . import BaseRule, FileContentStore
+from .globbing import is_glob, quantifier_passed, summarize_paths
+from .text_index import REGEX_FLAGS, compile_regex, regex_flags
+
+REGEX_SCOPES = ('file', 'line')
+
+
+def evaluate_glob_files(
+    store: FileContentStore,
+    file_pattern: str,
+    label: str,
+    contains: Callable[[str], bool],
+    match: str = 'any',
+    min_count: int = 1
+) -> Dict[str, Any]:
+    """
+    Check every file matching a glob file for a pattern.
+    
+    Args:
+        store: Run-scoped content store
+        file_pattern: Glob file of the rule
+        label: Pattern as shown in details (e.g. "Pattern 'License'")
+        contains: Whether a matched file contains the pattern; files that
+            raise count as not containing it
+        match: 'any' or 'all' (see quantifier_passed)
+        min_count: Files required by the match mode
+    
+    Returns:
+        Evaluation dictionary (passed, message, details)
+    """
+    files = store.glob(file_pattern, include_dirs=False)
+    if not files:
+        return {
+            "passed": False,
+            "message": f"❌ No files match {file_pattern}",
+            "details": f"Searched for: {store.resolve(file_pattern)}"
+        }
+    
+    found: List[str] = []
+    missing: List[str] = []
+    for file in files:
+        try:
+            contained = contains(file)
+        except Exception:
+            contained = False
+        (found if contained else missing).append(file)
+    
+    total = len(files)
+    summary = f"{label} found in {len(found)} of {total} file{'s' if total != 1 else ''}"
+    if quantifier_passed(len(found), total, match, min_count):
+        return {
+            "passed": True,
+            "message": f"✅ Pattern found in {len(found)} of {total} files matching {file_pattern}",
+            "details": f"{summary}: {summarize_paths(found)}"
+        }
+    
+    if match == 'all' and total >= min_count:
+        expected = "every file"
+    elif match == 'all':
+        expected = f"at least {min_count} matching files"
+    else:
+        expected = f"at least {min_count}"
+    return {
+        "passed": False,
+        "message": f"❌ Pattern found in {len(found)} of {total} files matching {file_pattern}, expected {expected}",
+        "details": f"{summary}; missing from: {summarize_paths(missing)}" if missing else summary
+    }
 
 
 class TextIncludesRule(BaseRule):
-    """Checks if text pattern appears in file."""
+    """
+    Checks if text pattern appears in file.
+    
+    A glob file (e.g. 'services/*/README.md', see governance.rules.globbing)
+    is checked against every matching file: with match 'any' at least
+    min_count files must contain the text, with match 'all' at least
+    min_count files must match and every one must contain it.
+    """
     
     TYPE = "text_includes"
     
@@ -21,6 +93,8 @@ class TextIncludesRule(BaseRule):
         file: str, 
         text: str,
         case_sensitive: bool = True,
+        match: str = 'any',
+        min_count: int = 1,
         **kwargs
     ):
         """
@@ -32,6 +106,8 @@ class TextIncludesRule(BaseRule):
             file: File path to search
             text: Text pattern to find
             case_sensitive: Whether search is case-sensitive (default: True)
+            match: 'any' or 'all' matched files must contain the text (glob files only)
+            min_count: Files required by the match mode (glob files only)
             **kwargs: Additional rule data
         """
         super().__init__(
@@ -40,29 +116,37 @@ class TextIncludesRule(BaseRule):
             file=file, 
             text=text, 
             case_sensitive=case_sensitive,
+            match=match,
+            min_count=min_count,
             **kwargs
         )
         self.file = file
         self.text = text
         self.case_sensitive = case_sensitive
+        self.match = match
+        self.min_count = min_count
     
-    def evaluate(self, project_root: str) -> Dict[str, Any]:
+    def evaluate(self, project_root: str, store: Optional[FileContentStore] = None) -> Dict[str, Any]:
         """
         Check if text pattern appears in file.
         
         Args:
             project_root: Absolute path to project root
+            store: Optional run-scoped content store (shares file reads)
         
         Returns:
             Dictionary with:
                 - passed (bool): True if pattern found
                 - message (str): Status message
-                - details (str): Number of occurrences, line number (if available)
+                - details (str): Number of occurrences and line of the first one
         """
-        project_path = Path(project_root)
-        file_path = project_path / self.file
+        store = store or FileContentStore(project_root)
+        if is_glob(self.file):
+            return self._evaluate_glob(store)
+        
+        file_path = store.resolve(self.file)
         
-        if not file_path.exists():
+        if not store.exists(self.file):
             return {
                 "passed": False,
                 "message": f"❌ File not found: {self.file}",
@@ -70,7 +154,7 @@ class TextIncludesRule(BaseRule):
             }
         
         try:
-            content = file_path.read_text()
+            index = store.text_index(self.file)
         except Exception as e:
             return {
                 "passed": False,
@@ -78,17 +162,18 @@ class TextIncludesRule(BaseRule):
                 "details": f"Error: {str(e)}"
             }
         
-        # Search for text pattern
-        search_content = content if self.case_sensitive else content.lower()
-        search_text = self.text if self.case_sensitive else self.text.lower()
+        # Search for text pattern (shared with other rules on this file)
+        match = index.find(self.text, self.case_sensitive)
         
-        if search_text in search_content:
-            # Count occurrences
-            occurrences = search_content.count(search_text)
+        if match.found:
+            occurrences = match.count
             return {
                 "passed": True,
                 "message": f"✅ Pattern found in {self.file}",
-                "details": f"Pattern '{self.text}' found ({occurrences} occurrence{'s' if occurrences != 1 else ''})"
+                "details": (
+                    f"Pattern '{self.text}' found ({occurrences} occurrence{'s' if occurrences != 1 else ''}, "
+                    f"first on line {match.first_line})"
+                )
             }
         else:
             return {
@@ -97,6 +182,17 @@ class TextIncludesRule(BaseRule):
                 "details": f"Searched for: '{self.text}' (case {'sensitive' if self.case_sensitive else 'insensitive'})"
             }
     
+    def _evaluate_glob(self, store: FileContentStore) -> Dict[str, Any]:
+        """Search every file matching a glob file for the text."""
+        return evaluate_glob_files(
+            store,
+            self.file,
+            f"Pattern '{self.text}'",
+            lambda file: store.text_index(file).find(self.text, self.case_sensitive).found,
+            self.match,
+            self.min_count
+        )
+    
     @classmethod
     def from_yaml(cls, data: Dict[str, Any]) -> 'TextIncludesRule':
         """
@@ -116,6 +212,8 @@ class TextIncludesRule(BaseRule):
         file = data.get('file')
         text = data.get('text')
         case_sensitive = data.get('case_sensitive', True)  # Default to case-sensitive
+        match = data.get('match', 'any')
+        min_count = data.get('min_count', 1)
         
         if not rule_id:
             raise ValueError("Rule missing required field: 'id'")
@@ -126,7 +224,186 @@ class TextIncludesRule(BaseRule):
         if not text:
             raise ValueError(f"Rule '{rule_id}' of type 'text_includes' missing required field: 'text'")
         
-        return cls(rule_id, description, file, text, case_sensitive)
+        return cls(rule_id, description, file, text, case_sensitive, match, min_count)
+
+
+class TextMatchesRule(BaseRule):
+    """
+    Checks if a regular expression matches in file.
+    
+    Flags are given by name (see REGEX_FLAGS). With scope 'line' each line
+    is matched on its own, so the expression cannot span lines and '^'/'$'
+    anchor at line boundaries. Compiled patterns are shared by every rule
+    in the process, and matches by every rule on the same file. Glob files
+    are handled as in TextIncludesRule.
+    """
+    
+    TYPE = "text_matches"
+    
+    def __init__(
+        self,
+        rule_id: str,
+        description: str,
+        file: str,
+        pattern: str,
+        flags: Optional[List[str]] = None,
+        scope: str = 'file',
+        match: str = 'any',
+        min_count: int = 1,
+        **kwargs
+    ):
+        """
+        Initialize regex match rule.
+        
+        Args:
+            rule_id: Unique rule identifier
+            description: Human-readable rule description
+            file: File path to search
+            pattern: Regular expression to match
+            flags: Flag names, e.g. ['ignorecase', 'multiline']
+            scope: 'file' to match the whole content or 'line' to match each line
+            match: 'any' or 'all' matched files must match (glob files only)
+            min_count: Files required by the match mode (glob files only)
+            **kwargs: Additional rule data
+        
+        Raises:
+            ValueError: If a flag or the scope is unknown
+        """
+        if isinstance(flags, str):
+            flags = [flags]
+        if scope not in REGEX_SCOPES:
+            raise ValueError(f"Unknown scope: {scope!r}. Supported scopes: {', '.join(REGEX_SCOPES)}")
+        super().__init__(
+            rule_id,
+            description,
+            file=file,
+            pattern=pattern,
+            flags=list(flags or []),
+            scope=scope,
+            match=match,
+            min_count=min_count,
+            **kwargs
+        )
+        self.file = file
+        self.pattern = pattern
+        self.flags = list(flags or [])
+        self.re_flags = regex_flags(self.flags)
+        self.scope = scope
+        self.match = match
+        self.min_count = min_count
+    
+    @property
+    def line_scoped(self) -> bool:
+        """Whether lines are matched on their own."""
+        return self.scope == 'line'
+    
+    @property
+    def query(self) -> tuple:
+        """(pattern, flags, line_scoped) lookup key for text indexes."""
+        return (self.pattern, self.re_flags, self.line_scoped)
+    
+    def _searched_for(self) -> str:
+        """Describe the expression for failure details."""
+        options = [*self.flags, 'line-scoped'] if self.line_scoped else list(self.flags)
+        return f"/{self.pattern}/" + (f" ({', '.join(options)})" if options else "")
+    
+    def evaluate(self, project_root: str, store: Optional[FileContentStore] = None) -> Dict[str, Any]:
+        """
+        Check if regular expression matches in file.
+        
+        Args:
+            project_root: Absolute path to project root
+            store: Optional run-scoped content store (shares file reads)
+        
+        Returns:
+            Dictionary with:
+                - passed (bool): True if the expression matches
+                - message (str): Status message
+                - details (str): Line of the first match
+        """
+        store = store or FileContentStore(project_root)
+        compile_regex(self.pattern, self.re_flags)
+        if is_glob(self.file):
+            return evaluate_glob_files(
+                store,
+                self.file,
+                f"Regex /{self.pattern}/",
+                lambda file: store.text_index(file).find_regex(*self.query).found,
+                self.match,
+                self.min_count
+            )
+        
+        file_path = store.resolve(self.file)
+        
+        if not store.exists(self.file):
+            return {
+                "passed": False,
+                "message": f"❌ File not found: {self.file}",
+                "details": f"Expected file at: {file_path}"
+            }
+        
+        try:
+            index = store.text_index(self.file)
+        except Exception as e:
+            return {
+                "passed": False,
+                "message": f"❌ Could not read file: {self.file}",
+                "details": f"Error: {str(e)}"
+            }
+        
+        # Shared with other rules on this file
+        found = index.find_regex(*self.query)
+        
+        if found.found:
+            return {
+                "passed": True,
+                "message": f"✅ Pattern matched in {self.file}",
+                "details": f"Regex /{self.pattern}/ first matched on line {found.first_line}"
+            }
+        return {
+            "passed": False,
+            "message": f"❌ Pattern not matched in {self.file}",
+            "details": f"Searched for: {self._searched_for()}"
+        }
+    
+    @classmethod
+    def from_yaml(cls, data: Dict[str, Any]) -> 'TextMatchesRule':
+        """
+        Create TextMatchesRule from YAML data.
+        
+        Args:
+            data: Parsed YAML rule definition
+        
+        Returns:
+            TextMatchesRule instance
+        
+        Raises:
+            ValueError: If required fields are missing or flags/scope are unknown
+        """
+        rule_id = data.get('id')
+        description = data.get('description')
+        file = data.get('file')
+        pattern = data.get('pattern')
+        
+        if not rule_id:
+            raise ValueError("Rule missing required field: 'id'")
+        if not description:
+            raise ValueError(f"Rule '{rule_id}' missing required field: 'description'")
+        if not file:
+            raise ValueError(f"Rule '{rule_id}' of type 'text_matches' missing required field: 'file'")
+        if not pattern:
+            raise ValueError(f"Rule '{rule_id}' of type 'text_matches' missing required field: 'pattern'")
+        
+        return cls(
+            rule_id,
+            description,
+            file,
+            pattern,
+            data.get('flags'),
+            data.get('scope', 'file'),
+            data.get('match', 'any'),
+            data.get('min_count', 1)
+        )
 
 
-__all__ = ['TextIncludesRule']
+__all__ = ['REGEX_FLAGS', 'REGEX_SCOPES', 'TextIncludesRule', 'TextMatchesRule', 'evaluate_glob_files']
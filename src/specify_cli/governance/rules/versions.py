@@ -0,0 +1,280 @@
+"""
+Version specifier matching for dependency rules.
+
+Understands the specifier forms found in Python and npm manifests:
+comparison operators (==, !=, >=, <=, >, <), PEP 440 compatible release
+(~=), npm tilde (~) and caret (^) ranges, wildcards (1.2.*, 1.x, *),
+hyphen ranges (1.0 - 2.0), comma/space-separated conjunctions and
+'||' disjunctions. A bare or partial version ("18", "1.2") is a prefix
+match. Pre-release and build suffixes are ignored; versions compare by
+their numeric release segments.
+
+Specifiers are parsed into unions of intervals, so a declared range can
+be checked for overlap with a required one.
+"""
+
+import re
+from typing import List, Optional, Tuple
+
+Version = Tuple[int, ...]
+# (lower, lower_inclusive, upper, upper_inclusive); None bounds are unbounded
+VersionRange = Tuple[Optional[Version], bool, Optional[Version], bool]
+
+_CLAUSE = re.compile(r'^(===|==|!=|~=|>=|<=|>|<|\^|~|=)?v?(.*)$')
+_OPERATOR_SPACE = re.compile(r'(===|==|!=|~=|>=|<=|>|<|\^|~|=)\s+')
+_HYPHEN_RANGE = re.compile(r'^\s*(\S+)\s+-\s+(\S+)\s*$')
+_RELEASE = re.compile(r'^v?(\d+(?:\.\d+)*)')
+_WILDCARDS = {'*', 'x', 'X'}
+
+
+def parse_version(version: str) -> Optional[Version]:
+    """
+    Extract the numeric release segments of a version string.
+    
+    Args:
+        version: Version such as "1.2.3", "v2.0.0-beta.1" or "3.1rc1"
+    
+    Returns:
+        Tuple of release numbers, or None if the string has no numeric release
+    """
+    match = _RELEASE.match(version.strip())
+    if not match:
+        return None
+    return tuple(int(part) for part in match.group(1).split('.'))
+
+
+def _pad(a: Version, b: Version) -> Tuple[Version, Version]:
+    """Pad two versions with zeros to equal length."""
+    length = max(len(a), len(b))
+    return a + (0,) * (length - len(a)), b + (0,) * (length - len(b))
+
+
+def _compare(a: Version, b: Version) -> int:
+    """Three-way compare two versions."""
+    a, b = _pad(a, b)
+    return (a > b) - (a < b)
+
+
+def _parse_target(target: str) -> Tuple[Version, bool]:
+    """
+    Parse the version part of a clause.
+    
+    Returns:
+        Tuple of (release prefix, is_wildcard). "1.2.*" gives ((1, 2), True)
+    
+    Raises:
+        ValueError: If the version cannot be parsed
+    """
+    target = target.strip()
+    if target in _WILDCARDS or target == '':
+        return (), True
+    
+    parts = target.split('.')
+    prefix: List[int] = []
+    for part in parts:
+        if part in _WILDCARDS:
+            return tuple(prefix), True
+        release = _RELEASE.match(part)
+        if not release:
+            raise ValueError(f"Invalid version: '{target}'")
+        prefix.append(int(release.group(1)))
+        # Anything after a suffixed component ("0rc1", "3-beta") is not release
+        if release.group(1) != part:
+            break
+    return tuple(prefix), False
+
+
+def _upper_bound(prefix: Version) -> Version:
+    """Smallest version above every version starting with prefix."""
+    return prefix[:-1] + (prefix[-1] + 1,)
+
+
+def _interval(
+    lower: Optional[Version] = None,
+    lower_inclusive: bool = True,
+    upper: Optional[Version] = None,
+    upper_inclusive: bool = False
+) -> VersionRange:
+    """Build an interval; None bounds are unbounded."""
+    return (lower, lower_inclusive, upper, upper_inclusive)
+
+
+def _intersect(a: VersionRange, b: VersionRange) -> Optional[VersionRange]:
+    """
+    Intersect two intervals.
+    
+    Returns:
+        The common interval, or None if the intervals do not overlap
+    """
+    lower, lower_inclusive = a[0], a[1]
+    if b[0] is not None:
+        order = 1 if lower is None else _compare(b[0], lower)
+        if order > 0 or (order == 0 and not b[1]):
+            lower, lower_inclusive = b[0], b[1]
+    upper, upper_inclusive = a[2], a[3]
+    if b[2] is not None:
+        order = -1 if upper is None else _compare(b[2], upper)
+        if order < 0 or (order == 0 and not b[3]):
+            upper, upper_inclusive = b[2], b[3]
+    
+    if lower is not None and upper is not None:
+        order = _compare(lower, upper)
+        if order > 0 or (order == 0 and not (lower_inclusive and upper_inclusive)):
+            return None
+    return (lower, lower_inclusive, upper, upper_inclusive)
+
+
+def _clause_ranges(operator: str, target: str) -> List[VersionRange]:
+    """
+    Get the intervals a single clause such as ">=1.2" allows.
+    
+    A bare or '=' version is a prefix match, as in npm: "18" allows
+    18.x.y and "1.2" allows 1.2.x. '==' is an exact match (PEP 440).
+    
+    Returns:
+        Union of intervals allowed by the clause
+    
+    Raises:
+        ValueError: If the clause cannot be parsed
+    """
+    prefix, wildcard = _parse_target(target)
+    
+    if not prefix:
+        # A bare wildcard ("*", "==*") allows everything
+        if wildcard and operator in ('', '=', '==', '==='):
+            return [_interval()]
+        if wildcard and operator == '!=':
+            return []
+        raise ValueError(f"Invalid version constraint: '{operator}{target}'")
+    
+    if operator in ('', '=') or (operator in ('==', '===') and wildcard):
+        return [_interval(prefix, True, _upper_bound(prefix), False)]
+    if operator in ('==', '==='):
+        return [_interval(prefix, True, prefix, True)]
+    if operator == '!=':
+        if wildcard:
+            return [_interval(upper=prefix), _interval(_upper_bound(prefix))]
+        return [_interval(upper=prefix), _interval(prefix, False)]
+    if operator == '>=':
+        return [_interval(prefix)]
+    if operator == '<=':
+        return [_interval(upper=prefix, upper_inclusive=True)]
+    if operator == '>':
+        return [_interval(prefix, False)]
+    if operator == '<':
+        return [_interval(upper=prefix)]
+    if operator == '~=':
+        # PEP 440: ~=1.4.2 means >=1.4.2, ==1.4.*
+        if len(prefix) < 2:
+            raise ValueError(f"Invalid version constraint: '~={target}' needs at least two components")
+        return [_interval(prefix, True, _upper_bound(prefix[:-1]))]
+    if operator == '~':
+        # npm: ~1.2.3 means >=1.2.3 <1.3.0; ~1 means >=1 <2
+        return [_interval(prefix, True, _upper_bound(prefix[:2] if len(prefix) >= 2 else prefix))]
+    if operator == '^':
+        # npm: bump the left-most non-zero component
+        significant = next((i for i, part in enumerate(prefix) if part != 0), len(prefix) - 1)
+        return [_interval(prefix, True, _upper_bound(prefix[:significant + 1]))]
+    raise ValueError(f"Unsupported version operator: '{operator}'")
+
+
+def _split_clauses(conjunction: str) -> List[Tuple[str, str]]:
+    """
+    Split a conjunction into (operator, version) clauses.
+    
+    A hyphen range with a partial upper bound includes everything that
+    bound matches, as in npm: "1.0 - 2.0" means >=1.0 <2.1.0.
+    
+    Raises:
+        ValueError: If a hyphen range bound cannot be parsed
+    """
+    hyphen = _HYPHEN_RANGE.match(conjunction)
+    if hyphen:
+        lower, upper = hyphen.groups()
+        prefix, wildcard = _parse_target(upper)
+        if not prefix:
+            return [('>=', lower)]
+        if wildcard or len(prefix) < 3:
+            return [('>=', lower), ('<', '.'.join(map(str, _upper_bound(prefix))))]
+        return [('>=', lower), ('<=', upper)]
+    
+    normalized = _OPERATOR_SPACE.sub(r'\1', conjunction)
+    clauses = []
+    for token in re.split(r'[,\s]+', normalized.strip()):
+        if not token:
+            continue
+        match = _CLAUSE.match(token)
+        clauses.append((match.group(1) or '', match.group(2)))
+    return clauses
+
+
+def _intersect_all(a: List[VersionRange], b: List[VersionRange]) -> List[VersionRange]:
+    """Intersect two unions of intervals."""
+    return [common for x in a for y in b if (common := _intersect(x, y)) is not None]
+
+
+def parse_specifier(specifier: str) -> List[VersionRange]:
+    """
+    Parse a specifier into the version intervals it allows.
+    
+    Args:
+        specifier: Version specifier (e.g., ">=2.28", "^1.4 || 2.x", "18")
+    
+    Returns:
+        Union of (lower, lower_inclusive, upper, upper_inclusive) intervals;
+        None bounds are unbounded. Empty if the specifier allows nothing.
+    
+    Raises:
+        ValueError: If the specifier cannot be parsed
+    """
+    ranges: List[VersionRange] = []
+    for conjunction in specifier.split('||'):
+        allowed = [_interval()]
+        for operator, target in _split_clauses(conjunction):
+            allowed = _intersect_all(allowed, _clause_ranges(operator, target))
+        ranges.extend(allowed)
+    return ranges
+
+
+def version_satisfies(version: str, specifier: str) -> bool:
+    """
+    Check whether a concrete version satisfies a specifier.
+    
+    Args:
+        version: Concrete version (e.g., "2.31.0")
+        specifier: Version specifier (e.g., ">=2.28", "^1.4", "~=3.1")
+    
+    Returns:
+        True if the version is allowed by the specifier
+    
+    Raises:
+        ValueError: If the version or specifier cannot be parsed
+    """
+    parsed = parse_version(version)
+    if parsed is None:
+        raise ValueError(f"Invalid version: '{version}'")
+    return bool(_intersect_all([_interval(parsed, True, parsed, True)], parse_specifier(specifier)))
+
+
+def specifiers_intersect(declared: str, required: str) -> bool:
+    """
+    Check whether a declared specifier allows any version a required one does.
+    
+    Used to compare a manifest's declared range against a rule's required
+    range: "^18.2.0" is compatible with "18" and ">1.4" with ">1.4", while
+    ">=2.0,<2.28" is not compatible with ">=2.28".
+    
+    Args:
+        declared: Declared specifier or concrete version
+        required: Required specifier
+    
+    Returns:
+        True if some version satisfies both specifiers
+    
+    Raises:
+        ValueError: If either specifier cannot be parsed
+    """
+    return bool(_intersect_all(parse_specifier(declared), parse_specifier(required)))
+
+
+__all__ = ['parse_specifier', 'parse_version', 'specifiers_intersect', 'version_satisfies']
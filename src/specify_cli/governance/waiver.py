@@ -5,15 +5,25 @@ Provides functionality for creating, storing, and retrieving compliance waivers.
 Waivers represent formal exceptions to compliance requirements with reason and audit trail.
 """
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, Iterator, List, Optional, Any, Tuple
+import json
 import re
 import logging
 
 logger = logging.getLogger(__name__)
 
 
+_SECTION_BOUNDARY = re.compile(rb'^## Waiver:', re.MULTILINE)
+_SECTION_HEADER = re.compile(rb'## Waiver: (W-\d+)\r?\n')
+_REASON = re.compile(r'- \*\*Reason\*\*: (.+?)(?:\n|$)')
+_TIMESTAMP = re.compile(r'- \*\*Timestamp\*\*: (.+?)(?:\n|$)')
+_CREATED_BY = re.compile(r'- \*\*Created By\*\*: (.+?)(?:\n|$)')
+_RELATED_RULES = re.compile(r'- \*\*Related Rules\*\*: \[(.+?)\]')
+
+
 class Waiver:
     """
     Represents a single compliance waiver.
@@ -60,6 +70,290 @@ class Waiver:
         return f"Waiver({self.waiver_id}, {self.reason[:30]}...)"
 
 
+def _iter_waiver_sections(content: bytes) -> Iterator[Tuple[str, int, int]]:
+    """
+    Locate waiver sections in raw waivers.md content.
+    
+    A section starts after a "## Waiver: W-XXX" header line and runs to the
+    next line starting with "## Waiver:" or the end of the file.
+    
+    Args:
+        content: Raw file content
+    
+    Yields:
+        Tuples of (waiver_id, section_start, section_end) byte offsets
+    """
+    boundaries = [match.start() for match in _SECTION_BOUNDARY.finditer(content)]
+    boundaries.append(len(content))
+    for start, end in zip(boundaries, boundaries[1:]):
+        header = _SECTION_HEADER.match(content, start, end)
+        if header:
+            yield header.group(1).decode(), header.end(), end
+
+
+def _parse_waiver_section(waiver_id: str, section: str) -> Optional[Waiver]:
+    """
+    Parse the fields of one waiver section.
+    
+    Args:
+        waiver_id: Waiver identifier from the section header
+        section: Section text following the header
+    
+    Returns:
+        Waiver instance, or None if reason or timestamp is missing
+    """
+    section = section.replace('\r\n', '\n')
+    reason_match = _REASON.search(section)
+    timestamp_match = _TIMESTAMP.search(section)
+    if not (reason_match and timestamp_match):
+        return None
+    
+    created_by_match = _CREATED_BY.search(section)
+    rules_match = _RELATED_RULES.search(section)
+    related_rules = [
+        r.strip() for r in rules_match.group(1).split(',')
+    ] if rules_match else None
+    
+    return Waiver(
+        waiver_id=waiver_id,
+        reason=reason_match.group(1),
+        timestamp=timestamp_match.group(1),
+        related_rules=related_rules,
+        created_by=created_by_match.group(1) if created_by_match else None
+    )
+
+
+class WaiverIndex:
+    """
+    Sidecar index over waivers.md mapping waiver and rule IDs to file offsets.
+    
+    waivers.md stays the source of truth. The index records the file's
+    mtime and size and is rebuilt with one pass over the file whenever
+    either changes; appends made through WaiverManager update it in place.
+    Once loaded, ID lookups and next-ID generation need only a stat and a
+    read of the matching section.
+    """
+    
+    INDEX_VERSION = 1
+    
+    def __init__(self, waivers_file: Path, index_file: Path):
+        """
+        Initialize waiver index.
+        
+        Args:
+            waivers_file: Path to waivers.md
+            index_file: Path the index is persisted to
+        """
+        self.waivers_file = Path(waivers_file)
+        self.index_file = Path(index_file)
+        self._data: Optional[Dict[str, Any]] = None
+        self._by_id: Dict[str, int] = {}
+    
+    def stat_key(self) -> Optional[Tuple[int, int]]:
+        """Get (mtime_ns, size) of waivers.md, or None if missing."""
+        try:
+            stat_result = self.waivers_file.stat()
+        except OSError:
+            return None
+        return stat_result.st_mtime_ns, stat_result.st_size
+    
+    def _is_fresh(self, data: Optional[Dict[str, Any]], key: Tuple[int, int]) -> bool:
+        """Check whether index data describes the current waivers.md."""
+        return (
+            data is not None
+            and data.get("version") == self.INDEX_VERSION
+            and (data.get("mtime_ns"), data.get("size")) == key
+        )
+    
+    def _set_data(self, data: Dict[str, Any]) -> None:
+        """Install index data and derive the ID lookup table."""
+        self._data = data
+        self._by_id = {}
+        for position, (waiver_id, _, _) in enumerate(data["entries"]):
+            # First occurrence wins, matching a linear scan of the file
+            self._by_id.setdefault(waiver_id, position)
+    
+    def _build(self, key: Tuple[int, int]) -> Dict[str, Any]:
+        """Rebuild the index with one pass over waivers.md."""
+        content = self.waivers_file.read_bytes()
+        entries: List[List[Any]] = []
+        rules: Dict[str, List[int]] = {}
+        max_num = 0
+        
+        for waiver_id, start, end in _iter_waiver_sections(content):
+            waiver = _parse_waiver_section(waiver_id, content[start:end].decode("utf-8"))
+            if waiver is None:
+                continue
+            position = len(entries)
+            entries.append([waiver_id, start, end])
+            for rule_id in waiver.related_rules:
+                rules.setdefault(rule_id, []).append(position)
+            max_num = max(max_num, int(waiver_id[2:]))
+        
+        logger.debug(f"Rebuilt waiver index: {len(entries)} waivers")
+        return {
+            "version": self.INDEX_VERSION,
+            "mtime_ns": key[0],
+            "size": key[1],
+            "entries": entries,
+            "rules": rules,
+            "max_num": max_num,
+        }
+    
+    def _save(self) -> None:
+        """Persist the index atomically."""
+        try:
+            self.index_file.parent.mkdir(parents=True, exist_ok=True)
+            tmp_file = self.index_file.with_suffix(".tmp")
+            tmp_file.write_text(json.dumps(self._data, separators=(",", ":")))
+            tmp_file.replace(self.index_file)
+        except Exception as e:
+            logger.warning(f"Error saving waiver index: {e}")
+    
+    def load(self) -> Dict[str, Any]:
+        """
+        Get index data for the current waivers.md, rebuilding if stale.
+        
+        Returns:
+            Index data (empty if waivers.md does not exist)
+        """
+        key = self.stat_key()
+        if key is None:
+            self._set_data({"version": self.INDEX_VERSION, "mtime_ns": None, "size": None,
+                            "entries": [], "rules": {}, "max_num": 0})
+            return self._data
+        
+        if self._is_fresh(self._data, key):
+            return self._data
+        
+        data = None
+        if self.index_file.exists():
+            try:
+                data = json.loads(self.index_file.read_text())
+            except Exception as e:
+                logger.warning(f"Error reading waiver index: {e}")
+        
+        if self._is_fresh(data, key):
+            self._set_data(data)
+        else:
+            self._set_data(self._build(key))
+            self._save()
+        return self._data
+    
+    def next_waiver_id(self) -> str:
+        """
+        Get the next auto-incremented waiver ID.
+        
+        Returns:
+            Next waiver ID (e.g., "W-001", "W-002")
+        """
+        return f"W-{self.load()['max_num'] + 1:03d}"
+    
+    def _read_entry(self, position: int) -> Optional[Waiver]:
+        """Read and parse one indexed waiver section."""
+        waiver_id, start, end = self._data["entries"][position]
+        with open(self.waivers_file, "rb") as f:
+            f.seek(start)
+            section = f.read(end - start).decode("utf-8")
+        return _parse_waiver_section(waiver_id, section)
+    
+    def get_waiver(self, waiver_id: str) -> Optional[Waiver]:
+        """
+        Read a waiver by ID.
+        
+        Args:
+            waiver_id: Waiver identifier
+        
+        Returns:
+            Waiver instance if indexed, None otherwise
+        """
+        self.load()
+        position = self._by_id.get(waiver_id)
+        if position is None:
+            return None
+        return self._read_entry(position)
+    
+    def get_waiver_for_rule(self, rule_id: str) -> Optional[Waiver]:
+        """
+        Read the latest waiver covering a rule.
+        
+        Args:
+            rule_id: Rule identifier
+        
+        Returns:
+            Most recently appended waiver listing the rule, or None
+        """
+        positions = self.load()["rules"].get(rule_id)
+        if not positions:
+            return None
+        return self._read_entry(positions[-1])
+    
+    def record_append(self, waiver: Waiver, start: int, end: int, previous_key: Optional[Tuple[int, int]]) -> None:
+        """
+        Update the index for a waiver just appended to waivers.md.
+        
+        Args:
+            waiver: Appended waiver
+            start: Byte offset where its section starts
+            end: Byte offset where its section ends
+            previous_key: (mtime_ns, size) of waivers.md before the append;
+                the index is only updated in place if it matched that state
+        """
+        key = self.stat_key()
+        if key is None or previous_key is None or not self._is_fresh(self._data, previous_key):
+            return
+        
+        position = len(self._data["entries"])
+        self._data["entries"].append([waiver.waiver_id, start, end])
+        self._by_id.setdefault(waiver.waiver_id, position)
+        for rule_id in waiver.related_rules:
+            self._data["rules"].setdefault(rule_id, []).append(position)
+        self._data["max_num"] = max(self._data["max_num"], int(waiver.waiver_id[2:]))
+        self._data["mtime_ns"], self._data["size"] = key
+        self._save()
+    
+    def clear(self) -> None:
+        """Delete the persisted index."""
+        self._data = None
+        self._by_id = {}
+        try:
+            if self.index_file.exists():
+                self.index_file.unlink()
+        except Exception as e:
+            logger.warning(f"Error clearing waiver index: {e}")
+
+
+class RuleWaiverMap(Mapping):
+    """
+    Read-only map from rule IDs to their latest waiver, backed by WaiverIndex.
+    
+    Membership checks use the index only; waivers are read from waivers.md
+    when first accessed.
+    """
+    
+    def __init__(self, index: WaiverIndex):
+        self._index = index
+        self._rules = index.load()["rules"]
+        self._waivers: Dict[str, Waiver] = {}
+    
+    def __getitem__(self, rule_id: str) -> Waiver:
+        if rule_id not in self._waivers:
+            waiver = self._index.get_waiver_for_rule(rule_id) if rule_id in self._rules else None
+            if waiver is None:
+                raise KeyError(rule_id)
+            self._waivers[rule_id] = waiver
+        return self._waivers[rule_id]
+    
+    def __contains__(self, rule_id: object) -> bool:
+        return rule_id in self._rules
+    
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._rules)
+    
+    def __len__(self) -> int:
+        return len(self._rules)
+
+
 class WaiverManager:
     """
     Manages creation, storage, and retrieval of compliance waivers.
@@ -70,6 +364,7 @@ class WaiverManager:
     
     WAIVERS_FILE = Path(".specify/waivers.md")
     WAIVERS_DIR = Path(".specify")
+    INDEX_FILE = Path(".specify/.cache/waivers_index.json")
     
     def __init__(self, project_root: Optional[Path] = None):
         """
@@ -81,6 +376,7 @@ class WaiverManager:
         self.project_root = Path(project_root) if project_root else Path(".")
         self.waivers_file = self.project_root / self.WAIVERS_FILE
         self.waivers_dir = self.project_root / self.WAIVERS_DIR
+        self.index = WaiverIndex(self.waivers_file, self.project_root / self.INDEX_FILE)
     
     @staticmethod
     def generate_waiver_id(existing_waivers: List[Waiver]) -> str:
@@ -171,9 +467,8 @@ class WaiverManager:
         # Generate timestamp in ISO-8601 format
         timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
         
-        # Read existing waivers to generate next ID
-        existing_waivers = self.parse_waivers_file()
-        waiver_id = self.generate_waiver_id(existing_waivers)
+        # Generate next ID from the waiver index
+        waiver_id = self.index.next_waiver_id()
         
         logger.debug(f"Generating new waiver ID: {waiver_id}")
         
@@ -221,8 +516,17 @@ class WaiverManager:
             waiver.created_by
         )
         
-        with open(self.waivers_file, 'a') as f:
-            f.write(entry)
+        # Bring the index up to date so the append can be recorded in place
+        self.index.load()
+        previous_key = self.index.stat_key()
+        with open(self.waivers_file, 'ab') as f:
+            start = f.tell()
+            f.write(entry.encode("utf-8"))
+            end = f.tell()
+        
+        # The entry starts with a blank line followed by its header line
+        header_len = len(f"\n## Waiver: {waiver.waiver_id}\n".encode("utf-8"))
+        self.index.record_append(waiver, start + header_len, end, previous_key)
         logger.debug(f"Appended waiver {waiver.waiver_id} to {self.waivers_file}")
     
     def parse_waivers_file(self) -> List[Waiver]:
@@ -237,38 +541,13 @@ class WaiverManager:
             return []
         
         logger.debug(f"Parsing waivers file: {self.waivers_file}")
-        content = self.waivers_file.read_text()
+        content = self.waivers_file.read_bytes()
         waivers = []
         
         # Split by waiver sections (## Waiver: W-XXX)
-        pattern = r'## Waiver: (W-\d+)\n((?:.*?\n)*?)(?=## Waiver:|$)'
-        matches = re.finditer(pattern, content)
-        
-        for match in matches:
-            waiver_id = match.group(1)
-            waiver_section = match.group(2)
-            
-            # Parse fields from waiver section
-            reason_match = re.search(r'- \*\*Reason\*\*: (.+?)(?:\n|$)', waiver_section)
-            timestamp_match = re.search(r'- \*\*Timestamp\*\*: (.+?)(?:\n|$)', waiver_section)
-            created_by_match = re.search(r'- \*\*Created By\*\*: (.+?)(?:\n|$)', waiver_section)
-            rules_match = re.search(r'- \*\*Related Rules\*\*: \[(.+?)\]', waiver_section)
-            
-            if reason_match and timestamp_match:
-                reason = reason_match.group(1)
-                timestamp = timestamp_match.group(1)
-                created_by = created_by_match.group(1) if created_by_match else None
-                related_rules = [
-                    r.strip() for r in rules_match.group(1).split(',')
-                ] if rules_match else None
-                
-                waiver = Waiver(
-                    waiver_id=waiver_id,
-                    reason=reason,
-                    timestamp=timestamp,
-                    related_rules=related_rules,
-                    created_by=created_by
-                )
+        for waiver_id, start, end in _iter_waiver_sections(content):
+            waiver = _parse_waiver_section(waiver_id, content[start:end].decode("utf-8"))
+            if waiver is not None:
                 waivers.append(waiver)
                 logger.debug(f"Parsed waiver {waiver_id}")
         
@@ -286,14 +565,22 @@ class WaiverManager:
             Waiver instance if found, None otherwise
         """
         logger.debug(f"Looking up waiver: {waiver_id}")
-        waivers = self.parse_waivers_file()
-        for waiver in waivers:
-            if waiver.waiver_id == waiver_id:
-                logger.debug(f"Found waiver: {waiver_id}")
-                return waiver
+        waiver = self.index.get_waiver(waiver_id)
+        if waiver is not None:
+            logger.debug(f"Found waiver: {waiver_id}")
+            return waiver
         logger.warning(f"Waiver not found: {waiver_id}")
         return None
     
+    def get_rule_waiver_map(self) -> RuleWaiverMap:
+        """
+        Get a map from rule IDs to the latest waiver covering each rule.
+        
+        Returns:
+            Read-only mapping backed by the waiver index
+        """
+        return RuleWaiverMap(self.index)
+    
     def list_waivers(self) -> List[Waiver]:
         """
         Get all waivers in chronological order.
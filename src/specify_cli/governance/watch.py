@@ -0,0 +1,201 @@
+"""
+Watch mode for compliance checking.
+
+Keeps one ComplianceChecker resident, so its guide, parse and rule caches
+stay warm, and re-checks the project whenever files change. Only rules
+whose target or source guide changed are re-evaluated; all other results
+carry over from the previous cycle.
+
+Changes are detected by polling file mtimes and sizes, which works on
+every platform without extra dependencies.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+import logging
+
+from .compliance import ComplianceChecker, RuleEvaluationResult
+from .waiver import WaiverManager
+
+logger = logging.getLogger(__name__)
+
+# (mtime_ns, size) of a file; size is -1 for directories
+FileStamp = Tuple[int, int]
+
+
+class PollingWatcher:
+    """
+    Detects changed files under a project by comparing stat snapshots.
+    
+    Each poll walks the project with os.scandir, skipping ignored
+    directories without entering them, and reports paths that were added,
+    removed, or whose mtime or size changed since the previous poll.
+    Directories are included (by mtime), so rules targeting a directory
+    see it appear, disappear or gain entries.
+    """
+    
+    def __init__(
+        self,
+        project_root: Union[str, Path],
+        is_ignored: Optional[Callable[[str, bool], bool]] = None,
+        extra_paths: Iterable[str] = ()
+    ):
+        """
+        Initialize watcher and take the first snapshot.
+        
+        Args:
+            project_root: Root directory of project
+            is_ignored: Called with (relative path, is_dir); True skips the path
+            extra_paths: Relative file paths watched even if ignored
+                (e.g. .specify/waivers.md)
+        """
+        self.project_root = Path(project_root)
+        self.is_ignored = is_ignored or (lambda rel_path, is_dir: False)
+        self.extra_paths = list(extra_paths)
+        self._snapshot = self.snapshot()
+    
+    def snapshot(self) -> Dict[str, FileStamp]:
+        """
+        Stat every watched file and directory.
+        
+        Returns:
+            Map of '/'-separated relative path to FileStamp
+        """
+        stamps: Dict[str, FileStamp] = {}
+        self._scan(self.project_root, "", stamps)
+        for rel_path in self.extra_paths:
+            try:
+                st = (self.project_root / rel_path).stat()
+            except OSError:
+                continue
+            stamps[rel_path] = (st.st_mtime_ns, st.st_size)
+        return stamps
+    
+    def _scan(self, dir_path: Path, rel_dir: str, stamps: Dict[str, FileStamp]) -> None:
+        try:
+            with os.scandir(dir_path) as it:
+                entries = list(it)
+        except OSError:
+            return
+        
+        for entry in entries:
+            rel_path = f"{rel_dir}/{entry.name}" if rel_dir else entry.name
+            try:
+                is_dir = entry.is_dir(follow_symlinks=False)
+                if self.is_ignored(rel_path, is_dir):
+                    continue
+                st = entry.stat(follow_symlinks=False)
+            except OSError:
+                continue
+            stamps[rel_path] = (st.st_mtime_ns, -1 if is_dir else st.st_size)
+            if is_dir:
+                self._scan(Path(entry.path), rel_path, stamps)
+    
+    def poll(self) -> Set[str]:
+        """
+        Take a new snapshot and compare it with the previous one.
+        
+        Returns:
+            Relative paths added, removed or modified since the last poll
+        """
+        current = self.snapshot()
+        previous = self._snapshot
+        self._snapshot = current
+        changed = {path for path, stamp in current.items() if previous.get(path) != stamp}
+        changed.update(path for path in previous if path not in current)
+        return changed
+
+
+@dataclass
+class WatchUpdate:
+    """Outcome of one watch cycle."""
+    results: List[RuleEvaluationResult]
+    changed_files: Set[str] = field(default_factory=set)  # empty for the initial check
+    duration_ms: float = 0.0
+    # (previous result or None, new result) for rules whose status or message changed
+    status_changes: List[Tuple[Optional[RuleEvaluationResult], RuleEvaluationResult]] = field(default_factory=list)
+
+
+def _status_changes(
+    previous: List[RuleEvaluationResult],
+    current: List[RuleEvaluationResult]
+) -> List[Tuple[Optional[RuleEvaluationResult], RuleEvaluationResult]]:
+    """Pair up results whose status or message differs between two runs."""
+    before = {(r.guide_id, r.rule_id): r for r in previous}
+    changes = []
+    for result in current:
+        old = before.get((result.guide_id, result.rule_id))
+        if old is None or old.status != result.status or old.message != result.message:
+            changes.append((old, result))
+    return changes
+
+
+def watch_compliance(
+    checker: ComplianceChecker,
+    on_update: Callable[[WatchUpdate], None],
+    interval: float = 0.5,
+    settle: float = 0.05,
+    stop: Optional[threading.Event] = None,
+    watcher: Optional[PollingWatcher] = None
+) -> None:
+    """
+    Run a full check, then re-check affected rules whenever files change.
+    
+    Runs until stop is set (or forever). Caches are persisted once when
+    watching ends, not on every cycle.
+    
+    Args:
+        checker: Checker kept resident between cycles
+        on_update: Called after the initial check and after every re-check
+        interval: Seconds between polls while nothing changes
+        settle: Seconds to wait after a change so a burst of saves is
+            handled in one cycle
+        stop: Event that ends watching
+        watcher: Change detector (defaults to a PollingWatcher honoring the
+            checker's discovery ignore patterns)
+    """
+    stop = stop or threading.Event()
+    if watcher is None:
+        watcher = PollingWatcher(
+            checker.project_root,
+            is_ignored=checker.discovery.is_ignored,
+            extra_paths=[WaiverManager.WAIVERS_FILE.as_posix()]
+        )
+    
+    try:
+        started = time.perf_counter()
+        results = checker.run_compliance_check(record=False)
+        on_update(WatchUpdate(results=results, duration_ms=(time.perf_counter() - started) * 1000))
+        
+        while not stop.wait(interval):
+            changed = watcher.poll()
+            if not changed:
+                continue
+            # Collect the rest of a multi-file save before re-checking
+            if settle > 0 and not stop.wait(settle):
+                changed |= watcher.poll()
+            logger.debug(f"Files changed: {sorted(changed)}")
+            
+            started = time.perf_counter()
+            updated = checker.run_compliance_check(
+                changed_files=changed,
+                previous_results=results,
+                record=False
+            )
+            duration_ms = (time.perf_counter() - started) * 1000
+            on_update(WatchUpdate(
+                results=updated,
+                changed_files=changed,
+                duration_ms=duration_ms,
+                status_changes=_status_changes(results, updated)
+            ))
+            results = updated
+    finally:
+        checker.save_caches()
+
+
+__all__ = ['PollingWatcher', 'WatchUpdate', 'watch_compliance']
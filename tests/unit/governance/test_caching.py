@@ -2,6 +2,7 @@
 Unit tests for governance caching module.
 """
 
+import os
 import time
 from pathlib import Path
 import pytest
@@ -9,7 +10,9 @@ import tempfile
 import shutil
 
 from specify_cli.governance.caching import (
+    DirectoryIndex,
     GuideCacheManager,
+    ProjectFileIndex,
     RuleEvaluationCache
 )
 
@@ -91,14 +94,39 @@ class TestGuideCacheManager:
         cached = manager.get_guides()
         assert cached is not None
         
-        # Modify a guide file
+        # Add a guide file
         time.sleep(0.1)
-        (temp_project / "specs" / "backend.md").write_text("# Backend Guide Modified")
+        (temp_project / "specs" / "new-guide.md").write_text("# New Guide")
         
         # Cache should be invalid now
         cached = manager.get_guides()
         assert cached is None
     
+    def test_cache_valid_after_content_edit(self, temp_project):
+        """Editing a guide's content does not change the discovered guide list."""
+        manager = GuideCacheManager(temp_project)
+        
+        guides = [temp_project / "specs" / "backend.md"]
+        manager.save_guides(guides)
+        
+        (temp_project / "specs" / "backend.md").write_text("# Backend Guide Modified")
+        
+        assert manager.get_guides() == guides
+    
+    def test_cache_invalid_after_nested_removal(self, temp_project):
+        """Removing a guide from a nested directory invalidates the cache."""
+        nested = temp_project / "specs" / "001-feature"
+        nested.mkdir()
+        (nested / "spec.md").write_text("# Spec")
+        
+        manager = GuideCacheManager(temp_project)
+        manager.save_guides([temp_project / "specs" / "backend.md"])
+        assert manager.get_guides() is not None
+        
+        (nested / "spec.md").unlink()
+        
+        assert manager.get_guides() is None
+    
     def test_cache_expiry(self, temp_project):
         """Test cache expiry based on time."""
         manager = GuideCacheManager(temp_project)
@@ -156,6 +184,177 @@ class TestGuideCacheManager:
             shutil.rmtree(empty_project)
 
 
+class TestDirectoryIndex:
+    """Tests for DirectoryIndex."""
+    
+    @pytest.fixture
+    def tree(self):
+        """Create a small directory tree with old mtimes."""
+        temp_dir = Path(tempfile.mkdtemp())
+        (temp_dir / "specs" / "a").mkdir(parents=True)
+        (temp_dir / "specs" / "b").mkdir()
+        (temp_dir / "specs" / "top.md").write_text("# Top")
+        (temp_dir / "specs" / "a" / "one.md").write_text("# One")
+        (temp_dir / "specs" / "a" / "notes.txt").write_text("not a guide")
+        (temp_dir / "specs" / "b" / "two.md").write_text("# Two")
+        
+        # Age the directories so their listings are trusted on reuse
+        old = time.time() - 60
+        for dir_path in [temp_dir / "specs", temp_dir / "specs" / "a", temp_dir / "specs" / "b"]:
+            os.utime(dir_path, (old, old))
+        
+        yield temp_dir
+        shutil.rmtree(temp_dir)
+    
+    def _index(self, root):
+        return DirectoryIndex(root, root / ".specify" / ".cache" / "index.json", [root / "specs"], suffix=".md")
+    
+    def test_refresh_lists_matching_files(self, tree):
+        """Test refresh returns sorted relative paths filtered by suffix."""
+        files = self._index(tree).refresh()
+        
+        assert files == ["specs/a/one.md", "specs/b/two.md", "specs/top.md"]
+    
+    def test_unchanged_dirs_are_not_rescanned(self, tree):
+        """Test a second refresh reuses the persisted listings."""
+        self._index(tree).refresh()
+        
+        index = self._index(tree)
+        files = index.refresh()
+        
+        assert files == ["specs/a/one.md", "specs/b/two.md", "specs/top.md"]
+        assert index.rescanned_dirs == 0
+    
+    def test_only_changed_dir_is_rescanned(self, tree):
+        """Test adding a file rescans only its directory."""
+        self._index(tree).refresh()
+        (tree / "specs" / "b" / "three.md").write_text("# Three")
+        
+        index = self._index(tree)
+        files = index.refresh()
+        
+        assert "specs/b/three.md" in files
+        assert index.rescanned_dirs == 1
+    
+    def test_removed_dir_is_dropped(self, tree):
+        """Test removing a directory drops its files."""
+        self._index(tree).refresh()
+        shutil.rmtree(tree / "specs" / "a")
+        
+        files = self._index(tree).refresh()
+        
+        assert files == ["specs/b/two.md", "specs/top.md"]
+    
+    def test_missing_root(self, tree):
+        """Test a missing root yields no files."""
+        index = DirectoryIndex(tree, tree / "index.json", [tree / "missing"], suffix=".md")
+        
+        assert index.refresh() == []
+
+
+class TestProjectFileIndex:
+    """Test ProjectFileIndex class."""
+    
+    @pytest.fixture
+    def tree(self, tmp_path):
+        for rel_path in ("README.md", "src/app.py", "src/api/routes.py", "node_modules/pkg/index.js"):
+            path = tmp_path / rel_path
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text("x")
+        (tmp_path / "empty").mkdir()
+        (tmp_path / ".specify" / ".cache").mkdir(parents=True)
+        
+        old = time.time() - 60
+        for dir_path in (tmp_path, tmp_path / "src", tmp_path / "src" / "api", tmp_path / "empty"):
+            os.utime(dir_path, (old, old))
+        return tmp_path
+    
+    def _index(self, root, **kwargs):
+        return ProjectFileIndex(
+            root,
+            is_ignored=lambda rel_path, is_dir: rel_path.split("/")[0] in ("node_modules", ".specify"),
+            **kwargs
+        )
+    
+    def test_exists(self, tree):
+        """Test existence is answered from the index, deferring on ignored paths."""
+        index = self._index(tree, use_git=False)
+        
+        assert index.exists("README.md") is True
+        assert index.exists("src/api") is True
+        assert index.exists("empty") is True
+        assert index.exists("src/missing.py") is False
+        assert index.exists("missing/deep/file.py") is False
+        assert index.exists("node_modules/pkg/index.js") is None
+        assert index.exists("../outside.txt") is None
+    
+    def test_list_dir(self, tree):
+        """Test directory listings leave out ignored entries."""
+        index = self._index(tree, use_git=False)
+        
+        assert index.list_dir("") == (("README.md", False), ("empty", True), ("src", True))
+        assert index.list_dir("src") == (("api", True), ("app.py", False))
+        assert index.list_dir("node_modules") is None
+    
+    def test_refreshes_once_until_stale(self, tree):
+        """Test the index refreshes on first query and again after mark_stale."""
+        index = self._index(tree, use_git=False)
+        index.exists("README.md")
+        
+        (tree / "src" / "new.py").write_text("x")
+        assert index.exists("src/new.py") is False
+        
+        index.mark_stale()
+        assert index.exists("src/new.py") is True
+    
+    def test_persisted_and_updated_incrementally(self, tree):
+        """Test a new index reuses unchanged listings and rescans changed directories."""
+        self._index(tree, use_git=False).refresh()
+        
+        index = self._index(tree, use_git=False)
+        index.refresh()
+        assert index.rescanned_dirs == 0
+        
+        (tree / "src" / "api" / "models.py").write_text("x")
+        index = self._index(tree, use_git=False)
+        index.refresh()
+        assert index.rescanned_dirs == 1
+        assert index.exists("src/api/models.py") is True
+    
+    def test_changed_ignore_rules_rebuild(self, tree):
+        """Test an index built with other ignore rules is not reused."""
+        self._index(tree, use_git=False, ignore_key="a").refresh()
+        
+        index = self._index(tree, use_git=False, ignore_key="b")
+        index.refresh()
+        assert index.rescanned_dirs == 4
+    
+    def test_built_from_git(self, tree, monkeypatch):
+        """Test the first build uses git's file list when available."""
+        monkeypatch.setattr(
+            "specify_cli.governance.caching.list_project_files",
+            lambda path: {"README.md", "src/app.py", "src/api/routes.py", "node_modules/pkg/index.js"}
+        )
+        index = self._index(tree)
+        index.refresh()
+        
+        assert index.built_from_git
+        assert index.rescanned_dirs == 0
+        assert index.exists("src/api/routes.py") is True
+        # git does not list empty directories, so misses are deferred to a stat
+        assert index.exists("empty") is None
+        assert index.list_dir("") == (("README.md", False), ("src", True))
+    
+    def test_git_unavailable_falls_back_to_scan(self, tree, monkeypatch):
+        """Test the index is scanned when the project is not in a git repository."""
+        monkeypatch.setattr("specify_cli.governance.caching.list_project_files", lambda path: None)
+        index = self._index(tree)
+        index.refresh()
+        
+        assert not index.built_from_git
+        assert index.exists("empty") is True
+
+
 class TestRuleEvaluationCache:
     """Test RuleEvaluationCache class."""
     
@@ -264,3 +463,107 @@ class TestCachingIntegration:
         guides2 = manager.get_guides()
         
         assert guides1 == guides2
+
+
+class TestRuleEvaluationCachePersistence:
+    """Test RuleEvaluationCache hit/miss, invalidation and eviction."""
+    
+    @pytest.fixture
+    def temp_project(self):
+        """Create temporary project with a rule target."""
+        temp_dir = tempfile.mkdtemp()
+        project_root = Path(temp_dir)
+        (project_root / "README.md").write_text("License: MIT\n")
+        
+        yield project_root
+        
+        shutil.rmtree(temp_dir)
+    
+    RESULT = {"passed": True, "message": "✅ Pattern found", "details": "1 occurrence"}
+    
+    def test_hash_rule_is_stable(self):
+        """Test rule hash ignores key order and tracks definition changes."""
+        rule_a = {"id": "r1", "type": "text_includes", "file": "README.md", "text": "MIT"}
+        rule_b = {"text": "MIT", "file": "README.md", "type": "text_includes", "id": "r1"}
+        rule_c = dict(rule_a, text="Apache")
+        
+        assert RuleEvaluationCache.hash_rule(rule_a) == RuleEvaluationCache.hash_rule(rule_b)
+        assert RuleEvaluationCache.hash_rule(rule_a) != RuleEvaluationCache.hash_rule(rule_c)
+    
+    def test_cache_hit_across_instances(self, temp_project):
+        """Test results persist to disk and are reused by a new cache."""
+        cache = RuleEvaluationCache(temp_project)
+        cache.cache_result("r1", "README.md", self.RESULT, rule_hash="abc")
+        cache.save()
+        
+        assert cache.cache_file.exists()
+        reloaded = RuleEvaluationCache(temp_project)
+        assert reloaded.get_cached_result("r1", "README.md", rule_hash="abc") == self.RESULT
+        assert reloaded.get_cached_result("r1", "README.md", rule_hash="other") is None
+    
+    def test_content_change_invalidates(self, temp_project):
+        """Test modifying the target invalidates the cached result."""
+        cache = RuleEvaluationCache(temp_project)
+        cache.cache_result("r1", "README.md", self.RESULT, rule_hash="abc")
+        
+        (temp_project / "README.md").write_text("License: Apache\n")
+        
+        assert cache.get_cached_result("r1", "README.md", rule_hash="abc") is None
+    
+    def test_touch_without_change_still_hits(self, temp_project):
+        """Test an mtime change with identical content falls back to the content hash."""
+        cache = RuleEvaluationCache(temp_project)
+        cache.cache_result("r1", "README.md", self.RESULT, rule_hash="abc")
+        
+        target = temp_project / "README.md"
+        stat_result = target.stat()
+        os.utime(target, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 5_000_000_000))
+        
+        assert cache.get_cached_result("r1", "README.md", rule_hash="abc") == self.RESULT
+    
+    def test_missing_target_fingerprint(self, temp_project):
+        """Test results for missing targets are invalidated once the file appears."""
+        cache = RuleEvaluationCache(temp_project)
+        missing = {"passed": False, "message": "❌ File not found", "details": ""}
+        cache.cache_result("r2", "src/app.py", missing, rule_hash="def")
+        
+        assert cache.get_cached_result("r2", "src/app.py", rule_hash="def") == missing
+        
+        (temp_project / "src").mkdir()
+        (temp_project / "src" / "app.py").write_text("app = 1\n")
+        
+        assert cache.get_cached_result("r2", "src/app.py", rule_hash="def") is None
+    
+    def test_lru_eviction(self, temp_project):
+        """Test least recently used entries are evicted beyond max_entries."""
+        cache = RuleEvaluationCache(temp_project, max_entries=2)
+        cache.cache_result("r1", "README.md", self.RESULT, rule_hash="h1")
+        cache.cache_result("r2", "README.md", self.RESULT, rule_hash="h2")
+        
+        # Touch r1 so r2 becomes least recently used
+        assert cache.get_cached_result("r1", "README.md", rule_hash="h1") is not None
+        cache.cache_result("r3", "README.md", self.RESULT, rule_hash="h3")
+        
+        assert cache.get_cached_result("r2", "README.md", rule_hash="h2") is None
+        assert cache.get_cached_result("r1", "README.md", rule_hash="h1") is not None
+        assert cache.get_cached_result("r3", "README.md", rule_hash="h3") is not None
+    
+    def test_expired_entry_misses(self, temp_project):
+        """Test entries older than the expiry window are ignored."""
+        cache = RuleEvaluationCache(temp_project)
+        cache.CACHE_EXPIRY_SECONDS = 0
+        cache.cache_result("r1", "README.md", self.RESULT, rule_hash="abc")
+        time.sleep(0.01)
+        
+        assert cache.get_cached_result("r1", "README.md", rule_hash="abc") is None
+    
+    def test_corrupt_cache_file_is_ignored(self, temp_project):
+        """Test an unreadable cache file behaves like an empty cache."""
+        cache = RuleEvaluationCache(temp_project)
+        cache.cache_dir.mkdir(parents=True, exist_ok=True)
+        cache.cache_file.write_text("not json")
+        
+        assert cache.get_cached_result("r1", "README.md", rule_hash="abc") is None
+        cache.cache_result("r1", "README.md", self.RESULT, rule_hash="abc")
+        cache.save()
+        assert RuleEvaluationCache(temp_project).get_cached_result("r1", "README.md", rule_hash="abc") == self.RESULT
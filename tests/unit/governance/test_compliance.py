@@ -14,12 +14,16 @@ from pathlib import Path
 from datetime import datetime
 import tempfile
 import shutil
+from unittest.mock import patch
 
 from specify_cli.governance.compliance import (
     ComplianceChecker,
+    ResultAggregate,
     RuleEvaluationResult,
     RuleStatus
 )
+from specify_cli.governance.metrics import get_metrics_collector
+from specify_cli.governance.rules.engine import evaluate_rules_in_processes
 from specify_cli.governance.report import ComplianceReportGenerator
 from specify_cli.governance.waiver import WaiverManager
 
@@ -133,6 +137,71 @@ class TestRuleEvaluationResult:
         assert result.timestamp.endswith("Z")
 
 
+class TestResultAggregate:
+    """Tests for ResultAggregate."""
+    
+    @staticmethod
+    def make(rule_id, status, guide_id="g1", rule_type="file_exists", waiver_id=None):
+        return RuleEvaluationResult(
+            rule_id=rule_id,
+            rule_type=rule_type,
+            status=status,
+            message="m",
+            target="t",
+            guide_id=guide_id,
+            waiver_id=waiver_id
+        )
+    
+    def test_buckets_and_counts(self):
+        """Test one pass fills status buckets, counts and checked guides."""
+        aggregate = ResultAggregate([
+            self.make("b", RuleStatus.PASS),
+            self.make("a", RuleStatus.PASS, guide_id="g2"),
+            self.make("c", RuleStatus.WAIVED, waiver_id="W-001"),
+            self.make("d", RuleStatus.WAIVED, waiver_id="W-001"),
+            self.make("parse-error", RuleStatus.ERROR, guide_id="broken", rule_type="parsing"),
+            self.make("discovery-error", RuleStatus.ERROR, guide_id="missing", rule_type="discovery"),
+        ])
+        
+        assert aggregate.total == 6
+        assert (aggregate.pass_count, aggregate.fail_count) == (2, 0)
+        assert (aggregate.waived_count, aggregate.error_count) == (2, 2)
+        assert aggregate.waiver_ids == {"W-001"}
+        assert aggregate.checked_guide_ids == {"g1", "g2", "missing"}
+    
+    def test_sorted_view_reused_until_add(self):
+        """Test the sorted view is cached and refreshed when its status changes."""
+        aggregate = ResultAggregate([self.make("b", RuleStatus.FAIL)])
+        first = aggregate.sorted_by_rule(RuleStatus.FAIL)
+        assert aggregate.sorted_by_rule(RuleStatus.FAIL) is first
+        
+        aggregate.add(self.make("c", RuleStatus.PASS))
+        assert aggregate.sorted_by_rule(RuleStatus.FAIL) is first
+        
+        aggregate.add(self.make("a", RuleStatus.FAIL))
+        assert [r.rule_id for r in aggregate.sorted_by_rule(RuleStatus.FAIL)] == ["a", "b"]
+    
+    def test_report_accepts_aggregate(self, temp_project_dir):
+        """Test a report from an aggregate matches one from the result list."""
+        results = [self.make("b", RuleStatus.FAIL), self.make("a", RuleStatus.PASS)]
+        generator = ComplianceReportGenerator(project_root=temp_project_dir)
+        
+        added = []
+        original_add = ResultAggregate.add
+        
+        def counting_add(self, result):
+            added.append(result)
+            original_add(self, result)
+        
+        with patch.object(ResultAggregate, "add", counting_add):
+            from_aggregate = generator.generate_report(ResultAggregate(results), project_name="P")
+        from_list = generator.generate_report(results, project_name="P")
+        
+        # The report reads the aggregate instead of bucketing the results again
+        assert added == results
+        assert from_aggregate.split("**Generated**")[1][25:] == from_list.split("**Generated**")[1][25:]
+
+
 class TestComplianceChecker:
     """Tests for ComplianceChecker."""
     
@@ -156,6 +225,46 @@ class TestComplianceChecker:
         assert len(guides) > 0
         assert any("backend-api.md" in str(g) for g in guides)
     
+    def test_run_discovers_guides_lazily(self, temp_with_guides):
+        """Test run_compliance_check consumes discovery as a stream and caches it."""
+        checker = ComplianceChecker(project_root=temp_with_guides)
+        
+        results = checker.run_compliance_check()
+        
+        assert {r.guide_id for r in results} == {"backend-api"}
+        assert checker.cache_manager.get_guides() == checker._discover_guides()
+    
+    def test_rules_evaluated_in_process(self, temp_with_guides):
+        """Test rules evaluated without a process pool pass and fail instead of erroring."""
+        (temp_with_guides / "src" / "api").mkdir(parents=True)
+        (temp_with_guides / "src" / "api" / "routes.py").write_text("routes = []\n")
+        checker = ComplianceChecker(project_root=temp_with_guides, use_cache=False)
+        
+        results = checker.run_compliance_check()
+        
+        assert [(r.rule_id, r.status) for r in results] == [
+            ("api-routes-defined", RuleStatus.PASS),
+            ("tests-present", RuleStatus.FAIL),
+        ]
+        assert results[0].message.startswith("✅")
+        assert results[1].message.startswith("❌")
+    
+    def test_rule_instances_shared_between_guides(self, temp_with_guides):
+        """Test a rule declared by several guides is built once per run."""
+        guides_dir = temp_with_guides / "context" / "references"
+        shutil.copy(guides_dir / "backend-api.md", guides_dir / "backend-worker.md")
+        checker = ComplianceChecker(project_root=temp_with_guides, use_cache=False)
+        
+        with patch.object(checker.rule_engine, "create_rule", wraps=checker.rule_engine.create_rule) as create:
+            results = checker.run_compliance_check()
+            assert create.call_count == 2
+            checker.run_compliance_check()
+            assert create.call_count == 4
+        
+        assert len(results) == 4
+        assert {r.guide_id for r in results} == {"backend-api", "backend-worker"}
+        assert all(r.status == RuleStatus.FAIL for r in results)
+    
     def test_build_waiver_map(self, temp_project_dir):
         """Test building waiver map for rule lookup."""
         from specify_cli.governance.waiver import Waiver
@@ -410,6 +519,31 @@ class TestComplianceReportGenerator:
         assert report_path.exists()
         assert report_path.read_text() == report_content
     
+    def test_write_report_streams_lines(self, temp_project_dir):
+        """Test the streamed report matches the generated string."""
+        import io
+        
+        results = [
+            RuleEvaluationResult(
+                rule_id=f"rule-{i}",
+                rule_type="file_exists",
+                status=status,
+                message="Message",
+                target="test",
+                guide_id="backend"
+            )
+            for i, status in enumerate([RuleStatus.PASS, RuleStatus.FAIL, RuleStatus.ERROR])
+        ]
+        generator = ComplianceReportGenerator(project_root=temp_project_dir)
+        
+        lines = list(generator.iter_report(results, project_name="TestProject"))
+        out = io.StringIO()
+        generator.write_report(results, out, project_name="TestProject")
+        
+        assert len(lines) > 10 and all(line.endswith("\n") for line in lines)
+        assert out.getvalue().split("**Generated**")[0] == "".join(lines).split("**Generated**")[0]
+        assert "## ❌ Failed Rules" in out.getvalue()
+    
     def test_generate_and_write_report(self, temp_project_dir):
         """Test generate and write in one operation."""
         results = [
@@ -433,3 +567,501 @@ class TestComplianceReportGenerator:
         content = report_path.read_text()
         assert "TestProject" in content
         assert "## Summary" in content
+
+
+class TestRuleResultCaching:
+    """Tests for rule result caching in ComplianceChecker."""
+    
+    def test_evaluate_rule_uses_cached_result(self, temp_project_dir):
+        """Test a cached result is returned without instantiating the rule."""
+        from specify_cli.governance.caching import RuleEvaluationCache
+        
+        (temp_project_dir / "README.md").write_text("License: MIT\n")
+        rule_data = {
+            "id": "license-present",
+            "type": "text_includes",
+            "file": "README.md",
+            "text": "License",
+            "description": "License notice required",
+        }
+        
+        checker = ComplianceChecker(project_root=temp_project_dir)
+        checker.rule_cache.cache_result(
+            "license-present",
+            "README.md",
+            {"passed": True, "message": "✅ Pattern found in README.md", "details": "cached"},
+            RuleEvaluationCache.hash_rule(rule_data),
+        )
+        
+        def fail_create_rule(*args, **kwargs):
+            raise AssertionError("rule should not be instantiated on a cache hit")
+        
+        checker.rule_engine.create_rule = fail_create_rule
+        result = checker._evaluate_rule(rule_data, "backend", {})
+        
+        assert result.status == RuleStatus.PASS
+        assert result.target == "cached"
+    
+    def test_caching_disabled(self, temp_project_dir):
+        """Test use_cache=False disables the rule cache."""
+        checker = ComplianceChecker(project_root=temp_project_dir, use_cache=False)
+        assert checker.rule_cache is None
+
+
+class TestIncrementalCompliance:
+    """Tests for git-diff driven incremental compliance checking."""
+    
+    GUIDE = """---
+rules:
+  - id: readme-license
+    type: text_includes
+    file: README.md
+    text: License
+    description: License notice required
+  - id: app-main
+    type: text_includes
+    file: src/app.py
+    text: main
+    description: Entry point required
+---
+
+# Guide
+"""
+    
+    @pytest.fixture
+    def git_project(self, temp_project):
+        """Create a committed git project with one guide and its targets."""
+        import subprocess
+        
+        guides_dir = temp_project / "context" / "references"
+        guides_dir.mkdir(parents=True)
+        (guides_dir / "backend.md").write_text(self.GUIDE)
+        (temp_project / "README.md").write_text("License: MIT\n")
+        (temp_project / "src").mkdir()
+        (temp_project / "src" / "app.py").write_text("def main():\n    pass\n")
+        (temp_project / ".gitignore").write_text(".specify/.cache/\n")
+        subprocess.run(["git", "add", "."], cwd=temp_project, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "init"], cwd=temp_project, check=True, capture_output=True)
+        return temp_project
+    
+    def _record_previous_run(self, checker):
+        """Store a previous run whose results are recognisable."""
+        from specify_cli.core.git import get_head_commit
+        
+        previous = [
+            RuleEvaluationResult(
+                rule_id=rule_id,
+                rule_type="text_includes",
+                status=RuleStatus.PASS,
+                message="stored",
+                target="",
+                guide_id="backend",
+                guide_path="context/references/backend.md"
+            ).to_dict()
+            for rule_id in ("readme-license", "app-main")
+        ]
+        checker.run_store.save(previous, commit=get_head_commit(checker.project_root))
+    
+    def test_get_changed_files(self, git_project):
+        """Test git change detection includes modified and untracked files."""
+        from specify_cli.core.git import get_changed_files
+        
+        assert get_changed_files(git_project, "HEAD") == set()
+        
+        (git_project / "README.md").write_text("License: Apache\n")
+        (git_project / "NEW.md").write_text("new\n")
+        
+        assert get_changed_files(git_project, "HEAD") == {"README.md", "NEW.md"}
+    
+    def test_get_changed_files_non_ascii(self, git_project):
+        """Test non-ASCII paths are returned unquoted."""
+        from specify_cli.core.git import get_changed_files
+        
+        (git_project / "résumé.md").write_text("new\n")
+        
+        assert get_changed_files(git_project, "HEAD") == {"résumé.md"}
+    
+    def test_get_changed_files_outside_repo(self, temp_project_dir):
+        """Test change detection returns None outside a git repository."""
+        from specify_cli.core.git import get_changed_files
+        
+        assert get_changed_files(temp_project_dir, "HEAD") is None
+    
+    def test_list_project_files(self, git_project):
+        """Test git's file list has untracked files and drops deleted ones."""
+        from specify_cli.core.git import list_project_files
+        
+        (git_project / "NEW.md").write_text("new\n")
+        (git_project / "README.md").unlink()
+        
+        files = list_project_files(git_project)
+        assert "NEW.md" in files and "src/app.py" in files
+        assert "README.md" not in files
+        assert list_project_files(git_project.parent / "missing") is None
+    
+    def test_file_index_built_from_git(self, git_project):
+        """Test the checker's file index is seeded from git on first use."""
+        checker = ComplianceChecker(project_root=git_project)
+        
+        assert checker.file_index.exists("src/app.py") is True
+        assert checker.file_index.built_from_git
+        assert checker.file_index.index_file.exists()
+    
+    def test_incremental_reuses_unaffected_results(self, git_project):
+        """Test only rules whose targets changed are re-evaluated."""
+        checker = ComplianceChecker(project_root=git_project)
+        self._record_previous_run(checker)
+        
+        (git_project / "src" / "app.py").write_text("def start():\n    pass\n")
+        results = checker.run_compliance_check(incremental=True)
+        
+        by_id = {r.rule_id: r for r in results}
+        assert by_id["readme-license"].message == "stored"
+        assert by_id["app-main"].message != "stored"
+    
+    def test_incremental_reevaluates_changed_guide(self, git_project):
+        """Test every rule of a changed guide is re-evaluated."""
+        checker = ComplianceChecker(project_root=git_project)
+        self._record_previous_run(checker)
+        
+        guide = git_project / "context" / "references" / "backend.md"
+        guide.write_text(guide.read_text() + "\nMore guidance.\n")
+        results = checker.run_compliance_check(incremental=True)
+        
+        assert all(r.message != "stored" for r in results)
+    
+    def test_incremental_distinguishes_guides_with_same_name(self, git_project):
+        """Test results are reused per guide path, not per guide file name."""
+        import subprocess
+        
+        for feature, text in (("001", "License"), ("002", "Missing")):
+            spec_dir = git_project / "specs" / feature
+            spec_dir.mkdir(parents=True)
+            (spec_dir / "spec.md").write_text(
+                f"---\nrules:\n  - id: r1\n    type: text_includes\n    file: README.md\n"
+                f"    text: {text}\n    description: d\n---\n"
+            )
+        subprocess.run(["git", "add", "."], cwd=git_project, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "specs"], cwd=git_project, check=True, capture_output=True)
+        checker = ComplianceChecker(project_root=git_project)
+        
+        def spec_statuses(results):
+            return {r.guide_path: r.status for r in results if r.rule_id == "r1"}
+        
+        expected = {"specs/001/spec.md": RuleStatus.PASS, "specs/002/spec.md": RuleStatus.FAIL}
+        assert spec_statuses(checker.run_compliance_check()) == expected
+        
+        (git_project / "NOTES.md").write_text("unrelated\n")
+        results = checker.run_compliance_check(incremental=True)
+        assert spec_statuses(results) == expected
+    
+    def test_incremental_reevaluates_gitignored_target(self, git_project):
+        """Test rules on files git ignores are re-evaluated, as their changes are not in the diff."""
+        import subprocess
+        
+        (git_project / ".gitignore").write_text(".specify/.cache/\ndist/\n")
+        guide = git_project / "context" / "references" / "build.md"
+        guide.write_text(
+            "---\nrules:\n  - id: bundle\n    type: file_exists\n    path: dist/out.js\n"
+            "    description: d\n---\n"
+        )
+        subprocess.run(["git", "add", "."], cwd=git_project, check=True, capture_output=True)
+        subprocess.run(["git", "commit", "-m", "build"], cwd=git_project, check=True, capture_output=True)
+        checker = ComplianceChecker(project_root=git_project)
+        
+        def bundle_status(results):
+            return next(r.status for r in results if r.rule_id == "bundle")
+        
+        assert bundle_status(checker.run_compliance_check()) == RuleStatus.FAIL
+        
+        (git_project / "dist").mkdir()
+        (git_project / "dist" / "out.js").write_text("bundle\n")
+        results = checker.run_compliance_check(incremental=True)
+        
+        assert bundle_status(results) == RuleStatus.PASS
+        by_id = {r.rule_id: r for r in results}
+        assert by_id["readme-license"].status == RuleStatus.PASS
+    
+    @pytest.mark.parametrize("target,expected", [
+        ("README.md", False),
+        ("src", False),
+        ("src/*.py", False),
+        ("dist/out.js", True),
+        ("dist", True),
+        ("dist/**/*.js", True),
+    ])
+    def test_unobserved_target_changed(self, temp_project_dir, target, expected):
+        """Test targets outside the observed paths always count as changed."""
+        checker = ComplianceChecker(project_root=temp_project_dir, use_cache=False)
+        rule_data = {"id": "r", "type": "file_exists", "path": target, "description": "d"}
+        observed = {"README.md", "src", "src/app.py"}.__contains__
+        
+        assert checker._is_target_changed(rule_data, set(), observed) is expected
+    
+    def test_reusable_results_skip_ambiguous_keys(self, temp_project_dir):
+        """Test results whose (guide path, rule ID) is not unique are not reused."""
+        checker = ComplianceChecker(project_root=temp_project_dir, use_cache=False)
+        
+        def result(rule_id, guide_path, status=RuleStatus.PASS):
+            return RuleEvaluationResult(
+                rule_id=rule_id, rule_type="file_exists", status=status, message="stored",
+                target="", guide_id="spec", guide_path=guide_path
+            )
+        
+        _, reusable = checker._reusable_results(set(), [
+            result("r1", "specs/001/spec.md"),
+            result("r1", "specs/001/spec.md", RuleStatus.FAIL),
+            result("r2", "specs/001/spec.md"),
+            result("r2", "specs/002/spec.md"),
+            result("r3", None),
+        ])
+        
+        assert set(reusable) == {("specs/001/spec.md", "r2"), ("specs/002/spec.md", "r2")}
+    
+    def test_incremental_without_previous_run_is_full(self, git_project):
+        """Test incremental mode falls back to a full check with no record."""
+        checker = ComplianceChecker(project_root=git_project)
+        results = checker.run_compliance_check(incremental=True)
+        
+        assert len(results) == 2
+        assert all(r.message != "stored" for r in results)
+        # The run is recorded for the next incremental check
+        assert checker.run_store.load()["results"]
+    
+    def test_incremental_waiver_change_is_full(self, git_project):
+        """Test a waivers.md change forces re-evaluation of every rule."""
+        checker = ComplianceChecker(project_root=git_project)
+        self._record_previous_run(checker)
+        
+        checker.waiver_manager.create_waiver("Temporary exception", related_rules=["app-main"])
+        results = checker.run_compliance_check(incremental=True)
+        
+        assert all(r.message != "stored" for r in results)
+    
+    @pytest.mark.parametrize("changed,expected", [
+        ({"src/users/routes.py"}, True),
+        ({"src/orders/v2/routes.py"}, True),
+        ({"src/users/models.py"}, False),
+        ({"README.md"}, False),
+    ])
+    def test_glob_target_changed(self, temp_project_dir, changed, expected):
+        """Test a glob rule is affected by changes to any path it matches."""
+        checker = ComplianceChecker(project_root=temp_project_dir, use_cache=False)
+        rule_data = {"id": "routes", "type": "file_exists", "path": "src/**/routes.py", "description": "d"}
+        assert checker._is_target_changed(rule_data, changed) is expected
+    
+    def test_glob_results_not_cached(self, temp_project_dir):
+        """Test glob rules bypass the rule result cache, whose fingerprint is per file."""
+        checker = ComplianceChecker(project_root=temp_project_dir)
+        rule_data = {"id": "routes", "type": "file_exists", "path": "src/**/routes.py", "description": "d"}
+        
+        cached, target, rule_hash = checker._cached_evaluation(rule_data)
+        assert (cached, target, rule_hash) == (None, "src/**/routes.py", "")
+        assert checker._result_path(rule_data) is None
+
+
+class TestCompliancePipeline:
+    """Tests for the staged discovery/parse/evaluate pipeline."""
+    
+    def _write_guide(self, directory, name, rule_ids):
+        rules = "".join(
+            f"  - id: {rule_id}\n    type: file_exists\n    path: \"{rule_id}.txt\"\n    description: \"{rule_id}\"\n"
+            for rule_id in rule_ids
+        )
+        (directory / f"{name}.md").write_text(f"---\ntitle: {name}\nrules:\n{rules}---\n# {name}\n")
+    
+    def test_results_keep_guide_order(self, temp_project_dir):
+        """Test results follow guide order and errors stay in place."""
+        refs = temp_project_dir / "context" / "references"
+        refs.mkdir(parents=True)
+        self._write_guide(refs, "a-guide", ["a1", "a2"])
+        (refs / "b-broken.md").write_text("---\nrules: [\n---\n")
+        self._write_guide(refs, "c-guide", ["c1"])
+        
+        checker = ComplianceChecker(project_root=temp_project_dir, use_cache=False)
+        results = checker.run_compliance_check()
+        
+        assert [(r.guide_id, r.rule_id) for r in results] == [
+            ("a-guide", "a1"),
+            ("a-guide", "a2"),
+            ("b-broken", "parse-error"),
+            ("c-guide", "c1"),
+        ]
+    
+    def test_missing_guide_reported(self, temp_project_dir):
+        """Test an explicitly passed missing guide yields a discovery error."""
+        checker = ComplianceChecker(project_root=temp_project_dir, use_cache=False)
+        
+        results = checker.run_compliance_check(guides=[temp_project_dir / "missing.md"])
+        
+        assert [r.rule_id for r in results] == ["discovery-error"]
+    
+    def test_stage_timings_recorded(self, temp_with_guides):
+        """Test each pipeline stage reports busy time to the metrics collector."""
+        checker = ComplianceChecker(project_root=temp_with_guides, use_cache=False)
+        checker.run_compliance_check()
+        
+        metrics = get_metrics_collector().get_history()[-1]
+        assert set(metrics.stage_durations_ms) == {"discovery", "parse", "evaluate"}
+        assert "Stages:" in metrics.summary()
+        assert metrics.guides_count == 1
+
+
+class TestComplianceProfiling:
+    """Tests for per-rule and per-guide timing."""
+    
+    def test_rules_and_guides_timed(self, temp_with_guides):
+        """Test every evaluated rule and parsed guide is recorded in the metrics."""
+        checker = ComplianceChecker(project_root=temp_with_guides, use_cache=False)
+        results = checker.run_compliance_check()
+        
+        metrics = get_metrics_collector().get_history()[-1]
+        assert [m.rule_id for m in metrics.rule_metrics] == [r.rule_id for r in results]
+        guide = "context/references/backend-api.md"
+        assert all(m.guide_id == guide and m.end_time is not None for m in metrics.rule_metrics)
+        assert set(metrics.guide_parse_ms) == {guide}
+        assert metrics.slowest_guides(5)[0].rules_count == len(results)
+    
+    @pytest.mark.parametrize("processes", [1, 2])
+    def test_guides_with_same_name_timed_separately(self, temp_project_dir, processes):
+        """Test specs/<feature>/spec.md guides get their own timings."""
+        for feature in ("001", "002"):
+            spec_dir = temp_project_dir / "specs" / feature
+            spec_dir.mkdir(parents=True)
+            (spec_dir / "spec.md").write_text(
+                "---\nrules:\n  - id: r1\n    type: file_exists\n    path: README.md\n    description: d\n---\n"
+            )
+        checker = ComplianceChecker(project_root=temp_project_dir, use_cache=False, processes=processes)
+        checker.run_compliance_check()
+        
+        metrics = get_metrics_collector().get_history()[-1]
+        guides = {g.guide_id: g for g in metrics.guide_metrics()}
+        assert set(guides) == {"specs/001/spec.md", "specs/002/spec.md"}
+        assert all(g.rules_count == 1 for g in guides.values())
+    
+    def test_pooled_rules_timed(self, temp_with_guides):
+        """Test rules evaluated on the process pool report their worker time."""
+        checker = ComplianceChecker(project_root=temp_with_guides, use_cache=False, processes=2)
+        with patch("specify_cli.governance.compliance.evaluate_rules_in_processes") as pool:
+            pool.return_value = ([{"passed": True}, {"passed": False}], 0, 2, [0.004, 0.001])
+            checker.run_compliance_check()
+        
+        metrics = get_metrics_collector().get_history()[-1]
+        assert [round(m.duration_ms, 3) for m in metrics.rule_metrics] == [4.0, 1.0]
+        assert metrics.slowest_rules(1)[0].rule_id == "api-routes-defined"
+
+
+class TestProcessPoolCompliance:
+    """Tests for evaluating rules on a process pool."""
+    
+    def test_invalid_processes(self, temp_project_dir):
+        """Test a negative process count is rejected."""
+        with pytest.raises(ValueError, match="processes"):
+            ComplianceChecker(project_root=temp_project_dir, processes=-1)
+    
+    def test_results_merged_in_guide_order(self, temp_project_dir):
+        """Test pooled results keep guide and rule order and apply waivers."""
+        refs = temp_project_dir / "context" / "references"
+        refs.mkdir(parents=True)
+        (temp_project_dir / "present.txt").write_text("MIT")
+        (refs / "guide.md").write_text(
+            "---\nrules:\n"
+            "  - id: present\n    type: file_exists\n    path: present.txt\n    description: d\n"
+            "  - id: missing\n    type: file_exists\n    path: missing.txt\n    description: d\n"
+            "  - id: license\n    type: text_includes\n    file: present.txt\n    text: MIT\n    description: d\n"
+            "  - id: waived\n    type: file_exists\n    path: other.txt\n    description: d\n"
+            "---\n"
+        )
+        WaiverManager(project_root=temp_project_dir).create_waiver("Legacy", related_rules=["waived"])
+        
+        checker = ComplianceChecker(project_root=temp_project_dir, use_cache=False, processes=2)
+        results = checker.run_compliance_check()
+        
+        assert [(r.rule_id, r.status) for r in results] == [
+            ("present", RuleStatus.PASS),
+            ("missing", RuleStatus.FAIL),
+            ("license", RuleStatus.PASS),
+            ("waived", RuleStatus.WAIVED),
+        ]
+    
+    def test_on_result_waits_for_pool(self, temp_with_guides):
+        """Test pooled results are streamed in guide order once the pool finishes."""
+        streamed = []
+        checker = ComplianceChecker(project_root=temp_with_guides, use_cache=False, processes=2)
+        with patch("specify_cli.governance.compliance.evaluate_rules_in_processes") as pool:
+            pool.side_effect = lambda *args, **kwargs: (
+                streamed.append("pool") or ([{"passed": True}, {"passed": False}], 0, 0, [0.0, 0.0])
+            )
+            results = checker.run_compliance_check(on_result=streamed.append)
+        
+        assert streamed == ["pool"] + results
+    
+    def test_dependents_of_failed_rules_skipped(self, temp_project_dir):
+        """Test depends_on chains stop at the first failed rule, in guide order."""
+        refs = temp_project_dir / "context" / "references"
+        refs.mkdir(parents=True)
+        (temp_project_dir / "README.md").write_text("License: MIT")
+        (refs / "guide.md").write_text(
+            "---\nrules:\n"
+            "  - id: react\n    type: dependency_present\n    file: package.json\n    package: react\n"
+            "    description: d\n    depends_on: package-json\n"
+            "  - id: package-json\n    type: file_exists\n    path: package.json\n    description: d\n"
+            "  - id: config\n    type: text_includes\n    file: app.config\n    text: react\n"
+            "    description: d\n    depends_on: [react]\n"
+            "  - id: readme\n    type: file_exists\n    path: README.md\n    description: d\n"
+            "---\n"
+        )
+        
+        checker = ComplianceChecker(project_root=temp_project_dir, use_cache=False, processes=2)
+        with patch(
+            "specify_cli.governance.compliance.evaluate_rules_in_processes",
+            wraps=evaluate_rules_in_processes
+        ) as pool:
+            results = checker.run_compliance_check()
+        
+        assert [r["id"] for r in pool.call_args.args[1]] == ["package-json", "readme"]
+        assert [(r.rule_id, r.status) for r in results] == [
+            ("react", RuleStatus.FAIL),
+            ("package-json", RuleStatus.FAIL),
+            ("config", RuleStatus.FAIL),
+            ("readme", RuleStatus.PASS),
+        ]
+        assert "Skipped: depends on 'package-json'" in results[0].message
+        assert "Skipped: depends on 'react'" in results[2].message
+    
+    def test_dependents_reevaluated_with_dependencies(self, temp_project_dir):
+        """Test a reused dependent is re-evaluated when its dependency changes."""
+        refs = temp_project_dir / "context" / "references"
+        refs.mkdir(parents=True)
+        (refs / "guide.md").write_text(
+            "---\nrules:\n"
+            "  - id: package-json\n    type: file_exists\n    path: package.json\n    description: d\n"
+            "  - id: readme\n    type: file_exists\n    path: README.md\n    description: d\n"
+            "    depends_on: package-json\n"
+            "---\n"
+        )
+        checker = ComplianceChecker(project_root=temp_project_dir, use_cache=False, processes=2)
+        first = checker.run_compliance_check(record=False)
+        assert "Skipped" in first[1].message
+        
+        (temp_project_dir / "package.json").write_text("{}")
+        second = checker.run_compliance_check(
+            changed_files={"package.json"}, previous_results=first, record=False
+        )
+        
+        assert second[0].status == RuleStatus.PASS
+        assert second[1].status == RuleStatus.FAIL
+        assert "File not found" in second[1].message
+    
+    def test_pool_results_cached(self, temp_with_guides):
+        """Test pooled evaluations populate the rule result cache."""
+        checker = ComplianceChecker(project_root=temp_with_guides, processes=2)
+        first = checker.run_compliance_check()
+        
+        rerun = ComplianceChecker(project_root=temp_with_guides, processes=2)
+        with patch("specify_cli.governance.compliance.evaluate_rules_in_processes") as pool:
+            pool.return_value = ([], 0, 0, [])
+            second = rerun.run_compliance_check()
+        
+        pool.assert_not_called()
+        assert [(r.rule_id, r.status, r.message) for r in second] == [(r.rule_id, r.status, r.message) for r in first]
@@ -0,0 +1,184 @@
+"""
+Unit tests for the run-scoped FileContentStore.
+"""
+
+import threading
+import pytest
+from pathlib import Path
+
+from specify_cli.governance.caching import ProjectFileIndex
+from specify_cli.governance.rules import FileContentStore
+from specify_cli.governance.rules.engine import RuleEngine
+from specify_cli.governance.rules.file_rules import FileExistsRule
+from specify_cli.governance.rules.text_rules import TextIncludesRule
+from specify_cli.governance.rules.dependency_rules import DependencyPresentRule
+from specify_cli.governance.metrics import get_metrics_collector
+
+
+def test_read_text_reads_file_once(tmp_path, monkeypatch):
+    """Test repeated reads return the same buffer without re-reading."""
+    (tmp_path / "README.md").write_text("# Project\nLicense: MIT\n")
+    store = FileContentStore(tmp_path)
+    
+    reads = []
+    original = Path.read_text
+    
+    def counting_read_text(self, *args, **kwargs):
+        reads.append(self)
+        return original(self, *args, **kwargs)
+    
+    monkeypatch.setattr(Path, "read_text", counting_read_text)
+    
+    first = store.read_text("README.md")
+    second = store.read_text("README.md")
+    
+    assert first is second
+    assert len(reads) == 1
+    assert store.misses == 1
+    assert store.hits == 1
+
+
+def test_read_text_error_is_remembered(tmp_path):
+    """Test a read error is raised for every caller."""
+    (tmp_path / "data.bin").write_bytes(b"\xff\xfe\xfa")
+    store = FileContentStore(tmp_path)
+    
+    with pytest.raises(UnicodeDecodeError):
+        store.read_text("data.bin")
+    with pytest.raises(UnicodeDecodeError):
+        store.read_text("data.bin")
+    
+    assert store.misses == 1
+    assert store.hits == 1
+
+
+def test_exists_caches_stat(tmp_path):
+    """Test exists() caches positive and negative stat results."""
+    (tmp_path / "present.txt").write_text("x")
+    store = FileContentStore(tmp_path)
+    
+    assert store.exists("present.txt") is True
+    assert store.exists("missing.txt") is False
+    assert store.exists("present.txt") is True
+    assert store.exists("missing.txt") is False
+    
+    assert store.misses == 2
+    assert store.hits == 2
+    assert store.stat("present.txt").st_size == 1
+
+
+def test_concurrent_reads_share_one_read(tmp_path):
+    """Test threads racing on the same file trigger a single read."""
+    (tmp_path / "package.json").write_text('{"dependencies": {"react": "^18.0.0"}}')
+    store = FileContentStore(tmp_path)
+    results = []
+    
+    def reader():
+        results.append(store.read_text("package.json"))
+    
+    threads = [threading.Thread(target=reader) for _ in range(16)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(results) == 16
+    assert all(r is results[0] for r in results)
+    assert store.misses == 1
+    assert store.hits == 15
+
+
+def test_clear_resets_store(tmp_path):
+    """Test clear() drops cached entries and counters."""
+    (tmp_path / "a.txt").write_text("a")
+    store = FileContentStore(tmp_path)
+    store.read_text("a.txt")
+    
+    store.clear()
+    
+    assert store.hits == 0
+    assert store.misses == 0
+    (tmp_path / "a.txt").write_text("b")
+    assert store.read_text("a.txt") == "b"
+
+
+def test_rules_share_store(tmp_path):
+    """Test rules of every type use the shared store."""
+    (tmp_path / "package.json").write_text('{"dependencies": {"express": "^4.18.0"}}')
+    store = FileContentStore(tmp_path)
+    
+    rules = [
+        FileExistsRule("exists", "Manifest exists", "package.json"),
+        DependencyPresentRule("dep", "Express declared", "package.json", "express"),
+        TextIncludesRule("text", "Dependencies section", "package.json", "dependencies"),
+    ]
+    results = [rule.evaluate(str(tmp_path), store=store) for rule in rules]
+    
+    assert all(r['passed'] for r in results)
+    # One stat and one read; every other lookup is served from the store
+    assert store.misses == 2
+    assert store.hits == 4
+
+
+def test_rule_engine_reports_cache_counts(tmp_path):
+    """Test evaluate_all reports store hit/miss counts to the metrics collector."""
+    (tmp_path / "README.md").write_text("License: MIT\n")
+    engine = RuleEngine(str(tmp_path))
+    for i in range(5):
+        engine.register_rule(TextIncludesRule(f"rule-{i}", "License", "README.md", "License"))
+    
+    collector = get_metrics_collector()
+    metrics = collector.start_check()
+    try:
+        engine.evaluate_all()
+        # One stat and one read, made while preparing the text index;
+        # rules then reuse the stat and the index
+        assert metrics.file_cache_misses == 2
+        assert metrics.file_cache_hits == 6
+    finally:
+        collector.end_check()
+
+
+@pytest.fixture
+def indexed_project(tmp_path):
+    (tmp_path / "src" / "api").mkdir(parents=True)
+    (tmp_path / "src" / "api" / "routes.py").write_text("app = Router()")
+    (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+    (tmp_path / "node_modules" / "pkg" / "routes.py").write_text("")
+    index = ProjectFileIndex(
+        tmp_path,
+        is_ignored=lambda rel_path, is_dir: rel_path.split("/")[0] in ("node_modules", ".specify"),
+        use_git=False
+    )
+    return tmp_path, index
+
+
+def test_missing_paths_not_stated_with_file_index(indexed_project, monkeypatch):
+    """Test paths the file index knows are missing cost no stat."""
+    root, index = indexed_project
+    store = FileContentStore(root, file_index=index)
+    assert store.exists("src/api/routes.py")
+    
+    stat_calls = []
+    original_stat = Path.stat
+    monkeypatch.setattr(Path, "stat", lambda self, **kw: stat_calls.append(self) or original_stat(self, **kw))
+    
+    assert not store.exists("src/api/missing.py")
+    assert not store.exists("docs/guide.md")
+    assert stat_calls == []
+    
+    # Ignored paths are not covered by the index and are stat-ed
+    assert store.exists("node_modules/pkg/routes.py")
+    assert stat_calls == [root / "node_modules" / "pkg" / "routes.py"]
+
+
+def test_globs_use_file_index(indexed_project):
+    """Test globs list directories from the index and skip ignored paths."""
+    root, index = indexed_project
+    store = FileContentStore(root, file_index=index)
+    
+    assert store.glob("**/routes.py") == ["src/api/routes.py"]
+    assert store.glob("node_modules/*/routes.py") == ["node_modules/pkg/routes.py"]
+    
+    rule = FileExistsRule("routes", "Routes", "src/**/routes.py")
+    assert rule.evaluate(str(root), store=store)["passed"] is True
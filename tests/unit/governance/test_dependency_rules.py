@@ -149,3 +149,102 @@ def test_dependency_present_rule_from_yaml_optional_version():
     
     rule = DependencyPresentRule.from_yaml(data)
     assert rule.version is None
+
+
+def test_dependency_present_rule_no_prefix_false_positive(tmp_path):
+    """Test 'react' is not satisfied by 'react-dom'."""
+    (tmp_path / "package.json").write_text('{"dependencies": {"react-dom": "^18.2.0"}}')
+    
+    rule = DependencyPresentRule("test-id", "Test description", "package.json", "react")
+    result = rule.evaluate(str(tmp_path))
+    
+    assert result['passed'] is False
+    assert "not declared" in result['message']
+
+
+def test_dependency_present_rule_version_not_satisfied(tmp_path):
+    """Test a declared range that excludes the required versions fails."""
+    (tmp_path / "requirements.txt").write_text("requests>=2.20,<2.28\n")
+    
+    rule = DependencyPresentRule("test-id", "Test description", "requirements.txt", "requests", version=">=2.28")
+    result = rule.evaluate(str(tmp_path))
+    
+    assert result['passed'] is False
+    assert "does not satisfy" in result['message']
+
+
+def test_dependency_present_rule_lockfile_version(tmp_path):
+    """Test lockfiles are checked against the resolved version."""
+    (tmp_path / "poetry.lock").write_text(
+        '[[package]]\nname = "FastAPI"\nversion = "0.110.0"\n\n'
+        '[[package]]\nname = "starlette"\nversion = "0.36.3"\n'
+    )
+    
+    passing = DependencyPresentRule("r1", "FastAPI", "poetry.lock", "fastapi", version="^0.110")
+    failing = DependencyPresentRule("r2", "Starlette", "poetry.lock", "starlette", version=">=0.37")
+    
+    assert passing.evaluate(str(tmp_path))['passed'] is True
+    assert failing.evaluate(str(tmp_path))['passed'] is False
+
+
+def test_dependency_present_rule_unpinned_declaration(tmp_path):
+    """Test a declaration without a version passes with a note."""
+    (tmp_path / "requirements.txt").write_text("requests\n")
+    
+    rule = DependencyPresentRule("test-id", "Test description", "requirements.txt", "requests", version=">=2.28")
+    result = rule.evaluate(str(tmp_path))
+    
+    assert result['passed'] is True
+    assert "not validated" in result['details']
+
+
+def test_dependency_present_rule_invalid_manifest(tmp_path):
+    """Test an unparsable manifest fails with the parse error."""
+    (tmp_path / "package.json").write_text('{"dependencies": ')
+    
+    rule = DependencyPresentRule("test-id", "Test description", "package.json", "axios")
+    result = rule.evaluate(str(tmp_path))
+    
+    assert result['passed'] is False
+    assert "Could not parse package.json" in result['details']
+
+
+def test_dependency_present_rule_unsupported_manifest(tmp_path):
+    """Test unsupported manifests keep the substring check."""
+    (tmp_path / "Gemfile").write_text("gem 'rails', '~> 7.1'\n")
+    
+    rule = DependencyPresentRule("test-id", "Test description", "Gemfile", "rails")
+    
+    assert rule.evaluate(str(tmp_path))['passed'] is True
+
+
+def test_dependency_present_rules_share_manifest_index(tmp_path):
+    """Test a manifest is parsed once for all rules in a run."""
+    from unittest.mock import patch
+    from specify_cli.governance.rules import FileContentStore
+    from specify_cli.governance.rules import content_store
+    
+    (tmp_path / "requirements.txt").write_text("requests>=2.28\npytest>=7\n")
+    store = FileContentStore(tmp_path)
+    
+    with patch.object(content_store, "parse_manifest", wraps=content_store.parse_manifest) as parse:
+        for package in ("requests", "pytest", "flask"):
+            DependencyPresentRule(package, "d", "requirements.txt", package).evaluate(str(tmp_path), store=store)
+    
+    assert parse.call_count == 1
+
+
+@pytest.mark.parametrize("declared,required", [
+    ("^18.2.0", "18"),
+    ("^18.2.0", "18.2"),
+    (">1.4", ">1.4"),
+])
+def test_dependency_present_rule_compatible_range(tmp_path, declared, required):
+    """Test partial rule versions and exclusive bounds match overlapping declared ranges."""
+    (tmp_path / "package.json").write_text(f'{{"dependencies": {{"react": "{declared}"}}}}')
+    
+    rule = DependencyPresentRule("test-id", "Test description", "package.json", "react", version=required)
+    result = rule.evaluate(str(tmp_path))
+    
+    assert result['passed'] is True
+    assert "satisfies" in result['details']
@@ -0,0 +1,146 @@
+"""
+Unit tests for guide discovery.
+"""
+
+import os
+import pytest
+from pathlib import Path
+
+from specify_cli.governance.discovery import GuideDiscovery, IgnorePattern
+
+
+@pytest.fixture
+def project(tmp_path):
+    """Create a project with guides, noise and ignored directories."""
+    refs = tmp_path / "context" / "references"
+    refs.mkdir(parents=True)
+    (refs / "architecture.md").write_text("# Architecture")
+    (refs / "nested").mkdir()
+    (refs / "nested" / "deep.md").write_text("# Not a top-level reference")
+    
+    specs = tmp_path / "specs"
+    (specs / "001-auth").mkdir(parents=True)
+    (specs / "001-auth" / "spec.md").write_text("# Spec")
+    (specs / "001-auth" / "notes.txt").write_text("notes")
+    (specs / "backend.md").write_text("# Backend")
+    (specs / "node_modules" / "pkg").mkdir(parents=True)
+    (specs / "node_modules" / "pkg" / "README.md").write_text("# Package")
+    (specs / ".git").mkdir()
+    (specs / ".git" / "description.md").write_text("# Submodule git dir")
+    return tmp_path
+
+
+def _relative(paths, root):
+    return [p.relative_to(root).as_posix() for p in paths]
+
+
+class TestIgnorePattern:
+    """Tests for .gitignore-style pattern parsing."""
+    
+    @pytest.mark.parametrize("line", ["", "   ", "# comment", "!keep.md", "/"])
+    def test_unusable_lines(self, line):
+        """Test blank, comment, negated and empty lines are skipped."""
+        assert IgnorePattern.parse(line) is None
+    
+    def test_dir_only_pattern(self):
+        """Test trailing slash restricts a pattern to directories."""
+        pattern = IgnorePattern.parse("build/")
+        
+        assert pattern.dir_only
+        assert pattern.matches("specs/build", "build", is_dir=True)
+        assert not pattern.matches("specs/build", "build", is_dir=False)
+    
+    def test_unanchored_pattern_matches_any_depth(self):
+        """Test patterns without a slash match the final component."""
+        pattern = IgnorePattern.parse("*.draft.md")
+        
+        assert pattern.matches("specs/a/b/x.draft.md", "x.draft.md", is_dir=False)
+    
+    def test_anchored_pattern_matches_from_root(self):
+        """Test patterns with a slash match the full relative path."""
+        pattern = IgnorePattern.parse("/specs/archive")
+        
+        assert pattern.matches("specs/archive", "archive", is_dir=True)
+        assert not pattern.matches("specs/old/archive", "archive", is_dir=True)
+
+
+class TestGuideDiscovery:
+    """Tests for GuideDiscovery."""
+    
+    def test_discovers_guides(self, project):
+        """Test references are scanned one level and specs recursively."""
+        guides = list(GuideDiscovery(project).iter_guides())
+        
+        assert _relative(guides, project) == [
+            "context/references/architecture.md",
+            "specs/backend.md",
+            "specs/001-auth/spec.md",
+        ]
+    
+    def test_default_ignores_prune_subtrees(self, project):
+        """Test node_modules and .git are never entered."""
+        discovery = GuideDiscovery(project)
+        scanned = []
+        original_walk = discovery._walk
+        
+        def recording_walk(dir_path, rel_dir, recursive):
+            scanned.append(rel_dir)
+            return original_walk(dir_path, rel_dir, recursive)
+        
+        discovery._walk = recording_walk
+        list(discovery.iter_guides())
+        
+        assert "specs/node_modules" not in scanned
+        assert "specs/.git" not in scanned
+    
+    def test_custom_ignore_patterns(self, project):
+        """Test a custom ignore list replaces the defaults."""
+        discovery = GuideDiscovery(project, ignore_patterns=["001-*/"], use_gitignore=False)
+        
+        guides = _relative(discovery.iter_guides(), project)
+        
+        assert "specs/001-auth/spec.md" not in guides
+        assert "specs/node_modules/pkg/README.md" in guides
+    
+    def test_gitignore_patterns(self, project):
+        """Test patterns from the project's .gitignore are honored."""
+        (project / "specs" / "scratch.md").write_text("# Scratch")
+        (project / ".gitignore").write_text("# local notes\nscratch.md\n")
+        
+        guides = _relative(GuideDiscovery(project).iter_guides(), project)
+        
+        assert "specs/scratch.md" not in guides
+        assert "specs/backend.md" in guides
+    
+    def test_symlinked_directories_not_followed(self, project, tmp_path_factory):
+        """Test symlinked directories are not descended into."""
+        outside = tmp_path_factory.mktemp("outside")
+        (outside / "linked.md").write_text("# Linked")
+        try:
+            os.symlink(outside, project / "specs" / "link", target_is_directory=True)
+        except (OSError, NotImplementedError):
+            pytest.skip("symlinks not supported")
+        
+        guides = _relative(GuideDiscovery(project).iter_guides(), project)
+        
+        assert "specs/link/linked.md" not in guides
+    
+    def test_yields_lazily(self, project):
+        """Test the first guide is available before the walk completes."""
+        discovery = GuideDiscovery(project)
+        scanned = []
+        original_walk = discovery._walk
+        
+        def recording_walk(dir_path, rel_dir, recursive):
+            scanned.append(rel_dir)
+            return original_walk(dir_path, rel_dir, recursive)
+        
+        discovery._walk = recording_walk
+        first = next(discovery.iter_guides())
+        
+        assert first.name == "architecture.md"
+        assert scanned == ["context/references"]
+    
+    def test_missing_roots(self, tmp_path):
+        """Test a project without guide directories yields nothing."""
+        assert list(GuideDiscovery(tmp_path).iter_guides()) == []
@@ -108,3 +108,31 @@ def test_file_exists_rule_from_yaml_missing_description():
     
     with pytest.raises(ValueError, match="missing required field: 'description'"):
         FileExistsRule.from_yaml(data)
+
+
+def test_file_exists_rule_glob(tmp_path):
+    """Test a glob path passes when enough paths match."""
+    for service in ("users", "orders"):
+        (tmp_path / "src" / service).mkdir(parents=True)
+        (tmp_path / "src" / service / "routes.py").write_text("")
+    
+    result = FileExistsRule("test-id", "Routes", "src/**/routes.py").evaluate(str(tmp_path))
+    assert result['passed'] is True
+    assert "2 paths match" in result['message']
+    assert "src/orders/routes.py, src/users/routes.py" in result['details']
+    
+    result = FileExistsRule("test-id", "Routes", "src/**/routes.py", min_count=3).evaluate(str(tmp_path))
+    assert result['passed'] is False
+    assert "expected at least 3" in result['message']
+
+
+def test_file_exists_rule_glob_no_match(tmp_path):
+    """Test a glob path fails when nothing matches."""
+    rule = FileExistsRule.from_yaml({
+        'id': 'test-id', 'description': 'Routes', 'path': 'src/*/routes.py', 'min_count': 2
+    })
+    assert rule.min_count == 2
+    
+    result = rule.evaluate(str(tmp_path))
+    assert result['passed'] is False
+    assert "No paths match src/*/routes.py" in result['message']
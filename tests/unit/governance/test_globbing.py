@@ -0,0 +1,104 @@
+"""
+Unit tests for glob rule targets and the shared tree index.
+"""
+
+import pytest
+
+from specify_cli.governance.rules.content_store import FileContentStore
+from specify_cli.governance.rules.globbing import TreeIndex, glob_matches, is_glob, quantifier_passed
+
+
+@pytest.fixture
+def tree(tmp_path):
+    for rel_path in (
+        "src/routes.py",
+        "src/users/routes.py",
+        "src/users/models.py",
+        "src/orders/v2/routes.py",
+        "src/.hidden/routes.py",
+        "docs/readme.md",
+    ):
+        path = tmp_path / rel_path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text("x")
+    return tmp_path
+
+
+@pytest.mark.parametrize("target,expected", [
+    ("src/main.py", False),
+    ("src/*.py", True),
+    ("src/**/routes.py", True),
+    ("file?.txt", True),
+    ("[ab].txt", True),
+])
+def test_is_glob(target, expected):
+    """Test only targets with glob characters are treated as globs."""
+    assert is_glob(target) is expected
+
+
+@pytest.mark.parametrize("pattern,expected", [
+    ("src/**/routes.py", ["src/orders/v2/routes.py", "src/routes.py", "src/users/routes.py"]),
+    ("src/*/routes.py", ["src/users/routes.py"]),
+    ("src/users/*.py", ["src/users/models.py", "src/users/routes.py"]),
+    ("src/.hidden/*.py", ["src/.hidden/routes.py"]),
+    ("docs/**", ["docs/readme.md"]),
+    ("src/*", ["src/orders", "src/routes.py", "src/users"]),
+    ("missing/**/*.py", []),
+])
+def test_glob(tree, pattern, expected):
+    """Test patterns expand to sorted relative paths, skipping hidden names."""
+    assert TreeIndex(tree).glob(pattern) == expected
+
+
+def test_glob_files_only(tree):
+    """Test directories can be left out of the matches."""
+    assert TreeIndex(tree).glob("src/*", include_dirs=False) == ["src/routes.py"]
+
+
+@pytest.mark.parametrize("pattern", [
+    "src/**/routes.py", "src/*/routes.py", "src/users/*.py", "src/.hidden/*.py", "docs/**", "src/*",
+])
+def test_glob_matches_agrees_with_expansion(tree, pattern):
+    """Test path matching accepts exactly the paths the walk finds."""
+    index = TreeIndex(tree)
+    all_paths = index.glob("**")
+    hidden = ["src/.hidden", "src/.hidden/routes.py"]
+    expanded = index.glob(pattern)
+    assert [p for p in all_paths + hidden if glob_matches(pattern, p)] == sorted(expanded)
+
+
+def test_directories_listed_once(tree):
+    """Test many globs over the same tree share one walk."""
+    index = TreeIndex(tree)
+    index.glob("src/**/routes.py")
+    listed = index.dirs_listed
+    
+    index.glob("src/**/*.py")
+    index.glob("src/*/models.py")
+    index.glob("src/**/routes.py")
+    
+    assert listed == 5  # root, src, users, orders, orders/v2
+    assert index.dirs_listed == listed
+
+
+def test_store_shares_tree_index(tree):
+    """Test the content store expands globs through one index per run."""
+    store = FileContentStore(tree)
+    assert store.glob("src/**/routes.py", include_dirs=False) is store.glob("src/**/routes.py", include_dirs=False)
+    
+    store.clear()
+    assert store.tree.dirs_listed == 0
+
+
+@pytest.mark.parametrize("satisfied,total,match,min_count,expected", [
+    (1, 3, "any", 1, True),
+    (0, 3, "any", 1, False),
+    (2, 3, "any", 3, False),
+    (3, 3, "all", 1, True),
+    (2, 3, "all", 1, False),
+    (0, 0, "all", 1, False),
+    (2, 2, "all", 3, False),
+])
+def test_quantifier(satisfied, total, match, min_count, expected):
+    """Test any/all/min_count semantics."""
+    assert quantifier_passed(satisfied, total, match, min_count) is expected
@@ -0,0 +1,227 @@
+"""
+Unit tests for manifest parsing and version matching.
+"""
+
+import json
+import pytest
+
+from specify_cli.governance.rules.manifests import (
+    ManifestParseError,
+    is_supported_manifest,
+    parse_manifest,
+    parse_requirement,
+)
+from specify_cli.governance.rules.versions import parse_specifier, specifiers_intersect, version_satisfies
+
+
+class TestParseRequirement:
+    """Tests for PEP 508 requirement splitting."""
+    
+    @pytest.mark.parametrize("line,expected", [
+        ("requests", ("requests", None)),
+        ("requests>=2.28", ("requests", ">=2.28")),
+        ("requests[socks] >= 2.28, <3", ("requests", ">= 2.28, <3")),
+        ("pywin32>=300; sys_platform == 'win32'", ("pywin32", ">=300")),
+        ("pkg @ https://example.com/pkg.whl", ("pkg", None)),
+        ("zope.interface (>=5.0)", ("zope.interface", ">=5.0")),
+    ])
+    def test_split(self, line, expected):
+        """Test name and specifier extraction."""
+        assert parse_requirement(line) == expected
+
+
+class TestParseManifest:
+    """Tests for the supported manifest formats."""
+    
+    def test_requirements_txt(self):
+        """Test comments, options and URLs are skipped."""
+        content = (
+            "# core\n"
+            "-r base.txt\n"
+            "--index-url https://pypi.example.com\n"
+            "Django_REST.framework==3.14  # api\n"
+            "git+https://github.com/org/repo@v1#egg=repo\n"
+            "black \\\n    >=23.0\n"
+        )
+        index = parse_manifest("requirements-dev.txt", content)
+        
+        assert index.packages == {"django-rest-framework": "==3.14", "black": ">=23.0"}
+        assert index.get("django_rest_framework") == "==3.14"
+    
+    def test_pyproject(self):
+        """Test PEP 621, dependency groups and Poetry tables."""
+        content = """
+[project]
+dependencies = ["typer>=0.9", "rich"]
+
+[project.optional-dependencies]
+test = ["pytest>=7"]
+
+[dependency-groups]
+lint = ["ruff"]
+
+[tool.poetry.dependencies]
+python = "^3.11"
+httpx = {version = "^0.27", extras = ["socks"]}
+
+[tool.poetry.group.docs.dependencies]
+mkdocs = "1.5.3"
+"""
+        index = parse_manifest("pyproject.toml", content)
+        
+        assert index.packages == {
+            "typer": ">=0.9",
+            "rich": None,
+            "pytest": ">=7",
+            "ruff": None,
+            "httpx": "^0.27",
+            "mkdocs": "1.5.3",
+        }
+        assert "python" not in index
+    
+    def test_package_json(self):
+        """Test all npm dependency fields are indexed."""
+        content = json.dumps({
+            "dependencies": {"react": "^18.2.0"},
+            "devDependencies": {"typescript": "~5.3.0"},
+            "peerDependencies": {"react-dom": ">=18"},
+        })
+        index = parse_manifest("frontend/package.json", content)
+        
+        assert index.packages == {"react": "^18.2.0", "typescript": "~5.3.0", "react-dom": ">=18"}
+        assert "React" not in index
+    
+    def test_package_lock_v3(self):
+        """Test install paths resolve to names; the top-level install wins."""
+        content = json.dumps({
+            "lockfileVersion": 3,
+            "packages": {
+                "": {"name": "app"},
+                "node_modules/a/node_modules/lodash": {"version": "3.10.1"},
+                "node_modules/lodash": {"version": "4.17.21"},
+                "node_modules/@scope/pkg": {"version": "1.0.0"},
+            },
+        })
+        index = parse_manifest("package-lock.json", content)
+        
+        assert index.locked
+        assert index.get("lodash") == "4.17.21"
+        assert index.get("@scope/pkg") == "1.0.0"
+        assert "app" not in index
+    
+    def test_package_lock_v1(self):
+        """Test nested dependency trees are indexed breadth-first."""
+        content = json.dumps({
+            "lockfileVersion": 1,
+            "dependencies": {
+                "a": {"version": "1.0.0", "dependencies": {"lodash": {"version": "3.10.1"}}},
+                "lodash": {"version": "4.17.21"},
+            },
+        })
+        index = parse_manifest("package-lock.json", content)
+        
+        assert index.get("lodash") == "4.17.21"
+    
+    def test_poetry_lock(self):
+        """Test [[package]] entries are indexed with resolved versions."""
+        index = parse_manifest("poetry.lock", '[[package]]\nname = "PyYAML"\nversion = "6.0.1"\n')
+        
+        assert index.locked
+        assert index.get("pyyaml") == "6.0.1"
+    
+    @pytest.mark.parametrize("name,content", [
+        ("package.json", "{not json"),
+        ("pyproject.toml", "[project\n"),
+        ("package.json", "[]"),
+    ])
+    def test_invalid_content(self, name, content):
+        """Test malformed manifests raise ManifestParseError."""
+        with pytest.raises(ManifestParseError):
+            parse_manifest(name, content)
+    
+    def test_unsupported(self):
+        """Test unknown manifest names are reported as unsupported."""
+        assert not is_supported_manifest("Gemfile")
+        assert is_supported_manifest("requirements.txt")
+        with pytest.raises(ManifestParseError, match="Unsupported"):
+            parse_manifest("go.mod", "")
+
+
+class TestVersions:
+    """Tests for version specifier matching."""
+    
+    @pytest.mark.parametrize("version,spec,expected", [
+        ("2.31.0", ">=2.28", True),
+        ("2.27.9", ">=2.28", False),
+        ("1.9.0", ">= 1.0, < 2.0", True),
+        ("2.0", ">=1.0,<2.0", False),
+        ("1.4.5", "^1.4", True),
+        ("2.0.0", "^1.4", False),
+        ("0.2.9", "^0.2.3", True),
+        ("0.3.0", "^0.2.3", False),
+        ("1.2.9", "~1.2.3", True),
+        ("1.3.0", "~1.2.3", False),
+        ("1.4.9", "~=1.4.2", True),
+        ("1.5.0", "~=1.4.2", False),
+        ("1.2.7", "1.2.*", True),
+        ("1.3.0", "1.x", True),
+        ("5.0", "*", True),
+        ("1.5", "1.0 - 2.0", True),
+        ("2.0.1", "1.0 - 2.0", True),
+        ("2.1.0", "1.0 - 2.0", False),
+        ("2.9.9", "1.0 - 2", True),
+        ("2.0.1", "1.0.0 - 2.0.0", False),
+        ("2.0.0", "1.0.0 - 2.0.0", True),
+        ("2.5.0", "1.0 - 2.x", True),
+        ("9.0.0", "1.0 - *", True),
+        ("3.1", "<2 || >=3", True),
+        ("2.5", "<2 || >=3", False),
+        ("1.0.0", "==1.0", True),
+        ("1.0.5", "==1.0", False),
+        ("18.2.0", "18", True),
+        ("19.0.0", "18", False),
+        ("1.2.9", "=1.2", True),
+        ("1.0.1", "!=1.0.1", False),
+        ("v2.0.0-beta.1", ">=2.0", True),
+    ])
+    def test_version_satisfies(self, version, spec, expected):
+        """Test comparisons, ranges, wildcards and disjunctions."""
+        assert version_satisfies(version, spec) is expected
+    
+    @pytest.mark.parametrize("spec", [">=abc", "~=1", "^*"])
+    def test_invalid_specifier(self, spec):
+        """Test unparsable specifiers raise ValueError."""
+        with pytest.raises(ValueError):
+            version_satisfies("1.0", spec)
+    
+    @pytest.mark.parametrize("declared,required,expected", [
+        ("^18.2.0", "18", True),
+        ("^18.2.0", "17", False),
+        (">1.4", ">1.4", True),
+        (">1.4", "<=1.4", False),
+        (">=1.4", "<=1.4", True),
+        (">=2.20,<2.28", ">=2.28", False),
+        (">=2.20", ">=2.28", True),
+        ("6.0.1", "^6.0", True),
+        ("<2", ">=2", False),
+        ("*", ">=3.0", True),
+        ("==1.0.1", "!=1.0.1", False),
+        ("~1.2.3", "1.3 || 1.2", True),
+    ])
+    def test_specifiers_intersect(self, declared, required, expected):
+        """Test declared ranges are compatible when they overlap the required range."""
+        assert specifiers_intersect(declared, required) is expected
+    
+    def test_parse_specifier_bounds(self):
+        """Test intervals record whether each bound is inclusive."""
+        assert parse_specifier(">1.4") == [((1, 4), False, None, False)]
+        assert parse_specifier("18") == [((18,), True, (19,), False)]
+        assert parse_specifier(">=1.0,<2 || ==3.0") == [
+            ((1, 0), True, (2,), False),
+            ((3, 0), True, (3, 0), True),
+        ]
+    
+    def test_declared_specifier_without_versions(self):
+        """Test non-version declarations raise ValueError."""
+        with pytest.raises(ValueError):
+            specifiers_intersect("workspace:*", ">=1.0")
@@ -8,6 +8,7 @@ from pathlib import Path
 
 from specify_cli.governance.metrics import (
     RuleMetrics,
+    GuideMetrics,
     ComplianceCheckMetrics,
     MetricsCollector,
     get_metrics_collector
@@ -117,6 +118,22 @@ class TestComplianceCheckMetrics:
         assert "Total Duration" in summary
         assert "Guides: 2" in summary
         assert "Rules Evaluated: 5" in summary
+    
+    def test_check_metrics_guide_totals(self):
+        """Test parse and rule times combine into per-guide totals."""
+        metrics = ComplianceCheckMetrics()
+        metrics.guide_parse_ms = {"fast": 1.0, "slow": 2.0}
+        for rule_id, guide_id, seconds in [("a", "fast", 0.001), ("b", "slow", 0.010), ("c", "slow", 0.005)]:
+            metrics.add_rule_metric(
+                RuleMetrics(rule_id=rule_id, rule_type="file_exists", guide_id=guide_id, start_time=0.0, end_time=seconds)
+            )
+        
+        guides = {g.guide_id: g for g in metrics.guide_metrics()}
+        assert guides["slow"].rules_count == 2
+        assert guides["slow"].total_ms == pytest.approx(17.0)
+        assert [m.rule_id for m in metrics.slowest_rules(2)] == ["b", "c"]
+        assert [g.guide_id for g in metrics.slowest_guides(1)] == ["slow"]
+        assert metrics.to_dict()['guides'][0] == GuideMetrics("fast", 1.0, 1.0, 1).to_dict()
 
 
 class TestMetricsCollector:
@@ -170,6 +187,23 @@ class TestMetricsCollector:
         assert metric.end_time is not None
         assert len(collector.current_check.rule_metrics) == 1
     
+    def test_record_rule_guide_and_waiver_times(self):
+        """Test externally timed rules, guide parses and waiver lookups are recorded."""
+        collector = MetricsCollector()
+        metrics = collector.start_check()
+        
+        collector.record_rule_duration("R-001", "text_includes", 0.02, guide_id="api")
+        collector.record_guide_parse("api", 0.003)
+        collector.record_guide_parse("api", 0.001)
+        collector.record_waiver_lookup(0.002)
+        collector.end_check()
+        
+        assert metrics.rule_metrics[0].guide_id == "api"
+        assert metrics.avg_rule_duration_ms == pytest.approx(20.0)
+        assert metrics.guide_parse_ms["api"] == pytest.approx(4.0)
+        assert metrics.waiver_lookup_ms == pytest.approx(2.0)
+        assert "Waiver Lookup" in metrics.summary()
+    
     def test_get_current_metrics(self):
         """Test getting current metrics."""
         collector = MetricsCollector()
@@ -237,3 +271,31 @@ class TestGlobalMetricsCollector:
         
         # Should be the same instance
         assert collector1 is collector2
+
+
+class TestFileCacheMetrics:
+    """Test content store hit/miss reporting."""
+    
+    def test_record_file_cache(self):
+        """Test hit/miss counts accumulate on the current check."""
+        collector = MetricsCollector()
+        metrics = collector.start_check()
+        
+        collector.record_file_cache(hits=3, misses=1)
+        collector.record_file_cache(hits=1, misses=1)
+        
+        assert metrics.file_cache_hits == 4
+        assert metrics.file_cache_misses == 2
+        assert metrics.file_cache_hit_rate == pytest.approx(4 / 6)
+        assert metrics.to_dict()['file_cache_hits'] == 4
+        assert "4 hits, 2 misses" in metrics.summary()
+    
+    def test_record_file_cache_without_check(self):
+        """Test recording outside a check is a no-op."""
+        collector = MetricsCollector()
+        collector.record_file_cache(hits=3, misses=1)
+        assert collector.get_current_metrics() is None
+    
+    def test_hit_rate_no_lookups(self):
+        """Test hit rate is zero when nothing was looked up."""
+        assert ComplianceCheckMetrics().file_cache_hit_rate == 0.0
@@ -0,0 +1,160 @@
+"""
+Unit tests for persistent metrics history.
+"""
+
+import json
+import pytest
+
+from specify_cli.governance.compliance import ComplianceChecker
+from specify_cli.governance.metrics import ComplianceCheckMetrics, RuleMetrics
+from specify_cli.governance.metrics_history import (
+    MetricsHistoryStore,
+    duration_stats,
+    find_regressions,
+    percentile,
+)
+
+
+def make_metrics(total_s, rules=()):
+    """Build finished check metrics with the given total and (guide, rule, seconds) timings."""
+    metrics = ComplianceCheckMetrics(start_time=1_700_000_000.0)
+    metrics.end_time = metrics.start_time + total_s
+    for guide_id, rule_id, seconds in rules:
+        metrics.add_rule_metric(
+            RuleMetrics(rule_id=rule_id, rule_type="file_exists", guide_id=guide_id, start_time=0.0, end_time=seconds)
+        )
+    metrics.rules_count = len(rules)
+    return metrics
+
+
+def record(total_ms, rule_ms=None):
+    return {
+        "version": MetricsHistoryStore.RECORD_VERSION,
+        "timestamp": "t",
+        "total_ms": total_ms,
+        "rule_ms": rule_ms or {},
+    }
+
+
+class TestMetricsHistoryStore:
+    """Tests for the append-only history file."""
+    
+    def test_append_and_load(self, tmp_path):
+        """Test records survive a new store instance, oldest first."""
+        store = MetricsHistoryStore(project_root=tmp_path)
+        store.append(make_metrics(0.1, [("api", "r1", 0.02)]))
+        store.append(make_metrics(0.2))
+        
+        records = MetricsHistoryStore(project_root=tmp_path).load()
+        
+        assert [r["total_ms"] for r in records] == [100.0, 200.0]
+        assert records[0]["rule_ms"] == {"api/r1": 20.0}
+        assert records[0]["timestamp"] == "2023-11-14T22:13:20Z"
+        assert MetricsHistoryStore(project_root=tmp_path).load(limit=1)[0]["total_ms"] == 200.0
+    
+    def test_skips_corrupt_and_foreign_lines(self, tmp_path):
+        """Test unreadable lines and other record versions are ignored."""
+        store = MetricsHistoryStore(project_root=tmp_path)
+        store.append(make_metrics(0.1))
+        with open(store.history_file, "a") as f:
+            f.write("{not json\n")
+            f.write(json.dumps({"version": 99}) + "\n")
+        store.append(make_metrics(0.3))
+        
+        assert [r["total_ms"] for r in store.load()] == [100.0, 300.0]
+    
+    def test_compacts_past_max_bytes(self, tmp_path):
+        """Test the file is trimmed to the newest records once it grows too large."""
+        store = MetricsHistoryStore(project_root=tmp_path, max_records=3, max_bytes=1024)
+        for i in range(20):
+            store.append(make_metrics(i / 1000))
+        
+        totals = [r["total_ms"] for r in store.load()]
+        assert len(totals) < 20
+        assert totals[-1] == 19.0
+        assert totals == sorted(totals)
+    
+    def test_checker_records_history(self, tmp_path):
+        """Test each compliance check appends one record when caching is enabled."""
+        refs = tmp_path / "context" / "references"
+        refs.mkdir(parents=True)
+        (refs / "guide.md").write_text(
+            "---\nrules:\n  - id: r1\n    type: file_exists\n    path: x.txt\n    description: d\n---\n"
+        )
+        
+        ComplianceChecker(project_root=tmp_path).run_compliance_check()
+        ComplianceChecker(project_root=tmp_path).run_compliance_check()
+        ComplianceChecker(project_root=tmp_path, use_cache=False).run_compliance_check()
+        
+        records = MetricsHistoryStore(project_root=tmp_path).load()
+        assert len(records) == 2
+        assert set(records[0]["rule_ms"]) == {"context/references/guide.md/r1"}
+        assert "context/references/guide.md" in records[0]["guide_ms"]
+    
+    def test_guides_with_same_name_recorded_separately(self, tmp_path):
+        """Test specs/*/spec.md guides sharing a rule ID keep separate history keys."""
+        for feature in ("001", "002"):
+            spec_dir = tmp_path / "specs" / feature
+            spec_dir.mkdir(parents=True)
+            (spec_dir / "spec.md").write_text(
+                "---\nrules:\n  - id: r1\n    type: file_exists\n    path: x.txt\n    description: d\n---\n"
+            )
+        
+        ComplianceChecker(project_root=tmp_path).run_compliance_check()
+        
+        record = MetricsHistoryStore(project_root=tmp_path).load()[-1]
+        assert set(record["rule_ms"]) == {"specs/001/spec.md/r1", "specs/002/spec.md/r1"}
+        assert set(record["guide_ms"]) == {"specs/001/spec.md", "specs/002/spec.md"}
+    
+    def test_stem_keyed_records_ignored(self, tmp_path):
+        """Test records written before guides were keyed by path are not compared."""
+        store = MetricsHistoryStore(project_root=tmp_path)
+        store.cache_dir.mkdir(parents=True)
+        with open(store.history_file, "w") as f:
+            f.write(json.dumps({"version": 1, "total_ms": 5.0, "rule_ms": {"spec/r1": 5.0}}) + "\n")
+        store.append(make_metrics(0.1))
+        
+        assert [r["total_ms"] for r in store.load()] == [100.0]
+
+
+class TestHistoryAnalysis:
+    """Tests for percentiles and regression detection."""
+    
+    def test_percentile(self):
+        """Test linear interpolation between closest ranks."""
+        values = [4.0, 1.0, 3.0, 2.0]
+        assert percentile(values, 0) == 1.0
+        assert percentile(values, 50) == 2.5
+        assert percentile(values, 100) == 4.0
+        assert percentile([], 95) == 0.0
+    
+    def test_duration_stats_sorted_by_p95(self):
+        """Test per-key stats collect every run that has the key."""
+        records = [record(10, {"g/a": 1.0, "g/b": 10.0}), record(10, {"g/a": 3.0})]
+        
+        stats = duration_stats(records, "rule_ms")
+        
+        assert [s.key for s in stats] == ["g/b", "g/a"]
+        assert stats[1].count == 2
+        assert stats[1].p50_ms == 2.0
+        assert stats[1].last_ms == 3.0
+    
+    def test_find_regressions(self):
+        """Test total and rule slowdowns beyond the threshold are flagged."""
+        records = [
+            record(100, {"g/a": 10.0, "g/b": 1.0}),
+            record(105, {"g/a": 11.0, "g/b": 1.0}),
+            record(200, {"g/a": 30.0, "g/b": 1.9}),
+        ]
+        
+        regressions = find_regressions(records, threshold=0.25, min_delta_ms=5.0)
+        
+        assert [(r.run_index, r.scope, r.key) for r in regressions] == [(2, "total", "total"), (2, "rule", "g/a")]
+        assert regressions[0].baseline_ms == pytest.approx(102.5)
+        assert regressions[1].increase == pytest.approx(30.0 / 10.5 - 1)
+    
+    def test_no_regression_for_first_run_or_small_delta(self):
+        """Test a run needs a baseline and an absolute increase to be flagged."""
+        records = [record(1.0), record(3.0)]
+        assert find_regressions(records, min_delta_ms=5.0) == []
+        assert len(find_regressions(records, min_delta_ms=1.0)) == 1
@@ -0,0 +1,134 @@
+"""
+Unit tests for threaded pipeline stages.
+"""
+
+import threading
+import time
+
+import pytest
+
+from specify_cli.governance.pipeline import pipeline_stage
+
+
+def test_stage_preserves_order():
+    """Test results arrive in source order."""
+    assert list(pipeline_stage(range(50), lambda x: x * 2)) == [x * 2 for x in range(50)]
+
+
+def test_chained_stages():
+    """Test stages can consume other stages."""
+    first = pipeline_stage(range(10), name="first")
+    second = pipeline_stage(first, str, name="second")
+    
+    assert list(second) == [str(x) for x in range(10)]
+
+
+def test_stage_overlaps_consumer():
+    """Test the stage produces the next item while the consumer works."""
+    produced = []
+    
+    def source():
+        for i in range(3):
+            produced.append(i)
+            yield i
+    
+    stage = pipeline_stage(source(), maxsize=2)
+    assert next(stage) == 0
+    deadline = time.time() + 2
+    while len(produced) < 3 and time.time() < deadline:
+        time.sleep(0.01)
+    
+    assert produced == [0, 1, 2]
+    stage.close()
+
+
+def test_stage_queue_is_bounded():
+    """Test the stage does not run further ahead than its queue allows."""
+    produced = []
+    
+    def source():
+        for i in range(100):
+            produced.append(i)
+            yield i
+    
+    stage = pipeline_stage(source(), maxsize=2)
+    next(stage)
+    time.sleep(0.2)
+    
+    # One consumed, two queued, one blocked in put()
+    assert len(produced) <= 4
+    stage.close()
+
+
+@pytest.mark.parametrize("fail_in", ["source", "func"])
+def test_stage_errors_reraised(fail_in):
+    """Test exceptions from the source or func surface in the consumer."""
+    def source():
+        yield 1
+        if fail_in == "source":
+            raise RuntimeError("boom")
+        yield 2
+    
+    def func(x):
+        if fail_in == "func" and x == 2:
+            raise RuntimeError("boom")
+        return x
+    
+    stage = pipeline_stage(source(), func)
+    assert next(stage) == 1
+    with pytest.raises(RuntimeError, match="boom"):
+        next(stage)
+
+
+def test_closing_stops_thread():
+    """Test closing the consumer stops the stage thread."""
+    def endless():
+        i = 0
+        while True:
+            yield i
+            i += 1
+    
+    stage = pipeline_stage(endless(), name="endless", maxsize=1)
+    next(stage)
+    stage.close()
+    
+    assert not any(t.name == "compliance-endless" for t in threading.enumerate())
+
+
+def test_closing_stops_upstream_stages():
+    """Test closing a chained stage closes its source and upstream threads."""
+    closed = threading.Event()
+    
+    def endless():
+        i = 0
+        try:
+            while True:
+                yield i
+                i += 1
+        finally:
+            closed.set()
+    
+    first = pipeline_stage(endless(), name="upstream", maxsize=1)
+    second = pipeline_stage(first, str, name="downstream", maxsize=1)
+    next(second)
+    second.close()
+    
+    assert closed.is_set()
+    names = {t.name for t in threading.enumerate()}
+    assert not names & {"compliance-upstream", "compliance-downstream"}
+
+
+def test_busy_time_reported():
+    """Test busy time covers func work and is reported once."""
+    reported = []
+    
+    def slow(x):
+        time.sleep(0.02)
+        return x
+    
+    list(pipeline_stage(range(3), slow, name="slow", on_busy_time=lambda *a: reported.append(a)))
+    
+    assert len(reported) == 1
+    name, seconds = reported[0]
+    assert name == "slow"
+    assert seconds >= 0.05
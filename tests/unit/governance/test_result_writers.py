@@ -0,0 +1,134 @@
+"""
+Unit tests for streaming result writers.
+"""
+
+import io
+import json
+import pytest
+
+from specify_cli.governance.compliance import ComplianceChecker, RuleEvaluationResult, RuleStatus
+from specify_cli.governance.result_writers import (
+    JsonResultWriter,
+    JsonlResultWriter,
+    ResultWriter,
+    SarifResultWriter,
+    create_result_writer,
+)
+
+
+def make_result(rule_id, status, **kwargs):
+    return RuleEvaluationResult(
+        rule_id=rule_id,
+        rule_type="file_exists",
+        status=status,
+        message=f"{rule_id} message",
+        target="details",
+        guide_id="guide",
+        **kwargs
+    )
+
+
+RESULTS = [
+    make_result("passing", RuleStatus.PASS, path="README.md"),
+    make_result("failing", RuleStatus.FAIL, path="src/app.py"),
+    make_result("waived", RuleStatus.WAIVED, waiver_id="W-001"),
+    make_result("broken", RuleStatus.ERROR),
+]
+
+
+def test_jsonl_writes_each_result_immediately():
+    """Test every result is on the stream before the next one is written."""
+    out = io.StringIO()
+    writer = JsonlResultWriter(out)
+    
+    writer.write(RESULTS[0])
+    assert json.loads(out.getvalue()) == RESULTS[0].to_dict()
+    
+    writer.write(RESULTS[1])
+    writer.close()
+    assert [json.loads(line)["rule_id"] for line in out.getvalue().splitlines()] == ["passing", "failing"]
+
+
+@pytest.mark.parametrize("results", [[], RESULTS])
+def test_json_document(results):
+    """Test the streamed array and summary form one valid document."""
+    out = io.StringIO()
+    with JsonResultWriter(out) as writer:
+        for result in results:
+            writer.write(result)
+    
+    document = json.loads(out.getvalue())
+    assert document["results"] == [r.to_dict() for r in results]
+    assert document["summary"]["total"] == len(results)
+    assert document["summary"]["fail"] == (1 if results else 0)
+
+
+def test_sarif_log():
+    """Test non-passing results map to SARIF levels, suppressions and locations."""
+    out = io.StringIO()
+    with SarifResultWriter(out) as writer:
+        for result in RESULTS:
+            writer.write(result)
+    
+    log = json.loads(out.getvalue())
+    assert log["version"] == "2.1.0"
+    run = log["runs"][0]
+    assert run["tool"]["driver"]["name"] == "specify-compliance"
+    by_rule = {r["ruleId"]: r for r in run["results"]}
+    assert set(by_rule) == {"failing", "waived", "broken"}
+    assert by_rule["failing"]["level"] == "error"
+    assert by_rule["failing"]["locations"][0]["physicalLocation"]["artifactLocation"]["uri"] == "src/app.py"
+    assert by_rule["waived"]["suppressions"][0]["justification"] == "Waived by W-001"
+    assert by_rule["broken"]["level"] == "warning"
+    assert "locations" not in by_rule["broken"]
+
+
+def test_sarif_include_passed():
+    """Test passed rules can be reported as kind 'pass'."""
+    out = io.StringIO()
+    with SarifResultWriter(out, include_passed=True) as writer:
+        writer.write(RESULTS[0])
+    
+    result = json.loads(out.getvalue())["runs"][0]["results"][0]
+    assert (result["kind"], result["level"]) == ("pass", "none")
+
+
+def test_closed_writer_rejects_results():
+    """Test writing after close fails and closing twice is harmless."""
+    writer = create_result_writer("jsonl", io.StringIO())
+    writer.close()
+    writer.close()
+    with pytest.raises(ValueError, match="closed"):
+        writer.write(RESULTS[0])
+
+
+def test_base_writer_is_abstract():
+    """Test writers must implement _write."""
+    with pytest.raises(TypeError):
+        ResultWriter(io.StringIO())
+
+
+def test_unknown_format():
+    """Test an unsupported format is rejected."""
+    with pytest.raises(ValueError, match="Unknown output format"):
+        create_result_writer("xml", io.StringIO())
+
+
+def test_checker_streams_results(tmp_path):
+    """Test a compliance check streams results in the order it returns them."""
+    refs = tmp_path / "context" / "references"
+    refs.mkdir(parents=True)
+    for name in ("a", "b"):
+        (refs / f"{name}.md").write_text(
+            f"---\nrules:\n  - id: {name}-rule\n    type: file_exists\n    path: {name}.txt\n    description: d\n---\n"
+        )
+    
+    out = io.StringIO()
+    with JsonlResultWriter(out) as writer:
+        results = ComplianceChecker(project_root=tmp_path, use_cache=False).run_compliance_check(
+            on_result=writer.write
+        )
+    
+    streamed = [json.loads(line) for line in out.getvalue().splitlines()]
+    assert streamed == [r.to_dict() for r in results]
+    assert [r["path"] for r in streamed] == ["a.txt", "b.txt"]
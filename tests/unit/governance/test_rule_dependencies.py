@@ -0,0 +1,76 @@
+"""
+Unit tests for rule dependency ordering.
+"""
+
+import pytest
+
+from specify_cli.governance.rules.dependencies import (
+    dependency_levels,
+    dependency_order,
+    rule_dependencies,
+    skipped_evaluation,
+)
+
+
+def test_rule_dependencies_normalized():
+    """Test a single ID, a list and a missing field are all accepted."""
+    assert rule_dependencies({'id': 'a'}) == ()
+    assert rule_dependencies({'depends_on': 'pkg'}) == ('pkg',)
+    assert rule_dependencies({'depends_on': ['pkg', 'cfg', 'pkg']}) == ('pkg', 'cfg')
+
+
+def test_dependency_levels_group_independent_branches():
+    """Test independent chains share levels and keep rule order within a level."""
+    rule_ids = ['pkg', 'dep', 'cfg', 'readme', 'license']
+    dependencies = [(), ('pkg',), ('dep',), (), ('readme',)]
+    
+    assert dependency_levels(rule_ids, dependencies) == [[0, 3], [1, 4], [2]]
+
+
+def test_dependency_levels_wait_for_every_rule_with_an_id():
+    """Test a dependency on a repeated ID waits for all rules sharing it."""
+    levels = dependency_levels(['base', 'pkg', 'pkg', 'dep'], [(), ('base',), (), ('pkg',)])
+    
+    assert levels == [[0, 2], [1], [3]]
+
+
+def test_dependency_order_sorts_dependents_after_dependencies():
+    """Test rules declared before their dependencies are moved after them."""
+    rules = [
+        {'id': 'cfg', 'depends_on': ['dep']},
+        {'id': 'dep', 'depends_on': 'pkg'},
+        {'id': 'pkg'},
+    ]
+    
+    assert dependency_order(rules) == [2, 1, 0]
+
+
+@pytest.mark.parametrize("rules,message", [
+    ([{'id': 'a', 'depends_on': 'missing'}], "depends on unknown rule 'missing'"),
+    ([{'id': 'a', 'depends_on': 'a'}], "cycle: a -> a"),
+    ([{'id': 'a', 'depends_on': 'b'}, {'id': 'b', 'depends_on': 'a'}], "cycle: a -> b -> a"),
+])
+def test_dependency_order_rejects_invalid_graphs(rules, message):
+    """Test unknown dependencies and cycles are rejected."""
+    with pytest.raises(ValueError, match=message):
+        dependency_order(rules)
+
+
+def test_dependency_order_handles_long_chains():
+    """Test chains far deeper than the recursion limit are ordered and checked."""
+    rules = [{'id': f'r{i}', 'depends_on': f'r{i + 1}'} for i in range(3000)] + [{'id': 'r3000'}]
+    
+    assert dependency_order(rules) == list(range(3000, -1, -1))
+    
+    rules[-1]['depends_on'] = 'r0'
+    with pytest.raises(ValueError, match="cycle: r0 -> r1 -> r2 -> "):
+        dependency_order(rules)
+
+
+def test_skipped_evaluation():
+    """Test skipped rules fail and name the dependency that stopped them."""
+    evaluation = skipped_evaluation('pkg')
+    
+    assert evaluation['passed'] is False
+    assert evaluation['skipped'] is True
+    assert "'pkg'" in evaluation['message']
@@ -4,10 +4,11 @@ Unit tests for RuleEngine.
 
 import pytest
 from pathlib import Path
-from specify_cli.governance.rules.engine import RuleEngine
+from unittest.mock import patch
+from specify_cli.governance.rules.engine import RuleEngine, RuleFactory, chunk_by_target, evaluate_rule_batch
 from specify_cli.governance.rules.file_rules import FileExistsRule
 from specify_cli.governance.rules.dependency_rules import DependencyPresentRule
-from specify_cli.governance.rules.text_rules import TextIncludesRule
+from specify_cli.governance.rules.text_rules import TextIncludesRule, TextMatchesRule
 
 
 def test_rule_engine_initialization(tmp_path):
@@ -98,7 +99,7 @@ def test_rule_engine_evaluate_all_error_handling(tmp_path):
     
     # Create a rule that will raise an error during evaluation
     class BrokenRule(FileExistsRule):
-        def evaluate(self, project_root):
+        def evaluate(self, project_root, store=None):
             raise RuntimeError("Intentional test error")
     
     rule = BrokenRule("broken-rule", "Broken rule", "test.txt")
@@ -178,3 +179,210 @@ def test_rule_engine_rule_types_registry():
     assert RuleEngine.RULE_TYPES['file_exists'] == FileExistsRule
     assert RuleEngine.RULE_TYPES['dependency_present'] == DependencyPresentRule
     assert RuleEngine.RULE_TYPES['text_includes'] == TextIncludesRule
+    assert RuleEngine.RULE_TYPES['text_matches'] == TextMatchesRule
+
+
+def test_rule_engine_invalid_max_workers(tmp_path):
+    """Test RuleEngine rejects a worker count below 1."""
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        RuleEngine(str(tmp_path), max_workers=0)
+    
+    engine = RuleEngine(str(tmp_path))
+    with pytest.raises(ValueError, match="max_workers must be at least 1"):
+        engine.evaluate_all(max_workers=0)
+
+
+def test_rule_engine_evaluate_all_concurrent_preserves_order(tmp_path):
+    """Test concurrent evaluation returns results in registration order."""
+    import time
+    
+    class SlowRule(FileExistsRule):
+        def evaluate(self, project_root, store=None):
+            # Earlier rules sleep longer so they finish last
+            time.sleep(0.002 * (20 - int(self.id.split('-')[1])))
+            return super().evaluate(project_root, store)
+    
+    (tmp_path / "even.txt").write_text("content")
+    
+    engine = RuleEngine(str(tmp_path), max_workers=8)
+    for i in range(20):
+        path = "even.txt" if i % 2 == 0 else "odd.txt"
+        engine.register_rule(SlowRule(f"rule-{i}", f"Rule {i}", path))
+    
+    results = engine.evaluate_all()
+    
+    assert [r['rule_id'] for r in results] == [f"rule-{i}" for i in range(20)]
+    assert [r['passed'] for r in results] == [i % 2 == 0 for i in range(20)]
+
+
+def test_rule_engine_evaluate_all_concurrent_error_isolation(tmp_path):
+    """Test a failing rule does not affect other rules in concurrent mode."""
+    class BrokenRule(FileExistsRule):
+        def evaluate(self, project_root, store=None):
+            raise RuntimeError("Intentional test error")
+    
+    (tmp_path / "test.txt").write_text("content")
+    
+    engine = RuleEngine(str(tmp_path))
+    engine.register_rule(FileExistsRule("rule-1", "Rule 1", "test.txt"))
+    engine.register_rule(BrokenRule("broken-rule", "Broken rule", "test.txt"))
+    engine.register_rule(FileExistsRule("rule-3", "Rule 3", "test.txt"))
+    
+    sequential = engine.evaluate_all()
+    concurrent = engine.evaluate_all(max_workers=4)
+    
+    assert concurrent == sequential
+    assert concurrent[1]['error'] is True
+    assert concurrent[1]['details'] == "Error: Intentional test error"
+    assert concurrent[0]['passed'] is True
+    assert concurrent[2]['passed'] is True
+
+
+def test_chunk_by_target_groups_rules():
+    """Test rules sharing a target land in one chunk, in first-seen order."""
+    rules = [
+        {'id': 'a1', 'file': 'a.txt'},
+        {'id': 'b1', 'file': 'b.txt'},
+        {'id': 'a2', 'file': 'a.txt'},
+        {'id': 'c1', 'path': 'c.txt'},
+    ]
+    target = lambda rule: rule.get('file') or rule.get('path')
+    
+    assert chunk_by_target(rules, target) == [[0, 2], [1], [3]]
+    assert chunk_by_target(rules, target, min_chunk_size=3) == [[0, 2, 1], [3]]
+
+
+def test_evaluate_rule_batch_isolates_errors(tmp_path):
+    """Test worker batches evaluate definitions and report errors per rule."""
+    (tmp_path / "README.md").write_text("hello")
+    rules = [
+        {'id': 'ok', 'type': 'file_exists', 'path': 'README.md', 'description': 'd'},
+        {'id': 'bad', 'type': 'no_such_type', 'description': 'd'},
+        {'id': 'text', 'type': 'text_includes', 'file': 'README.md', 'text': 'hello', 'description': 'd'},
+    ]
+    
+    evaluations, hits, misses, durations = evaluate_rule_batch(str(tmp_path), rules)
+    
+    assert evaluations[0]['passed'] is True
+    assert 'Unknown rule type' in evaluations[1]['error']
+    assert evaluations[2]['passed'] is True
+    assert misses == 2 and hits >= 1
+    assert len(durations) == 3 and all(d >= 0 for d in durations)
+
+
+def test_rule_engine_process_backend_matches_thread(tmp_path):
+    """Test the process backend returns the same results in the same order."""
+    (tmp_path / "README.md").write_text("License: MIT\n")
+    (tmp_path / "requirements.txt").write_text("requests>=2.28\n")
+    engine = RuleEngine(str(tmp_path), max_workers=2, backend='process')
+    for i in range(6):
+        engine.register_rule(TextIncludesRule(f"text-{i}", "d", "README.md", "MIT" if i % 2 else "GPL"))
+        engine.register_rule(FileExistsRule(f"file-{i}", "d", "README.md" if i % 2 else "missing.txt"))
+    engine.register_rule(DependencyPresentRule("dep", "d", "requirements.txt", "requests", version=">=2"))
+    
+    class LocalRule(FileExistsRule):
+        """Subclass that workers cannot rebuild from its definition."""
+    engine.register_rule(LocalRule("local", "d", "README.md"))
+    
+    process_results = engine.evaluate_all()
+    thread_results = engine.evaluate_all(backend='thread')
+    
+    assert process_results == thread_results
+    assert [r['rule_id'] for r in process_results][-1] == "local"
+
+
+def test_rule_engine_invalid_backend(tmp_path):
+    """Test unknown backends are rejected."""
+    with pytest.raises(ValueError, match="Unknown backend"):
+        RuleEngine(str(tmp_path), backend='gpu')
+
+
+def _chain_engine(tmp_path, **kwargs):
+    """Engine with a package.json -> react -> config chain and an independent README branch."""
+    engine = RuleEngine(str(tmp_path), **kwargs)
+    for definition in (
+        {'id': 'config', 'type': 'text_includes', 'file': 'app.config', 'text': 'react', 'depends_on': 'react'},
+        {'id': 'package-json', 'type': 'file_exists', 'path': 'package.json'},
+        {'id': 'react', 'type': 'dependency_present', 'file': 'package.json', 'package': 'react',
+         'depends_on': ['package-json']},
+        {'id': 'readme', 'type': 'file_exists', 'path': 'README.md'},
+        {'id': 'license', 'type': 'text_includes', 'file': 'README.md', 'text': 'MIT', 'depends_on': 'readme'},
+    ):
+        engine.register_rule(RuleEngine.create_rule(definition['type'], description='d', **definition))
+    return engine
+
+
+@pytest.mark.parametrize("kwargs", [{}, {'max_workers': 4}, {'max_workers': 2, 'backend': 'process'}])
+def test_rule_engine_depends_on_skips_dependents(tmp_path, kwargs):
+    """Test dependents of a failed rule are skipped while other branches run."""
+    (tmp_path / "README.md").write_text("License: MIT\n")
+    
+    results = _chain_engine(tmp_path, **kwargs).evaluate_all()
+    
+    assert [r['rule_id'] for r in results] == ['config', 'package-json', 'react', 'readme', 'license']
+    assert [r['passed'] for r in results] == [False, False, False, True, True]
+    assert results[2]['skipped'] is True and "'package-json'" in results[2]['message']
+    assert results[0]['skipped'] is True and "'react'" in results[0]['message']
+    assert 'skipped' not in results[1] and 'skipped' not in results[4]
+
+
+def test_rule_engine_depends_on_evaluates_satisfied_chain(tmp_path):
+    """Test a chain whose dependencies pass is evaluated in dependency order."""
+    (tmp_path / "package.json").write_text('{"dependencies": {"react": "^18.0.0"}}')
+    (tmp_path / "app.config").write_text("framework = react\n")
+    (tmp_path / "README.md").write_text("License: MIT\n")
+    engine = _chain_engine(tmp_path, max_workers=4)
+    
+    evaluated = []
+    original = RuleEngine._evaluate_rule
+    
+    def recording_evaluate(self, rule, store=None):
+        evaluated.append(rule.id)
+        return original(self, rule, store=store)
+    
+    with patch.object(RuleEngine, "_evaluate_rule", recording_evaluate):
+        results = engine.evaluate_all()
+    
+    assert all(r['passed'] for r in results)
+    assert evaluated.index('package-json') < evaluated.index('react') < evaluated.index('config')
+    assert evaluated.index('readme') < evaluated.index('license')
+
+
+def test_rule_engine_depends_on_unknown_rule(tmp_path):
+    """Test evaluate_all rejects dependencies on unregistered rules."""
+    engine = RuleEngine(str(tmp_path))
+    engine.register_rule(RuleEngine.create_rule(
+        'file_exists', id='a', description='d', path='a.txt', depends_on='missing'
+    ))
+    
+    with pytest.raises(ValueError, match="unknown rule 'missing'"):
+        engine.evaluate_all()
+
+
+def test_rule_factory_builds_each_definition_once():
+    """Test identical definitions share one instance, whatever their key order."""
+    factory = RuleFactory()
+    definition = {'id': 'readme', 'type': 'file_exists', 'path': 'README.md', 'description': 'd'}
+    
+    first = factory.create(definition)
+    second = factory.create(dict(reversed(list(definition.items()))))
+    other = factory.create({**definition, 'path': 'docs/README.md'})
+    
+    assert first is second
+    assert other is not first and other.path == 'docs/README.md'
+    assert (factory.built, factory.reused) == (2, 1)
+
+
+@pytest.mark.parametrize("definition,message", [
+    ({'id': 'x', 'description': 'd', 'path': 'a.txt'}, "missing required field: 'type'"),
+    ({'id': 'x', 'type': 'file_missing', 'description': 'd'}, "Unknown rule type"),
+    ({'id': 'x', 'type': 'text_includes', 'description': 'd', 'file': 'a.txt'}, "missing required field: 'text'"),
+])
+def test_rule_factory_invalid_definitions(definition, message):
+    """Test invalid definitions raise ValueError every time but are only built once."""
+    factory = RuleFactory()
+    
+    for _ in range(2):
+        with pytest.raises(ValueError, match=message):
+            factory.create(definition)
+    assert factory.built == 1
@@ -287,3 +287,284 @@ def test_rule_parser_validate_rule_structure_text_missing_text():
     
     with pytest.raises(RuleParseError, match="'text'"):
         RuleParser.validate_rule_structure(rule, 'text_includes')
+
+
+CACHED_GUIDE = """---
+title: "Cached Guide"
+rules:
+  - id: readme-present
+    type: file_exists
+    path: README.md
+    description: README required
+---
+
+# Cached Guide
+"""
+
+
+def test_extract_rules_with_cache_skips_parsing(tmp_path, monkeypatch):
+    """Test unchanged guides are served from the parse cache."""
+    from specify_cli.governance.caching import GuideParseCache
+    
+    guide = tmp_path / "guide.md"
+    guide.write_text(CACHED_GUIDE)
+    
+    cache = GuideParseCache(tmp_path)
+    first = RuleParser.extract_rules(guide, cache=cache)
+    cache.save()
+    
+    def fail_parse(content):
+        raise AssertionError("guide should not be parsed again")
+    
+    monkeypatch.setattr(RuleParser, "_parse_rules", staticmethod(fail_parse))
+    monkeypatch.setattr(RuleParser, "validate_rule_structure", staticmethod(fail_parse))
+    
+    reloaded = GuideParseCache(tmp_path)
+    second = RuleParser.extract_rules(guide, cache=reloaded)
+    
+    assert second == first
+    assert second[0]['id'] == 'readme-present'
+    assert reloaded.hits == 1
+
+
+def test_extract_rules_cache_content_hash_fallback(tmp_path):
+    """Test a touched but unchanged guide still hits by content hash."""
+    import os
+    from specify_cli.governance.caching import GuideParseCache
+    
+    guide = tmp_path / "guide.md"
+    guide.write_text(CACHED_GUIDE)
+    cache = GuideParseCache(tmp_path)
+    RuleParser.extract_rules(guide, cache=cache)
+    
+    stat_result = guide.stat()
+    os.utime(guide, ns=(stat_result.st_atime_ns, stat_result.st_mtime_ns + 5_000_000_000))
+    
+    rules = RuleParser.extract_rules(guide, cache=cache)
+    
+    assert rules[0]['id'] == 'readme-present'
+    assert cache.hits == 1
+    assert cache.misses == 1
+
+
+def test_extract_rules_cache_invalidated_on_change(tmp_path):
+    """Test editing a guide re-parses it."""
+    from specify_cli.governance.caching import GuideParseCache
+    
+    guide = tmp_path / "guide.md"
+    guide.write_text(CACHED_GUIDE)
+    cache = GuideParseCache(tmp_path)
+    RuleParser.extract_rules(guide, cache=cache)
+    
+    guide.write_text(CACHED_GUIDE.replace("readme-present", "readme-required"))
+    rules = RuleParser.extract_rules(guide, cache=cache)
+    
+    assert rules[0]['id'] == 'readme-required'
+    assert cache.misses == 2
+
+
+def test_extract_rules_cache_does_not_store_errors(tmp_path):
+    """Test invalid guides raise on every run instead of being cached."""
+    from specify_cli.governance.caching import GuideParseCache
+    
+    guide = tmp_path / "guide.md"
+    guide.write_text("---\nrules:\n  - id: broken\n    type: file_exists\n---\n")
+    cache = GuideParseCache(tmp_path)
+    
+    for _ in range(2):
+        with pytest.raises(RuleParseError):
+            RuleParser.extract_rules(guide, cache=cache)
+    assert cache.hits == 0
+
+
+def test_extract_rules_cache_skips_non_json_rules(tmp_path):
+    """Test rules with YAML-only types (dates) are parsed every time."""
+    from specify_cli.governance.caching import GuideParseCache
+    
+    guide = tmp_path / "guide.md"
+    guide.write_text(CACHED_GUIDE.replace("    description:", "    since: 2025-01-01\n    description:"))
+    cache = GuideParseCache(tmp_path)
+    
+    first = RuleParser.extract_rules(guide, cache=cache)
+    second = RuleParser.extract_rules(guide, cache=cache)
+    
+    assert first == second
+    assert cache.hits == 0
+
+
+@pytest.mark.parametrize("content", [
+    CACHED_GUIDE,
+    "# No frontmatter\n\nBody only.\n",
+    "---\ntitle: Empty body\n---\n",
+    "---   \ntitle: Trailing spaces\n---  \nBody\n",
+    "---\n\ntitle: Leading blank line\n---\nBody\n",
+    "---\ntitle: Unterminated\n",
+    "---\ntitle: No newline after close\n---",
+    "---\n---\nEmpty block\n",
+    "----\ntitle: Not a delimiter\n---\n",
+    "---\ntitle: First close wins\n---\nmiddle\n---\nend\n",
+])
+def test_read_frontmatter_block_matches_parse_frontmatter(tmp_path, content):
+    """Test the streaming reader agrees with the regex-based parser."""
+    guide = tmp_path / "guide.md"
+    guide.write_text(content)
+    
+    block = RuleParser.read_frontmatter_block(guide)
+    streamed = RuleParser.load_frontmatter(block) if block is not None else {}
+    expected, _ = RuleParser.parse_frontmatter(content)
+    
+    assert streamed == expected
+
+
+def test_read_frontmatter_block_does_not_read_body(tmp_path):
+    """Test reading stops at the closing delimiter."""
+    guide = tmp_path / "guide.md"
+    body = b"x" * (256 * 1024) + b"\xff\xfe undecodable body\n"
+    guide.write_bytes(CACHED_GUIDE.encode() + body)
+    
+    # Loading the whole file would fail to decode
+    with pytest.raises(UnicodeDecodeError):
+        guide.read_text(encoding="utf-8")
+    
+    rules = RuleParser.extract_rules(guide)
+    assert rules[0]['id'] == 'readme-present'
+
+
+def test_extract_rules_cache_hits_on_body_edit(tmp_path):
+    """Test editing only the markdown body keeps the parse cache valid."""
+    from specify_cli.governance.caching import GuideParseCache
+    
+    guide = tmp_path / "guide.md"
+    guide.write_text(CACHED_GUIDE)
+    cache = GuideParseCache(tmp_path)
+    RuleParser.extract_rules(guide, cache=cache)
+    
+    guide.write_text(CACHED_GUIDE + "\nA much longer body now.\n")
+    rules = RuleParser.extract_rules(guide, cache=cache)
+    
+    assert rules[0]['id'] == 'readme-present'
+    assert cache.hits == 1
+
+
+def test_extract_rules_cache_invalidated_on_validator_change(tmp_path, monkeypatch):
+    """Test rules cached before validation changed are validated again."""
+    from specify_cli.governance.caching import GuideParseCache
+    
+    guide = tmp_path / "guide.md"
+    guide.write_text(CACHED_GUIDE)
+    cache = GuideParseCache(tmp_path)
+    RuleParser.extract_rules(guide, cache=cache)
+    cache.save()
+    
+    monkeypatch.setattr(RuleParser, "VALIDATION_VERSION", RuleParser.VALIDATION_VERSION + 1)
+    reloaded = GuideParseCache(tmp_path)
+    rules = RuleParser.extract_rules(guide, cache=reloaded)
+    
+    assert rules[0]['id'] == 'readme-present'
+    assert (reloaded.hits, reloaded.misses) == (0, 1)
+    # The re-validated entry is served again
+    RuleParser.extract_rules(guide, cache=reloaded)
+    assert reloaded.hits == 1
+
+
+@pytest.mark.parametrize("field,value,message", [
+    ("match", "most", "'match' must be one of any, all"),
+    ("min_count", 0, "'min_count' must be a positive integer"),
+    ("min_count", "2", "'min_count' must be a positive integer"),
+    ("min_count", True, "'min_count' must be a positive integer"),
+])
+def test_validate_glob_quantifier(field, value, message):
+    """Test invalid glob quantifiers are rejected."""
+    rule = {
+        'id': 'owners',
+        'type': 'text_includes',
+        'description': 'Every service names an owner',
+        'file': 'services/*/README.md',
+        'text': 'Owner:',
+        field: value,
+    }
+    with pytest.raises(RuleParseError, match=message):
+        RuleParser.validate_rule_structure(rule)
+
+
+def test_validate_glob_quantifier_valid():
+    """Test glob targets with quantifiers validate."""
+    rule = {
+        'id': 'routes',
+        'type': 'file_exists',
+        'description': 'Services define routes',
+        'path': 'src/**/routes.py',
+        'min_count': 3,
+    }
+    assert RuleParser.validate_rule_structure(rule) is True
+
+
+def test_validate_text_matches_rule():
+    """Test text_matches rules with flags and scope validate."""
+    rule = {
+        'id': 'copyright',
+        'type': 'text_matches',
+        'description': 'Copyright header present',
+        'file': 'LICENSE',
+        'pattern': r'^Copyright \(c\) \d{4}',
+        'flags': ['ignorecase', 'multiline'],
+        'scope': 'line',
+    }
+    assert RuleParser.validate_rule_structure(rule) is True
+
+
+@pytest.mark.parametrize("field,value,message", [
+    ("pattern", "(unclosed", "invalid regular expression"),
+    ("pattern", "  ", "'pattern' cannot be empty"),
+    ("flags", ["unicode"], "unknown regex flag"),
+    ("flags", 2, "'flags' must be a list"),
+    ("scope", "paragraph", "'scope' must be one of file, line"),
+])
+def test_validate_text_matches_rule_invalid(field, value, message):
+    """Test invalid text_matches fields are rejected."""
+    rule = {
+        'id': 'copyright',
+        'type': 'text_matches',
+        'description': 'Copyright header present',
+        'file': 'LICENSE',
+        'pattern': r'Copyright \d{4}',
+        field: value,
+    }
+    with pytest.raises(RuleParseError, match=message):
+        RuleParser.validate_rule_structure(rule)
+
+
+def test_depends_on_parsed(tmp_path):
+    """Test rule chains with depends_on are extracted and ordered freely."""
+    guide = tmp_path / "guide.md"
+    guide.write_text(
+        "---\nrules:\n"
+        "  - id: react-present\n    type: dependency_present\n    file: package.json\n"
+        "    package: react\n    description: d\n    depends_on: package-json\n"
+        "  - id: package-json\n    type: file_exists\n    path: package.json\n    description: d\n"
+        "---\n"
+    )
+    
+    rules = RuleParser.extract_rules(guide)
+    
+    assert rules[0]['depends_on'] == 'package-json'
+
+
+@pytest.mark.parametrize("depends_on,message", [
+    (["missing"], "depends on unknown rule 'missing'"),
+    (["self"], "cycle"),
+    ([3], "'depends_on' must be a rule ID or a list of rule IDs"),
+    ({"id": "other"}, "'depends_on' must be a rule ID or a list of rule IDs"),
+])
+def test_depends_on_invalid(tmp_path, depends_on, message):
+    """Test invalid dependencies are reported when the guide is parsed."""
+    guide = tmp_path / "guide.md"
+    guide.write_text(
+        "---\nrules:\n"
+        f"  - id: self\n    type: file_exists\n    path: a.txt\n    description: d\n    depends_on: {depends_on}\n"
+        "  - id: other\n    type: file_exists\n    path: b.txt\n    description: d\n"
+        "---\n"
+    )
+    
+    with pytest.raises(RuleParseError, match=message):
+        RuleParser.extract_rules(guide)
@@ -0,0 +1,296 @@
+"""
+Unit tests for TextMatchIndex.
+"""
+
+import re
+import pytest
+from unittest.mock import patch
+
+from specify_cli.governance.rules.content_store import FileContentStore
+from specify_cli.governance.rules.dependency_rules import DependencyPresentRule
+from specify_cli.governance.rules.engine import RuleEngine
+from specify_cli.governance.rules.text_index import (
+    MappedTextIndex, RegexMatch, TextMatch, TextMatchIndex, compile_regex, regex_flags, required_literals
+)
+from specify_cli.governance.rules.text_rules import TextIncludesRule, TextMatchesRule
+
+
+CONTENT = "# Project\nLicense: MIT\n\nSee LICENSE for details.\nlicense again\n"
+
+
+@pytest.mark.parametrize("pattern,case_sensitive", [
+    ("License", True),
+    ("License", False),
+    ("LICENSE", True),
+    ("MIT", True),
+    ("missing", True),
+    ("\n", True),
+    ("aa", True),
+])
+def test_find_matches_str_semantics(pattern, case_sensitive):
+    """Test counts agree with str.count on the (lowered) content."""
+    index = TextMatchIndex(CONTENT)
+    buffer = CONTENT if case_sensitive else CONTENT.lower()
+    needle = pattern if case_sensitive else pattern.lower()
+    
+    match = index.find(pattern, case_sensitive)
+    
+    assert match.count == buffer.count(needle)
+    assert match.found == (needle in buffer)
+
+
+def test_first_line_numbers():
+    """Test the first occurrence's 1-based line is reported."""
+    index = TextMatchIndex(CONTENT)
+    
+    assert index.find("License").first_line == 2
+    assert index.find("license").first_line == 5
+    assert index.find("license", case_sensitive=False).first_line == 2
+    assert index.find("missing") == TextMatch(count=0, first_line=None)
+
+
+def test_lowered_buffer_shared():
+    """Test case-insensitive patterns lowercase the content once."""
+    index = TextMatchIndex(CONTENT)
+    
+    index.find("license", case_sensitive=False)
+    lowered = index.lowered
+    index.find("mit", case_sensitive=False)
+    
+    assert index.lowered is lowered
+
+
+def test_find_memoized():
+    """Test repeated lookups return the stored result."""
+    index = TextMatchIndex(CONTENT)
+    
+    first = index.find("MIT")
+    assert index.find("MIT") is first
+
+
+def test_find_all_deduplicates():
+    """Test a batch with duplicates returns one entry per distinct pattern."""
+    index = TextMatchIndex(CONTENT)
+    
+    matches = index.find_all([("MIT", True), ("MIT", True), ("mit", False)])
+    
+    assert set(matches) == {("MIT", True), ("mit", False)}
+    assert matches[("mit", False)].count == 1
+
+
+def test_rules_share_file_index(tmp_path):
+    """Test rules on the same file reuse one index from the store."""
+    (tmp_path / "README.md").write_text(CONTENT)
+    store = FileContentStore(tmp_path)
+    
+    TextIncludesRule("r1", "License", "README.md", "License").evaluate(str(tmp_path), store=store)
+    index = store.text_index("README.md")
+    result = TextIncludesRule("r2", "MIT", "README.md", "mit", case_sensitive=False).evaluate(
+        str(tmp_path), store=store
+    )
+    
+    assert result["passed"] is True
+    assert "first on line 2" in result["details"]
+    assert store.text_index("README.md") is index
+
+
+def test_engine_searches_each_pattern_once(tmp_path):
+    """Test evaluate_all batches patterns so duplicates are searched once."""
+    (tmp_path / "README.md").write_text(CONTENT)
+    engine = RuleEngine(str(tmp_path), max_workers=4)
+    for i in range(6):
+        engine.register_rule(TextIncludesRule(f"rule-{i}", "MIT", "README.md", "MIT"))
+    engine.register_rule(TextIncludesRule("other", "Other", "MISSING.md", "x"))
+    
+    calls = []
+    original_find = TextMatchIndex.find
+    
+    def counting_find(self, pattern, case_sensitive=True):
+        if (pattern, case_sensitive) not in self._matches:
+            calls.append(pattern)
+        return original_find(self, pattern, case_sensitive)
+    
+    with patch.object(TextMatchIndex, "find", counting_find):
+        results = engine.evaluate_all()
+    
+    assert calls == ["MIT"]
+    assert [r["passed"] for r in results] == [True] * 6 + [False]
+
+
+REGEX_QUERIES = [
+    (r"License: \w+", 0, False),
+    (r"^license", 0, False),
+    (r"^license", re.MULTILINE, False),
+    (r"^LICENSE", re.IGNORECASE | re.MULTILINE, False),
+    (r"MIT\s+See", 0, False),
+    (r"MIT\s+See", 0, True),
+    (r"details\.$", 0, True),
+    (r"(l)icense \1", 0, False),
+    (r"(?P<word>again)", 0, True),
+    (r"license  # comment", re.VERBOSE, True),
+    (r"GPL", 0, False),
+]
+
+
+def _expected_first_line(pattern, flags, line_scoped, content=CONTENT):
+    """First matching line found by a plain re.search."""
+    if line_scoped:
+        lines = content.split("\n")
+        return next((number for number, line in enumerate(lines, 1) if re.search(pattern, line, flags)), None)
+    found = re.search(pattern, content, flags)
+    return content.count("\n", 0, found.start()) + 1 if found else None
+
+
+def test_find_regex_all_matches_re():
+    """Test a batch of expressions finds the same first lines as re.search."""
+    index = TextMatchIndex(CONTENT)
+    
+    matches = index.find_regex_all(REGEX_QUERIES)
+    
+    for query in REGEX_QUERIES:
+        assert matches[query] == RegexMatch(_expected_first_line(*query)), query
+
+
+def test_find_regex_memoized():
+    """Test each distinct expression is searched once per file."""
+    index = TextMatchIndex(CONTENT)
+    first = index.find_regex(r"MIT", 0)
+    
+    with patch("specify_cli.governance.rules.text_index._first_positions", side_effect=AssertionError):
+        assert index.find_regex(r"MIT", 0) is first
+    assert first.first_line == 2
+
+
+def test_compile_regex_cached():
+    """Test patterns are compiled once per process."""
+    assert compile_regex(r"Owner: \w+", re.IGNORECASE) is compile_regex(r"Owner: \w+", re.IGNORECASE)
+    assert regex_flags(["IgnoreCase", "dotall"]) == re.IGNORECASE | re.DOTALL
+    with pytest.raises(ValueError, match="Unknown regex flag"):
+        regex_flags(["global"])
+
+
+@pytest.mark.parametrize("pattern,flags,literals", [
+    (r"\bLicense:\s+MIT", 0, ("License:", "MIT")),
+    (r"Copyright \(c\) \d{4}", 0, ("Copyright (c) ",)),
+    (r"MIT|GPL", 0, ()),
+    (r"license", re.IGNORECASE, ()),
+    (r"(?i)license", 0, ()),
+    (r"colou?r", 0, ("colo", "r")),
+])
+def test_required_literals(pattern, flags, literals):
+    """Test only text every match must contain is used to rule patterns out."""
+    assert required_literals(pattern, flags) == literals
+
+
+def test_required_literals_without_regex_parser(monkeypatch):
+    """Test expressions still match, unfiltered, when the stdlib parser is unavailable."""
+    from specify_cli.governance.rules import text_index
+    
+    monkeypatch.setattr(text_index, "_parser", None)
+    required_literals.cache_clear()
+    assert required_literals(r"\bLicense:\s+MIT", 0) == ()
+    
+    index = TextMatchIndex(CONTENT)
+    assert index.find_regex(r"License: [A-Z]+", 0, False).found
+    required_literals.cache_clear()
+
+
+def test_engine_batches_regex_rules(tmp_path):
+    """Test evaluate_all searches all expressions against a file as one batch."""
+    (tmp_path / "README.md").write_text(CONTENT)
+    engine = RuleEngine(str(tmp_path), max_workers=4)
+    for i in range(5):
+        engine.register_rule(TextMatchesRule(f"rule-{i}", "MIT", "README.md", r"License: [A-Z]+"))
+    engine.register_rule(TextMatchesRule("gpl", "GPL", "README.md", r"GPL-\d"))
+    
+    batches = []
+    original = TextMatchIndex.find_regex_all
+    
+    def recording_find_regex_all(self, queries):
+        queries = list(queries)
+        batches.append([query for query in queries if query not in self._regex_matches])
+        return original(self, queries)
+    
+    with patch.object(TextMatchIndex, "find_regex_all", recording_find_regex_all):
+        results = engine.evaluate_all()
+    
+    assert batches[0] == [(r"License: [A-Z]+", 0, False)] * 5 + [(r"GPL-\d", 0, False)]
+    assert all(batch == [] for batch in batches[1:])
+    assert [r["passed"] for r in results] == [True] * 5 + [False]
+
+
+class TestMappedTextIndex:
+    """Tests for memory-mapped scanning of large files."""
+    
+    CONTENT = "header\nAlpha beta\n" + "filler line\n" * 2000 + "ÄRGER über\nalpha BETA alpha\n"
+    
+    @pytest.fixture
+    def large_file(self, tmp_path):
+        path = tmp_path / "big.txt"
+        path.write_text(self.CONTENT, encoding="utf-8")
+        return path
+    
+    @pytest.mark.parametrize("pattern,case_sensitive", [
+        ("alpha", True),
+        ("alpha", False),
+        ("BETA", False),
+        ("filler", True),
+        ("über", True),
+        ("ärger", False),
+        ("missing", False),
+    ])
+    def test_matches_decoded_index(self, large_file, pattern, case_sensitive):
+        """Test counts and first lines agree with the decoded index."""
+        expected = TextMatchIndex(self.CONTENT).find(pattern, case_sensitive)
+        
+        mapped = MappedTextIndex(large_file)
+        mapped.CHUNK_SIZE = 64  # exercise chunked line counting
+        
+        assert mapped.find(pattern, case_sensitive) == expected
+    
+    def test_search(self, large_file):
+        """Test regex search runs over the mapped bytes."""
+        mapped = MappedTextIndex(large_file)
+        
+        assert mapped.search(r"alpha[^\n]*beta", re.IGNORECASE)
+        assert not mapped.search(r"gamma")
+    
+    def test_find_regex_matches_decoded_index(self, large_file):
+        """Test regex batches over the mapping agree with the decoded index."""
+        queries = [
+            (r"alpha\s+beta", re.IGNORECASE, False),
+            (r"^alpha", re.MULTILINE, False),
+            (r"über$", 0, True),
+            (r"filler line\nÄRGER", 0, False),
+            (r"filler line\nÄRGER", 0, True),
+            (r"gamma", 0, False),
+        ]
+        mapped = MappedTextIndex(large_file)
+        mapped.CHUNK_SIZE = 64
+        
+        assert mapped.find_regex_all(queries) == TextMatchIndex(self.CONTENT).find_regex_all(queries)
+    
+    def test_store_maps_files_over_threshold(self, tmp_path, large_file):
+        """Test the store only maps files at or above its threshold."""
+        (tmp_path / "small.txt").write_text("alpha\n")
+        store = FileContentStore(tmp_path, mmap_threshold=1024)
+        
+        assert isinstance(store.text_index("big.txt"), MappedTextIndex)
+        assert isinstance(store.text_index("small.txt"), TextMatchIndex)
+        assert isinstance(FileContentStore(tmp_path, mmap_threshold=None).text_index("big.txt"), TextMatchIndex)
+    
+    def test_large_file_not_decoded(self, tmp_path, large_file):
+        """Test rules on large files never read the whole file."""
+        store = FileContentStore(tmp_path, mmap_threshold=1024)
+        
+        with patch.object(FileContentStore, "read_text", side_effect=AssertionError("decoded")):
+            text = TextIncludesRule("t", "Alpha", "big.txt", "alpha", case_sensitive=False).evaluate(
+                str(tmp_path), store=store
+            )
+            dependency = DependencyPresentRule("d", "Alpha", "big.txt", "alpha").evaluate(
+                str(tmp_path), store=store
+            )
+        
+        assert text["passed"] is True
+        assert "3 occurrences, first on line 2" in text["details"]
+        assert dependency["passed"] is True
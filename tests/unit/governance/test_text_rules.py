@@ -1,10 +1,10 @@
 """
-Unit tests for TextIncludesRule.
+Unit tests for TextIncludesRule and TextMatchesRule.
 """
 
 import pytest
 from pathlib import Path
-from specify_cli.governance.rules.text_rules import TextIncludesRule
+from specify_cli.governance.rules.text_rules import TextIncludesRule, TextMatchesRule
 
 
 def test_text_includes_rule_initialization():
@@ -170,3 +170,123 @@ def test_text_includes_rule_from_yaml_missing_text():
     
     with pytest.raises(ValueError, match="missing required field: 'text'"):
         TextIncludesRule.from_yaml(data)
+
+
+@pytest.fixture
+def services(tmp_path):
+    for service, text in (("users", "Owner: team-a"), ("orders", "Owner: team-b"), ("billing", "TODO")):
+        (tmp_path / "services" / service).mkdir(parents=True)
+        (tmp_path / "services" / service / "README.md").write_text(text)
+    return tmp_path
+
+
+@pytest.mark.parametrize("match,min_count,passed", [
+    ("any", 1, True),
+    ("any", 2, True),
+    ("any", 3, False),
+    ("all", 1, False),
+])
+def test_text_includes_rule_glob(services, match, min_count, passed):
+    """Test glob files with any/all/min_count semantics."""
+    rule = TextIncludesRule(
+        "test-id", "Owners", "services/*/README.md", "Owner:", match=match, min_count=min_count
+    )
+    result = rule.evaluate(str(services))
+    
+    assert result['passed'] is passed
+    assert "2 of 3 files" in result['message']
+    if not passed:
+        assert "services/billing/README.md" in result['details']
+
+
+def test_text_includes_rule_glob_all(services):
+    """Test match 'all' passes once every matched file contains the text."""
+    (services / "services" / "billing" / "README.md").write_text("Owner: team-c")
+    rule = TextIncludesRule.from_yaml({
+        'id': 'test-id', 'description': 'Owners', 'file': 'services/**/README.md',
+        'text': 'owner:', 'case_sensitive': False, 'match': 'all'
+    })
+    
+    result = rule.evaluate(str(services))
+    assert result['passed'] is True
+    assert "3 of 3 files" in result['message']
+
+
+def test_text_includes_rule_glob_no_files(tmp_path):
+    """Test a glob file fails when no file matches."""
+    result = TextIncludesRule("test-id", "Owners", "services/*/README.md", "Owner:").evaluate(str(tmp_path))
+    assert result['passed'] is False
+    assert "No files match" in result['message']
+
+
+def test_text_matches_rule_evaluate(tmp_path):
+    """Test regex rules report the line of the first match."""
+    (tmp_path / "LICENSE").write_text("MIT License\n\nCopyright (c) 2024 Example\n")
+    
+    rule = TextMatchesRule("test-id", "Copyright", "LICENSE", r"Copyright \(c\) \d{4}")
+    result = rule.evaluate(str(tmp_path))
+    
+    assert result['passed'] is True
+    assert "Pattern matched in LICENSE" in result['message']
+    assert "line 3" in result['details']
+
+
+def test_text_matches_rule_flags(tmp_path):
+    """Test named flags are applied to the expression."""
+    (tmp_path / "README.md").write_text("intro\n## license\nMIT\n")
+    
+    plain = TextMatchesRule("a", "License", "README.md", r"^## License$")
+    flagged = TextMatchesRule("b", "License", "README.md", r"^## License$", flags=["ignorecase", "multiline"])
+    
+    assert plain.evaluate(str(tmp_path))['passed'] is False
+    assert "/^## License$/" in plain.evaluate(str(tmp_path))['details']
+    assert flagged.evaluate(str(tmp_path))['passed'] is True
+
+
+def test_text_matches_rule_line_scope(tmp_path):
+    """Test line scope keeps matches within one line."""
+    (tmp_path / "config.yml").write_text("name: app\nversion:\n  2\n")
+    
+    whole = TextMatchesRule("a", "Version", "config.yml", r"version:\s+\d")
+    line = TextMatchesRule("b", "Version", "config.yml", r"version:\s+\d", scope="line")
+    
+    assert whole.evaluate(str(tmp_path))['passed'] is True
+    result = line.evaluate(str(tmp_path))
+    assert result['passed'] is False
+    assert "(line-scoped)" in result['details']
+
+
+def test_text_matches_rule_file_not_found(tmp_path):
+    """Test regex rules fail when the file is missing."""
+    result = TextMatchesRule("test-id", "Copyright", "LICENSE", "Copyright").evaluate(str(tmp_path))
+    
+    assert result['passed'] is False
+    assert "File not found" in result['message']
+
+
+def test_text_matches_rule_glob(services):
+    """Test regex rules check every file matching a glob file."""
+    rule = TextMatchesRule("test-id", "Owners", "services/*/README.md", r"Owner: team-\w+", match="all")
+    result = rule.evaluate(str(services))
+    
+    assert result['passed'] is False
+    assert "2 of 3 files" in result['message']
+    assert "services/billing/README.md" in result['details']
+
+
+def test_text_matches_rule_from_yaml():
+    """Test creating TextMatchesRule from YAML data."""
+    rule = TextMatchesRule.from_yaml({
+        'id': 'test-id', 'description': 'Copyright', 'file': 'LICENSE',
+        'pattern': 'copyright', 'flags': 'ignorecase', 'scope': 'line'
+    })
+    
+    assert rule.TYPE == "text_matches"
+    assert rule.flags == ['ignorecase']
+    assert rule.line_scoped is True
+    assert rule.rule_data['flags'] == ['ignorecase']
+    
+    with pytest.raises(ValueError, match="missing required field: 'pattern'"):
+        TextMatchesRule.from_yaml({'id': 'test-id', 'description': 'd', 'file': 'LICENSE'})
+    with pytest.raises(ValueError, match="Unknown regex flag"):
+        TextMatchesRule("test-id", "d", "LICENSE", "x", flags=["global"])
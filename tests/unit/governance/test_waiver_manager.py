@@ -9,13 +9,15 @@ Tests cover:
 - Waiver parsing and retrieval
 """
 
+import json
 import pytest
 from pathlib import Path
+from unittest.mock import patch
 from datetime import datetime, timezone
 import tempfile
 import shutil
 
-from specify_cli.governance.waiver import Waiver, WaiverManager
+from specify_cli.governance.waiver import Waiver, WaiverIndex, WaiverManager
 
 
 @pytest.fixture
@@ -364,3 +366,67 @@ class TestWaiverRetrieval:
         assert waivers[0].waiver_id == "W-001"
         assert waivers[1].waiver_id == "W-002"
         assert waivers[2].waiver_id == "W-003"
+
+
+class TestWaiverIndex:
+    """Tests for the waivers.md sidecar index."""
+    
+    def test_index_persisted_on_create(self, waiver_manager):
+        """Test creating waivers writes the sidecar index."""
+        waiver_manager.create_waiver("First", related_rules=["rule-a"])
+        waiver_manager.create_waiver("Second", related_rules=["rule-b"])
+        
+        data = json.loads((waiver_manager.project_root / WaiverManager.INDEX_FILE).read_text())
+        assert [entry[0] for entry in data["entries"]] == ["W-001", "W-002"]
+        assert data["rules"] == {"rule-a": [0], "rule-b": [1]}
+        assert data["max_num"] == 2
+    
+    def test_lookup_matches_full_parse(self, waiver_manager):
+        """Test indexed lookups return the same waivers as parsing."""
+        for i in range(5):
+            waiver_manager.create_waiver(f"Reason {i}", related_rules=[f"rule-{i}"], created_by="dev")
+        
+        fresh = WaiverManager(project_root=waiver_manager.project_root)
+        for parsed in fresh.parse_waivers_file():
+            indexed = fresh.get_waiver_by_id(parsed.waiver_id)
+            assert indexed.to_dict() == parsed.to_dict()
+    
+    def test_appends_update_index_in_place(self, waiver_manager):
+        """Test appends do not trigger a full rebuild."""
+        waiver_manager.create_waiver("First")
+        
+        with patch.object(WaiverIndex, "_build", side_effect=AssertionError("rebuilt")):
+            waiver = waiver_manager.create_waiver("Second", related_rules=["rule-x"])
+            assert waiver.waiver_id == "W-002"
+            assert waiver_manager.get_waiver_by_id("W-002").reason == "Second"
+    
+    def test_index_rebuilt_after_manual_edit(self, waiver_manager):
+        """Test hand edits to waivers.md are picked up."""
+        waiver_manager.create_waiver("First")
+        with open(waiver_manager.waivers_file, "a") as f:
+            f.write("\n## Waiver: W-010\n- **Reason**: Imported\n- **Timestamp**: 2025-10-21T10:00:00Z\n")
+        
+        assert waiver_manager.get_waiver_by_id("W-010").reason == "Imported"
+        assert waiver_manager.create_waiver("Next").waiver_id == "W-011"
+    
+    def test_rule_waiver_map_latest_wins(self, waiver_manager):
+        """Test the rule map returns the latest waiver for a rule."""
+        waiver_manager.create_waiver("Old", related_rules=["rule-1"])
+        waiver_manager.create_waiver("New", related_rules=["rule-1", "rule-2"])
+        
+        waiver_map = waiver_manager.get_rule_waiver_map()
+        
+        assert "rule-1" in waiver_map
+        assert "rule-3" not in waiver_map
+        assert waiver_map["rule-1"].reason == "New"
+        assert len(waiver_map) == 2
+    
+    def test_incomplete_entries_skipped(self, waiver_manager):
+        """Test entries without a timestamp are not indexed."""
+        waiver_manager.waivers_dir.mkdir(parents=True)
+        waiver_manager.waivers_file.write_text(
+            "# Compliance Waivers\n\n## Waiver: W-005\n- **Reason**: No timestamp\n"
+        )
+        
+        assert waiver_manager.get_waiver_by_id("W-005") is None
+        assert waiver_manager.index.next_waiver_id() == "W-001"
@@ -0,0 +1,199 @@
+"""
+Unit tests for compliance watch mode.
+"""
+
+import os
+import threading
+
+from specify_cli.governance.compliance import ComplianceChecker, RuleStatus
+from specify_cli.governance.watch import PollingWatcher, watch_compliance
+
+
+GUIDE = """---
+rules:
+  - id: readme
+    type: file_exists
+    path: README.md
+    description: Project has a README
+  - id: license
+    type: file_exists
+    path: LICENSE
+    description: Project has a license
+---
+"""
+
+
+def make_project(tmp_path):
+    refs = tmp_path / "context" / "references"
+    refs.mkdir(parents=True)
+    (refs / "guide.md").write_text(GUIDE)
+    return tmp_path
+
+
+def bump_mtime(path):
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestPollingWatcher:
+    """Test change detection by stat snapshots."""
+    
+    def test_detects_add_modify_and_remove(self, tmp_path):
+        """Test added, modified and removed files are reported once."""
+        (tmp_path / "kept.txt").write_text("a")
+        (tmp_path / "gone.txt").write_text("b")
+        watcher = PollingWatcher(tmp_path)
+        assert watcher.poll() == set()
+        
+        (tmp_path / "new.txt").write_text("c")
+        (tmp_path / "kept.txt").write_text("longer")
+        (tmp_path / "gone.txt").unlink()
+        
+        assert watcher.poll() == {"new.txt", "kept.txt", "gone.txt"}
+        assert watcher.poll() == set()
+    
+    def test_reports_nested_files_and_directories(self, tmp_path):
+        """Test files in new directories are reported with the directory."""
+        watcher = PollingWatcher(tmp_path)
+        (tmp_path / "docs").mkdir()
+        (tmp_path / "docs" / "a.md").write_text("x")
+        
+        assert watcher.poll() == {"docs", "docs/a.md"}
+    
+    def test_skips_ignored_paths_except_extra(self, tmp_path):
+        """Test ignored directories are not scanned but extra paths are."""
+        (tmp_path / ".specify").mkdir()
+        waivers = tmp_path / ".specify" / "waivers.md"
+        waivers.write_text("")
+        watcher = PollingWatcher(
+            tmp_path,
+            is_ignored=lambda rel_path, is_dir: rel_path == ".specify",
+            extra_paths=[".specify/waivers.md"]
+        )
+        
+        (tmp_path / ".specify" / "cache.json").write_text("{}")
+        assert watcher.poll() == set()
+        
+        bump_mtime(waivers)
+        assert watcher.poll() == {".specify/waivers.md"}
+
+
+class TestIncrementalRecheck:
+    """Test re-checking against results kept in memory."""
+    
+    def test_reuses_results_of_unaffected_rules(self, tmp_path):
+        """Test only rules targeting a changed file are re-evaluated."""
+        checker = ComplianceChecker(project_root=make_project(tmp_path), use_cache=False, processes=2)
+        first = checker.run_compliance_check(record=False)
+        assert {r.rule_id: r.status for r in first} == {"readme": RuleStatus.FAIL, "license": RuleStatus.FAIL}
+        
+        (tmp_path / "README.md").write_text("# Project")
+        (tmp_path / "LICENSE").write_text("MIT")
+        second = checker.run_compliance_check(
+            changed_files={"README.md"},
+            previous_results=first,
+            record=False
+        )
+        
+        statuses = {r.rule_id: r.status for r in second}
+        # LICENSE was not reported as changed, so its previous result carries over
+        assert statuses == {"readme": RuleStatus.PASS, "license": RuleStatus.FAIL}
+    
+    def test_ignored_target_always_reevaluated(self, tmp_path):
+        """Test rules on paths the watcher ignores are re-evaluated every cycle."""
+        make_project(tmp_path)
+        (tmp_path / "context" / "references" / "build.md").write_text(
+            "---\nrules:\n  - id: bundle\n    type: file_exists\n    path: node_modules/pkg/index.js\n"
+            "    description: d\n---\n"
+        )
+        checker = ComplianceChecker(project_root=tmp_path, use_cache=False)
+        first = checker.run_compliance_check(record=False)
+        
+        (tmp_path / "node_modules" / "pkg").mkdir(parents=True)
+        (tmp_path / "node_modules" / "pkg" / "index.js").write_text("x")
+        (tmp_path / "LICENSE").write_text("MIT")
+        second = checker.run_compliance_check(
+            changed_files={"README.md"},
+            previous_results=first,
+            record=False
+        )
+        
+        statuses = {r.rule_id: r.status for r in second}
+        assert statuses == {"readme": RuleStatus.FAIL, "license": RuleStatus.FAIL, "bundle": RuleStatus.PASS}
+    
+    def test_waiver_change_reevaluates_everything(self, tmp_path):
+        """Test a changed waivers file invalidates all previous results."""
+        checker = ComplianceChecker(project_root=make_project(tmp_path), use_cache=False, processes=2)
+        first = checker.run_compliance_check(record=False)
+        
+        (tmp_path / "LICENSE").write_text("MIT")
+        second = checker.run_compliance_check(
+            changed_files={".specify/waivers.md"},
+            previous_results=first,
+            record=False
+        )
+        
+        assert {r.rule_id: r.status for r in second}["license"] == RuleStatus.PASS
+    
+    def test_record_false_leaves_no_history(self, tmp_path):
+        """Test unrecorded checks do not append to the metrics history."""
+        checker = ComplianceChecker(project_root=make_project(tmp_path))
+        checker.run_compliance_check(record=False)
+        
+        assert checker.metrics_history.load() == []
+
+
+class FakeWatcher:
+    """Replays a fixed sequence of change sets, then stops the watch loop."""
+    
+    def __init__(self, changes, stop, on_poll=None):
+        self.changes = list(changes)
+        self.stop = stop
+        self.on_poll = on_poll
+    
+    def poll(self):
+        if not self.changes:
+            self.stop.set()
+            return set()
+        changed = self.changes.pop(0)
+        if self.on_poll:
+            self.on_poll(changed)
+        return changed
+
+
+class TestWatchCompliance:
+    """Test the watch loop."""
+    
+    def test_reports_initial_check_and_status_changes(self, tmp_path):
+        """Test each change set produces an update listing changed statuses."""
+        project = make_project(tmp_path)
+        checker = ComplianceChecker(project_root=project, use_cache=False, processes=2)
+        stop = threading.Event()
+        
+        def create_files(changed):
+            for rel_path in changed:
+                (project / rel_path).write_text("content")
+        
+        watcher = FakeWatcher([{"README.md"}], stop, on_poll=create_files)
+        updates = []
+        watch_compliance(checker, updates.append, interval=0, settle=0, stop=stop, watcher=watcher)
+        
+        assert len(updates) == 2
+        initial, recheck = updates
+        assert initial.changed_files == set() and initial.status_changes == []
+        assert recheck.changed_files == {"README.md"}
+        [(before, after)] = recheck.status_changes
+        assert (before.status, after.status) == (RuleStatus.FAIL, RuleStatus.PASS)
+        assert after.rule_id == "readme"
+    
+    def test_saves_caches_when_stopped(self, tmp_path):
+        """Test caches are persisted once watching ends."""
+        checker = ComplianceChecker(project_root=make_project(tmp_path))
+        stop = threading.Event()
+        stop.set()
+        saved = []
+        checker.save_caches = lambda: saved.append(True)
+        
+        watch_compliance(checker, lambda update: None, stop=stop, watcher=FakeWatcher([], stop))
+        
+        assert saved == [True]
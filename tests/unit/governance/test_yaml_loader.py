@@ -0,0 +1,129 @@
+"""
+Tests for libyaml-accelerated frontmatter loading in RuleParser.
+
+Covers loader selection and fallback, error message parity between the C and
+pure-Python loaders, and an opt-in benchmark over a generated corpus of
+rule-heavy guides (set SPECIFY_RUN_BENCHMARKS=1 to run it).
+"""
+
+import os
+import time
+import pytest
+import yaml
+
+from specify_cli.governance.rules import parser as parser_module
+from specify_cli.governance.rules.parser import RuleParser, RuleParseError
+
+requires_libyaml = pytest.mark.skipif(
+    not getattr(yaml, '__with_libyaml__', False),
+    reason="PyYAML built without libyaml"
+)
+
+MALFORMED_YAML = [
+    'title: "Unterminated\nrules: []',
+    'rules: [1, 2',
+    '- a\nb: c',
+    'key: value\n\tbad: tab',
+    'rules:\n  - id: a\n   type: file_exists',
+]
+
+
+def generate_guide(guide_index: int, rule_count: int) -> str:
+    """Generate a guide with many rules in its frontmatter."""
+    lines = [
+        "---",
+        f'title: "Generated Guide {guide_index}"',
+        'division: "SE"',
+        "rules:",
+    ]
+    for rule_index in range(rule_count):
+        lines.extend([
+            f"  - id: guide-{guide_index}-rule-{rule_index}",
+            "    type: text_includes",
+            f'    file: "src/module_{rule_index % 17}/service.py"',
+            f'    text: "def handler_{rule_index}("',
+            "    case_sensitive: false",
+            f'    description: "Handler {rule_index} must be defined for guide {guide_index}"',
+        ])
+    lines.extend(["---", "", f"# Generated Guide {guide_index}", "", "Body text.", ""])
+    return "\n".join(lines)
+
+
+@pytest.fixture
+def pure_python_loader(monkeypatch):
+    """Force the pure-Python SafeLoader."""
+    monkeypatch.setattr(parser_module, "_YAML_LOADER", yaml.SafeLoader)
+
+
+def test_default_loader_prefers_libyaml(monkeypatch):
+    """Test the C loader is selected when PyYAML has libyaml."""
+    c_loader = type("CSafeLoader", (yaml.SafeLoader,), {})
+    monkeypatch.setattr(yaml, "CSafeLoader", c_loader, raising=False)
+    assert parser_module._default_yaml_loader() is c_loader
+
+
+def test_default_loader_falls_back_to_safe_loader(monkeypatch):
+    """Test SafeLoader is selected when PyYAML lacks libyaml."""
+    monkeypatch.delattr(yaml, "CSafeLoader", raising=False)
+    assert parser_module._default_yaml_loader() is yaml.SafeLoader
+
+
+def test_pure_python_fallback_parses(pure_python_loader):
+    """Test parsing still works without libyaml."""
+    frontmatter, _ = RuleParser.parse_frontmatter(generate_guide(0, 3))
+    assert len(frontmatter['rules']) == 3
+
+
+@requires_libyaml
+@pytest.mark.parametrize("yaml_content", MALFORMED_YAML)
+def test_error_messages_identical_between_loaders(monkeypatch, yaml_content):
+    """Test RuleParseError messages do not depend on the loader."""
+    messages = []
+    for loader in (yaml.CSafeLoader, yaml.SafeLoader):
+        monkeypatch.setattr(parser_module, "_YAML_LOADER", loader)
+        with pytest.raises(RuleParseError) as exc_info:
+            RuleParser.load_frontmatter(yaml_content)
+        messages.append(str(exc_info.value))
+    
+    assert messages[0] == messages[1]
+
+
+@requires_libyaml
+def test_loaders_produce_identical_rules(monkeypatch):
+    """Test both loaders produce the same rule dictionaries."""
+    content = generate_guide(1, 25)
+    parsed = []
+    for loader in (yaml.CSafeLoader, yaml.SafeLoader):
+        monkeypatch.setattr(parser_module, "_YAML_LOADER", loader)
+        parsed.append(RuleParser.parse_frontmatter(content)[0])
+    
+    assert parsed[0] == parsed[1]
+
+
+@pytest.mark.slow
+@pytest.mark.skipif(
+    not os.environ.get("SPECIFY_RUN_BENCHMARKS"),
+    reason="benchmark; set SPECIFY_RUN_BENCHMARKS=1 to run"
+)
+@requires_libyaml
+def test_benchmark_libyaml_speedup(tmp_path, monkeypatch, record_property):
+    """Benchmark extract_rules over rule-heavy guides with each loader."""
+    guides = []
+    for guide_index in range(20):
+        guide = tmp_path / f"guide-{guide_index}.md"
+        guide.write_text(generate_guide(guide_index, 50))
+        guides.append(guide)
+    
+    def best_of(loader, rounds=3):
+        monkeypatch.setattr(parser_module, "_YAML_LOADER", loader)
+        timings = []
+        for _ in range(rounds):
+            start = time.perf_counter()
+            for guide in guides:
+                RuleParser.extract_rules(guide)
+            timings.append(time.perf_counter() - start)
+        return min(timings)
+    
+    # Timings vary by machine, so report them rather than asserting a ratio
+    record_property("pure_ms", round(best_of(yaml.SafeLoader) * 1000, 1))
+    record_property("libyaml_ms", round(best_of(yaml.CSafeLoader) * 1000, 1))